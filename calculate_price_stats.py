@@ -7,7 +7,7 @@ import os
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from ui_integration.supabase_data import get_statistics_summary, _fetch_from_supabase
+from ui_integration.supabase_data import get_statistics_summary, fetch_many, STATISTICS_TOP_PRODUCTS
 
 def calculate_price_statistics():
     """평균 가격 통계 계산 및 출력"""
@@ -15,8 +15,11 @@ def calculate_price_statistics():
     print("평균 가격 통계 분석")
     print("=" * 60)
     
-    # 통계 요약 가져오기
-    stats = get_statistics_summary()
+    # 통계 요약과 상세 분석용 상위 30개 제품을 동시에 조회
+    stats, products = fetch_many([
+        get_statistics_summary,
+        ('products', f'select=*&order=rating_count.desc&limit={STATISTICS_TOP_PRODUCTS}')
+    ])
     
     print(f"\n[전체 통계] (최근 30개 제품 기준)")
     print(f"  - 제품 수: {stats.get('total_products', 0)}개")
@@ -24,7 +27,6 @@ def calculate_price_statistics():
     
     # 상세 가격 분석
     print(f"\n[상세 가격 분석]")
-    products = _fetch_from_supabase('products', 'select=*&order=rating_count.desc')[:30]
     
     valid_prices = []
     invalid_prices = []
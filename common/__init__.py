@@ -0,0 +1,12 @@
+"""
+공통 유틸리티 모듈
+여러 패키지(core, logic_designer)가 함께 쓰는 외부 의존성 없는 기능
+"""
+
+from .regex_safety import DEFAULT_SAFE_WINDOW, RuleTimeoutError, bound_pattern
+
+__all__ = [
+    "DEFAULT_SAFE_WINDOW",
+    "RuleTimeoutError",
+    "bound_pattern"
+]
@@ -0,0 +1,83 @@
+"""
+정규식 검색 비용 제한 공통 모듈 (외부 의존성 없음)
+logic_designer 규칙 엔진/체크리스트와 core 검증기가 함께 사용하는
+안전 모드 패턴 변환(bound_pattern)과 시간 예산 초과 예외(RuleTimeoutError)
+
+시간 예산 주의:
+- 마감 시각(deadline)은 검색과 검색 사이에서만 확인하므로 이미 실행 중인
+  re.search 하나는 중단할 수 없음
+- 검색 하나의 비용은 bound_pattern으로 .*/.+ 반복을 제한해야(안전 모드) 리뷰 길이에 비례
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Hashable, Optional, Tuple
+
+
+# 안전 모드의 .*/.+ 최대 일치 길이 (글자 수)
+DEFAULT_SAFE_WINDOW = 100
+
+
+class RuleTimeoutError(TimeoutError):
+    """리뷰 1건의 규칙 평가가 시간 예산을 초과함"""
+
+    def __init__(self, message: str, partial: Optional[Dict[Hashable, Tuple[int, int]]] = None):
+        """
+        Args:
+            message: 오류 메시지
+            partial: 초과 전까지 감지된 그룹 {그룹키: (시작, 끝)}
+        """
+        super().__init__(message)
+        self.partial = partial or {}
+
+
+@lru_cache(maxsize=512)
+def bound_pattern(pattern: str, window: int = DEFAULT_SAFE_WINDOW) -> str:
+    """
+    제한 없는 .*/.+/.{n,} 반복을 최대 window자로 제한한 패턴 반환
+
+    이스케이프(\\.)와 문자 클래스([.*]) 안의 문자는 바꾸지 않습니다.
+    게으른 반복(.*?)은 게으른 제한 반복(.{0,W}?)이 됩니다.
+
+    Args:
+        pattern: 정규표현식 패턴
+        window: 최대 반복 길이
+
+    Returns:
+        str: 제한된 패턴 (바꿀 곳이 없으면 원래 패턴)
+    """
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == "[":
+            # 문자 클래스 끝까지 그대로 복사 ([]...] / [^]...] 처리)
+            j = i + 1
+            if j < n and pattern[j] == "^":
+                j += 1
+            if j < n and pattern[j] == "]":
+                j += 1
+            while j < n and pattern[j] != "]":
+                j += 2 if pattern[j] == "\\" else 1
+            out.append(pattern[i:j + 1])
+            i = j + 1
+            continue
+        if char == "." and i + 1 < n:
+            quantifier = pattern[i + 1]
+            if quantifier in "*+":
+                out.append(f".{{{0 if quantifier == '*' else 1},{window}}}")
+                i += 2
+                continue
+            open_ended = re.match(r"\{(\d+),\}", pattern[i + 1:])
+            if open_ended:
+                minimum = int(open_ended.group(1))
+                out.append(f".{{{minimum},{max(minimum, window)}}}")
+                i += 1 + open_ended.end()
+                continue
+        out.append(char)
+        i += 1
+    return "".join(out)
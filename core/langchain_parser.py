@@ -3,10 +3,13 @@ LangChain Pydantic Output Parser를 활용한 리뷰 분석 모듈
 ReviewValidator의 결과를 구조화된 객체로 반환
 """
 
-from typing import List, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from pydantic import BaseModel, Field
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
+from langchain_core.runnables import Runnable
 from langchain_anthropic import ChatAnthropic
 
 
@@ -45,56 +48,8 @@ class ReviewValidationResult(BaseModel):
     )
 
 
-def parse_review_with_langchain(
-    review_text: str,
-    model_name: str = "claude-3-5-sonnet-20241022",
-    temperature: float = 0,
-    length_score: float = 50,
-    repurchase_score: float = 50,
-    monthly_use_score: float = 50,
-    photo_score: float = 0,
-    consistency_score: float = 50,
-    anthropic_api_key: Optional[str] = None
-) -> ReviewValidationResult:
-    """
-    LangChain Pydantic Output Parser를 사용하여 리뷰 텍스트를 분석하고
-    구조화된 ReviewValidationResult 객체로 반환
-
-    Args:
-        review_text: 분석할 리뷰 텍스트
-        model_name: 사용할 Claude 모델 이름 (기본값: "claude-3-5-sonnet-20241022")
-        temperature: LLM temperature 설정 (기본값: 0)
-        length_score: 리뷰 길이 점수 (0-100)
-        repurchase_score: 재구매 여부 점수 (0-100)
-        monthly_use_score: 한달 사용 여부 점수 (0-100)
-        photo_score: 사진 첨부 점수 (0-100)
-        consistency_score: 내용 일치도 점수 (0-100)
-        anthropic_api_key: Anthropic API 키 (선택사항)
-
-    Returns:
-        ReviewValidationResult: 구조화된 리뷰 검증 결과 객체
-
-    Example:
-        >>> review = "이 제품 정말 좋아요!!! 완전 대박!!! 강추합니다!!!"
-        >>> result = parse_review_with_langchain(
-        ...     review_text=review,
-        ...     length_score=60,
-        ...     repurchase_score=80
-        ... )
-        >>> print(result.trust_score)
-        >>> print(result.is_ad)
-        >>> for item in result.detected_items:
-        ...     print(f"{item.item_number}. {item.item_name}: {item.detected}")
-    """
-    # Pydantic Output Parser 초기화
-    output_parser = PydanticOutputParser(pydantic_object=ReviewValidationResult)
-
-    # Format instructions 생성
-    format_instructions = output_parser.get_format_instructions()
-
-    # Prompt Template 정의
-    prompt_template = PromptTemplate(
-        template="""당신은 건강기능식품 리뷰의 신뢰도를 평가하는 전문가입니다.
+# 리뷰 검증 프롬프트 (format_instructions는 체인 생성 시 채움)
+REVIEW_PROMPT_TEMPLATE = """당신은 건강기능식품 리뷰의 신뢰도를 평가하는 전문가입니다.
 
 다음 리뷰 텍스트를 분석하여 13단계 광고 판별 체크리스트를 적용하고,
 신뢰도 점수를 계산하여 구조화된 형태로 반환하세요.
@@ -133,17 +88,65 @@ def parse_review_with_langchain(
 
 위 리뷰를 분석하여 각 체크리스트 항목의 감지 여부를 판단하고,
 신뢰도 점수를 계산한 후 지정된 JSON 형식으로 응답하세요.
-""",
-        input_variables=[
-            "review_text",
-            "length_score",
-            "repurchase_score",
-            "monthly_use_score",
-            "photo_score",
-            "consistency_score"
-        ],
-        partial_variables={"format_instructions": format_instructions}
+"""
+
+# 점수 매개변수 (프롬프트 입력값, 규칙 기반 검증 인자)
+_SCORE_PARAMS = (
+    "length_score",
+    "repurchase_score",
+    "monthly_use_score",
+    "photo_score",
+    "consistency_score"
+)
+
+# 점수 매개변수 기본값 (parse_review_with_langchain과 동일)
+_SCORE_DEFAULTS = {
+    "length_score": 50,
+    "repurchase_score": 50,
+    "monthly_use_score": 50,
+    "photo_score": 0,
+    "consistency_score": 50
+}
+
+
+@lru_cache(maxsize=1)
+def _review_prompt() -> Tuple[PromptTemplate, PydanticOutputParser]:
+    """Output Parser와 Prompt Template 생성 (format_instructions 포함, 한 번만 생성)"""
+    # Pydantic Output Parser 초기화
+    output_parser = PydanticOutputParser(pydantic_object=ReviewValidationResult)
+
+    # Prompt Template 정의
+    prompt_template = PromptTemplate(
+        template=REVIEW_PROMPT_TEMPLATE,
+        input_variables=["review_text", *_SCORE_PARAMS],
+        partial_variables={"format_instructions": output_parser.get_format_instructions()}
     )
+    return prompt_template, output_parser
+
+
+@lru_cache(maxsize=32)
+def get_review_chain(
+    model_name: str = "claude-3-5-sonnet-20241022",
+    temperature: float = 0,
+    anthropic_api_key: Optional[str] = None
+) -> Runnable:
+    """
+    리뷰 검증 체인 반환 (모델/temperature/API 키 조합별로 한 번만 생성하여 재사용)
+
+    같은 ChatAnthropic 클라이언트(HTTP 연결)를 공유하므로 반복 호출과
+    batch()/abatch() 동시 실행 시 연결 설정 비용이 줄어듭니다.
+
+    Args:
+        model_name: 사용할 Claude 모델 이름
+        temperature: LLM temperature 설정
+        anthropic_api_key: Anthropic API 키 (선택사항)
+
+    Returns:
+        Runnable: prompt | llm | output_parser 체인
+            - 입력: {"review_text": ..., "length_score": ..., ...}
+            - 출력: ReviewValidationResult
+    """
+    prompt_template, output_parser = _review_prompt()
 
     # LLM 초기화
     llm = ChatAnthropic(
@@ -152,8 +155,51 @@ def parse_review_with_langchain(
         anthropic_api_key=anthropic_api_key
     )
 
-    # Chain 생성 및 실행
-    chain = prompt_template | llm | output_parser
+    return prompt_template | llm | output_parser
+
+
+def parse_review_with_langchain(
+    review_text: str,
+    model_name: str = "claude-3-5-sonnet-20241022",
+    temperature: float = 0,
+    length_score: float = 50,
+    repurchase_score: float = 50,
+    monthly_use_score: float = 50,
+    photo_score: float = 0,
+    consistency_score: float = 50,
+    anthropic_api_key: Optional[str] = None
+) -> ReviewValidationResult:
+    """
+    LangChain Pydantic Output Parser를 사용하여 리뷰 텍스트를 분석하고
+    구조화된 ReviewValidationResult 객체로 반환
+
+    Args:
+        review_text: 분석할 리뷰 텍스트
+        model_name: 사용할 Claude 모델 이름 (기본값: "claude-3-5-sonnet-20241022")
+        temperature: LLM temperature 설정 (기본값: 0)
+        length_score: 리뷰 길이 점수 (0-100)
+        repurchase_score: 재구매 여부 점수 (0-100)
+        monthly_use_score: 한달 사용 여부 점수 (0-100)
+        photo_score: 사진 첨부 점수 (0-100)
+        consistency_score: 내용 일치도 점수 (0-100)
+        anthropic_api_key: Anthropic API 키 (선택사항)
+
+    Returns:
+        ReviewValidationResult: 구조화된 리뷰 검증 결과 객체
+
+    Example:
+        >>> review = "이 제품 정말 좋아요!!! 완전 대박!!! 강추합니다!!!"
+        >>> result = parse_review_with_langchain(
+        ...     review_text=review,
+        ...     length_score=60,
+        ...     repurchase_score=80
+        ... )
+        >>> print(result.trust_score)
+        >>> print(result.is_ad)
+        >>> for item in result.detected_items:
+        ...     print(f"{item.item_number}. {item.item_name}: {item.detected}")
+    """
+    chain = get_review_chain(model_name, temperature, anthropic_api_key)
 
     # 실행
     result = chain.invoke({
@@ -168,70 +214,200 @@ def parse_review_with_langchain(
     return result
 
 
+def parse_reviews_with_langchain(
+    reviews: Iterable[Union[str, Dict[str, Any]]],
+    max_concurrency: int = 5,
+    model_name: str = "claude-3-5-sonnet-20241022",
+    temperature: float = 0,
+    anthropic_api_key: Optional[str] = None,
+    return_exceptions: bool = False
+) -> List[Union[ReviewValidationResult, Exception]]:
+    """
+    여러 리뷰를 LangChain 체인의 batch()로 동시 분석
+
+    Args:
+        reviews: 리뷰 텍스트 또는 리뷰 딕셔너리 목록
+            - 딕셔너리 키: review_text, length_score 등 점수 매개변수(선택적)
+        max_concurrency: 최대 동시 LLM 요청 수 (기본값: 5)
+        model_name: 사용할 Claude 모델 이름
+        temperature: LLM temperature 설정
+        anthropic_api_key: Anthropic API 키 (선택사항)
+        return_exceptions: True면 실패한 리뷰 위치에 예외 객체 반환 (False면 예외 발생)
+
+    Returns:
+        List: 입력 순서대로 ReviewValidationResult (return_exceptions=True면 예외 포함)
+    """
+    chain = get_review_chain(model_name, temperature, anthropic_api_key)
+    return chain.batch(
+        [_chain_input(review) for review in reviews],
+        config={"max_concurrency": max(1, max_concurrency)},
+        return_exceptions=return_exceptions
+    )
+
+
+async def aparse_reviews_with_langchain(
+    reviews: Iterable[Union[str, Dict[str, Any]]],
+    max_concurrency: int = 5,
+    model_name: str = "claude-3-5-sonnet-20241022",
+    temperature: float = 0,
+    anthropic_api_key: Optional[str] = None,
+    return_exceptions: bool = False
+) -> List[Union[ReviewValidationResult, Exception]]:
+    """parse_reviews_with_langchain의 비동기 버전 (체인의 abatch() 사용)"""
+    chain = get_review_chain(model_name, temperature, anthropic_api_key)
+    return await chain.abatch(
+        [_chain_input(review) for review in reviews],
+        config={"max_concurrency": max(1, max_concurrency)},
+        return_exceptions=return_exceptions
+    )
+
+
+def _chain_input(review: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """리뷰 텍스트/딕셔너리를 체인 입력으로 변환 (없는 점수는 기본값)"""
+    if isinstance(review, str):
+        review = {"review_text": review}
+    chain_input = {"review_text": review["review_text"]}
+    for param in _SCORE_PARAMS:
+        value = review.get(param)
+        chain_input[param] = _SCORE_DEFAULTS[param] if value is None else value
+    return chain_input
+
+
+# use_llm="auto"일 때 LLM으로 넘기는 애매한 구간 (신뢰도 여유폭, 점수 단위, 경계값 포함)
+# 기본값 10은 3개 항목 기준에서 항목 하나 차이(항목당 10점)인 리뷰까지 포함
+DEFAULT_ESCALATION_BAND = 10.0
+
+# 자동 라우팅 통계
+_routing_lock = threading.Lock()
+_routing_stats = {"total": 0, "escalated": 0, "llm_errors": 0}
+
+
+def get_routing_stats() -> Dict[str, Any]:
+    """
+    use_llm="auto" 라우팅 통계 반환
+
+    Returns:
+        Dict: {
+            "total": 자동 라우팅한 리뷰 수,
+            "escalated": LLM으로 넘긴 리뷰 수,
+            "llm_errors": LLM 실패로 규칙 기반 결과를 사용한 수,
+            "escalation_rate": LLM으로 넘긴 비율
+        }
+    """
+    with _routing_lock:
+        stats = dict(_routing_stats)
+    stats["escalation_rate"] = (
+        round(stats["escalated"] / stats["total"], 4) if stats["total"] else 0.0
+    )
+    return stats
+
+
+def reset_routing_stats() -> None:
+    """자동 라우팅 통계 초기화"""
+    with _routing_lock:
+        for key in _routing_stats:
+            _routing_stats[key] = 0
+
+
 def parse_review_hybrid(
     review_text: str,
-    use_llm: bool = False,
+    use_llm: Union[bool, str] = False,
+    escalation_band: float = DEFAULT_ESCALATION_BAND,
     **kwargs
 ) -> ReviewValidationResult:
     """
     하이브리드 방식으로 리뷰 분석
     - use_llm=False: validator.py의 규칙 기반 검증 사용 (빠름, 비용 없음)
     - use_llm=True: LangChain + LLM 사용 (느림, 비용 발생, 더 정교함)
+    - use_llm="auto": 규칙 기반 검증 후 판별이 애매한 리뷰만 LLM 사용
+      (신뢰도 여유폭이 escalation_band 이하인 경우, LLM 실패 시 규칙 기반 결과 반환)
 
     Args:
         review_text: 분석할 리뷰 텍스트
-        use_llm: LLM 사용 여부 (기본값: False)
+        use_llm: LLM 사용 여부 (True/False 또는 "auto", 기본값: False)
+        escalation_band: "auto"에서 LLM으로 넘길 신뢰도 여유폭 기준 (기본값: 10.0)
+            - 40점 기준선과의 거리 / 3개 항목 기준과의 거리(항목당 10점)
+            - ReviewValidator.confidence_margin 참고
         **kwargs: parse_review_with_langchain()의 추가 매개변수
 
     Returns:
         ReviewValidationResult: 구조화된 리뷰 검증 결과 객체
     """
+    if use_llm == "auto":
+        result, margin = _parse_review_rules(review_text, **kwargs)
+        escalate = margin <= escalation_band
+
+        with _routing_lock:
+            _routing_stats["total"] += 1
+            if escalate:
+                _routing_stats["escalated"] += 1
+        if not escalate:
+            return result
+
+        try:
+            return parse_review_with_langchain(review_text, **kwargs)
+        except Exception:
+            # LLM 실패 시 규칙 기반 결과 사용 (오류 없이)
+            with _routing_lock:
+                _routing_stats["llm_errors"] += 1
+            return result
+
     if use_llm:
         return parse_review_with_langchain(review_text, **kwargs)
-    else:
-        # 규칙 기반 검증 사용
-        from .validator import ReviewValidator
 
-        validator = ReviewValidator()
+    result, _ = _parse_review_rules(review_text, **kwargs)
+    return result
 
-        # kwargs에서 점수 파라미터 추출
-        score_params = {
-            k: v for k, v in kwargs.items()
-            if k in ['length_score', 'repurchase_score', 'monthly_use_score',
-                     'photo_score', 'consistency_score']
-        }
 
-        # 검증 수행
-        validation_result = validator.validate_review(review_text, **score_params)
-
-        # 감지된 항목 상세 정보 생성
-        detected_issues = validator.check_ad_patterns(review_text)
-        detected_items = []
-
-        # 모든 13개 항목에 대해 AdCheckItem 생성
-        for item_num in range(1, 14):
-            item_data = validator.AD_PATTERNS[item_num]
-            detected_items.append(
-                AdCheckItem(
-                    item_number=item_num,
-                    item_name=item_data["name"],
-                    detected=(item_num in detected_issues)
-                )
-            )
+def _parse_review_rules(review_text: str, **kwargs) -> Tuple[ReviewValidationResult, float]:
+    """
+    규칙 기반 검증 (validator.py)
+
+    Args:
+        review_text: 분석할 리뷰 텍스트
+        **kwargs: 점수 매개변수 (나머지는 무시)
 
-        # ReviewValidationResult 객체 생성
-        result = ReviewValidationResult(
-            trust_score=validation_result["trust_score"],
-            base_score=validation_result["base_score"],
-            penalty=validation_result["penalty"],
-            is_ad=validation_result["is_ad"],
-            detected_count=validation_result["detected_count"],
-            detected_items=detected_items,
-            reasons=validation_result["reasons"],
-            review_text=review_text
+    Returns:
+        Tuple[ReviewValidationResult, float]: (검증 결과, 신뢰도 여유폭)
+    """
+    from .validator import ReviewValidator
+
+    validator = ReviewValidator()
+
+    # kwargs에서 점수 파라미터 추출
+    score_params = {k: v for k, v in kwargs.items() if k in _SCORE_PARAMS}
+
+    # 검증 수행
+    validation_result = validator.validate_review(review_text, **score_params)
+
+    # 감지된 항목 상세 정보 생성
+    detected_issues = validator.check_ad_patterns(review_text)
+    detected_items = []
+
+    # 모든 13개 항목에 대해 AdCheckItem 생성
+    for item_num in range(1, 14):
+        item_data = validator.AD_PATTERNS[item_num]
+        detected_items.append(
+            AdCheckItem(
+                item_number=item_num,
+                item_name=item_data["name"],
+                detected=(item_num in detected_issues)
+            )
         )
 
-        return result
+    # ReviewValidationResult 객체 생성
+    result = ReviewValidationResult(
+        trust_score=validation_result["trust_score"],
+        base_score=validation_result["base_score"],
+        penalty=validation_result["penalty"],
+        is_ad=validation_result["is_ad"],
+        detected_count=validation_result["detected_count"],
+        detected_items=detected_items,
+        reasons=validation_result["reasons"],
+        review_text=review_text
+    )
+
+    return result, validation_result["confidence_margin"]
 
 
 # 편의 함수
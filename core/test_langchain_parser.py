@@ -0,0 +1,163 @@
+"""
+langchain_parser.py 테스트 스크립트
+use_llm="auto"에서 판별이 애매한 리뷰만 LLM으로 넘기는지, 라우팅 통계,
+체인 캐시와 batch()/abatch() 일괄 분석 검증
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from core import langchain_parser
+from core.validator import ReviewValidator
+
+
+# 개인 경험 + 단점 언급이 있어 감점 항목이 적은 리뷰
+CLEAR_REVIEW = "제가 직접 한 달 먹어봤는데 눈이 덜 피곤해요. 다만 알약이 좀 커서 삼키기 불편해요."
+# 대가성/감탄사/찬사가 많은 광고 리뷰
+AD_REVIEW = "업체에서 무료로 제공 받았어요!!! 완전 진짜 최고 강추 대박 만족!!! 100% 효과 바로 나타나요"
+
+
+def test_confidence_margin_reflects_both_rules():
+    """40점 기준선과 3개 항목 기준 중 판별을 뒤집기 가장 쉬운 거리"""
+    validator = ReviewValidator()
+
+    assert validator.confidence_margin(40, 0) == 0
+    assert validator.confidence_margin(45, 2) == 5
+    assert validator.confidence_margin(39, 0) == 1
+    assert validator.confidence_margin(60, 3) == 10
+    assert validator.confidence_margin(30, 4) == 20
+
+
+def test_auto_escalates_only_ambiguous_reviews(monkeypatch):
+    """여유폭이 band 이하인 리뷰만 LLM 호출, 통계에 비율 기록"""
+    llm_calls = []
+
+    def fake_llm(review_text, **kwargs):
+        llm_calls.append((review_text, kwargs))
+        return "llm-result"
+
+    monkeypatch.setattr(langchain_parser, "parse_review_with_langchain", fake_llm)
+    langchain_parser.reset_routing_stats()
+
+    clear = langchain_parser.parse_review_hybrid(
+        CLEAR_REVIEW, use_llm="auto", length_score=100, repurchase_score=100,
+        monthly_use_score=100, consistency_score=100
+    )
+    ad = langchain_parser.parse_review_hybrid(AD_REVIEW, use_llm="auto")
+    borderline = langchain_parser.parse_review_hybrid(
+        CLEAR_REVIEW, use_llm="auto", model_name="m"
+    )
+
+    assert clear.is_ad is False
+    assert ad.is_ad is True
+    assert borderline == "llm-result"
+    assert llm_calls == [(CLEAR_REVIEW, {"model_name": "m"})]
+
+    stats = langchain_parser.get_routing_stats()
+    assert stats["total"] == 3
+    assert stats["escalated"] == 1
+    assert stats["escalation_rate"] == round(1 / 3, 4)
+
+    # band를 넓히면 모두 LLM으로
+    langchain_parser.parse_review_hybrid(AD_REVIEW, use_llm="auto", escalation_band=100)
+    assert len(llm_calls) == 2
+
+
+def test_auto_escalates_margin_on_band_boundary(monkeypatch):
+    """3개 항목 기준에서 항목 하나 차이(여유폭 10)인 리뷰는 기본 band(10)에서 LLM으로 넘김"""
+    validator = ReviewValidator()
+    assert validator.confidence_margin(80, 2) == langchain_parser.DEFAULT_ESCALATION_BAND
+
+    margins = {"one-off": 10.0, "clear": 10.5}
+    monkeypatch.setattr(langchain_parser, "_parse_review_rules",
+                        lambda review_text, **kwargs: ("rules-result", margins[review_text]))
+    monkeypatch.setattr(langchain_parser, "parse_review_with_langchain",
+                        lambda review_text, **kwargs: "llm-result")
+
+    assert langchain_parser.parse_review_hybrid("one-off", use_llm="auto") == "llm-result"
+    assert langchain_parser.parse_review_hybrid("clear", use_llm="auto") == "rules-result"
+
+
+def test_auto_falls_back_to_rules_on_llm_error(monkeypatch):
+    """LLM 실패 시 규칙 기반 결과 반환"""
+    def failing_llm(review_text, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(langchain_parser, "parse_review_with_langchain", failing_llm)
+    langchain_parser.reset_routing_stats()
+
+    result = langchain_parser.parse_review_hybrid(CLEAR_REVIEW, use_llm="auto", escalation_band=100)
+
+    assert result == langchain_parser.parse_review_hybrid(CLEAR_REVIEW)
+    assert langchain_parser.get_routing_stats()["llm_errors"] == 1
+
+
+def _use_fake_llm(monkeypatch):
+    """프롬프트의 리뷰 텍스트/L 점수를 그대로 담은 JSON을 돌려주는 가짜 LLM"""
+    created = []
+
+    def fake_chat_anthropic(model, temperature, anthropic_api_key):
+        created.append((model, temperature))
+
+        def respond(prompt_value):
+            prompt = prompt_value.to_string()
+            review_text = prompt.split("## 분석할 리뷰 텍스트:\n")[1].split("\n")[0]
+            length_score = float(prompt.split("L (length_score): ")[1].split("\n")[0])
+            return AIMessage(content=json.dumps({
+                "trust_score": length_score, "base_score": length_score, "penalty": 0,
+                "is_ad": False, "detected_count": 0, "detected_items": [],
+                "reasons": [], "review_text": review_text
+            }, ensure_ascii=False))
+
+        return RunnableLambda(respond)
+
+    monkeypatch.setattr(langchain_parser, "ChatAnthropic", fake_chat_anthropic)
+    langchain_parser.get_review_chain.cache_clear()
+    return created
+
+
+def test_chain_is_cached_per_model_and_temperature(monkeypatch):
+    """같은 모델/temperature는 체인(LLM 클라이언트)을 한 번만 생성"""
+    created = _use_fake_llm(monkeypatch)
+
+    first = langchain_parser.parse_review_with_langchain(CLEAR_REVIEW, length_score=70)
+    second = langchain_parser.parse_review_with_langchain(AD_REVIEW)
+    langchain_parser.parse_review_with_langchain(CLEAR_REVIEW, temperature=0.5)
+
+    assert first.review_text == CLEAR_REVIEW
+    assert first.trust_score == 70
+    assert second.trust_score == 50
+    assert created == [("claude-3-5-sonnet-20241022", 0), ("claude-3-5-sonnet-20241022", 0.5)]
+    langchain_parser.get_review_chain.cache_clear()
+
+
+def test_batch_and_abatch_keep_input_order(monkeypatch):
+    """batch()/abatch() 결과는 입력 순서, 점수 없는 항목은 기본값"""
+    created = _use_fake_llm(monkeypatch)
+    reviews = [
+        {"review_text": f"{i}번 리뷰 {CLEAR_REVIEW}", "length_score": i * 10} for i in range(6)
+    ] + [AD_REVIEW]
+
+    results = langchain_parser.parse_reviews_with_langchain(reviews, max_concurrency=3)
+    async_results = asyncio.run(
+        langchain_parser.aparse_reviews_with_langchain(reviews, max_concurrency=3)
+    )
+
+    assert [r.trust_score for r in results] == [0, 10, 20, 30, 40, 50, 50]
+    assert [r.review_text for r in results][-1] == AD_REVIEW
+    assert async_results == results
+    assert len(created) == 1
+    langchain_parser.get_review_chain.cache_clear()
@@ -0,0 +1,61 @@
+"""
+validator.py 테스트 스크립트
+안전 모드/시간 예산이 기존 판별 결과를 바꾸지 않고,
+반복 문자 스팸에서도 검색 시간이 제한되는지 검증
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.validator import ReviewValidator
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+from common.regex_safety import RuleTimeoutError
+
+
+def test_safe_mode_matches_default_on_templates():
+    """짧은 리뷰는 안전 모드/시간 예산과 관계없이 같은 판별 결과"""
+    default = ReviewValidator()
+    for template in NORMAL_REVIEW_TEMPLATES + AD_REVIEW_TEMPLATES:
+        text = template["body"]
+        expected = default.validate_review(text)
+        assert ReviewValidator(safe_mode=True).validate_review(text) == expected
+        assert ReviewValidator(time_budget=60).validate_review(text) == expected
+
+
+def test_time_budget_bounds_pathological_input():
+    """시간 예산을 지정하면 안전 모드가 켜져 반복 문자 스팸도 빠르게 끝나고, 초과 시 RuleTimeoutError"""
+    validator = ReviewValidator(time_budget=60)
+    assert validator.safe_mode
+
+    text = "무상" * 20000
+    started = time.perf_counter()
+    validator.check_ad_patterns(text)
+    assert time.perf_counter() - started < 3.0
+
+    with pytest.raises(RuleTimeoutError):
+        ReviewValidator(time_budget=0).check_ad_patterns(AD_REVIEW_TEMPLATES[0]["body"])
+
+
+def test_import_does_not_load_logic_designer():
+    """core.validator는 공통 모듈만 사용하므로 logic_designer(분석기, Supabase)를 불러오지 않음"""
+    code = (
+        "import sys; import core.validator; "
+        "print(','.join(m for m in ('logic_designer', 'supabase') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=str(project_root),
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
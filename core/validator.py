@@ -4,7 +4,10 @@
 """
 
 import re
-from typing import Dict, List, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
+
+from common.regex_safety import DEFAULT_SAFE_WINDOW, RuleTimeoutError, bound_pattern
 
 
 class ReviewValidator:
@@ -95,8 +98,53 @@ class ReviewValidator:
         }
     }
 
-    def __init__(self):
-        pass
+    # 광고 판별 기준: 최종 점수 40점 미만 또는 감점 항목 3개 이상
+    AD_SCORE_THRESHOLD = 40
+    AD_DETECTED_LIMIT = 3
+
+    # 감점 항목 1개당 감점 (신뢰도 여유폭 계산 시 항목 수를 점수로 환산)
+    PENALTY_PER_ITEM = 10
+
+    # 개인 경험 표현 패턴 (4번 항목)
+    PERSONAL_PATTERNS = [
+        r"나는", r"저는", r"제가", r"내가", r"우리",
+        r"직접", r"실제로", r"먹어보니", r"사용해보니"
+    ]
+
+    # 부정적 의견/단점 표현 패턴 (7번 항목)
+    NEGATIVE_PATTERNS = [
+        r"단점", r"아쉬", r"불편", r"별로", r"그런데",
+        r"하지만", r"다만", r"개선", r"부족", r"안.*좋"
+    ]
+
+    # 안전 모드에서 .*/.+ 최대 일치 길이 (긴 리뷰/반복 문자 스팸의 O(n²) 검색 방지)
+    SAFE_REGEX_WINDOW = DEFAULT_SAFE_WINDOW
+
+    def __init__(self, safe_mode: bool = False, time_budget: Optional[float] = None):
+        """
+        검증기 초기화
+
+        Args:
+            safe_mode: 안전 모드 (제한 없는 .*/.+ 를 SAFE_REGEX_WINDOW자로 제한하여 검색)
+            time_budget: 리뷰 1건 패턴 검사 시간 예산(초), 초과 시 RuleTimeoutError (None이면 제한 없음)
+                → 예산은 패턴 검색과 검색 사이에서만 확인하며 진행 중인 re.search 하나는
+                  중단할 수 없으므로, 시간 예산을 지정하면 안전 모드를 함께 사용
+        """
+        self.safe_mode = safe_mode or time_budget is not None
+        self.time_budget = time_budget
+
+    def _search(self, pattern: str, text: str, flags: int = 0, deadline: Optional[float] = None) -> bool:
+        """
+        단일 패턴 검색 (안전 모드면 반복 길이 제한)
+
+        Raises:
+            RuleTimeoutError: 검색 전 마감 시각이 지난 경우
+        """
+        if deadline is not None and time.perf_counter() > deadline:
+            raise RuleTimeoutError(f"규칙 평가 시간 초과 ({pattern})")
+        if self.safe_mode:
+            pattern = bound_pattern(pattern, self.SAFE_REGEX_WINDOW)
+        return re.search(pattern, text, flags) is not None
 
     def calculate_base_score(
         self,
@@ -139,7 +187,11 @@ class ReviewValidator:
 
         Returns:
             Dict[int, str]: {항목번호: 항목명} 형태로 감점된 항목 반환
+
+        Raises:
+            RuleTimeoutError: time_budget을 초과한 경우
         """
+        deadline = time.perf_counter() + self.time_budget if self.time_budget is not None else None
         detected_issues = {}
 
         for item_num, item_data in self.AD_PATTERNS.items():
@@ -148,7 +200,7 @@ class ReviewValidator:
 
             # 특수 케이스 처리
             if item_num == 4:  # 개인 경험 부재
-                if not self._has_personal_experience(review_text):
+                if not self._has_personal_experience(review_text, deadline):
                     detected_issues[item_num] = name
                 continue
 
@@ -158,26 +210,22 @@ class ReviewValidator:
                 continue
 
             if item_num == 7:  # 단점 회피
-                if not self._has_negative_opinion(review_text):
+                if not self._has_negative_opinion(review_text, deadline):
                     detected_issues[item_num] = name
                 continue
 
             # 정규표현식 패턴 매칭
             for pattern in patterns:
-                if re.search(pattern, review_text, re.IGNORECASE | re.MULTILINE):
+                if self._search(pattern, review_text, re.IGNORECASE | re.MULTILINE, deadline):
                     detected_issues[item_num] = name
                     break
 
         return detected_issues
 
-    def _has_personal_experience(self, text: str) -> bool:
+    def _has_personal_experience(self, text: str, deadline: Optional[float] = None) -> bool:
         """개인 경험 표현 존재 여부 검사"""
-        personal_patterns = [
-            r"나는", r"저는", r"제가", r"내가", r"우리",
-            r"직접", r"실제로", r"먹어보니", r"사용해보니"
-        ]
-        for pattern in personal_patterns:
-            if re.search(pattern, text):
+        for pattern in self.PERSONAL_PATTERNS:
+            if self._search(pattern, text, deadline=deadline):
                 return True
         return False
 
@@ -196,14 +244,10 @@ class ReviewValidator:
         max_freq = max(word_freq.values()) if word_freq else 0
         return max_freq >= threshold
 
-    def _has_negative_opinion(self, text: str) -> bool:
+    def _has_negative_opinion(self, text: str, deadline: Optional[float] = None) -> bool:
         """부정적 의견 또는 단점 언급 여부 검사"""
-        negative_patterns = [
-            r"단점", r"아쉬", r"불편", r"별로", r"그런데",
-            r"하지만", r"다만", r"개선", r"부족", r"안.*좋"
-        ]
-        for pattern in negative_patterns:
-            if re.search(pattern, text):
+        for pattern in self.NEGATIVE_PATTERNS:
+            if self._search(pattern, text, deadline=deadline):
                 return True
         return False
 
@@ -231,7 +275,8 @@ class ReviewValidator:
             Dict: {
                 "trust_score": 최종 신뢰도 점수,
                 "is_ad": 광고 여부 (bool),
-                "reasons": 감점된 항목 리스트 (List[str])
+                "reasons": 감점된 항목 리스트 (List[str]),
+                "confidence_margin": 판별 결과 신뢰도 여유폭 (confidence_margin 참고)
             }
         """
         # 기본 점수 계산
@@ -247,11 +292,14 @@ class ReviewValidator:
         detected_issues = self.check_ad_patterns(review_text)
 
         # 감점 적용 (항목당 -10점)
-        penalty = len(detected_issues) * 10
+        penalty = len(detected_issues) * self.PENALTY_PER_ITEM
         final_score = max(0, base_score - penalty)
 
         # 광고 판별: 40점 미만 또는 감점 항목 3개 이상
-        is_ad = final_score < 40 or len(detected_issues) >= 3
+        is_ad = (
+            final_score < self.AD_SCORE_THRESHOLD or
+            len(detected_issues) >= self.AD_DETECTED_LIMIT
+        )
 
         # 감점 사유 리스트
         reasons = [f"{num}. {name}" for num, name in detected_issues.items()]
@@ -262,9 +310,42 @@ class ReviewValidator:
             "reasons": reasons,
             "base_score": base_score,
             "penalty": penalty,
-            "detected_count": len(detected_issues)
+            "detected_count": len(detected_issues),
+            "confidence_margin": self.confidence_margin(final_score, len(detected_issues))
         }
 
+    def confidence_margin(self, final_score: float, detected_count: int) -> float:
+        """
+        광고 판별 결과의 신뢰도 여유폭 계산
+
+        판별 결과가 뒤집히려면 점수가 얼마나 바뀌어야 하는지를 점수 단위로 반환합니다.
+        - 점수 기준: 최종 점수와 40점 기준선의 거리
+        - 항목 기준: 감점 항목 수와 3개 기준의 거리 (항목당 10점으로 환산)
+        - 광고가 아닌 경우: 두 기준 중 하나만 넘어도 광고 → 두 거리 중 작은 값
+        - 광고인 경우: 해당하는 기준을 모두 벗어나야 정상 → 해당 기준 거리 중 큰 값
+
+        Args:
+            final_score: 최종 신뢰도 점수
+            detected_count: 감지된 광고 패턴 항목 개수
+
+        Returns:
+            float: 신뢰도 여유폭 (0에 가까울수록 경계선에 있는 애매한 리뷰)
+        """
+        score_distance = final_score - self.AD_SCORE_THRESHOLD
+        count_distance = (self.AD_DETECTED_LIMIT - detected_count) * self.PENALTY_PER_ITEM
+
+        if score_distance >= 0 and count_distance > 0:
+            # 광고 아님: 점수가 기준 아래로 내려가거나 항목이 기준에 도달하면 광고
+            return round(min(score_distance, count_distance), 2)
+
+        # 광고: 점수 미달분(0초과)과 항목 초과분(기준에서 1개 적어질 때까지) 중 큰 값
+        margins = []
+        if score_distance < 0:
+            margins.append(-score_distance)
+        if count_distance <= 0:
+            margins.append(-count_distance + self.PENALTY_PER_ITEM)
+        return round(max(margins), 2)
+
 
 # 편의 함수
 def validate_review(review_text: str, **kwargs) -> Dict:
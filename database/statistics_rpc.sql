@@ -0,0 +1,101 @@
+-- =====================================================
+-- 대시보드 통계 집계 함수 (PostgREST RPC)
+-- =====================================================
+-- 설명: get_statistics_summary / get_all_categories 집계를 DB에서 계산하여
+--       전체 products/reviews 행 대신 집계 결과(JSON 수백 바이트)만 반환
+-- 호출: GET /rest/v1/rpc/get_statistics_summary?p_top_products=30
+--       GET /rest/v1/rpc/get_all_categories
+-- 적용: schema.sql 적용 후 Supabase SQL Editor에서 실행
+-- =====================================================
+
+-- 1) 가격 정규화 (ui_integration/supabase_data.py와 동일한 규칙)
+--    1000보다 크면 100으로 나누고 (KRW to USD 근사치), 0 초과 1000 이하만 유효
+CREATE OR REPLACE FUNCTION public.normalize_product_price(p_price NUMERIC)
+RETURNS NUMERIC
+LANGUAGE sql
+IMMUTABLE
+AS $$
+  SELECT CASE
+    WHEN p_price IS NULL THEN NULL
+    WHEN p_price > 1000 AND p_price / 100 <= 1000 THEN p_price / 100
+    WHEN p_price > 0 AND p_price <= 1000 THEN p_price
+    ELSE NULL
+  END;
+$$;
+
+-- 2) 전체 통계 요약
+--    제품 통계는 rating_count 기준 상위 p_top_products개, 리뷰 통계는 전체 리뷰 기준
+--    브랜드/카테고리가 NULL 또는 빈 문자열이면 'Unknown' (클라이언트 집계의 `or 'Unknown'`과 동일)
+CREATE OR REPLACE FUNCTION public.get_statistics_summary(p_top_products INT DEFAULT 30)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  WITH top_products AS (
+    SELECT brand, category, price, rating_avg, rating_count
+    FROM public.products
+    ORDER BY rating_count DESC NULLS FIRST
+    LIMIT p_top_products
+  ),
+  brand_stats AS (
+    SELECT COALESCE(NULLIF(brand, ''), 'Unknown') AS brand,
+           COUNT(*) AS count,
+           COALESCE(SUM(rating_avg), 0) AS total_rating,
+           COALESCE(SUM(rating_count), 0) AS total_reviews
+    FROM top_products
+    GROUP BY 1
+  ),
+  category_stats AS (
+    SELECT COALESCE(NULLIF(category, ''), 'Unknown') AS category, COUNT(*) AS count
+    FROM top_products
+    GROUP BY 1
+  ),
+  rating_stats AS (
+    SELECT rating, COUNT(*) AS count
+    FROM public.reviews
+    WHERE rating BETWEEN 1 AND 5
+    GROUP BY rating
+  )
+  SELECT jsonb_build_object(
+    'total_products', (SELECT COUNT(*) FROM top_products),
+    'total_reviews', (SELECT COUNT(*) FROM public.reviews),
+    'brands', COALESCE((
+      SELECT jsonb_object_agg(brand, jsonb_build_object(
+        'count', count, 'total_rating', total_rating, 'total_reviews', total_reviews))
+      FROM brand_stats), '{}'::jsonb),
+    'categories', COALESCE((
+      SELECT jsonb_object_agg(category, jsonb_build_object('count', count))
+      FROM category_stats), '{}'::jsonb),
+    'rating_distribution', (
+      SELECT jsonb_object_agg(r.rating, COALESCE(s.count, 0))
+      FROM generate_series(1, 5) AS r(rating)
+      LEFT JOIN rating_stats s ON s.rating = r.rating),
+    'avg_price', COALESCE((
+      SELECT AVG(public.normalize_product_price(price)) FROM top_products), 0)
+  );
+$$;
+
+-- 3) 카테고리 목록 (중복 제거, 정렬)
+CREATE OR REPLACE FUNCTION public.get_all_categories()
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  SELECT COALESCE(jsonb_agg(category ORDER BY category), '[]'::jsonb)
+  FROM (
+    SELECT DISTINCT category
+    FROM public.products
+    WHERE category IS NOT NULL AND category <> ''
+  ) AS c;
+$$;
+
+-- 카테고리 집계용 인덱스
+CREATE INDEX IF NOT EXISTS idx_products_category ON public.products(category);
+
+-- 익명 키(anon)로 RPC 호출 허용
+GRANT EXECUTE ON FUNCTION public.normalize_product_price(NUMERIC) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_statistics_summary(INT) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.get_all_categories() TO anon, authenticated;
+
+COMMENT ON FUNCTION public.get_statistics_summary(INT) IS '대시보드 통계 요약 (브랜드/카테고리/평점 분포/평균 가격)';
+COMMENT ON FUNCTION public.get_all_categories() IS '제품 카테고리 목록';
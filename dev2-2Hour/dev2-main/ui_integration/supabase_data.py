@@ -6,11 +6,22 @@ Supabase REST API를 통해 products와 reviews 테이블에서 데이터를 가
 
 import os
 import sys
-import requests
 from typing import Dict, List, Optional, Any
 
-# logic_designer 모듈 import 경로 추가
+# 공유 HTTP 클라이언트는 저장소 최상위 ui_integration/http_client.py를 사용 (복사본을 두지 않음)
 current_dir = os.path.dirname(os.path.abspath(__file__))
+shared_ui_path = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(current_dir))), "ui_integration"
+)
+if shared_ui_path not in sys.path:
+    sys.path.append(shared_ui_path)
+
+try:
+    from http_client import http_get  # ui_integration에서 실행 (Streamlit, API 서버)
+except ImportError:
+    from ui_integration.http_client import http_get  # 프로젝트 루트에서 실행
+
+# logic_designer 모듈 import 경로 추가
 project_root = os.path.dirname(os.path.dirname(current_dir))
 logic_designer_path = os.path.join(project_root, "logic_designer")
 if logic_designer_path not in sys.path:
@@ -142,7 +153,7 @@ class SupabaseDataManager:
         try:
             url = f'{supabase_url}/rest/v1/{table}?{params}'
             headers = self.config_manager.get_headers()
-            response = requests.get(url, headers=headers, timeout=10)
+            response = http_get(url, headers=headers)
             
             if response.status_code == 200:
                 return response.json()
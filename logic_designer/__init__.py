@@ -3,10 +3,27 @@
 검증 로직과 AI 분석을 통합한 파이프라인
 """
 
-from typing import Dict, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from .checklist import AdChecklist, check_ad_patterns
+from .rule_engine import RuleTimeoutError
 from .trust_score import TrustScoreCalculator, calculate_trust_score
 from .analyzer import PharmacistAnalyzer
+from .async_analyzer import AsyncPharmacistAnalyzer
+from .batch_analyzer import BatchPharmacistAnalyzer
+from .packed_analyzer import PackedPharmacistAnalyzer
+from .analysis_cache import AnalysisResultCache
+from .speculative import get_speculation_stats, get_speculative_analyzer
+from .review_features import ReviewFeatures, get_review_features
+from .rule_version import review_input_hash, rule_set_fingerprint
+from .ingredient_lexicon import IngredientLexicon, rebuild_ingredient_lexicon
+from .nutrition_utils import (
+    IngredientIndex,
+    extract_ingredient_ids,
+    get_nutrition_cache_stats,
+    get_nutrition_info_many,
+    invalidate_nutrition_cache
+)
 
 
 def analyze(
@@ -19,7 +36,8 @@ def analyze(
     consistency_score: float = 50,
     api_key: Optional[str] = None,
     model: str = "claude-sonnet-4-5-20250929",
-    use_nutrition_validation: bool = True
+    use_nutrition_validation: bool = True,
+    speculative: bool = False
 ) -> Dict:
     """
     리뷰 종합 분석 통합 함수 (영양성분 DB 통합, 안전한 방식)
@@ -41,6 +59,8 @@ def analyze(
         api_key: Anthropic API 키 (선택)
         model: 사용할 Claude 모델 (기본값: claude-sonnet-4-5-20250929)
         use_nutrition_validation: 영양성분 검증 사용 여부 (기본값: True)
+        speculative: True면 광고 판별과 동시에 영양성분 조회/AI 분석을 시작하고
+            광고로 판별되면 진행 중인 분석을 취소 (기본값: False, 통계는 get_speculation_stats)
 
     Returns:
         Dict: {
@@ -63,6 +83,379 @@ def analyze(
             } 또는 None (광고인 경우)
         }
     """
+    if speculative and len(review_text.strip()) >= 10:
+        # 검증 단계와 겹쳐서 AI 분석 시작 (광고/오류로 결과가 안 쓰이면 취소)
+        call = get_speculative_analyzer(api_key).start(
+            review_text,
+            product_id=product_id if use_nutrition_validation else None,
+            model=model
+        )
+        try:
+            result = _analyze_with_engines(
+                review_text,
+                product_id=product_id,
+                length_score=length_score,
+                repurchase_score=repurchase_score,
+                monthly_use_score=monthly_use_score,
+                photo_score=photo_score,
+                consistency_score=consistency_score,
+                model=model,
+                use_nutrition_validation=use_nutrition_validation,
+                checklist=AdChecklist(),
+                calculator=TrustScoreCalculator(),
+                get_analyzer=lambda: call
+            )
+        finally:
+            call.cancel()
+        return result
+
+    return _analyze_with_engines(
+        review_text,
+        product_id=product_id,
+        length_score=length_score,
+        repurchase_score=repurchase_score,
+        monthly_use_score=monthly_use_score,
+        photo_score=photo_score,
+        consistency_score=consistency_score,
+        model=model,
+        use_nutrition_validation=use_nutrition_validation,
+        checklist=AdChecklist(),
+        calculator=TrustScoreCalculator(),
+        get_analyzer=lambda: PharmacistAnalyzer(api_key=api_key)
+    )
+
+
+# analyze_batch()/validate_review() 등에서 리뷰 dict로 받을 수 있는 점수 필드
+SCORE_FIELDS = (
+    "length_score",
+    "repurchase_score",
+    "monthly_use_score",
+    "photo_score",
+    "consistency_score"
+)
+
+
+# analyze_batch()가 한 번에 읽어 처리하는 리뷰 수 (영양성분 일괄 조회 단위)
+ANALYZE_BATCH_CHUNK_SIZE = 500
+
+
+def analyze_batch(
+    reviews: Iterable[Dict],
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-5-20250929",
+    use_nutrition_validation: bool = True,
+    chunk_size: int = ANALYZE_BATCH_CHUNK_SIZE
+) -> List[Dict]:
+    """
+    여러 리뷰 일괄 분석 (엔진 객체 재사용)
+
+    analyze()와 동일한 파이프라인을 수행하지만 AdChecklist, TrustScoreCalculator,
+    PharmacistAnalyzer(및 Anthropic 클라이언트)를 배치 전체에서 한 번만 생성합니다.
+    입력은 chunk_size건씩 읽고, 청크마다 영양성분 정보를 get_nutrition_info_many()로
+    일괄 조회한 뒤 평가합니다. 결과를 모두 모으지 않고 하나씩 받으려면
+    iter_analyze_batch()를 사용합니다.
+
+    Args:
+        reviews: 리뷰 dict 리스트 또는 이터레이터
+            - "review_text" (또는 "text", "body"): 리뷰 텍스트 (필수)
+            - "product_id": 제품 ID (선택)
+            - "length_score" 등 analyze()의 점수 인자 (선택, 없으면 기본값)
+        api_key: Anthropic API 키 (선택)
+        model: 사용할 Claude 모델 (기본값: claude-sonnet-4-5-20250929)
+        use_nutrition_validation: 영양성분 검증 사용 여부 (기본값: True)
+        chunk_size: 한 번에 읽어 영양성분 정보를 일괄 조회하는 리뷰 수
+
+    Returns:
+        List[Dict]: 입력 순서대로 analyze()와 같은 형식의 결과 리스트
+            - 개별 리뷰 처리 실패 시 해당 항목만
+              {"error": "ITEM_ERROR", "message": ..., "validation": None, "analysis": None}
+    """
+    return list(iter_analyze_batch(
+        reviews,
+        api_key=api_key,
+        model=model,
+        use_nutrition_validation=use_nutrition_validation,
+        chunk_size=chunk_size
+    ))
+
+
+def iter_analyze_batch(
+    reviews: Iterable[Dict],
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-5-20250929",
+    use_nutrition_validation: bool = True,
+    chunk_size: int = ANALYZE_BATCH_CHUNK_SIZE
+) -> Iterator[Dict]:
+    """
+    여러 리뷰 일괄 분석 스트리밍 (입력 순서대로 결과를 하나씩 반환)
+
+    입력을 chunk_size건씩만 메모리에 올리므로 큰 덤프나 이터레이터도
+    입력 크기와 관계없이 일정한 메모리로 처리합니다.
+    인자와 결과 형식은 analyze_batch()와 동일합니다.
+
+    Yields:
+        Dict: analyze()와 같은 형식의 결과 (개별 실패 시 "ITEM_ERROR" 항목)
+    """
+    checklist = AdChecklist()
+    calculator = TrustScoreCalculator()
+
+    # 약사 분석기는 광고가 아닌 리뷰가 처음 나올 때 한 번만 생성
+    analyzer_state = {}
+
+    def get_analyzer() -> PharmacistAnalyzer:
+        if "error" in analyzer_state:
+            raise analyzer_state["error"]
+        if "analyzer" not in analyzer_state:
+            try:
+                analyzer_state["analyzer"] = PharmacistAnalyzer(api_key=api_key)
+            except Exception as e:
+                analyzer_state["error"] = e
+                raise
+        return analyzer_state["analyzer"]
+
+    iterator = iter(reviews)
+    while True:
+        chunk = list(islice(iterator, max(1, chunk_size)))
+        if not chunk:
+            return
+
+        # 청크에 등장하는 제품의 영양성분 정보를 한 번에 조회하여 캐시 적재
+        if use_nutrition_validation:
+            get_nutrition_info_many(
+                review.get("product_id") for review in chunk
+                if isinstance(review, dict)
+            )
+
+        for review in chunk:
+            yield _analyze_batch_item(
+                review,
+                model=model,
+                use_nutrition_validation=use_nutrition_validation,
+                checklist=checklist,
+                calculator=calculator,
+                get_analyzer=get_analyzer
+            )
+
+
+def _analyze_batch_item(
+    review: Dict,
+    model: str,
+    use_nutrition_validation: bool,
+    checklist: AdChecklist,
+    calculator: TrustScoreCalculator,
+    get_analyzer: Callable[[], PharmacistAnalyzer]
+) -> Dict:
+    """배치의 리뷰 1건 분석 (실패 시 ITEM_ERROR 결과)"""
+    try:
+        review_text = review.get("review_text")
+        if review_text is None:
+            review_text = review.get("text", review.get("body"))
+        if not isinstance(review_text, str):
+            raise ValueError("리뷰 텍스트(review_text)가 없습니다")
+
+        scores = {
+            field: review[field]
+            for field in SCORE_FIELDS
+            if review.get(field) is not None
+        }
+
+        return _analyze_with_engines(
+            review_text,
+            product_id=review.get("product_id"),
+            model=model,
+            use_nutrition_validation=use_nutrition_validation,
+            checklist=checklist,
+            calculator=calculator,
+            get_analyzer=get_analyzer,
+            **scores
+        )
+    except Exception as e:
+        return {
+            "error": "ITEM_ERROR",
+            "message": str(e),
+            "validation": None,
+            "analysis": None
+        }
+
+
+def analyze_stream(
+    review_text: str,
+    product_id: Optional[int] = None,
+    length_score: float = 50,
+    repurchase_score: float = 50,
+    monthly_use_score: float = 50,
+    photo_score: float = 0,
+    consistency_score: float = 50,
+    api_key: Optional[str] = None,
+    model: str = "claude-sonnet-4-5-20250929",
+    use_nutrition_validation: bool = True
+) -> Iterator[Dict]:
+    """
+    리뷰 종합 분석 스트리밍 (검증 결과를 먼저, AI 분석 결과는 도착 시 반환)
+
+    analyze()와 같은 파이프라인이지만 체크리스트/신뢰도 점수 단계가 끝나는 즉시
+    검증 결과를 내보내고, 느린 Claude 호출은 그 다음에 수행합니다.
+    인자는 analyze()와 동일합니다.
+
+    Yields:
+        Dict: 단계별 이벤트
+            - {"event": "validation", "data": analyze() 결과의 "validation" 블록}
+            - {"event": "analysis", "data": analyze() 결과의 "analysis" 블록}
+            - 리뷰가 너무 짧으면 {"event": "error", "data": {"error": ..., "message": ...}} 하나만
+    """
+    validation_result = _validate_with_engines(
+        review_text,
+        product_id=product_id,
+        use_nutrition_validation=use_nutrition_validation,
+        checklist=AdChecklist(),
+        calculator=TrustScoreCalculator(),
+        length_score=length_score,
+        repurchase_score=repurchase_score,
+        monthly_use_score=monthly_use_score,
+        photo_score=photo_score,
+        consistency_score=consistency_score
+    )
+    if "error" in validation_result:
+        yield {
+            "event": "error",
+            "data": {
+                "error": validation_result["error"],
+                "message": validation_result["message"]
+            }
+        }
+        return
+
+    yield {"event": "validation", "data": validation_result}
+
+    yield {
+        "event": "analysis",
+        "data": _pharmacist_analysis(
+            review_text,
+            product_id=product_id,
+            model=model,
+            use_nutrition_validation=use_nutrition_validation,
+            is_ad=validation_result["is_ad"],
+            get_analyzer=lambda: PharmacistAnalyzer(api_key=api_key)
+        )
+    }
+
+
+def validate_review(
+    review_text: str,
+    product_id: Optional[int] = None,
+    length_score: float = 50,
+    repurchase_score: float = 50,
+    monthly_use_score: float = 50,
+    photo_score: float = 0,
+    consistency_score: float = 50,
+    use_nutrition_validation: bool = True,
+    checklist: Optional[AdChecklist] = None,
+    calculator: Optional[TrustScoreCalculator] = None
+) -> Dict:
+    """
+    리뷰 규칙 기반 검증 (광고 패턴 검사 + 신뢰도 점수 + 광고 판별, AI 호출 없음)
+
+    analyze() 결과의 "validation" 블록만 계산합니다. 대량 채점처럼 여러 리뷰를
+    처리할 때는 checklist/calculator를 한 번 만들어 넘기면 엔진을 재사용합니다.
+
+    Args:
+        checklist: 광고 패턴 체크리스트 (None이면 새로 생성)
+        calculator: 신뢰도 점수 계산기 (None이면 새로 생성)
+        나머지 인자는 analyze()와 동일 (점수 필드 목록은 SCORE_FIELDS)
+
+    Returns:
+        Dict: analyze() 결과의 "validation" 블록
+            - 리뷰가 너무 짧으면 {"error": "REVIEW_TOO_SHORT", ..., "validation": None, "analysis": None}
+            - 체크리스트 시간 예산 초과 시 {"error": "RULE_TIMEOUT", ...} (checklist.time_budget 지정 시)
+    """
+    return _validate_with_engines(
+        review_text,
+        product_id=product_id,
+        use_nutrition_validation=use_nutrition_validation,
+        checklist=checklist if checklist is not None else AdChecklist(),
+        calculator=calculator if calculator is not None else TrustScoreCalculator(),
+        length_score=length_score,
+        repurchase_score=repurchase_score,
+        monthly_use_score=monthly_use_score,
+        photo_score=photo_score,
+        consistency_score=consistency_score
+    )
+
+
+def _analyze_with_engines(
+    review_text: str,
+    product_id: Optional[int],
+    model: str,
+    use_nutrition_validation: bool,
+    checklist: AdChecklist,
+    calculator: TrustScoreCalculator,
+    get_analyzer: Callable[[], PharmacistAnalyzer],
+    length_score: float = 50,
+    repurchase_score: float = 50,
+    monthly_use_score: float = 50,
+    photo_score: float = 0,
+    consistency_score: float = 50
+) -> Dict:
+    """
+    analyze() 파이프라인 본체 (엔진 객체를 외부에서 주입)
+
+    Args:
+        checklist: 광고 패턴 체크리스트
+        calculator: 신뢰도 점수 계산기
+        get_analyzer: 약사 분석기 반환 함수 (광고가 아닌 경우에만 호출)
+        나머지 인자는 analyze()와 동일
+
+    Returns:
+        Dict: analyze()와 동일한 형식의 결과
+    """
+    validation_result = _validate_with_engines(
+        review_text,
+        product_id=product_id,
+        use_nutrition_validation=use_nutrition_validation,
+        checklist=checklist,
+        calculator=calculator,
+        length_score=length_score,
+        repurchase_score=repurchase_score,
+        monthly_use_score=monthly_use_score,
+        photo_score=photo_score,
+        consistency_score=consistency_score
+    )
+    if "error" in validation_result:
+        return validation_result
+
+    return {
+        "validation": validation_result,
+        "analysis": _pharmacist_analysis(
+            review_text,
+            product_id=product_id,
+            model=model,
+            use_nutrition_validation=use_nutrition_validation,
+            is_ad=validation_result["is_ad"],
+            get_analyzer=get_analyzer
+        )
+    }
+
+
+def _validate_with_engines(
+    review_text: str,
+    product_id: Optional[int],
+    use_nutrition_validation: bool,
+    checklist: AdChecklist,
+    calculator: TrustScoreCalculator,
+    length_score: float = 50,
+    repurchase_score: float = 50,
+    monthly_use_score: float = 50,
+    photo_score: float = 0,
+    consistency_score: float = 50
+) -> Dict:
+    """
+    검증 단계 (광고 패턴 검사 + 신뢰도 점수 + 광고 판별, AI 호출 없음)
+
+    Returns:
+        Dict: analyze() 결과의 "validation" 블록
+            - 리뷰가 너무 짧으면 {"error": "REVIEW_TOO_SHORT", ..., "validation": None, "analysis": None}
+            - 체크리스트 시간 예산 초과 시 {"error": "RULE_TIMEOUT", ...} (checklist.time_budget 지정 시)
+    """
     # 입력 검증: 리뷰가 너무 짧으면 오류 반환
     if len(review_text.strip()) < 10:
         return {
@@ -72,11 +465,21 @@ def analyze(
             "analysis": None
         }
 
+    # 리뷰 특징(토큰, 규칙 스캔, 성분 추출)은 한 번만 계산하여 모든 단계가 공유
+    features = get_review_features(review_text)
+
     # 1단계: 광고 패턴 검사 (영양성분 DB 통합)
     try:
-        checklist = AdChecklist()
-        detected_issues = checklist.check_ad_patterns(review_text, product_id)
+        detected_issues = checklist.check_ad_patterns(review_text, product_id, features=features)
         penalty_count = len(detected_issues)
+    except RuleTimeoutError as e:
+        # 시간 예산 초과: 일부 결과로 판별하지 않고 시간 초과로 기록
+        return {
+            "error": "RULE_TIMEOUT",
+            "message": f"광고 패턴 검사 시간 초과: {e}",
+            "validation": None,
+            "analysis": None
+        }
     except Exception:
         # 체크리스트 검사 실패 시 기본값 사용
         detected_issues = {}
@@ -84,7 +487,6 @@ def analyze(
 
     # 2단계: 신뢰도 점수 계산 (영양성분 일치도 포함)
     try:
-        calculator = TrustScoreCalculator()
         score_result = calculator.calculate_final_score(
             length_score=length_score,
             repurchase_score=repurchase_score,
@@ -94,7 +496,8 @@ def analyze(
             penalty_count=penalty_count,
             review_text=review_text if use_nutrition_validation else None,
             product_id=product_id if use_nutrition_validation else None,
-            use_nutrition_score=use_nutrition_validation
+            use_nutrition_score=use_nutrition_validation,
+            features=features
         )
     except Exception:
         # 점수 계산 실패 시 기본값 사용
@@ -140,11 +543,28 @@ def analyze(
     if "nutrition_score" in score_result:
         validation_result["nutrition_score"] = score_result["nutrition_score"]
 
+    return validation_result
+
+
+def _pharmacist_analysis(
+    review_text: str,
+    product_id: Optional[int],
+    model: str,
+    use_nutrition_validation: bool,
+    is_ad: bool,
+    get_analyzer: Callable[[], PharmacistAnalyzer]
+) -> Dict:
+    """
+    AI 분석 단계 (광고가 아닌 경우에만 약사 분석 수행, 안전한 방식)
+
+    Returns:
+        Dict: analyze() 결과의 "analysis" 블록
+    """
     # 4단계: 광고가 아닌 경우에만 AI 분석 수행 (영양성분 정보 포함)
     analysis_result = None
     if not is_ad:
         try:
-            analyzer = PharmacistAnalyzer(api_key=api_key)
+            analyzer = get_analyzer()
             analysis_result = analyzer.analyze_safe(
                 review_text, 
                 product_id=product_id if use_nutrition_validation else None,
@@ -172,19 +592,38 @@ def analyze(
             "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
         }
 
-    return {
-        "validation": validation_result,
-        "analysis": analysis_result
-    }
+    return analysis_result
 
 
 __all__ = [
     "analyze",
+    "analyze_batch",
+    "iter_analyze_batch",
+    "analyze_stream",
+    "validate_review",
+    "SCORE_FIELDS",
     "AdChecklist",
     "check_ad_patterns",
+    "RuleTimeoutError",
     "TrustScoreCalculator",
     "calculate_trust_score",
-    "PharmacistAnalyzer"
+    "PharmacistAnalyzer",
+    "AsyncPharmacistAnalyzer",
+    "BatchPharmacistAnalyzer",
+    "PackedPharmacistAnalyzer",
+    "get_speculation_stats",
+    "AnalysisResultCache",
+    "ReviewFeatures",
+    "get_review_features",
+    "rule_set_fingerprint",
+    "review_input_hash",
+    "IngredientLexicon",
+    "rebuild_ingredient_lexicon",
+    "IngredientIndex",
+    "extract_ingredient_ids",
+    "get_nutrition_cache_stats",
+    "get_nutrition_info_many",
+    "invalidate_nutrition_cache"
 ]
 
 
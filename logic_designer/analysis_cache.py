@@ -0,0 +1,273 @@
+"""
+약사 분석 결과 캐시 모듈
+같은 리뷰/제품/영양성분 정보/모델/프롬프트 조합의 AI 분석 결과를
+로컬 SQLite 파일에 저장하여 재분석 시 API 호출을 생략합니다.
+
+캐시 키 구성:
+- 정규화된 리뷰 텍스트(앞뒤 공백 제거, 연속 공백 통일)의 해시
+- product_id
+- 영양성분 정보 버전 (영양성분 정보 내용의 해시)
+- 모델명
+- 프롬프트 버전 (PharmacistAnalyzer.PROMPT_VERSION, 묶음 분석은 PackedPharmacistAnalyzer.PROMPT_VERSION)
+
+환경변수 ANALYSIS_CACHE_PATH를 설정하면 공유 캐시가 활성화됩니다.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+
+
+# 최대 항목 수를 이 비율만큼 넘으면 한 번에 정리 (저장할 때마다 정리하지 않음)
+EVICTION_SLACK = 0.1
+
+# 파일 크기 제한(max_bytes) 확인 주기 (저장 횟수)
+SIZE_CHECK_INTERVAL = 50
+
+
+def _hash(value: str) -> str:
+    """SHA-256 해시 (16진수)"""
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def normalize_review_text(review_text: str) -> str:
+    """캐시 키용 리뷰 텍스트 정규화 (앞뒤 공백 제거, 연속 공백 통일)"""
+    return " ".join(review_text.split())
+
+
+def _json_default(value: Any) -> Any:
+    """영양성분 캐시의 읽기 전용 스냅샷(MappingProxyType)은 dict로 직렬화"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def nutrition_info_version(nutrition_info: Optional[Mapping[str, Any]]) -> str:
+    """영양성분 정보 버전 (내용이 바뀌면 달라지는 해시, 정보 없으면 "none")"""
+    if not nutrition_info:
+        return "none"
+    return _hash(json.dumps(nutrition_info, sort_keys=True, ensure_ascii=False, default=_json_default))[:16]
+
+
+class AnalysisResultCache:
+    """
+    SQLite 기반 분석 결과 캐시 (항목 수/크기 제한, 최근 사용 순 제거)
+
+    항목 수는 저장할 때마다 COUNT(*)로 세지 않고 메모리의 누적 값으로 관리하며,
+    max_entries를 EVICTION_SLACK 비율만큼 넘었을 때 한 번에 정리합니다.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 10000,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        캐시 초기화
+
+        Args:
+            path: SQLite 파일 경로 (None이면 메모리 DB)
+            max_entries: 최대 저장 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            max_bytes: 최대 사용 크기 (바이트, 사용 중인 페이지 기준, None이면 제한 없음)
+                - SIZE_CHECK_INTERVAL번 저장할 때마다 확인
+        """
+        self.path = path or ":memory:"
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._slack = max(1, int(max_entries * EVICTION_SLACK))
+        self._sets_since_size_check = 0
+
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_results ("
+            " cache_key TEXT PRIMARY KEY,"
+            " result TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_analysis_results_accessed"
+            " ON analysis_results (accessed_at)"
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM analysis_results").fetchone()[0]
+
+    @staticmethod
+    def make_key(
+        review_text: str,
+        product_id: Optional[Any],
+        nutrition_info: Optional[Dict[str, Any]],
+        model: str,
+        prompt_version: str
+    ) -> str:
+        """
+        캐시 키 생성
+
+        Args:
+            review_text: 리뷰 텍스트 (정규화 후 해시)
+            product_id: 제품 ID
+            nutrition_info: 분석에 사용한 영양성분 정보
+            model: 모델명
+            prompt_version: 프롬프트 템플릿 버전
+
+        Returns:
+            str: 캐시 키
+        """
+        parts = [
+            _hash(normalize_review_text(review_text)),
+            "" if product_id is None else str(product_id),
+            nutrition_info_version(nutrition_info),
+            model,
+            prompt_version
+        ]
+        return _hash("\x1f".join(parts))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """캐시 조회 (없거나 조회 실패 시 None, 있으면 새 딕셔너리)"""
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT result FROM analysis_results WHERE cache_key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE analysis_results SET accessed_at = ? WHERE cache_key = ?",
+                        (time.time(), key)
+                    )
+            except sqlite3.Error:
+                # 캐시 오류는 무시하고 새로 분석 (오류 없이)
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, result: Dict[str, Any]) -> None:
+        """캐시 저장 (최대 항목 수 초과 시 오래 사용되지 않은 항목 제거, 실패해도 무시)"""
+        data = json.dumps(result, ensure_ascii=False)
+        now = time.time()
+        with self._lock:
+            try:
+                self._store(key, data, now)
+            except sqlite3.Error:
+                # 캐시 저장 실패는 무시 (분석 결과는 그대로 반환)
+                pass
+
+    def _store(self, key: str, data: str, now: float) -> None:
+        """항목 저장 및 크기 제한 적용 (잠금 상태에서 호출)"""
+        inserted = self._conn.execute(
+            "INSERT OR IGNORE INTO analysis_results"
+            " (cache_key, result, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+            (key, data, now, now)
+        ).rowcount
+        if inserted:
+            self._count += 1
+        else:
+            self._conn.execute(
+                "UPDATE analysis_results SET result = ?, created_at = ?, accessed_at = ?"
+                " WHERE cache_key = ?",
+                (data, now, now, key)
+            )
+
+        if self._count > self.max_entries + self._slack:
+            self._evict_to(self.max_entries)
+            return
+
+        if self.max_bytes:
+            self._sets_since_size_check += 1
+            if self._sets_since_size_check >= SIZE_CHECK_INTERVAL:
+                self._sets_since_size_check = 0
+                used = self._used_bytes()
+                if used > self.max_bytes:
+                    # 평균 항목 크기 기준으로 제한 아래가 되도록 비율만큼 제거 (EVICTION_SLACK 여유 포함)
+                    self._evict_to(int(self._count * self.max_bytes / used * (1 - EVICTION_SLACK)))
+
+    def _evict_to(self, target: int) -> None:
+        """가장 오래 사용되지 않은 항목부터 제거하여 target개만 남김 (잠금 상태에서 호출)"""
+        # 다른 프로세스가 같은 파일을 쓰는 경우를 위해 정리할 때만 실제 항목 수로 보정
+        self._count = self._conn.execute("SELECT COUNT(*) FROM analysis_results").fetchone()[0]
+        if self._count <= target:
+            return
+        self._conn.execute(
+            "DELETE FROM analysis_results WHERE cache_key IN ("
+            " SELECT cache_key FROM analysis_results"
+            " ORDER BY accessed_at ASC LIMIT ?)",
+            (self._count - target,)
+        )
+        self._count = target
+
+    def _used_bytes(self) -> int:
+        """사용 중인 페이지 크기 (바이트, 빈 페이지 제외)"""
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - freelist_count) * page_size
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._conn.execute("DELETE FROM analysis_results")
+            self._count = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환 (적중/미스 횟수, 현재 크기 등)"""
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM analysis_results").fetchone()[0]
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "size": size,
+                "bytes": self._used_bytes(),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "path": self.path
+            }
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+# 공유 분석 결과 캐시 (ANALYSIS_CACHE_PATH 설정 시 생성)
+_analysis_cache: Optional[AnalysisResultCache] = None
+_analysis_cache_lock = threading.Lock()
+
+
+def get_analysis_cache() -> Optional[AnalysisResultCache]:
+    """
+    공유 분석 결과 캐시 반환
+
+    환경변수 ANALYSIS_CACHE_PATH(SQLite 파일 경로)가 없으면 None (캐시 사용 안 함).
+    ANALYSIS_CACHE_MAX_ENTRIES로 최대 항목 수를 지정할 수 있습니다 (기본값: 10000).
+    ANALYSIS_CACHE_MAX_BYTES로 최대 크기(바이트)를 지정할 수 있습니다 (기본값: 제한 없음).
+    """
+    global _analysis_cache
+    path = os.getenv("ANALYSIS_CACHE_PATH")
+    if not path:
+        return None
+
+    with _analysis_cache_lock:
+        if _analysis_cache is None or _analysis_cache.path != path:
+            max_entries = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "10000"))
+            max_bytes = os.getenv("ANALYSIS_CACHE_MAX_BYTES")
+            _analysis_cache = AnalysisResultCache(
+                path, max_entries=max_entries, max_bytes=int(max_bytes) if max_bytes else None
+            )
+        return _analysis_cache
@@ -5,19 +5,23 @@
 
 import os
 import json
-from typing import Dict, Optional
+from typing import Any, Dict, Optional, Tuple, Union
 from anthropic import Anthropic
+from .analysis_cache import AnalysisResultCache, get_analysis_cache
 from .nutrition_utils import (
     get_nutrition_info_safe,
-    extract_ingredients,
     is_valid_ingredient,
     get_official_efficacy
 )
+from .review_features import get_review_features
 
 
 class PharmacistAnalyzer:
     """15년 경력 임상 약사 페르소나 기반 AI 분석기"""
 
+    # 프롬프트 템플릿 버전 (SYSTEM_PROMPT, _build_enhanced_prompt 변경 시 올려서 캐시 무효화)
+    PROMPT_VERSION = "1"
+
     SYSTEM_PROMPT = """당신은 15년 경력의 임상 약사입니다.
 
 **역할 및 태도:**
@@ -83,13 +87,19 @@ class PharmacistAnalyzer:
 본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다.
 """
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        result_cache: Optional[AnalysisResultCache] = None
+    ):
         """
         약사 분석기 초기화
 
         Args:
             api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+            result_cache: 분석 결과 캐시 (None이면 ANALYSIS_CACHE_PATH 설정 시 공유 캐시)
         """
+        self.result_cache = result_cache or get_analysis_cache()
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
         if not self.api_key:
             raise ValueError(
@@ -103,7 +113,8 @@ class PharmacistAnalyzer:
         self, 
         review_text: str, 
         product_id: Optional[int] = None,
-        model: str = "claude-sonnet-4-5-20250929"
+        model: str = "claude-sonnet-4-5-20250929",
+        use_cache: bool = True
     ) -> Dict:
         """
         리뷰를 약사 페르소나로 분석 (영양성분 DB 통합)
@@ -112,6 +123,7 @@ class PharmacistAnalyzer:
             review_text: 분석할 리뷰 텍스트
             product_id: 제품 ID (제공 시 영양성분 정보 포함, 없어도 오류 없음)
             model: 사용할 Claude 모델 (기본값: claude-sonnet-4-5-20250929)
+            use_cache: False면 캐시를 조회하지 않고 새로 분석 (결과는 캐시에 갱신)
 
         Returns:
             Dict: {
@@ -127,6 +139,44 @@ class PharmacistAnalyzer:
             ValueError: 리뷰 텍스트가 10자 미만인 경우
             Exception: API 호출 실패 시
         """
+        nutrition_info, user_prompt = self._prepare_request(review_text, product_id)
+
+        # 캐시된 분석 결과가 있으면 API 호출 생략
+        cache_key = self._cache_key(review_text, product_id, nutrition_info, model)
+        if cache_key and use_cache:
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            # 3. Anthropic API 호출
+            response = self.client.messages.create(
+                **self._message_params(user_prompt, model)
+            )
+            result = self._parse_response(response, review_text, nutrition_info)
+            if cache_key:
+                self.result_cache.set(cache_key, result)
+            return result
+
+        except json.JSONDecodeError as e:
+            raise Exception(f"AI 응답 파싱 실패: {e}")
+        except Exception as e:
+            raise Exception(f"AI 분석 중 오류 발생: {e}")
+
+    def _prepare_request(
+        self,
+        review_text: str,
+        product_id: Optional[int] = None
+    ) -> Tuple[Optional[Dict], str]:
+        """
+        입력 검증, 영양성분 정보 조회, 프롬프트 생성 (동기/비동기 분석 공통)
+
+        Returns:
+            Tuple[Optional[Dict], str]: (영양성분 정보, 사용자 프롬프트)
+
+        Raises:
+            ValueError: 리뷰 텍스트가 10자 미만인 경우
+        """
         # 입력 검증: 리뷰가 너무 짧으면 오류 반환
         if len(review_text.strip()) < 10:
             raise ValueError("리뷰 텍스트가 너무 짧습니다 (최소 10자 이상)")
@@ -143,46 +193,89 @@ class PharmacistAnalyzer:
         
         # 2. AI 프롬프트 생성 (영양성분 정보가 있으면 포함, 없으면 기본 프롬프트)
         user_prompt = self._build_enhanced_prompt(review_text, nutrition_info)
+        return nutrition_info, user_prompt
+
+    def _cache_key(
+        self,
+        review_text: str,
+        product_id: Optional[int],
+        nutrition_info: Optional[Dict],
+        model: str
+    ) -> Optional[str]:
+        """분석 결과 캐시 키 (캐시를 사용하지 않으면 None)"""
+        if self.result_cache is None:
+            return None
+        return self.result_cache.make_key(
+            review_text, product_id, nutrition_info, model, self.PROMPT_VERSION
+        )
+
+    def _message_params(self, user_prompt: str, model: str) -> Dict:
+        """
+        Messages API 요청 파라미터
 
-        try:
-            # 3. Anthropic API 호출
-            response = self.client.messages.create(
-                model=model,
-                max_tokens=1000,
-                temperature=0.3,  # 일관성 있는 분석을 위해 낮은 temperature
-                system=self.SYSTEM_PROMPT,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ]
-            )
+        temperature는 extra_body로 전달합니다. 최신 SDK의 messages.create()는
+        temperature 키워드를 받지 않지만, 요청 본문은 이전과 동일합니다.
+        """
+        return {
+            "model": model,
+            "max_tokens": 1000,
+            "system": self.SYSTEM_PROMPT,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": user_prompt
+                }
+            ],
+            "extra_body": {
+                "temperature": 0.3  # 일관성 있는 분석을 위해 낮은 temperature
+            }
+        }
 
-            # 4. JSON 파싱
-            content = response.content[0].text
-            result = json.loads(content)
+    def _parse_response(
+        self,
+        response,
+        review_text: str,
+        nutrition_info: Optional[Dict] = None
+    ) -> Dict:
+        """
+        API 응답을 분석 결과로 변환
 
-            # 5. 필수 필드 검증
-            required_fields = ["summary", "efficacy", "side_effects", "tip"]
-            for field in required_fields:
-                if field not in result:
-                    raise ValueError(f"필수 필드 누락: {field}")
+        Raises:
+            json.JSONDecodeError: JSON 파싱 실패
+            ValueError: 필수 필드 누락
+        """
+        # 4. JSON 파싱
+        content = response.content[0].text
+        result = json.loads(content)
+        return self._finalize_result(result, review_text, nutrition_info)
+
+    def _finalize_result(
+        self,
+        result: Dict,
+        review_text: str,
+        nutrition_info: Optional[Dict] = None
+    ) -> Dict:
+        """
+        파싱된 리뷰 1건의 결과 검증 및 부인 공지/성분 검증 추가
 
-            # 6. 부인 공지 추가
-            result["disclaimer"] = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
-            
-            # 7. 영양성분 검증 결과 추가 (있는 경우)
-            if nutrition_info:
-                ingredient_validation = self._validate_ingredients(review_text, nutrition_info)
-                result["ingredient_validation"] = ingredient_validation
+        Raises:
+            ValueError: 필수 필드 누락
+        """
+        # 5. 필수 필드 검증
+        required_fields = ["summary", "efficacy", "side_effects", "tip"]
+        for field in required_fields:
+            if field not in result:
+                raise ValueError(f"필수 필드 누락: {field}")
+
+        # 6. 부인 공지 추가
+        result["disclaimer"] = "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+        
+        # 7. 영양성분 검증 결과 추가 (있는 경우)
+        if nutrition_info:
+            ingredient_validation = self._validate_ingredients(review_text, nutrition_info)
+            result["ingredient_validation"] = ingredient_validation
 
-            return result
-
-        except json.JSONDecodeError as e:
-            raise Exception(f"AI 응답 파싱 실패: {e}")
-        except Exception as e:
-            raise Exception(f"AI 분석 중 오류 발생: {e}")
+        return result
 
     def _build_enhanced_prompt(
         self, 
@@ -209,18 +302,7 @@ class PharmacistAnalyzer:
 """
         
         if nutrition_info:
-            nutrition_section = f"""
-
-**제품 영양성분 정보:**
-{self._format_nutrition_info(nutrition_info)}
-
-**분석 시 주의사항:**
-1. 리뷰에서 언급된 성분이 위 영양성분 목록에 실제로 포함되어 있는지 확인하세요
-2. 리뷰의 효능 주장이 공식 효능 범위 내인지 검증하세요
-3. 허위 주장이나 과장된 표현이 있으면 ingredient_validation에 명시하세요
-4. 성분 함량 정보를 참고하여 효과의 현실성을 평가하세요
-"""
-            base_prompt += nutrition_section
+            base_prompt += self._nutrition_section(nutrition_info)
         
         base_prompt += """
 **분석 시 주의사항:**
@@ -234,6 +316,28 @@ class PharmacistAnalyzer:
         
         return base_prompt.format(review_text=review_text)
 
+    def _nutrition_section(self, nutrition_info: Dict) -> str:
+        """
+        프롬프트의 영양성분 정보 구간 생성
+        
+        Args:
+            nutrition_info: 영양성분 정보
+            
+        Returns:
+            str: 영양성분 목록과 검증 주의사항
+        """
+        return f"""
+
+**제품 영양성분 정보:**
+{self._format_nutrition_info(nutrition_info)}
+
+**분석 시 주의사항:**
+1. 리뷰에서 언급된 성분이 위 영양성분 목록에 실제로 포함되어 있는지 확인하세요
+2. 리뷰의 효능 주장이 공식 효능 범위 내인지 검증하세요
+3. 허위 주장이나 과장된 표현이 있으면 ingredient_validation에 명시하세요
+4. 성분 함량 정보를 참고하여 효과의 현실성을 평가하세요
+"""
+
     def _format_nutrition_info(self, nutrition_info: Dict) -> str:
         """
         영양성분 정보를 AI 프롬프트에 적합한 형식으로 포맷팅
@@ -277,7 +381,8 @@ class PharmacistAnalyzer:
             Dict: 검증 결과
         """
         try:
-            mentioned_ingredients = extract_ingredients(review_text)
+            # 체크리스트/신뢰도 점수 단계에서 추출한 성분명 재사용
+            mentioned_ingredients = list(get_review_features(review_text).ingredients)
             valid_ingredients = []
             invalid_ingredients = []
             
@@ -305,7 +410,8 @@ class PharmacistAnalyzer:
         self, 
         review_text: str, 
         product_id: Optional[int] = None,
-        model: str = "claude-sonnet-4-5-20250929"
+        model: str = "claude-sonnet-4-5-20250929",
+        use_cache: bool = True
     ) -> Dict:
         """
         안전한 분석 (오류 발생 시 기본값 반환, 영양성분 DB 통합)
@@ -314,33 +420,43 @@ class PharmacistAnalyzer:
             review_text: 분석할 리뷰 텍스트
             product_id: 제품 ID (선택적)
             model: 사용할 Claude 모델
+            use_cache: False면 캐시를 조회하지 않고 새로 분석
 
         Returns:
             Dict: 분석 결과 또는 오류 정보
         """
         try:
-            return self.analyze(review_text, product_id, model)
-        except ValueError as e:
+            return self.analyze(review_text, product_id, model, use_cache)
+        except Exception as e:
+            return self._error_result(e)
+
+    @staticmethod
+    def _error_result(error: Exception) -> Dict:
+        """analyze_safe 형식의 오류 결과 (입력 오류 / 분석 실패)"""
+        if isinstance(error, ValueError):
             return {
                 "error": "입력 오류",
-                "message": str(e),
+                "message": str(error),
                 "summary": "분석 불가",
                 "efficacy": "정보 없음",
                 "side_effects": "정보 없음",
                 "tip": "리뷰 내용이 부족하여 분석할 수 없습니다.",
                 "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
             }
-        except Exception as e:
-            return {
-                "error": "분석 실패",
-                "message": str(e),
-                "summary": "분석 실패",
-                "efficacy": "정보 없음",
-                "side_effects": "정보 없음",
-                "tip": "분석 중 오류가 발생했습니다.",
-                "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
-            }
-
-
-
-
+        return {
+            "error": "분석 실패",
+            "message": str(error),
+            "summary": "분석 실패",
+            "efficacy": "정보 없음",
+            "side_effects": "정보 없음",
+            "tip": "분석 중 오류가 발생했습니다.",
+            "disclaimer": "본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다."
+        }
+
+
+def _review_item(review: Union[str, Dict[str, Any]]) -> Tuple[str, Optional[int]]:
+    """리뷰 입력을 (리뷰 텍스트, 제품 ID)로 변환"""
+    if isinstance(review, str):
+        return review, None
+    review_text = review.get("review_text") or review.get("text") or review.get("body") or ""
+    return review_text, review.get("product_id")
@@ -0,0 +1,193 @@
+"""
+비동기 약사 인사이트 분석 모듈
+AsyncAnthropic 기반으로 여러 리뷰를 동시에 분석합니다.
+
+동작 방식:
+- 프롬프트 생성, 응답 파싱, 성분 검증은 PharmacistAnalyzer와 동일한 로직 재사용
+- 세마포어로 동시 요청 수 제한 (max_concurrency)
+- 429(요청 한도 초과)/5xx 응답은 retry-after 헤더만큼 기다린 뒤 재시도
+- 결과는 입력 리뷰 순서대로 반환 (개별 실패는 analyze_safe 형식의 오류 결과)
+- 영양성분 조회(Supabase)와 결과 캐시(SQLite)는 동기 I/O이므로 스레드에서 실행 (이벤트 루프 차단 방지)
+"""
+
+import asyncio
+import json
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from anthropic import APIStatusError, AsyncAnthropic
+
+from .analysis_cache import AnalysisResultCache
+from .analyzer import PharmacistAnalyzer, _review_item
+from .nutrition_utils import get_nutrition_info_many
+
+
+# 재시도 대상 HTTP 상태 코드 (요청 한도 초과, 서버 오류, 과부하)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504, 529}
+
+# retry-after 헤더가 없을 때의 지수 백오프 기본 대기 시간 (초)
+RETRY_BACKOFF_BASE = 0.5
+
+
+class AsyncPharmacistAnalyzer(PharmacistAnalyzer):
+    """PharmacistAnalyzer의 비동기 버전 (동시 분석 지원)"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        max_retries: int = 3,
+        max_retry_wait: float = 60.0,
+        result_cache: Optional[AnalysisResultCache] = None
+    ):
+        """
+        비동기 약사 분석기 초기화
+
+        Args:
+            api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+            base_url: API 주소 (None이면 기본값, 테스트용 스텁 서버 지정 가능)
+            max_retries: 429/5xx 응답 시 최대 재시도 횟수 (기본값: 3)
+            max_retry_wait: 재시도 1회당 최대 대기 시간 (초)
+            result_cache: 분석 결과 캐시 (None이면 ANALYSIS_CACHE_PATH 설정 시 공유 캐시)
+        """
+        super().__init__(api_key, result_cache)
+        self.max_retries = max_retries
+        self.max_retry_wait = max_retry_wait
+        # 재시도는 retry-after를 직접 처리하므로 SDK 자체 재시도는 끔
+        self.client = AsyncAnthropic(api_key=self.api_key, base_url=base_url, max_retries=0)
+
+    async def analyze(
+        self,
+        review_text: str,
+        product_id: Optional[int] = None,
+        model: str = "claude-sonnet-4-5-20250929",
+        use_cache: bool = True
+    ) -> Dict:
+        """
+        리뷰를 약사 페르소나로 분석 (비동기, PharmacistAnalyzer.analyze와 같은 결과 형식)
+
+        Raises:
+            ValueError: 리뷰 텍스트가 10자 미만인 경우
+            Exception: API 호출 실패 시
+        """
+        nutrition_info, user_prompt = await asyncio.to_thread(
+            self._prepare_request, review_text, product_id
+        )
+
+        # 캐시된 분석 결과가 있으면 API 호출 생략
+        cache_key = self._cache_key(review_text, product_id, nutrition_info, model)
+        if cache_key and use_cache:
+            cached = await asyncio.to_thread(self.result_cache.get, cache_key)
+            if cached is not None:
+                return cached
+
+        try:
+            response = await self._create_with_retry(self._message_params(user_prompt, model))
+            result = self._parse_response(response, review_text, nutrition_info)
+            if cache_key:
+                await asyncio.to_thread(self.result_cache.set, cache_key, result)
+            return result
+
+        except json.JSONDecodeError as e:
+            raise Exception(f"AI 응답 파싱 실패: {e}")
+        except Exception as e:
+            raise Exception(f"AI 분석 중 오류 발생: {e}")
+
+    async def analyze_safe(
+        self,
+        review_text: str,
+        product_id: Optional[int] = None,
+        model: str = "claude-sonnet-4-5-20250929",
+        use_cache: bool = True
+    ) -> Dict:
+        """안전한 비동기 분석 (오류 발생 시 analyze_safe 형식의 기본값 반환)"""
+        try:
+            return await self.analyze(review_text, product_id, model, use_cache)
+        except Exception as e:
+            return self._error_result(e)
+
+    async def analyze_many(
+        self,
+        reviews: Iterable[Union[str, Dict[str, Any]]],
+        max_concurrency: int = 5,
+        model: str = "claude-sonnet-4-5-20250929",
+        use_cache: bool = True
+    ) -> List[Dict]:
+        """
+        여러 리뷰 동시 분석 (동시 요청 수 제한)
+
+        Args:
+            reviews: 리뷰 텍스트 또는 리뷰 딕셔너리 목록
+                - 딕셔너리 키: review_text(또는 text/body), product_id(선택적)
+            max_concurrency: 최대 동시 요청 수 (기본값: 5)
+            model: 사용할 Claude 모델
+            use_cache: False면 캐시를 조회하지 않고 새로 분석
+
+        Returns:
+            List[Dict]: 입력 순서대로 정렬된 리뷰별 분석 결과
+        """
+        items = [_review_item(review) for review in reviews]
+
+        # 제품별 영양성분 정보는 분석 전에 한 번에 조회 (이후 캐시 적중)
+        product_ids = [product_id for _, product_id in items if product_id]
+        if product_ids:
+            await asyncio.to_thread(get_nutrition_info_many, product_ids)
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(review_text: str, product_id: Optional[int]) -> Dict:
+            async with semaphore:
+                return await self.analyze_safe(review_text, product_id, model, use_cache)
+
+        return list(await asyncio.gather(*(run(text, pid) for text, pid in items)))
+
+    async def _create_with_retry(self, params: Dict) -> Any:
+        """Messages API 호출 (429/5xx 응답 시 retry-after만큼 기다렸다가 재시도)"""
+        attempt = 0
+        while True:
+            try:
+                return await self.client.messages.create(**params)
+            except APIStatusError as e:
+                if e.status_code not in RETRYABLE_STATUS_CODES or attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(e, attempt))
+                attempt += 1
+
+    def _retry_delay(self, error: APIStatusError, attempt: int) -> float:
+        """
+        재시도 대기 시간 계산
+
+        retry-after-ms / retry-after(초) 헤더가 있으면 그 값을,
+        없으면 지수 백오프(0.5초, 1초, 2초, ...)를 사용합니다.
+        """
+        headers = getattr(error.response, "headers", None) or {}
+        for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+            value = headers.get(header)
+            if value is None:
+                continue
+            try:
+                return min(max(0.0, float(value) * scale), self.max_retry_wait)
+            except ValueError:
+                continue  # HTTP 날짜 형식 등은 무시
+        return min(RETRY_BACKOFF_BASE * (2 ** attempt), self.max_retry_wait)
+
+
+def analyze_many(
+    reviews: Iterable[Union[str, Dict[str, Any]]],
+    api_key: Optional[str] = None,
+    max_concurrency: int = 5,
+    model: str = "claude-sonnet-4-5-20250929"
+) -> List[Dict]:
+    """
+    여러 리뷰 동시 분석 편의 함수 (동기 코드에서 호출용)
+
+    Args:
+        reviews: 리뷰 텍스트 또는 리뷰 딕셔너리 목록
+        api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+        max_concurrency: 최대 동시 요청 수 (기본값: 5)
+        model: 사용할 Claude 모델
+
+    Returns:
+        List[Dict]: 입력 순서대로 정렬된 리뷰별 분석 결과
+    """
+    analyzer = AsyncPharmacistAnalyzer(api_key=api_key)
+    return asyncio.run(analyzer.analyze_many(reviews, max_concurrency, model))
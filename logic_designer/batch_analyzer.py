@@ -0,0 +1,280 @@
+"""
+약사 인사이트 일괄(배치) 분석 모듈
+Message Batches API로 저장된 리뷰 전체를 야간에 다시 분석할 때 사용합니다.
+
+동작 방식:
+- PharmacistAnalyzer와 같은 프롬프트(_build_enhanced_prompt)로 요청 생성
+- 요청을 메시지 배치로 제출하고 처리 완료까지 주기적으로 상태 확인
+- 결과(JSONL 스트림)를 analyze_safe와 같은 형식으로 변환하여 순차 반환
+- 진행 상황을 체크포인트 파일(JSONL)에 기록 → 중단 후 재실행 시
+  이미 제출한 배치는 다시 제출하지 않고, 받은 결과는 다시 받지 않음
+
+체크포인트 파일 형식 (한 줄에 하나의 이벤트):
+    {"type": "start", "fingerprint": 입력 지문}
+    {"type": "batch", "batch_id": 배치 ID, "custom_ids": [...]}
+    {"type": "result", "custom_id": 요청 ID, "result": 분석 결과}
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from anthropic import Anthropic
+
+from .analysis_cache import AnalysisResultCache
+from .analyzer import PharmacistAnalyzer, _review_item
+from .nutrition_utils import get_nutrition_info_many
+
+
+# 배치 하나에 담을 최대 요청 수 (API 제한 100,000건보다 작게)
+MAX_BATCH_REQUESTS = 10000
+
+
+class BatchPharmacistAnalyzer(PharmacistAnalyzer):
+    """Message Batches API 기반 약사 일괄 분석기"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        poll_interval: float = 30.0,
+        max_batch_requests: int = MAX_BATCH_REQUESTS,
+        result_cache: Optional[AnalysisResultCache] = None
+    ):
+        """
+        일괄 분석기 초기화
+
+        Args:
+            api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+            base_url: API 주소 (None이면 기본값, 테스트용 가짜 배치 서버 지정 가능)
+            poll_interval: 배치 상태 확인 간격 (초)
+            max_batch_requests: 배치 하나에 담을 최대 요청 수
+            result_cache: 분석 결과 캐시 (None이면 ANALYSIS_CACHE_PATH 설정 시 공유 캐시)
+        """
+        super().__init__(api_key, result_cache)
+        self.poll_interval = poll_interval
+        self.max_batch_requests = max_batch_requests
+        if base_url:
+            self.client = Anthropic(api_key=self.api_key, base_url=base_url)
+
+    def analyze_bulk(
+        self,
+        reviews: Iterable[Union[str, Dict[str, Any]]],
+        model: str = "claude-sonnet-4-5-20250929",
+        checkpoint_path: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        리뷰 일괄 분석 (입력 순서대로 결과 반환)
+
+        Args:
+            reviews: 리뷰 텍스트 또는 리뷰 딕셔너리 목록
+                - 딕셔너리 키: review_text(또는 text/body), product_id(선택적)
+            model: 사용할 Claude 모델
+            checkpoint_path: 체크포인트 파일 경로 (None이면 재개 불가)
+
+        Returns:
+            List[Dict]: 리뷰별 분석 결과 (analyze_safe와 같은 형식)
+        """
+        reviews = list(reviews)
+        results: List[Optional[Dict]] = [None] * len(reviews)
+        for index, result in self.iter_results(reviews, model, checkpoint_path):
+            results[index] = result
+        return results
+
+    def iter_results(
+        self,
+        reviews: Iterable[Union[str, Dict[str, Any]]],
+        model: str = "claude-sonnet-4-5-20250929",
+        checkpoint_path: Optional[str] = None
+    ) -> Iterator[Tuple[int, Dict]]:
+        """
+        리뷰 일괄 분석 (결과가 도착하는 대로 반환)
+
+        Args:
+            reviews: 리뷰 텍스트 또는 리뷰 딕셔너리 목록
+            model: 사용할 Claude 모델
+            checkpoint_path: 체크포인트 파일 경로 (None이면 재개 불가)
+
+        Yields:
+            Tuple[int, Dict]: (입력 리뷰 인덱스, analyze_safe 형식의 분석 결과)
+                순서는 배치 결과 도착 순서이며 입력 순서와 다를 수 있음
+
+        Raises:
+            ValueError: 체크포인트가 다른 입력/모델로 생성된 경우
+        """
+        items = [_review_item(review) for review in reviews]
+        checkpoint = _Checkpoint(checkpoint_path, _fingerprint(items, model))
+
+        # 1. 체크포인트에 이미 기록된 결과
+        for custom_id, result in checkpoint.results.items():
+            yield _index(custom_id), result
+
+        # 2. 제품별 영양성분 정보 일괄 조회 (이후 캐시 적중)
+        product_ids = [product_id for _, product_id in items if product_id]
+        if product_ids:
+            get_nutrition_info_many(product_ids)
+
+        # 3. 아직 제출하지 않은 리뷰의 요청 생성 (입력 오류, 캐시 적중은 바로 반환)
+        pending: Dict[str, Tuple[str, Optional[Dict], Optional[str]]] = {}
+        requests = []
+        for index, (review_text, product_id) in enumerate(items):
+            custom_id = _custom_id(index)
+            if custom_id in checkpoint.results:
+                continue
+
+            try:
+                nutrition_info, user_prompt = self._prepare_request(review_text, product_id)
+            except Exception as e:
+                result = self._error_result(e)
+                checkpoint.add_result(custom_id, result)
+                yield index, result
+                continue
+
+            cache_key = self._cache_key(review_text, product_id, nutrition_info, model)
+            cached = self.result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                checkpoint.add_result(custom_id, cached)
+                yield index, cached
+                continue
+
+            pending[custom_id] = (review_text, nutrition_info, cache_key)
+            if custom_id not in checkpoint.submitted:
+                requests.append({
+                    "custom_id": custom_id,
+                    "params": self._batch_params(user_prompt, model)
+                })
+
+        # 4. 새 요청은 배치 단위로 제출 (제출 즉시 체크포인트 기록)
+        batch_ids = list(checkpoint.batches)
+        for start in range(0, len(requests), self.max_batch_requests):
+            chunk = requests[start:start + self.max_batch_requests]
+            batch = self.client.messages.batches.create(requests=chunk)
+            checkpoint.add_batch(batch.id, [request["custom_id"] for request in chunk])
+            batch_ids.append(batch.id)
+
+        # 5. 배치별 처리 완료 대기 후 결과 스트리밍
+        for batch_id in batch_ids:
+            if not any(cid in pending for cid in checkpoint.batches.get(batch_id, [])):
+                continue
+            self._wait_for_batch(batch_id)
+
+            for entry in self.client.messages.batches.results(batch_id):
+                if entry.custom_id not in pending:
+                    continue
+                review_text, nutrition_info, cache_key = pending.pop(entry.custom_id)
+                result = self._convert_result(entry.result, review_text, nutrition_info)
+                if cache_key and "error" not in result:
+                    self.result_cache.set(cache_key, result)
+                checkpoint.add_result(entry.custom_id, result)
+                yield _index(entry.custom_id), result
+
+        # 6. 결과가 오지 않은 요청 (배치 만료 등)
+        for custom_id in list(pending):
+            pending.pop(custom_id)
+            result = self._error_result(Exception("AI 분석 중 오류 발생: 배치 결과 없음"))
+            checkpoint.add_result(custom_id, result)
+            yield _index(custom_id), result
+
+    def _batch_params(self, user_prompt: str, model: str) -> Dict:
+        """배치 요청 파라미터 (messages.create와 같은 요청 본문)"""
+        params = self._message_params(user_prompt, model)
+        params.update(params.pop("extra_body", {}))
+        return params
+
+    def _wait_for_batch(self, batch_id: str) -> None:
+        """배치 처리 완료까지 대기"""
+        while True:
+            batch = self.client.messages.batches.retrieve(batch_id)
+            if batch.processing_status == "ended":
+                return
+            time.sleep(self.poll_interval)
+
+    def _convert_result(
+        self,
+        batch_result: Any,
+        review_text: str,
+        nutrition_info: Optional[Dict]
+    ) -> Dict:
+        """배치 개별 결과를 analyze_safe 형식으로 변환"""
+        if batch_result.type != "succeeded":
+            return self._error_result(
+                Exception(f"AI 분석 중 오류 발생: 배치 요청 {batch_result.type}")
+            )
+        try:
+            return self._parse_response(batch_result.message, review_text, nutrition_info)
+        except json.JSONDecodeError as e:
+            return self._error_result(Exception(f"AI 응답 파싱 실패: {e}"))
+        except Exception as e:
+            return self._error_result(Exception(f"AI 분석 중 오류 발생: {e}"))
+
+
+class _Checkpoint:
+    """일괄 분석 진행 기록 (추가 전용 JSONL 파일)"""
+
+    def __init__(self, path: Optional[str], fingerprint: str):
+        self.path = path
+        self.batches: Dict[str, List[str]] = {}
+        self.submitted = set()
+        self.results: Dict[str, Dict] = {}
+
+        if not path:
+            return
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 중단 시 마지막 줄이 잘린 경우
+                    self._apply(event, fingerprint)
+        else:
+            self._write({"type": "start", "fingerprint": fingerprint})
+
+    def _apply(self, event: Dict, fingerprint: str) -> None:
+        """기록된 이벤트 반영"""
+        if event.get("type") == "start" and event.get("fingerprint") != fingerprint:
+            raise ValueError(f"체크포인트가 다른 입력으로 생성되었습니다: {self.path}")
+        if event.get("type") == "batch":
+            self.batches[event["batch_id"]] = event["custom_ids"]
+            self.submitted.update(event["custom_ids"])
+        elif event.get("type") == "result":
+            self.results[event["custom_id"]] = event["result"]
+
+    def add_batch(self, batch_id: str, custom_ids: List[str]) -> None:
+        self.batches[batch_id] = custom_ids
+        self.submitted.update(custom_ids)
+        self._write({"type": "batch", "batch_id": batch_id, "custom_ids": custom_ids})
+
+    def add_result(self, custom_id: str, result: Dict) -> None:
+        self.results[custom_id] = result
+        self._write({"type": "result", "custom_id": custom_id, "result": result})
+
+    def _write(self, event: Dict) -> None:
+        if not self.path:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+
+def _custom_id(index: int) -> str:
+    """배치 요청 ID (입력 리뷰 인덱스 기반)"""
+    return f"review-{index}"
+
+
+def _index(custom_id: str) -> int:
+    """배치 요청 ID → 입력 리뷰 인덱스"""
+    return int(custom_id.rsplit("-", 1)[1])
+
+
+def _fingerprint(items: List[Tuple[str, Optional[int]]], model: str) -> str:
+    """입력 리뷰 목록과 모델의 지문 (체크포인트 일치 확인용)"""
+    digest = hashlib.sha256(model.encode("utf-8"))
+    for review_text, product_id in items:
+        digest.update(json.dumps([review_text, product_id], ensure_ascii=False).encode("utf-8"))
+    digest.update(PharmacistAnalyzer.PROMPT_VERSION.encode("utf-8"))
+    return digest.hexdigest()
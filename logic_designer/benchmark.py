@@ -0,0 +1,550 @@
+"""
+logic_designer 처리량 벤치마크
+목업 리뷰 템플릿(database/mock_data.py)으로 만든 결정적(seed 고정) 한국어/영어 합성 코퍼스로
+단계별 처리량(리뷰/초)과 지연 시간(p50/p99)을 측정하고 기준값(baseline)과 비교합니다.
+
+측정 단계:
+- checklist: AdChecklist.check_ad_patterns (영양성분 DB 검증 포함)
+- extract_ingredients: 성분명 추출
+- trust_score: TrustScoreCalculator.calculate_final_score (영양성분 일치도 포함)
+- rating: RatingAnalyzer 평점 분석 (analyze_rating)
+- analyze: logic_designer.analyze() 전체 흐름 (검증 + 약사 분석)
+
+코퍼스:
+- synthetic: 목업 템플릿 조합 (일반적인 리뷰 분포)
+- pathological: 긴 스크랩 리뷰와 반복 문자 스팸 (정규식 역추적 최악 입력),
+  --safe-regex/--time-budget으로 체크리스트 안전 모드와 시간 예산 효과 측정
+
+외부 서비스는 호출하지 않음:
+- Supabase: 영양성분 조회를 고정된 목업 성분 정보로 대체
+- Anthropic: 고정된 JSON 응답을 돌려주는 가짜 클라이언트로 대체
+
+사용 예:
+    python -m logic_designer.benchmark --size 1k
+    python -m logic_designer.benchmark --size 100k --save-baseline output/benchmarks/100k.json
+    python -m logic_designer.benchmark --size 100k --baseline output/benchmarks/100k.json
+    python -m logic_designer.benchmark --size 1m --stages checklist,trust_score
+    python -m logic_designer.benchmark --corpus pathological --size 200 --safe-regex --time-budget 0.5
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from unittest import mock
+
+# 패키지 밖에서 실행해도 database 모듈을 찾을 수 있도록 프로젝트 루트 추가
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+import logic_designer
+from logic_designer import analyzer, ingredient_lexicon, nutrition_utils
+from logic_designer.checklist import AdChecklist
+from logic_designer.nutrition_utils import extract_ingredients
+from logic_designer.rule_engine import RuleTimeoutError
+from logic_designer.rating_analyzer import analyze_rating
+from logic_designer.trust_score import TrustScoreCalculator
+from database.mock_data import MOCK_PRODUCTS, NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+
+
+# 코퍼스 크기 별칭
+CORPUS_SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# 측정 단계 (실행 순서)
+STAGES = ("checklist", "extract_ingredients", "trust_score", "rating", "analyze")
+
+# pathological 코퍼스 기본 단계 (analyze()는 안전 모드를 쓰지 않으므로 제외)
+PATHOLOGICAL_STAGES = ("checklist", "extract_ingredients", "trust_score")
+
+# pathological 코퍼스 리뷰 최대 길이 (글자 수)
+PATHOLOGICAL_LENGTH = 20_000
+
+# 역추적을 유발하는 반복 조각 (패턴 앞부분만 있고 뒷부분은 없는 입력)
+PATHOLOGICAL_FRAGMENTS = ("무상", "100%", "단", "하루", "완전", "기적", "안", "함유", "!a", "~a")
+
+# 기준값 대비 처리량이 이 비율 이상 떨어지면 성능 저하로 판단
+DEFAULT_TOLERANCE = 0.2
+
+# 목업 템플릿의 영어 버전 (영어 리뷰 코퍼스용)
+ENGLISH_NORMAL_TEMPLATES = [
+    "I have been taking it for about a month and my eyes feel less tired. I work on a computer all day so I bought it.",
+    "This is my second purchase. Not sure about the effect yet but I will keep taking it for my eye health.",
+    "Good amount of lutein and a reasonable price. The capsules are easy to swallow.",
+    "Took it for two weeks and no noticeable change yet. I think I need to take it longer.",
+    "The capsule is a bit big and hard to swallow, but the product itself is fine.",
+    "Bought it for my parents' eye health and they are taking it well.",
+]
+ENGLISH_AD_TEMPLATES = [
+    "Wow this is amazing!!! I felt the effect right away!!! My vision went from 1.0 to 1.5!!! Best ever!!",
+    "My eyes got better in just 3 days! A miracle product! I strongly recommend it to everyone!",
+    "Perfect product!!! 100 out of 100!!! Fast effect, cheap price, fast shipping! I will buy it 1000 times!!!",
+    "Don't hesitate and buy it now! You will never regret it! I bought 10 bottles for my friends!",
+]
+
+# 영양성분 조회 대체값 (제품 공통 루테인 성분 정보)
+STUB_NUTRITION_INGREDIENTS = [
+    {"ingredient_name": "루테인", "official_efficacy": "노화로 인해 감소될 수 있는 황반색소밀도를 유지하여 눈 건강에 도움",
+     "typical_effect_period_days": 30},
+    {"ingredient_name": "지아잔틴", "official_efficacy": "눈 건강에 도움", "typical_effect_period_days": 30},
+]
+
+# 약사 분석 대체 응답
+STUB_ANALYSIS = {
+    "summary": "눈 피로 개선을 체감한 후기",
+    "efficacy": "루테인 섭취 후 눈 피로 감소를 보고함",
+    "side_effects": "언급 없음",
+    "tip": "꾸준히 3개월 이상 섭취를 권장"
+}
+
+
+# =====================================================
+# 합성 코퍼스
+# =====================================================
+
+def corpus_size(value: str) -> int:
+    """코퍼스 크기 해석 ("1k", "100k", "1m" 또는 정수)"""
+    key = str(value).strip().lower()
+    if key in CORPUS_SIZES:
+        return CORPUS_SIZES[key]
+    size = int(key.replace("_", "").replace(",", ""))
+    if size <= 0:
+        raise ValueError(f"코퍼스 크기는 1 이상이어야 합니다: {value}")
+    return size
+
+
+def generate_corpus(size: int, seed: int = 42, english_ratio: float = 0.3) -> Iterator[Dict[str, Any]]:
+    """
+    결정적 합성 리뷰 코퍼스 생성 (같은 size/seed면 항상 같은 리뷰)
+
+    정상:광고성 = 6:4 (mock_data와 동일), 한국어:영어 = 7:3 (기본값)
+    리뷰 텍스트는 모두 달라지도록 일련번호를 붙입니다 (리뷰 특징 캐시 적중 방지).
+
+    Args:
+        size: 리뷰 수
+        seed: 난수 seed
+        english_ratio: 영어 리뷰 비율
+
+    Yields:
+        Dict: {"id", "product_id", "language", "is_ad_template", "rating", "review_text",
+               "product_rating_avg", "product_rating_count", "length_score",
+               "repurchase_score", "monthly_use_score", "photo_score", "consistency_score"}
+    """
+    rng = random.Random(seed)
+    korean_normal = [t["body"] for t in NORMAL_REVIEW_TEMPLATES]
+    korean_ad = [t["body"] for t in AD_REVIEW_TEMPLATES]
+
+    for i in range(size):
+        is_ad = rng.random() < 0.4
+        english = rng.random() < english_ratio
+        if english:
+            templates = ENGLISH_AD_TEMPLATES if is_ad else ENGLISH_NORMAL_TEMPLATES
+        else:
+            templates = korean_ad if is_ad else korean_normal
+
+        # 1~3개 템플릿을 이어 붙여 길이 분포를 만듦
+        body = " ".join(rng.choice(templates) for _ in range(rng.randint(1, 3)))
+        product_index = rng.randrange(len(MOCK_PRODUCTS))
+        product = MOCK_PRODUCTS[product_index]
+
+        yield {
+            "id": i + 1,
+            "product_id": product_index + 1,
+            "language": "en" if english else "ko",
+            "is_ad_template": is_ad,
+            "rating": 5 if is_ad else rng.choice([3, 4, 4, 5]),
+            "review_text": f"{body} [{i + 1}]",
+            "product_rating_avg": product["rating_avg"],
+            "product_rating_count": product["rating_count"],
+            "length_score": rng.randint(20, 100),
+            "repurchase_score": rng.choice([0, 50, 100]),
+            "monthly_use_score": rng.choice([0, 50, 100]),
+            "photo_score": rng.choice([0, 0, 100]),
+            "consistency_score": rng.randint(30, 90)
+        }
+
+
+def generate_pathological_corpus(
+    size: int,
+    seed: int = 42,
+    length: int = PATHOLOGICAL_LENGTH
+) -> Iterator[Dict[str, Any]]:
+    """
+    긴 리뷰/반복 문자 스팸 코퍼스 생성 (generate_corpus와 같은 필드, 결정적)
+
+    유형 (순환):
+    - 반복 조각 스팸: "루테인 " + 조각 × N (줄바꿈 없음 → .* 가 줄 끝까지 역추적)
+    - 긴 스크랩 리뷰: 템플릿을 줄바꿈 없이 이어 붙인 긴 문단
+    - 두 조각 교대 반복: 서로 다른 패턴 앞부분을 번갈아 반복
+
+    Args:
+        size: 리뷰 수
+        seed: 난수 seed
+        length: 리뷰 최대 길이 (글자 수, 리뷰마다 length/4 ~ length)
+
+    Yields:
+        Dict: generate_corpus()와 같은 형식
+    """
+    rng = random.Random(seed)
+    templates = [t["body"] for t in NORMAL_REVIEW_TEMPLATES + AD_REVIEW_TEMPLATES] + \
+        ENGLISH_NORMAL_TEMPLATES + ENGLISH_AD_TEMPLATES
+
+    for review, i in zip(generate_corpus(size, seed), range(size)):
+        target = rng.randint(max(1, length // 4), max(1, length))
+        kind = i % 3
+        if kind == 0:
+            fragment = rng.choice(PATHOLOGICAL_FRAGMENTS)
+            text = "루테인 " + fragment * (target // len(fragment))
+        elif kind == 1:
+            parts = []
+            while sum(len(part) + 1 for part in parts) < target:
+                parts.append(rng.choice(templates))
+            text = " ".join(parts)
+        else:
+            first, second = rng.sample(PATHOLOGICAL_FRAGMENTS, 2)
+            text = "루테인 " + (first + " " + second + " ") * (target // (len(first) + len(second) + 2))
+
+        review["review_text"] = f"{text[:target]} [{i + 1}]"
+        yield review
+
+
+CORPORA = {"synthetic": generate_corpus, "pathological": generate_pathological_corpus}
+
+
+# =====================================================
+# 외부 서비스 대체
+# =====================================================
+
+class _StubMessages:
+    """고정된 분석 JSON을 돌려주는 messages 엔드포인트"""
+
+    def __init__(self):
+        self.calls = 0
+        self._text = json.dumps(STUB_ANALYSIS, ensure_ascii=False)
+
+    def create(self, **kwargs):
+        self.calls += 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(type="text", text=self._text)],
+            usage=SimpleNamespace(input_tokens=0, output_tokens=0)
+        )
+
+
+def _stub_anthropic(messages: _StubMessages) -> type:
+    """Anthropic 클라이언트 대체 클래스 (네트워크 호출 없음, messages 엔드포인트 공유)"""
+
+    class StubAnthropic:
+        def __init__(self, *args, **kwargs):
+            self.messages = messages
+
+    return StubAnthropic
+
+
+@contextmanager
+def stub_external_services():
+    """
+    Supabase 영양성분 조회와 Anthropic API 호출을 대체하는 컨텍스트
+
+    성분 사전도 nutrition_info 조회 없이 기본 성분 목록으로 미리 만들어 두므로
+    첫 측정에 사전 생성(DB 조회) 시간이 섞이지 않습니다.
+
+    Yields:
+        SimpleNamespace: {"nutrition_fetches": 영양성분 조회 횟수,
+                          "lexicon_loads": 성분 사전용 nutrition_info 조회 횟수,
+                          "messages": 가짜 messages 엔드포인트}
+    """
+    calls = SimpleNamespace(nutrition_fetches=0, lexicon_loads=0, messages=_StubMessages())
+
+    def fetch_nutrition_info(product_id):
+        calls.nutrition_fetches += 1
+        return {"ingredients": STUB_NUTRITION_INGREDIENTS, "product_id": product_id}
+
+    def load_nutrition_rows(*args, **kwargs):
+        calls.lexicon_loads += 1
+        return []
+
+    with mock.patch.object(nutrition_utils, "_fetch_nutrition_info", fetch_nutrition_info), \
+            mock.patch.object(ingredient_lexicon, "_load_nutrition_rows", load_nutrition_rows), \
+            mock.patch.object(ingredient_lexicon, "_lexicon",
+                              ingredient_lexicon.IngredientLexicon.from_nutrition_rows([])), \
+            mock.patch.object(ingredient_lexicon, "_lexicon_retry_at", None), \
+            mock.patch.object(analyzer, "Anthropic", _stub_anthropic(calls.messages)), \
+            mock.patch.dict(os.environ, {"ANTHROPIC_API_KEY": "benchmark-stub"}):
+        os.environ.pop("ANALYSIS_CACHE_PATH", None)
+        nutrition_utils.invalidate_nutrition_cache()
+        try:
+            yield calls
+        finally:
+            nutrition_utils.invalidate_nutrition_cache()
+
+
+# =====================================================
+# 측정
+# =====================================================
+
+def _stage_functions(
+    safe_regex: bool = False,
+    time_budget: Optional[float] = None
+) -> Dict[str, Callable[[Dict[str, Any]], Any]]:
+    """단계별 리뷰 1건 처리 함수 (체크리스트는 안전 모드/시간 예산 적용)"""
+    checklist = AdChecklist(safe_mode=safe_regex, time_budget=time_budget)
+    calculator = TrustScoreCalculator()
+
+    def trust_score(review):
+        return calculator.calculate_final_score(
+            length_score=review["length_score"],
+            repurchase_score=review["repurchase_score"],
+            monthly_use_score=review["monthly_use_score"],
+            photo_score=review["photo_score"],
+            consistency_score=review["consistency_score"],
+            penalty_count=2 if review["is_ad_template"] else 0,
+            review_text=review["review_text"],
+            product_id=review["product_id"]
+        )
+
+    def full_analyze(review):
+        return logic_designer.analyze(
+            review["review_text"],
+            product_id=review["product_id"],
+            length_score=review["length_score"],
+            repurchase_score=review["repurchase_score"],
+            monthly_use_score=review["monthly_use_score"],
+            photo_score=review["photo_score"],
+            consistency_score=review["consistency_score"]
+        )
+
+    return {
+        "checklist": lambda review: checklist.check_ad_patterns(review["review_text"], review["product_id"]),
+        "extract_ingredients": lambda review: extract_ingredients(review["review_text"]),
+        "trust_score": trust_score,
+        "rating": lambda review: analyze_rating(
+            review["rating"], review["product_rating_avg"], review["product_rating_count"]
+        ),
+        "analyze": full_analyze
+    }
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def measure_stage(
+    func: Callable[[Dict[str, Any]], Any],
+    reviews: Iterator[Dict[str, Any]]
+) -> Dict[str, float]:
+    """
+    단계 1개 측정 (리뷰마다 호출 시간 기록, 시간 예산 초과는 건수만 기록하고 계속)
+
+    Returns:
+        Dict: {"reviews", "timeouts", "total_s", "reviews_per_sec", "p50_ms", "p99_ms"}
+    """
+    latencies = []
+    timeouts = 0
+    clock = time.perf_counter_ns
+    for review in reviews:
+        started = clock()
+        try:
+            func(review)
+        except RuleTimeoutError:
+            timeouts += 1
+        latencies.append(clock() - started)
+
+    total_ns = sum(latencies)
+    latencies.sort()
+    return {
+        "reviews": len(latencies),
+        "timeouts": timeouts,
+        "total_s": round(total_ns / 1e9, 4),
+        "reviews_per_sec": round(len(latencies) / (total_ns / 1e9), 1) if total_ns else 0.0,
+        "p50_ms": round(_percentile(latencies, 50) / 1e6, 4),
+        "p99_ms": round(_percentile(latencies, 99) / 1e6, 4)
+    }
+
+
+def run_benchmark(
+    size: int = 1_000,
+    stages: Optional[List[str]] = None,
+    seed: int = 42,
+    progress: bool = False,
+    corpus: str = "synthetic",
+    safe_regex: bool = False,
+    time_budget: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    벤치마크 실행 (외부 서비스 대체 상태)
+
+    Args:
+        size: 코퍼스 리뷰 수
+        stages: 측정할 단계 (None이면 코퍼스별 기본 단계)
+        seed: 코퍼스 seed
+        progress: 단계별 진행 상황 출력 여부 (stderr)
+        corpus: "synthetic" 또는 "pathological"
+        safe_regex: 체크리스트 안전 모드 사용 여부
+        time_budget: 리뷰 1건 체크리스트 시간 예산(초)
+
+    Returns:
+        Dict: {"size", "seed", "corpus", "safe_regex", "time_budget", "python", "platform", "created_at",
+               "stages": {단계: {"reviews", "timeouts", "total_s", "reviews_per_sec", "p50_ms", "p99_ms"}}}
+    """
+    if corpus not in CORPORA:
+        raise ValueError(f"알 수 없는 코퍼스입니다: {corpus} (가능: {', '.join(CORPORA)})")
+    stages = list(stages or (PATHOLOGICAL_STAGES if corpus == "pathological" else STAGES))
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계입니다: {', '.join(unknown)} (가능: {', '.join(STAGES)})")
+
+    results = {}
+    with stub_external_services():
+        functions = _stage_functions(safe_regex, time_budget)
+        for stage in stages:
+            if progress:
+                print(f"[benchmark] {stage} ({size:,} reviews)...", file=sys.stderr, flush=True)
+            # 단계마다 같은 코퍼스를 다시 생성 (메모리에 전체 코퍼스를 두지 않음)
+            results[stage] = measure_stage(functions[stage], CORPORA[corpus](size, seed))
+
+    return {
+        "size": size,
+        "seed": seed,
+        "corpus": corpus,
+        "safe_regex": safe_regex,
+        "time_budget": time_budget,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "stages": results
+    }
+
+
+# =====================================================
+# 기준값 저장/비교
+# =====================================================
+
+def save_baseline(results: Dict[str, Any], path: str) -> None:
+    """벤치마크 결과를 기준값 파일(JSON)로 저장"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """기준값 파일 읽기"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_with_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """
+    기준값과 비교하여 처리량이 떨어진 단계 찾기
+
+    Args:
+        results: run_benchmark() 결과
+        baseline: 기준값 (같은 형식)
+        tolerance: 허용 감소 비율 (기본값: 0.2 → 20% 이상 느려지면 성능 저하)
+
+    Returns:
+        List[Dict]: [{"stage", "baseline", "current", "change"}] (change: 처리량 변화율)
+    """
+    regressions = []
+    for stage, current in results["stages"].items():
+        previous = baseline.get("stages", {}).get(stage)
+        if not previous or not previous.get("reviews_per_sec"):
+            continue
+        change = current["reviews_per_sec"] / previous["reviews_per_sec"] - 1
+        if change < -tolerance:
+            regressions.append({
+                "stage": stage,
+                "baseline": previous["reviews_per_sec"],
+                "current": current["reviews_per_sec"],
+                "change": round(change, 4)
+            })
+    return regressions
+
+
+def format_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    """결과 표 (기준값이 있으면 처리량 변화율 포함)"""
+    lines = [
+        f"corpus: {results.get('corpus', 'synthetic')} {results['size']:,} reviews (seed={results['seed']}), "
+        f"safe_regex={results.get('safe_regex', False)}, python {results['python']}",
+        f"{'stage':<22}{'reviews/s':>14}{'p50 ms':>10}{'p99 ms':>10}{'timeouts':>10}{'vs baseline':>14}"
+    ]
+    for stage, stats in results["stages"].items():
+        previous = (baseline or {}).get("stages", {}).get(stage)
+        change = ""
+        if previous and previous.get("reviews_per_sec"):
+            change = f"{stats['reviews_per_sec'] / previous['reviews_per_sec'] - 1:+.1%}"
+        lines.append(
+            f"{stage:<22}{stats['reviews_per_sec']:>14,.1f}{stats['p50_ms']:>10.3f}"
+            f"{stats['p99_ms']:>10.3f}{stats.get('timeouts', 0):>10,}{change:>14}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 진입점 (기준값 대비 성능 저하가 있으면 1 반환)"""
+    parser = argparse.ArgumentParser(
+        prog="python -m logic_designer.benchmark",
+        description="logic_designer 단계별 처리량/지연 시간 벤치마크 (Supabase/Anthropic 호출 없음)"
+    )
+    parser.add_argument("--size", default="1k", help="코퍼스 크기: 1k, 100k, 1m 또는 정수 (기본값: 1k)")
+    parser.add_argument("--stages", default=None,
+                        help=f"측정할 단계 (쉼표 구분, 기본값: {','.join(STAGES)})")
+    parser.add_argument("--corpus", choices=list(CORPORA), default="synthetic",
+                        help="코퍼스 종류 (기본값: synthetic)")
+    parser.add_argument("--safe-regex", action="store_true", help="체크리스트 안전 모드 (반복 길이 제한)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="리뷰 1건 체크리스트 시간 예산(초), 초과 건수는 timeouts로 기록 (안전 모드 포함)")
+    parser.add_argument("--seed", type=int, default=42, help="코퍼스 seed (기본값: 42)")
+    parser.add_argument("--baseline", default=None, help="비교할 기준값 파일 (JSON)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"허용 처리량 감소 비율 (기본값: {DEFAULT_TOLERANCE})")
+    parser.add_argument("--save-baseline", default=None, help="결과를 기준값 파일로 저장")
+    args = parser.parse_args(argv)
+
+    try:
+        size = corpus_size(args.size)
+        stages = [stage.strip() for stage in (args.stages or "").split(",") if stage.strip()]
+        baseline = load_baseline(args.baseline) if args.baseline else None
+        results = run_benchmark(
+            size, stages or None, seed=args.seed, progress=True, corpus=args.corpus,
+            safe_regex=args.safe_regex, time_budget=args.time_budget
+        )
+    except (OSError, ValueError) as e:
+        print(f"[benchmark] 오류: {e}", file=sys.stderr)
+        return 1
+
+    print(format_results(results, baseline))
+
+    if args.save_baseline:
+        save_baseline(results, args.save_baseline)
+        print(f"기준값 저장: {args.save_baseline}")
+
+    if baseline:
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        for item in regressions:
+            print(f"성능 저하: {item['stage']} {item['baseline']:,.1f} → {item['current']:,.1f} reviews/s "
+                  f"({item['change']:+.1%})")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
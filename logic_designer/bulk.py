@@ -0,0 +1,553 @@
+"""
+대량 리뷰 규칙 기반 채점 CLI
+리뷰 덤프(CSV/JSONL/JSON)를 청크 단위로 읽어 프로세스 풀에서 체크리스트와
+신뢰도 점수를 계산하고 JSONL 또는 Parquet으로 저장합니다. (AI 분석은 하지 않음)
+
+사용 예:
+    python -m logic_designer.bulk reviews_rows.csv -o scores.jsonl
+    python -m logic_designer.bulk data/reviews.json -o scores.parquet --workers 8
+    python -m logic_designer.bulk reviews_rows.csv -o scores.jsonl --encoding cp949
+    python -m logic_designer.bulk reviews.json -o scores.jsonl --previous scores.jsonl
+    python -m logic_designer.bulk scraped.jsonl -o scores.jsonl --safe-regex --time-budget 0.5
+
+동작 방식:
+- 입력은 청크(기본 1,000건) 단위로 스트리밍 → 메모리 사용량은 청크 수에만 비례
+- 워커 프로세스는 시작 시 체크리스트 규칙 엔진을 한 번 컴파일하고 계속 재사용
+- 결과는 입력 순서대로 기록, 청크마다 진행 상황과 처리량(리뷰/초)을 stderr에 출력
+- 규칙 기반 경로는 프로세스 간 공유 상태가 없으므로 코어 수에 비례하여 확장
+
+증분 재채점 (--previous):
+- 결과마다 규칙 세트 버전(rule_set_version)과 리뷰 입력 해시(input_hash)를 기록
+- 이전 결과 파일을 주면 두 값이 모두 같은 행은 이전 결과를 재사용하고,
+  규칙(AD_PATTERNS, 임계값, 가중치)이나 리뷰 내용이 바뀐 행만 다시 계산
+- 재사용(skipped)/재계산(recomputed) 건수를 함께 보고
+
+긴 리뷰/스팸 대비 (--safe-regex, --time-budget):
+- 안전 모드는 체크리스트의 .*/.+ 반복을 제한하여 검색 시간을 리뷰 길이에 비례하게 유지
+- 시간 예산을 넘긴 리뷰는 워커를 붙잡지 않고 error="RULE_TIMEOUT"으로 기록
+  (--time-budget은 안전 모드를 함께 켜서 검색 하나가 제한 없이 실행되지 않게 함)
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    pq = None
+    PYARROW_AVAILABLE = False
+
+# 패키지 밖에서 실행해도 database 모듈을 찾을 수 있도록 프로젝트 루트 추가
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
+
+from logic_designer import SCORE_FIELDS, get_nutrition_info_many, validate_review
+from logic_designer.checklist import AdChecklist
+from logic_designer.rule_version import review_input_hash, rule_set_fingerprint
+from logic_designer.trust_score import TrustScoreCalculator
+
+
+# 기본 청크 크기 (워커에 한 번에 넘기는 리뷰 수)
+DEFAULT_CHUNK_SIZE = 1000
+
+# 리뷰 텍스트/ID/제품 ID로 인식하는 입력 필드 (앞쪽 우선)
+TEXT_FIELDS = ("review_text", "body", "text")
+ID_FIELDS = ("id", "review_id", "source_review_id")
+
+# 출력 레코드 필드 (Parquet 스키마 순서)
+OUTPUT_FIELDS = (
+    "row", "review_id", "product_id", "rule_set_version", "input_hash", "trust_score", "is_ad", "base_score",
+    "nutrition_score", "penalty", "detected_count", "checklist_items", "reasons", "error"
+)
+
+
+# =====================================================
+# 입력 읽기
+# =====================================================
+
+def read_reviews(path: str, encoding: str = "utf-8-sig") -> Iterator[Dict[str, Any]]:
+    """
+    리뷰 파일을 한 줄(행)씩 읽기
+
+    Args:
+        path: 입력 파일 경로 (.csv, .jsonl/.ndjson, .json)
+        encoding: 파일 인코딩 (reviews_rows.csv 같은 엑셀 저장본은 cp949)
+
+    Yields:
+        Dict: 리뷰 행
+    """
+    extension = os.path.splitext(path)[1].lower()
+
+    with open(path, encoding=encoding, newline="") as f:
+        if extension == ".csv":
+            yield from csv.DictReader(f)
+        elif extension in (".jsonl", ".ndjson"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        elif extension == ".json":
+            # export_supabase_data.py 출력 (JSON 배열)
+            data = json.load(f)
+            yield from (data if isinstance(data, list) else [data])
+        else:
+            raise ValueError(f"지원하지 않는 입력 형식입니다: {path}")
+
+
+def _chunks(rows: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    """행을 size개씩 묶기"""
+    iterator = iter(rows)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# =====================================================
+# 채점 (워커 프로세스)
+# =====================================================
+
+# 워커별 엔진 (초기화 시 한 번 생성, 규칙 엔진 컴파일 유지)
+_worker_engines: Dict[str, Any] = {}
+
+
+def _init_worker(safe_regex: bool = False, time_budget: Optional[float] = None) -> None:
+    """
+    워커 초기화: 체크리스트 규칙 엔진 컴파일, 엔진 객체 생성
+
+    Args:
+        safe_regex: 체크리스트 안전 모드 (반복 길이 제한)
+        time_budget: 리뷰 1건 체크리스트 시간 예산(초)
+            (패턴 검색 사이에만 확인, 진행 중인 re.search 하나는 중단하지 못함)
+    """
+    # 시간 예산은 안전 모드 엔진에서만 검색 하나의 비용까지 제한됨
+    AdChecklist.get_rule_engine(safe_regex or time_budget is not None)
+    _worker_engines["checklist"] = AdChecklist(safe_mode=safe_regex, time_budget=time_budget)
+    _worker_engines["calculator"] = TrustScoreCalculator()
+
+
+def _score_chunk(
+    indexed_rows: List[Tuple[int, Dict[str, Any]]],
+    use_nutrition_validation: bool,
+    rule_version: str
+) -> List[Dict[str, Any]]:
+    """
+    리뷰 청크 채점 (광고 패턴 검사 + 신뢰도 점수 + 광고 판별)
+
+    영양성분 검증을 사용하면 청크에 등장하는 제품의 영양성분 정보를
+    get_nutrition_info_many()로 한 번에 조회한 뒤 채점하므로 리뷰마다 DB를 조회하지 않습니다.
+
+    Args:
+        indexed_rows: (입력 행 번호, 리뷰 행) 목록
+        use_nutrition_validation: 영양성분 검증 사용 여부
+        rule_version: 규칙 세트 버전 (rule_set_fingerprint)
+
+    Returns:
+        List[Dict]: OUTPUT_FIELDS 형식의 결과 레코드
+    """
+    if not _worker_engines:
+        _init_worker()
+
+    if use_nutrition_validation:
+        get_nutrition_info_many(row.get("product_id") or None for _, row in indexed_rows)
+
+    return [
+        score_review(row, row_number, use_nutrition_validation, rule_version)
+        for row_number, row in indexed_rows
+    ]
+
+
+def score_review(
+    row: Dict[str, Any],
+    row_number: int = 0,
+    use_nutrition_validation: bool = False,
+    rule_version: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    리뷰 1건 채점 (안전한 방식, 실패 시 error 필드에 사유 기록)
+
+    Args:
+        row: 리뷰 행 (review_text/body/text, id, product_id, 점수 필드)
+        row_number: 입력 행 번호
+        use_nutrition_validation: 영양성분 검증 사용 여부
+        rule_version: 규칙 세트 버전 (None이면 현재 규칙으로 계산)
+
+    Returns:
+        Dict: OUTPUT_FIELDS 형식의 결과 레코드
+    """
+    if not _worker_engines:
+        _init_worker()
+
+    record = dict.fromkeys(OUTPUT_FIELDS)
+    record["row"] = row_number
+    record["review_id"] = _first(row, ID_FIELDS)
+    record["product_id"] = row.get("product_id") or None
+    if rule_version is None:
+        checklist = _worker_engines["checklist"]
+        rule_version = rule_set_fingerprint(
+            use_nutrition_validation=use_nutrition_validation,
+            safe_regex=checklist.safe_mode,
+            time_budget=checklist.time_budget
+        )
+    record["rule_set_version"] = rule_version
+
+    try:
+        review_text = _first(row, TEXT_FIELDS)
+        record["input_hash"] = review_input_hash(review_text, row)
+        if not isinstance(review_text, str):
+            raise ValueError("리뷰 텍스트(review_text)가 없습니다")
+
+        validation = validate_review(
+            review_text,
+            product_id=record["product_id"],
+            use_nutrition_validation=use_nutrition_validation,
+            checklist=_worker_engines["checklist"],
+            calculator=_worker_engines["calculator"],
+            **_scores(row)
+        )
+        if "error" in validation:
+            record["error"] = validation["error"]
+            return record
+
+        record.update({
+            "trust_score": validation["trust_score"],
+            "is_ad": validation["is_ad"],
+            "base_score": validation["base_score"],
+            "nutrition_score": validation.get("nutrition_score"),
+            "penalty": validation["penalty"],
+            "detected_count": validation["detected_count"],
+            "checklist_items": [int(reason.split(".", 1)[0]) for reason in validation["reasons"]],
+            "reasons": validation["reasons"]
+        })
+    except Exception as e:
+        record["error"] = str(e)
+
+    return record
+
+
+def _first(row: Dict[str, Any], fields: Iterable[str]) -> Any:
+    """여러 후보 필드 중 처음으로 값이 있는 필드의 값"""
+    for field in fields:
+        value = row.get(field)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+def _scores(row: Dict[str, Any]) -> Dict[str, float]:
+    """행에 있는 점수 필드 (CSV 문자열은 숫자로 변환, 빈 값은 기본값 사용)"""
+    scores = {}
+    for field in SCORE_FIELDS:
+        value = row.get(field)
+        if value not in (None, ""):
+            scores[field] = float(value)
+    return scores
+
+
+# =====================================================
+# 출력 쓰기
+# =====================================================
+
+class _JsonlWriter:
+    """JSONL 결과 쓰기"""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """Parquet 결과 쓰기 (청크마다 행 그룹 하나)"""
+
+    def __init__(self, path: str):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet 출력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        self._schema = pa.schema([
+            ("row", pa.int64()),
+            ("review_id", pa.string()),
+            ("product_id", pa.string()),
+            ("rule_set_version", pa.string()),
+            ("input_hash", pa.string()),
+            ("trust_score", pa.float64()),
+            ("is_ad", pa.bool_()),
+            ("base_score", pa.float64()),
+            ("nutrition_score", pa.float64()),
+            ("penalty", pa.float64()),
+            ("detected_count", pa.int64()),
+            ("checklist_items", pa.list_(pa.int64())),
+            ("reasons", pa.list_(pa.string())),
+            ("error", pa.string()),
+        ])
+        self._writer = pq.ParquetWriter(path, self._schema)
+
+    def write(self, records: List[Dict[str, Any]]) -> None:
+        columns = {field: [record[field] for record in records] for field in OUTPUT_FIELDS}
+        for field in ("review_id", "product_id"):
+            columns[field] = [None if value is None else str(value) for value in columns[field]]
+        self._writer.write_table(pa.table(columns, schema=self._schema))
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def _open_writer(path: str, output_format: Optional[str]):
+    """출력 형식에 맞는 결과 쓰기 객체 (형식 미지정 시 확장자로 판단)"""
+    if output_format is None:
+        output_format = "parquet" if path.lower().endswith(".parquet") else "jsonl"
+    if output_format == "parquet":
+        return _ParquetWriter(path)
+    if output_format == "jsonl":
+        return _JsonlWriter(path)
+    raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+
+
+def load_previous_results(path: str, rule_version: str) -> Dict[str, Dict[str, Any]]:
+    """
+    이전 결과 파일에서 재사용 가능한 결과 읽기
+
+    Args:
+        path: 이전 결과 파일 (.jsonl 또는 .parquet)
+        rule_version: 현재 규칙 세트 버전 (버전이 다른 결과는 제외)
+
+    Returns:
+        Dict: {input_hash: 결과 레코드} (시간 예산 초과(RULE_TIMEOUT) 행은 다시 계산하도록 제외)
+    """
+    if path.lower().endswith(".parquet"):
+        if not PYARROW_AVAILABLE:
+            raise ImportError("Parquet 입력에는 pyarrow가 필요합니다 (pip install pyarrow)")
+        records = pq.read_table(path).to_pylist()
+    else:
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f if line.strip()]
+
+    return {
+        record["input_hash"]: record
+        for record in records
+        if record.get("rule_set_version") == rule_version
+        and record.get("input_hash")
+        and record.get("error") != "RULE_TIMEOUT"
+    }
+
+
+def _reuse_previous(
+    start_row: int,
+    rows: List[Dict[str, Any]],
+    previous: Dict[str, Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], List[Tuple[int, Dict[str, Any]]]]:
+    """
+    청크를 재사용할 결과와 다시 계산할 행으로 나누기
+
+    Returns:
+        Tuple: (재사용 결과 레코드 목록, 다시 계산할 (행 번호, 행) 목록)
+    """
+    reused, pending = [], []
+    for offset, row in enumerate(rows):
+        row_number = start_row + offset
+        record = None
+        if previous:
+            review_text = _first(row, TEXT_FIELDS)
+            if isinstance(review_text, str):
+                record = previous.get(review_input_hash(review_text, row))
+        if record is None:
+            pending.append((row_number, row))
+        else:
+            record = dict(
+                record,
+                row=row_number,
+                review_id=_first(row, ID_FIELDS),
+                product_id=row.get("product_id") or None
+            )
+            reused.append(record)
+    return reused, pending
+
+
+def _merge(reused: List[Dict[str, Any]], computed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """재사용/재계산 결과를 입력 순서로 합치기"""
+    if not reused:
+        return computed
+    return sorted(reused + computed, key=lambda record: record["row"])
+
+
+# =====================================================
+# 실행
+# =====================================================
+
+def score_file(
+    input_path: str,
+    output_path: str,
+    output_format: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = "utf-8-sig",
+    use_nutrition_validation: bool = False,
+    progress: bool = True,
+    previous_path: Optional[str] = None,
+    safe_regex: bool = False,
+    time_budget: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    리뷰 파일 전체 채점
+
+    Args:
+        input_path: 입력 파일 경로 (.csv, .jsonl, .json)
+        output_path: 출력 파일 경로 (.jsonl 또는 .parquet)
+        output_format: "jsonl" 또는 "parquet" (None이면 출력 확장자로 판단)
+        workers: 워커 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 실행)
+        chunk_size: 워커에 한 번에 넘기는 리뷰 수
+        encoding: 입력 파일 인코딩
+        use_nutrition_validation: 영양성분 검증 사용 여부 (Supabase 조회 발생)
+        progress: 진행 상황 출력 여부 (stderr)
+        previous_path: 이전 결과 파일 (규칙 세트 버전과 입력 해시가 같은 행은 재사용)
+        safe_regex: 체크리스트 안전 모드 (긴 리뷰/반복 문자 스팸에서도 검색 시간이 길이에 비례)
+        time_budget: 리뷰 1건 체크리스트 시간 예산(초), 초과한 행은 error="RULE_TIMEOUT"으로 기록
+            (패턴 검색 사이에만 확인하므로 진행 중인 re.search 하나는 중단하지 못함,
+             검색 하나의 비용을 제한하도록 지정하면 safe_regex도 켜짐)
+
+    Returns:
+        Dict: {"reviews": 처리 건수, "ads": 광고 판별 건수, "errors": 오류 건수,
+               "timeouts": 시간 초과 건수, "skipped": 재사용 건수, "recomputed": 재계산 건수,
+               "rule_set_version": 규칙 세트 버전,
+               "elapsed": 소요 시간(초), "reviews_per_sec": 처리량, "workers": 워커 수}
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    # 시간 예산은 안전 모드를 강제 (AdChecklist와 동일, 규칙 세트 버전에도 반영)
+    safe_regex = safe_regex or time_budget is not None
+    rule_version = rule_set_fingerprint(
+        use_nutrition_validation=use_nutrition_validation, safe_regex=safe_regex, time_budget=time_budget
+    )
+    stats = {"reviews": 0, "ads": 0, "errors": 0, "timeouts": 0, "skipped": 0, "recomputed": 0}
+    started = time.perf_counter()
+
+    # 출력 파일을 열기 전에 읽음 (이전 결과 파일에 덮어쓰는 경우)
+    previous = load_previous_results(previous_path, rule_version) if previous_path else {}
+
+    def record_chunk(reused: List[Dict[str, Any]], computed: List[Dict[str, Any]]) -> None:
+        records = _merge(reused, computed)
+        writer.write(records)
+        stats["skipped"] += len(reused)
+        stats["recomputed"] += len(computed)
+        stats["reviews"] += len(records)
+        stats["ads"] += sum(1 for record in records if record["is_ad"])
+        stats["errors"] += sum(1 for record in records if record["error"])
+        stats["timeouts"] += sum(1 for record in records if record["error"] == "RULE_TIMEOUT")
+        if progress:
+            elapsed = time.perf_counter() - started
+            rate = stats["reviews"] / elapsed if elapsed else 0.0
+            print(f"[bulk] {stats['reviews']:,} reviews | {rate:,.1f} reviews/s",
+                  file=sys.stderr, flush=True)
+
+    rows = read_reviews(input_path, encoding)
+    writer = _open_writer(output_path, output_format)
+    try:
+        if workers == 1:
+            _init_worker(safe_regex, time_budget)
+            start_row = 0
+            for chunk in _chunks(rows, chunk_size):
+                reused, to_score = _reuse_previous(start_row, chunk, previous)
+                record_chunk(reused, _score_chunk(to_score, use_nutrition_validation, rule_version))
+                start_row += len(chunk)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(safe_regex, time_budget)
+            ) as pool:
+                # 입력 순서를 유지하면서 워커 수의 2배까지만 청크를 미리 제출
+                pending = deque()
+                start_row = 0
+                for chunk in _chunks(rows, chunk_size):
+                    reused, to_score = _reuse_previous(start_row, chunk, previous)
+                    future = pool.submit(
+                        _score_chunk, to_score, use_nutrition_validation, rule_version
+                    ) if to_score else None
+                    pending.append((reused, future))
+                    start_row += len(chunk)
+                    if len(pending) >= workers * 2:
+                        reused, future = pending.popleft()
+                        record_chunk(reused, future.result() if future else [])
+                while pending:
+                    reused, future = pending.popleft()
+                    record_chunk(reused, future.result() if future else [])
+    finally:
+        writer.close()
+
+    elapsed = time.perf_counter() - started
+    stats["elapsed"] = round(elapsed, 3)
+    stats["reviews_per_sec"] = round(stats["reviews"] / elapsed, 1) if elapsed else 0.0
+    stats["workers"] = workers
+    stats["rule_set_version"] = rule_version
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(
+        prog="python -m logic_designer.bulk",
+        description="리뷰 덤프(CSV/JSONL/JSON)를 규칙 기반으로 대량 채점합니다 (AI 분석 없음)."
+    )
+    parser.add_argument("input", help="입력 파일 (.csv, .jsonl, .json)")
+    parser.add_argument("-o", "--output", required=True, help="출력 파일 (.jsonl 또는 .parquet)")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default=None,
+                        help="출력 형식 (기본값: 출력 파일 확장자로 판단)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="워커 프로세스 수 (기본값: CPU 수, 1이면 단일 프로세스)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"청크 크기 (기본값: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--encoding", default="utf-8-sig", help="입력 인코딩 (기본값: utf-8-sig)")
+    parser.add_argument("--nutrition", action="store_true",
+                        help="영양성분 DB 검증 사용 (청크마다 Supabase 일괄 조회)")
+    parser.add_argument("--safe-regex", action="store_true",
+                        help="체크리스트 안전 모드 (.*/.+ 반복 길이 제한, 긴 리뷰/스팸 대비)")
+    parser.add_argument("--time-budget", type=float, default=None,
+                        help="리뷰 1건 체크리스트 시간 예산(초), 초과 시 RULE_TIMEOUT으로 기록 (안전 모드 포함)")
+    parser.add_argument("--previous", default=None,
+                        help="이전 결과 파일 (규칙과 리뷰가 바뀌지 않은 행은 재사용)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="진행 상황 출력 안 함")
+    args = parser.parse_args(argv)
+
+    try:
+        stats = score_file(
+            args.input,
+            args.output,
+            output_format=args.format,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            encoding=args.encoding,
+            use_nutrition_validation=args.nutrition,
+            progress=not args.quiet,
+            previous_path=args.previous,
+            safe_regex=args.safe_regex,
+            time_budget=args.time_budget
+        )
+    except (OSError, ValueError, ImportError) as e:
+        print(f"[bulk] 오류: {e}", file=sys.stderr)
+        return 1
+
+    print(
+        f"[bulk] 완료: {stats['reviews']:,}건 (광고 {stats['ads']:,}건, 오류 {stats['errors']:,}건, 시간 초과 {stats['timeouts']:,}건, "
+        f"재사용 {stats['skipped']:,}건, 재계산 {stats['recomputed']:,}건), "
+        f"{stats['elapsed']}초, {stats['reviews_per_sec']:,} reviews/s, workers={stats['workers']}",
+        file=sys.stderr
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,11 +16,13 @@
 """
 
 import re
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Set
 from .product_criteria import ProductCheckCriteria
+from .rule_engine import DEFAULT_SAFE_WINDOW, CompiledRuleEngine, RuleTimeoutError, bound_pattern
+from .review_features import ReviewFeatures, get_review_features
 from .nutrition_utils import (
     get_nutrition_info_safe,
-    extract_ingredients,
     is_valid_ingredient,
     get_official_efficacy,
     get_typical_effect_period
@@ -115,19 +117,105 @@ class AdChecklist:
         }
     }
 
-    def __init__(self, criteria: Optional[ProductCheckCriteria] = None):
+    # 키워드 반복 임계값 (6번 항목, 제품별 기준이 없을 때)
+    # 개선 (2026-01-07): 임계값 5 → 7로 완화
+    KEYWORD_REPETITION_THRESHOLD = 7
+
+    # 개인 경험 표현 패턴 (4번 항목)
+    # 개선 (2026-01-07): 구매/사용, 체감, 재구매 표현 추가
+    PERSONAL_PATTERNS = [
+        # 1인칭 대명사
+        r"나는", r"저는", r"제가", r"내가", r"우리",
+        # 직접 경험
+        r"직접", r"실제로", r"먹어보니", r"사용해보니",
+        # 구매/사용 표현
+        r"구매", r"샀", r"사서", r"먹", r"사용", r"복용", r"써",
+        # 체감 표현
+        r"느", r"같아", r"되는", r"됐", r"했", r"해서",
+        # 재구매 및 지속 사용
+        r"재구매", r"또", r"다시", r"계속", r"리피트",
+        # 소유 표현
+        r"내", r"제", r"우리", r"아버지", r"어머니", r"부모님", r"가족"
+    ]
+
+    # 부정적 의견/단점 표현 패턴 (7번 항목)
+    NEGATIVE_PATTERNS = [
+        r"단점", r"아쉬", r"불편", r"별로", r"그런데",
+        r"하지만", r"다만", r"개선", r"부족", r"안.*좋"
+    ]
+
+    # 과장된 의학적 주장 패턴 (9번 항목 영양성분 DB 검증)
+    MEDICAL_CLAIM_PATTERNS = [
+        r"100%.*(회복|치료|완치)",
+        r"(완벽|완전).*(치료|회복|개선)",
+        r"(기적|놀라운|엄청난).*(효과|변화)",
+        r"(즉시|바로|단.*하루|일주일).*(효과|개선|변화)"
+    ]
+
+    # 비현실적인 효과 시점 표현 패턴 (10번 항목 영양성분 DB 검증)
+    UNREALISTIC_TIMELINE_PATTERNS = [
+        r"(즉시|바로|단.*하루|하루만에|일주일만에).*(효과|개선|변화|달라)",
+        r"(하루|일주일).*(만에|만).*(효과|개선|변화)"
+    ]
+
+    # 효과 발현이 2주 이상 걸리는 성분에 대한 단기 효과 표현
+    SHORT_PERIOD_PATTERN = r"(하루|일주일).*(만에|만)"
+
+    # 안전 모드에서 .*/.+ 최대 일치 길이 (긴 리뷰/반복 문자 스팸의 O(n²) 검색 방지)
+    SAFE_REGEX_WINDOW = DEFAULT_SAFE_WINDOW
+
+    def __init__(
+        self,
+        criteria: Optional[ProductCheckCriteria] = None,
+        safe_mode: bool = False,
+        time_budget: Optional[float] = None
+    ):
         """
         체크리스트 초기화
         
         Args:
             criteria: 제품별 체크 기준 (None이면 기본 기준 사용)
+            safe_mode: 안전 모드 (제한 없는 .*/.+ 를 SAFE_REGEX_WINDOW자로 제한하여 검색)
+            time_budget: 리뷰 1건 검사 시간 예산(초), 초과 시 RuleTimeoutError (None이면 제한 없음)
+                → 마감 시각은 패턴 검색 사이에만 확인되고 진행 중인 re.search 하나는 중단할 수 없으므로,
+                  시간 예산을 지정하면 검색 하나의 비용이 제한되도록 안전 모드를 함께 사용
         """
         self.criteria = criteria
+        self.safe_mode = safe_mode or time_budget is not None
+        self.time_budget = time_budget
+
+    @classmethod
+    def get_rule_engine(cls, safe: bool = False) -> CompiledRuleEngine:
+        """
+        체크리스트 전체 패턴을 컴파일한 규칙 엔진 반환 (클래스당 1회 생성)
+
+        Args:
+            safe: 안전 모드 엔진 여부 (반복을 SAFE_REGEX_WINDOW자로 제한)
+
+        그룹키:
+            - 항목번호 (int): AD_PATTERNS의 정규표현식 패턴 (IGNORECASE | MULTILINE)
+            - "personal": 개인 경험 표현 패턴
+            - "negative": 부정적 의견 패턴
+        """
+        attr = "_safe_rule_engine" if safe else "_rule_engine"
+        engine = cls.__dict__.get(attr)
+        if engine is None:
+            rule_groups = {
+                item_num: (item_data["patterns"], re.IGNORECASE | re.MULTILINE)
+                for item_num, item_data in cls.AD_PATTERNS.items()
+                if item_num not in (4, 6, 7)  # 특수 케이스는 별도 검사
+            }
+            rule_groups["personal"] = (cls.PERSONAL_PATTERNS, 0)
+            rule_groups["negative"] = (cls.NEGATIVE_PATTERNS, 0)
+            engine = CompiledRuleEngine(rule_groups, window=cls.SAFE_REGEX_WINDOW if safe else None)
+            setattr(cls, attr, engine)
+        return engine
 
     def check_ad_patterns(
         self, 
         review_text: str, 
-        product_id: Optional[int] = None
+        product_id: Optional[int] = None,
+        features: Optional[ReviewFeatures] = None
     ) -> Dict[int, str]:
         """
         13단계 광고 판별 체크리스트 검사 (영양성분 DB 통합)
@@ -135,37 +223,49 @@ class AdChecklist:
         Args:
             review_text: 검사할 리뷰 텍스트
             product_id: 제품 ID (제공 시 영양성분 DB 조회, 없어도 오류 없음)
+            features: 리뷰 특징 (None이면 get_review_features로 조회)
 
         Returns:
             Dict[int, str]: {항목번호: 항목명} 형태로 감지된 항목 반환
+
+        Raises:
+            RuleTimeoutError: time_budget을 초과한 경우
         """
         # 입력 검증: 리뷰가 너무 짧으면 빈 결과 반환
         if not review_text or len(review_text.strip()) < 3:
             return {}
         
+        if features is None:
+            features = get_review_features(review_text)
+
+        deadline = time.perf_counter() + self.time_budget if self.time_budget else None
         detected_issues = {}
 
+        # 모든 패턴 그룹을 한 번에 평가 (리뷰 특징에 스캔 결과 공유)
+        matched = set(features.rule_spans(self.get_rule_engine(self.safe_mode), deadline))
+
         for item_num, item_data in self.AD_PATTERNS.items():
             name = item_data["name"]
-            patterns = item_data["patterns"]
 
             # 특수 케이스 처리
             if item_num == 4:  # 개인 경험 부재
-                if not self._has_personal_experience(review_text):
+                if not self._has_personal_experience(review_text, matched):
                     detected_issues[item_num] = name
                 continue
 
             if item_num == 6:  # 키워드 반복
-                # 개선 (2026-01-07): 임계값 5 → 7로 완화
-                threshold = self.criteria.keyword_repetition_threshold if self.criteria else 7
-                if self._has_keyword_repetition(review_text, threshold=threshold):
+                threshold = (
+                    self.criteria.keyword_repetition_threshold if self.criteria
+                    else self.KEYWORD_REPETITION_THRESHOLD
+                )
+                if self._has_keyword_repetition(review_text, threshold=threshold, features=features):
                     detected_issues[item_num] = name
                 continue
 
             if item_num == 7:  # 단점 회피
                 # 개선 (2026-01-07): 단점이 없다고 무조건 광고는 아님
                 # 다른 광고 패턴(찬사 위주, 감탄사 남발)이 함께 있을 때만 의심
-                if not self._has_negative_opinion(review_text):
+                if not self._has_negative_opinion(review_text, matched):
                     # 찬사 위주(8번) 또는 감탄사 남발(2번)이 이미 감지된 경우에만 추가
                     if 8 in detected_issues or 2 in detected_issues:
                         detected_issues[item_num] = name
@@ -178,17 +278,15 @@ class AdChecklist:
                         detected_issues[item_num] = f"{name} (제품별 기준: {suspicious_expr})"
                         break
 
-            # 정규표현식 패턴 매칭
-            for pattern in patterns:
-                if re.search(pattern, review_text, re.IGNORECASE | re.MULTILINE):
-                    detected_issues[item_num] = name
-                    break
+            # 정규표현식 패턴 매칭 (규칙 엔진 스캔 결과)
+            if item_num in matched:
+                detected_issues[item_num] = name
 
         # 영양성분 DB 기반 추가 검증 (product_id가 있고 정보가 있는 경우만)
         if product_id:
             try:
                 # 5번: 원료 특징 나열 - 허위 성분 주장 검증
-                if self._validate_ingredient_claims(review_text, product_id):
+                if self._validate_ingredient_claims(review_text, product_id, features):
                     # 기존 5번 항목이 있으면 강화, 없으면 추가
                     if 5 in detected_issues:
                         detected_issues[5] = f"{detected_issues[5]} (허위 성분 주장 포함)"
@@ -196,25 +294,40 @@ class AdChecklist:
                         detected_issues[5] = "원료 특징 나열 (허위 성분 주장)"
                 
                 # 9번: 전문 용어 오남용 - 허위 의학적 주장 검증
-                if self._validate_medical_claims(review_text, product_id):
+                if self._validate_medical_claims(review_text, product_id, features, deadline):
                     if 9 in detected_issues:
                         detected_issues[9] = f"{detected_issues[9]} (허위 의학적 주장 포함)"
                     else:
                         detected_issues[9] = "전문 용어 오남용 (허위 의학적 주장)"
                 
                 # 10번: 비현실적 효과 강조 - 효과 시점 검증
-                if self._validate_effect_timeline(review_text, product_id):
+                if self._validate_effect_timeline(review_text, product_id, features, deadline):
                     if 10 in detected_issues:
                         detected_issues[10] = f"{detected_issues[10]} (효과 시점 과장)"
                     else:
                         detected_issues[10] = "비현실적 효과 강조 (효과 시점 과장)"
+            except RuleTimeoutError:
+                raise
             except Exception:
                 # 영양성분 검증 중 오류 발생 시 무시하고 기존 결과만 반환
                 pass
 
         return detected_issues
 
-    def _has_personal_experience(self, text: str) -> bool:
+    def _search(self, pattern: str, text: str, deadline: Optional[float] = None) -> bool:
+        """
+        단일 패턴 검색 (IGNORECASE, 안전 모드면 반복 길이 제한)
+
+        Raises:
+            RuleTimeoutError: 검색 전 마감 시각이 지난 경우
+        """
+        if deadline is not None and time.perf_counter() > deadline:
+            raise RuleTimeoutError(f"규칙 평가 시간 초과 ({pattern})")
+        if self.safe_mode:
+            pattern = bound_pattern(pattern, self.SAFE_REGEX_WINDOW)
+        return re.search(pattern, text, re.IGNORECASE) is not None
+
+    def _has_personal_experience(self, text: str, matched: Optional[Set] = None) -> bool:
         """
         개인 경험 표현 존재 여부 검사
 
@@ -222,47 +335,42 @@ class AdChecklist:
         - 구매/사용 관련 표현 추가 (구매, 샀, 먹, 사용, 복용)
         - 체감 표현 추가 (느, 같아, 되는, 했)
         - 재구매 표현 추가 (재구매, 또, 다시, 계속)
+
+        Args:
+            text: 리뷰 텍스트
+            matched: 규칙 엔진 스캔 결과 (제공 시 재스캔 생략)
         """
-        personal_patterns = [
-            # 1인칭 대명사
-            r"나는", r"저는", r"제가", r"내가", r"우리",
-            # 직접 경험
-            r"직접", r"실제로", r"먹어보니", r"사용해보니",
-            # 구매/사용 표현
-            r"구매", r"샀", r"사서", r"먹", r"사용", r"복용", r"써",
-            # 체감 표현
-            r"느", r"같아", r"되는", r"됐", r"했", r"해서",
-            # 재구매 및 지속 사용
-            r"재구매", r"또", r"다시", r"계속", r"리피트",
-            # 소유 표현
-            r"내", r"제", r"우리", r"아버지", r"어머니", r"부모님", r"가족"
-        ]
-        for pattern in personal_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
-
-    def _has_keyword_repetition(self, text: str, threshold: int = 7) -> bool:
+        if matched is not None:
+            return "personal" in matched
+        return self.get_rule_engine().matches("personal", text)
+
+    def _has_keyword_repetition(
+        self,
+        text: str,
+        threshold: int = 7,
+        features: Optional[ReviewFeatures] = None
+    ) -> bool:
         """
         특정 키워드 과도한 반복 검사
 
         개선 사항 (2026-01-07):
         - 기본 임계값 5 → 7로 완화 (정상 리뷰도 특정 단어를 여러 번 쓸 수 있음)
+
+        Args:
+            text: 리뷰 텍스트
+            threshold: 반복 횟수 기준
+            features: 리뷰 특징 (토큰 목록/등장 횟수 재사용)
         """
-        words = re.findall(r'\b\w+\b', text)
-        if len(words) < 10:
-            return False
+        if features is None:
+            features = get_review_features(text)
 
-        word_freq = {}
-        for word in words:
-            if len(word) >= 2:  # 2글자 이상 단어만
-                word_freq[word] = word_freq.get(word, 0) + 1
+        if len(features.tokens) < 10:
+            return False
 
-        # 가장 많이 반복된 단어가 threshold 이상이면 True
-        max_freq = max(word_freq.values()) if word_freq else 0
-        return max_freq >= threshold
+        # 가장 많이 반복된 단어(2글자 이상)가 threshold 이상이면 True
+        return features.max_token_count >= threshold
 
-    def _has_negative_opinion(self, text: str) -> bool:
+    def _has_negative_opinion(self, text: str, matched: Optional[Set] = None) -> bool:
         """
         부정적 의견 또는 단점 언급 여부 검사
 
@@ -270,13 +378,11 @@ class AdChecklist:
         - 이 함수는 단점 회피(7번) 항목에서만 사용됨
         - 단점이 없다고 무조건 광고는 아님 (정상 리뷰도 만족하면 단점을 안 쓸 수 있음)
         - 따라서 check_ad_patterns()에서 다른 광고 패턴과 함께 있을 때만 감점
+
+        Args:
+            text: 리뷰 텍스트
+            matched: 규칙 엔진 스캔 결과 (제공 시 재스캔 생략)
         """
-        # 기본 부정적 패턴
-        negative_patterns = [
-            r"단점", r"아쉬", r"불편", r"별로", r"그런데",
-            r"하지만", r"다만", r"개선", r"부족", r"안.*좋"
-        ]
-        
         # 제품별 부정적 표현 추가
         if self.criteria and self.criteria.negative_expressions:
             for expr in self.criteria.negative_expressions:
@@ -284,10 +390,9 @@ class AdChecklist:
                     return True
         
         # 기본 패턴 검사
-        for pattern in negative_patterns:
-            if re.search(pattern, text):
-                return True
-        return False
+        if matched is not None:
+            return "negative" in matched
+        return self.get_rule_engine().matches("negative", text)
     
     def check_with_criteria(
         self, 
@@ -360,7 +465,8 @@ class AdChecklist:
     def _validate_ingredient_claims(
         self, 
         review_text: str, 
-        product_id: Optional[int] = None
+        product_id: Optional[int] = None,
+        features: Optional[ReviewFeatures] = None
     ) -> bool:
         """
         리뷰에서 언급된 성분이 실제 제품에 포함되어 있는지 검증
@@ -368,6 +474,7 @@ class AdChecklist:
         Args:
             review_text: 리뷰 텍스트
             product_id: 제품 ID (None이면 검증 생략)
+            features: 리뷰 특징 (추출된 성분명 재사용)
             
         Returns:
             bool: 허위 성분 주장이 있으면 True (광고 의심), 정보 없으면 False
@@ -381,8 +488,10 @@ class AdChecklist:
         if not nutrition_info:
             return False  # 정보 없으면 검증 생략 (오류 없이)
         
-        # 3. 리뷰 텍스트에서 성분명 추출
-        mentioned_ingredients = extract_ingredients(review_text)
+        # 3. 리뷰 텍스트에서 성분명 추출 (리뷰 특징에서 재사용)
+        if features is None:
+            features = get_review_features(review_text)
+        mentioned_ingredients = features.ingredients
         if not mentioned_ingredients:
             return False  # 성분 언급 없으면 검증 불가
         
@@ -396,7 +505,9 @@ class AdChecklist:
     def _validate_medical_claims(
         self, 
         review_text: str, 
-        product_id: Optional[int] = None
+        product_id: Optional[int] = None,
+        features: Optional[ReviewFeatures] = None,
+        deadline: Optional[float] = None
     ) -> bool:
         """
         리뷰의 의학적 주장이 영양성분 DB의 공식 효능과 일치하는지 검증
@@ -404,6 +515,8 @@ class AdChecklist:
         Args:
             review_text: 리뷰 텍스트
             product_id: 제품 ID (None이면 검증 생략)
+            features: 리뷰 특징 (추출된 성분명 재사용)
+            deadline: 검사 마감 시각 (time.perf_counter() 기준)
             
         Returns:
             bool: 허위 의학적 주장이 있으면 True
@@ -416,23 +529,17 @@ class AdChecklist:
             if not nutrition_info:
                 return False
             
-            # 리뷰에서 성분명 추출
-            mentioned_ingredients = extract_ingredients(review_text)
+            # 리뷰에서 성분명 추출 (리뷰 특징에서 재사용)
+            if features is None:
+                features = get_review_features(review_text)
+            mentioned_ingredients = features.ingredients
             if not mentioned_ingredients:
                 return False
             
-            # 의학적 주장 패턴 (과장된 표현)
-            exaggerated_claims = [
-                r"100%.*(회복|치료|완치)",
-                r"(완벽|완전).*(치료|회복|개선)",
-                r"(기적|놀라운|엄청난).*(효과|변화)",
-                r"(즉시|바로|단.*하루|일주일).*(효과|개선|변화)"
-            ]
-            
             # 리뷰에 과장된 주장이 있는지 확인
             has_exaggerated_claim = False
-            for pattern in exaggerated_claims:
-                if re.search(pattern, review_text, re.IGNORECASE):
+            for pattern in self.MEDICAL_CLAIM_PATTERNS:
+                if self._search(pattern, review_text, deadline):
                     has_exaggerated_claim = True
                     break
             
@@ -451,13 +558,17 @@ class AdChecklist:
             # (더 정교한 검증은 향후 개선)
             return False
             
+        except RuleTimeoutError:
+            raise
         except Exception:
             return False  # 오류 발생 시 False 반환 (오류 없이)
 
     def _validate_effect_timeline(
         self, 
         review_text: str, 
-        product_id: Optional[int] = None
+        product_id: Optional[int] = None,
+        features: Optional[ReviewFeatures] = None,
+        deadline: Optional[float] = None
     ) -> bool:
         """
         리뷰의 효과 발현 시점이 현실적인지 검증
@@ -465,6 +576,8 @@ class AdChecklist:
         Args:
             review_text: 리뷰 텍스트
             product_id: 제품 ID (None이면 검증 생략)
+            features: 리뷰 특징 (추출된 성분명 재사용)
+            deadline: 검사 마감 시각 (time.perf_counter() 기준)
             
         Returns:
             bool: 비현실적인 효과 시점 주장이 있으면 True
@@ -477,21 +590,17 @@ class AdChecklist:
             if not nutrition_info:
                 return False
             
-            # 리뷰에서 성분명 추출
-            mentioned_ingredients = extract_ingredients(review_text)
+            # 리뷰에서 성분명 추출 (리뷰 특징에서 재사용)
+            if features is None:
+                features = get_review_features(review_text)
+            mentioned_ingredients = features.ingredients
             if not mentioned_ingredients:
                 return False
             
-            # 비현실적인 시점 표현 패턴
-            unrealistic_timeline_patterns = [
-                r"(즉시|바로|단.*하루|하루만에|일주일만에).*(효과|개선|변화|달라)",
-                r"(하루|일주일).*(만에|만).*(효과|개선|변화)"
-            ]
-            
             # 비현실적인 시점 표현이 있는지 확인
             has_unrealistic_timeline = False
-            for pattern in unrealistic_timeline_patterns:
-                if re.search(pattern, review_text, re.IGNORECASE):
+            for pattern in self.UNREALISTIC_TIMELINE_PATTERNS:
+                if self._search(pattern, review_text, deadline):
                     has_unrealistic_timeline = True
                     break
             
@@ -505,11 +614,13 @@ class AdChecklist:
                     # 일반적으로 2주 이상 걸리는 성분인데 "하루만에" 효과 주장하면 의심
                     if typical_period >= 14:
                         # "하루만에", "일주일만에" 같은 표현이 있으면 비현실적
-                        if re.search(r"(하루|일주일).*(만에|만)", review_text, re.IGNORECASE):
+                        if self._search(self.SHORT_PERIOD_PATTERN, review_text, deadline):
                             return True
             
             return False
             
+        except RuleTimeoutError:
+            raise
         except Exception:
             return False  # 오류 발생 시 False 반환 (오류 없이)
 
@@ -0,0 +1,356 @@
+"""
+성분 사전(lexicon) 모듈
+기본 성분 목록과 nutrition_info 테이블의 성분명/동의어를 하나의 트라이(trie)로
+컴파일하여 리뷰 텍스트에서 성분을 한 번의 스캔으로 추출합니다.
+
+동작 방식:
+- 모든 성분 표기를 소문자 기준 트라이로 구성 (공백/하이픈 위치는 선택적 구분자)
+- 트라이를 접두사가 인수분해된 정규식으로 컴파일 → C 정규식 엔진에서 위치마다
+  결정적으로 분기하므로 텍스트 길이에 선형 (성분 수와 무관)
+- 일치한 표기는 정규화 키로 정규(canonical) 성분 ID에 매핑
+- "비타민"/"Vitamin"은 뒤따르는 종류 표기(C, D3, B12 등)까지 읽어 ID 생성
+
+nutrition_info 테이블이 바뀌면 rebuild_ingredient_lexicon()으로 다시 생성합니다.
+테이블 조회에 실패하면 기본 성분 사전을 쓰다가 LEXICON_RETRY_INTERVAL 후 다시 조회합니다.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from database.supabase_client import SupabaseClient
+
+
+logger = logging.getLogger(__name__)
+
+# nutrition_info 페이지당 행 수 (PostgREST max-rows보다 크면 서버 상한만큼만 반환됨)
+NUTRITION_PAGE_SIZE = 1000
+
+# nutrition_info 조회 실패 후 기본 사전으로 동작하다가 다시 조회할 때까지의 시간 (초)
+LEXICON_RETRY_INTERVAL = 300.0
+
+# 비타민 정규 ID (종류 표기가 붙으면 "vitamin_c", "vitamin_d3" 형태)
+VITAMIN_ID = "vitamin"
+
+# 기본 성분 목록 {정규 ID: 표기 목록}
+# 표기 안의 공백/하이픈은 "없음 또는 공백/하이픈 여러 개"로 매칭됨
+BUILTIN_INGREDIENTS: Dict[str, List[str]] = {
+    # 비타민류
+    VITAMIN_ID: ["비타민", "Vitamin"],
+
+    # 카로티노이드
+    "lutein": ["루테인", "Lutein"],
+    "zeaxanthin": ["제아잔틴", "Zeaxanthin"],
+    "lycopene": ["리코펜", "Lycopene"],
+    "beta_carotene": ["베타카로틴", "Beta-carotene"],
+
+    # 오메가
+    "omega_3": ["오메가 3", "Omega 3"],
+    "omega_6": ["오메가 6", "Omega 6"],
+    "omega_9": ["오메가 9", "Omega 9"],
+    "dha": ["DHA"],
+    "epa": ["EPA"],
+
+    # 프로바이오틱스
+    "probiotics": ["프로바이오틱스", "Probiotic"],
+    "lactobacillus": ["락토바실러스", "Lactobacillus"],
+    "bifidobacterium": ["비피도박테리움", "Bifidobacterium"],
+
+    # 미네랄
+    "calcium": ["칼슘", "Calcium"],
+    "magnesium": ["마그네슘", "Magnesium"],
+    "zinc": ["아연", "Zinc"],
+    "selenium": ["셀레늄", "Selenium"],
+
+    # 기타
+    "coenzyme_q10": ["코엔자임 Q10", "CoQ10"],
+    "glucosamine": ["글루코사민", "Glucosamine"],
+    "chondroitin": ["콘드로이틴", "Chondroitin"],
+}
+
+# 표기 안의 선택적 구분자 (공백, 하이픈, 밑줄)
+_SEPARATOR_RUN = re.compile(r"[\s\-_]+")
+_SEPARATOR_REGEX = r"[\s\-_]*"
+_SEP = None  # 트라이 토큰: 구분자
+
+# "비타민" 뒤의 종류 표기 (예: " C", "D3", "B12")
+_VITAMIN_SUFFIX = re.compile(r"\s*([A-Z]?\d*)", re.IGNORECASE)
+
+
+def _digest(payload: Any) -> str:
+    """JSON 직렬화 결과의 SHA-256 앞 16자리 (사전/원본 데이터 버전)"""
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def _normalize_key(surface: str) -> str:
+    """표기를 매핑용 키로 정규화 (소문자, 구분자 제거)"""
+    return _SEPARATOR_RUN.sub("", surface.lower().strip())
+
+
+def _tokenize(surface: str) -> List[Optional[str]]:
+    """표기를 트라이 토큰 리스트로 변환 (구분자 연속은 _SEP 하나)"""
+    tokens: List[Optional[str]] = []
+    for part_index, part in enumerate(_SEPARATOR_RUN.split(surface.lower().strip())):
+        if part_index and part:
+            tokens.append(_SEP)
+        tokens.extend(part)
+    return tokens
+
+
+class IngredientLexicon:
+    """성분 표기 → 정규 ID 사전 (트라이 정규식 기반 추출기)"""
+
+    def __init__(self, entries: Dict[str, Iterable[str]], source_digest: str = ""):
+        """
+        성분 사전 초기화 (트라이 구성 및 정규식 컴파일은 여기서 한 번만 수행)
+
+        Args:
+            entries: {정규 ID: 표기 목록}
+            source_digest: 사전을 만든 nutrition_info 행의 해시 (version에 포함)
+        """
+        self.source_digest = source_digest
+        self._ids: Dict[str, str] = {}
+        self._surfaces: Dict[str, List[str]] = {}
+        trie: Dict = {}
+
+        for canonical_id, surfaces in entries.items():
+            for surface in surfaces:
+                key = _normalize_key(str(surface))
+                if not key:
+                    continue
+                # 같은 키가 여러 번 나오면 먼저 등록된 ID 유지
+                if key not in self._ids:
+                    self._ids[key] = canonical_id
+                    self._surfaces.setdefault(canonical_id, []).append(str(surface))
+
+                node = trie
+                for token in _tokenize(str(surface)):
+                    node = node.setdefault(token, {})
+                node[""] = True  # 표기 끝 표시
+
+        self._pattern = re.compile(self._trie_regex(trie), re.IGNORECASE) if trie else None
+        self.version = _digest({"ids": self._ids, "source": source_digest})
+
+    @classmethod
+    def builtin(cls) -> "IngredientLexicon":
+        """기본 성분 목록만으로 구성된 사전"""
+        return cls(BUILTIN_INGREDIENTS)
+
+    @classmethod
+    def from_nutrition_rows(cls, rows: Iterable[Dict[str, Any]]) -> "IngredientLexicon":
+        """
+        기본 성분 목록 + nutrition_info 행(성분명, ingredient_aliases)으로 사전 생성
+
+        DB 성분명이 기본 성분과 같으면(예: "루테인", "비타민 C") 기본 정규 ID를 사용하고,
+        그 외에는 정규화된 성분명을 정규 ID로 사용합니다.
+        동의어는 해당 행의 정규 ID로 매핑됩니다.
+        """
+        rows = list(rows)
+        builtin = cls.builtin()
+        entries: Dict[str, List[str]] = {
+            canonical_id: list(surfaces)
+            for canonical_id, surfaces in BUILTIN_INGREDIENTS.items()
+        }
+
+        for row in rows:
+            name = row.get('ingredient_name', '') or row.get('food_name', '')
+            if not name:
+                continue
+            canonical_id = builtin.canonical_id(name) or _normalize_key(name)
+
+            surfaces = [name]
+            aliases = row.get('ingredient_aliases', [])
+            if isinstance(aliases, list):
+                surfaces.extend(str(alias) for alias in aliases if alias)
+
+            entries.setdefault(canonical_id, []).extend(surfaces)
+
+        return cls(entries, source_digest=_digest(rows))
+
+    @property
+    def size(self) -> int:
+        """등록된 표기 수"""
+        return len(self._ids)
+
+    def surfaces(self, canonical_id: str) -> List[str]:
+        """정규 ID의 등록 표기 목록"""
+        return list(self._surfaces.get(canonical_id, []))
+
+    def canonical_id(self, name: str) -> Optional[str]:
+        """성분명 전체가 하나의 성분 표기와 일치하면 정규 ID 반환"""
+        found = self.find(name)
+        if len(found) == 1 and _normalize_key(found[0][1]) == _normalize_key(name):
+            return found[0][0]
+        return None
+
+    def find(self, text: str) -> List[Tuple[str, str]]:
+        """
+        텍스트에서 성분 표기 검색 (등장 순서, 가장 긴 표기 우선)
+
+        Args:
+            text: 리뷰 텍스트
+
+        Returns:
+            List[Tuple[str, str]]: [(정규 ID, 원문 표기), ...]
+        """
+        if not text or self._pattern is None:
+            return []
+
+        found = []
+        pos = 0
+        while True:
+            match = self._pattern.search(text, pos)
+            if match is None:
+                break
+
+            start, end = match.span()
+            canonical_id = self._ids.get(_normalize_key(match.group()))
+
+            # 비타민: 뒤따르는 종류 표기까지 포함
+            if canonical_id == VITAMIN_ID:
+                suffix = _VITAMIN_SUFFIX.match(text, end)
+                if suffix.group(1):
+                    canonical_id = f"{VITAMIN_ID}_{suffix.group(1).lower()}"
+                end = suffix.end()
+
+            if canonical_id:
+                found.append((canonical_id, text[start:end].strip()))
+            pos = max(end, start + 1)
+
+        return found
+
+    def extract_ids(self, text: str) -> List[str]:
+        """텍스트에서 정규 성분 ID 추출 (중복 제거, 등장 순서)"""
+        return list(dict.fromkeys(canonical_id for canonical_id, _ in self.find(text)))
+
+    @classmethod
+    def _trie_regex(cls, node: Dict) -> str:
+        """트라이 노드를 접두사가 인수분해된 정규식으로 변환"""
+        # 구분자 분기를 먼저 시도 (빈 문자열도 허용하므로 더 일반적)
+        branches = []
+        for token in sorted((t for t in node if t != ""), key=lambda t: (t is not _SEP, t or "")):
+            head = _SEPARATOR_REGEX if token is _SEP else re.escape(token)
+            child = node[token]
+
+            # 분기 없는 연속 구간은 하나의 리터럴로 압축 (중첩 깊이 제한)
+            while len(child) == 1 and "" not in child:
+                (next_token, next_child), = child.items()
+                head += _SEPARATOR_REGEX if next_token is _SEP else re.escape(next_token)
+                child = next_child
+
+            branches.append(head + cls._trie_regex(child))
+
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            return f"(?:{body})?"
+        return body
+
+
+# 공유 성분 사전 (최초 사용 시 nutrition_info 테이블로 생성)
+_lexicon: Optional[IngredientLexicon] = None
+# 조회 실패로 기본 사전을 쓰는 중이면 다시 조회할 시각 (time.monotonic 기준, 정상 생성이면 None)
+_lexicon_retry_at: Optional[float] = None
+_lexicon_lock = threading.Lock()
+
+
+def _load_nutrition_rows(page_size: int = NUTRITION_PAGE_SIZE) -> Optional[List[Dict[str, Any]]]:
+    """
+    사전 생성용 nutrition_info 전체 행 조회 (id 순서로 페이지 단위 조회)
+
+    서버 max-rows가 page_size보다 작아도 빠짐없이 읽도록 받은 행 수만큼 다음 범위로 이동하고,
+    빈 페이지가 오면 끝으로 판단합니다.
+
+    Args:
+        page_size: 요청당 행 수
+
+    Returns:
+        Optional[List[Dict]]: 전체 행 (조회 실패 시 None)
+    """
+    rows: List[Dict[str, Any]] = []
+    try:
+        supabase = SupabaseClient().get_client()
+        while True:
+            response = (
+                supabase.table('nutrition_info')
+                .select('*')
+                .order('id')
+                .range(len(rows), len(rows) + page_size - 1)
+                .execute()
+            )
+            page = response.data or []
+            if not page:
+                return rows
+            rows.extend(page)
+    except Exception as e:
+        logger.warning("nutrition_info 조회 실패, 기본 성분 사전 사용 (%d행 조회 후 중단): %s", len(rows), e)
+        return None
+
+
+def _build_lexicon(rows: Optional[Iterable[Dict[str, Any]]]) -> IngredientLexicon:
+    """
+    공유 사전 교체 (_lexicon_lock을 잡은 상태에서 호출)
+
+    rows가 None(조회 실패)이면 기본 사전을 저장하고 LEXICON_RETRY_INTERVAL 후 다시 조회하도록 표시합니다.
+    """
+    global _lexicon, _lexicon_retry_at
+    if rows is None:
+        _lexicon = IngredientLexicon.builtin()
+        _lexicon_retry_at = time.monotonic() + LEXICON_RETRY_INTERVAL
+    else:
+        _lexicon = IngredientLexicon.from_nutrition_rows(rows)
+        _lexicon_retry_at = None
+    return _lexicon
+
+
+def _needs_load() -> bool:
+    """사전이 없거나, 조회 실패 후 재시도 시각이 지났는지 여부"""
+    return _lexicon is None or (_lexicon_retry_at is not None and time.monotonic() >= _lexicon_retry_at)
+
+
+def get_ingredient_lexicon() -> IngredientLexicon:
+    """
+    공유 성분 사전 반환 (없으면 생성)
+
+    조회 실패로 만든 기본 사전은 영구 캐시하지 않고 LEXICON_RETRY_INTERVAL마다 다시 조회합니다.
+    재조회 중에는 다른 스레드가 기다리지 않고 기존 기본 사전을 사용합니다.
+    """
+    lexicon = _lexicon
+    if not _needs_load():
+        return lexicon
+    if lexicon is not None:
+        # 재조회는 한 스레드만 수행
+        if not _lexicon_lock.acquire(blocking=False):
+            return lexicon
+    else:
+        _lexicon_lock.acquire()
+    try:
+        if _needs_load():
+            return _build_lexicon(_load_nutrition_rows())
+        return _lexicon
+    finally:
+        _lexicon_lock.release()
+
+
+def rebuild_ingredient_lexicon(
+    rows: Optional[Iterable[Dict[str, Any]]] = None
+) -> IngredientLexicon:
+    """
+    공유 성분 사전 재생성 (nutrition_info 테이블 변경 시 또는 시작 시 미리 호출)
+
+    Args:
+        rows: nutrition_info 행 목록 (None이면 DB에서 다시 조회, 실패 시 기본 사전 후 재시도 예약)
+
+    Returns:
+        IngredientLexicon: 새로 생성된 사전
+    """
+    if rows is None:
+        rows = _load_nutrition_rows()
+    with _lexicon_lock:
+        return _build_lexicon(rows)
@@ -4,24 +4,197 @@
 """
 
 import re
-from typing import Dict, List, Optional, Any
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping as MappingABC
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Any, Tuple
 from database.supabase_client import SupabaseClient
+from .analysis_cache import nutrition_info_version
+from .ingredient_lexicon import get_ingredient_lexicon
 
 
-def get_nutrition_info_safe(product_id: int) -> Optional[Dict[str, Any]]:
+def _freeze(value: Any) -> Any:
+    """딕셔너리는 MappingProxyType, 리스트는 tuple로 바꾼 읽기 전용 스냅샷 생성 (재귀)"""
+    if isinstance(value, MappingABC):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class NutritionInfoCache:
+    """
+    영양성분 정보 캐시 (LRU 크기 제한 + TTL)
+
+    한 번의 analyze() 호출에서 체크리스트, 신뢰도 점수, 약사 분석기가
+    같은 제품의 영양성분 정보를 여러 번 조회하므로 모듈 전역 캐시로 공유합니다.
+    정보가 없는 제품(None)도 캐시하여 TTL 동안 재조회하지 않습니다.
+    저장할 때 한 번만 읽기 전용 스냅샷(MappingProxyType/tuple)으로 복사하고
+    조회 시에는 그 스냅샷을 그대로 반환하므로, 호출한 쪽이 캐시를 수정할 수 없고
+    같은 제품은 TTL 동안 항상 같은 객체를 받습니다.
+    스냅샷의 성분 색인(IngredientIndex)도 같은 항목에 보관하여 스냅샷과 함께 만료됩니다.
+    """
+
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        """
+        캐시 초기화
+
+        Args:
+            maxsize: 최대 캐시 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl: 항목 유효 시간 (초)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # product_id -> (만료 시각, 스냅샷, 성분 색인 또는 None)
+        self._entries: "OrderedDict[Any, Tuple[float, Optional[Mapping[str, Any]], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, product_id: Any) -> Tuple[bool, Optional[Mapping[str, Any]]]:
+        """
+        캐시 조회
+
+        Returns:
+            Tuple[bool, Optional[Mapping]]: (캐시 적중 여부, 영양성분 정보의 읽기 전용 스냅샷)
+        """
+        with self._lock:
+            entry = self._entries.get(product_id)
+            if entry is not None:
+                expires_at, value, _ = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(product_id)
+                    self.hits += 1
+                    return True, value
+                del self._entries[product_id]
+            self.misses += 1
+            return False, None
+
+    def set(self, product_id: Any, value: Optional[Dict[str, Any]]) -> Optional[Mapping[str, Any]]:
+        """캐시 저장 (읽기 전용 스냅샷 저장, 크기 초과 시 LRU 항목 제거, 저장한 스냅샷 반환)"""
+        value = _freeze(value) if value is not None else None
+        with self._lock:
+            self._entries[product_id] = (time.monotonic() + self.ttl, value, None)
+            self._entries.move_to_end(product_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def get_index(self, product_id: Any, value: Any) -> Tuple[bool, Any]:
+        """
+        캐시된 스냅샷의 성분 색인 조회
+
+        Returns:
+            Tuple[bool, Any]: (value가 현재 캐시된 스냅샷인지 여부, 성분 색인 또는 None)
+        """
+        with self._lock:
+            entry = self._entries.get(product_id)
+            if entry is not None and entry[1] is value:
+                return True, entry[2]
+            return False, None
+
+    def set_index(self, product_id: Any, value: Any, index: Any) -> bool:
+        """캐시된 스냅샷에 성분 색인 보관 (value가 현재 스냅샷이 아니면 저장하지 않고 False)"""
+        with self._lock:
+            entry = self._entries.get(product_id)
+            if entry is None or entry[1] is not value:
+                return False
+            self._entries[product_id] = (entry[0], value, index)
+            return True
+
+    def invalidate(self, product_id: Any = None) -> None:
+        """
+        캐시 무효화
+
+        Args:
+            product_id: 무효화할 제품 ID (None이면 전체 삭제)
+        """
+        with self._lock:
+            if product_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(product_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환 (적중/미스 횟수, 현재 크기 등)"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else 0.0,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl
+            }
+
+    def reset_stats(self) -> None:
+        """적중/미스 카운터 초기화"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+# logic_designer 전체가 공유하는 영양성분 정보 캐시
+_nutrition_cache = NutritionInfoCache()
+
+# 조회 실패 표식 (정보 없음(None)과 구분하여 캐시하지 않기 위함)
+_FETCH_FAILED = object()
+
+
+def get_nutrition_cache() -> NutritionInfoCache:
+    """공유 영양성분 정보 캐시 반환"""
+    return _nutrition_cache
+
+
+def invalidate_nutrition_cache(product_id: Optional[int] = None) -> None:
+    """
+    영양성분 정보 캐시 무효화 (nutrition_info 테이블 변경 시 호출)
+
+    Args:
+        product_id: 무효화할 제품 ID (None이면 전체)
+    """
+    _nutrition_cache.invalidate(product_id)
+
+
+def get_nutrition_cache_stats() -> Dict[str, Any]:
+    """영양성분 정보 캐시 통계 반환"""
+    return _nutrition_cache.stats()
+
+
+def get_nutrition_info_safe(
+    product_id: int,
+    use_cache: bool = True
+) -> Optional[Mapping[str, Any]]:
     """
-    제품의 영양성분 정보 조회 (안전한 방식)
+    제품의 영양성분 정보 조회 (안전한 방식, 공유 캐시 사용)
     
     Args:
         product_id: 제품 ID
+        use_cache: 캐시 사용 여부 (False면 항상 DB 조회, 결과는 캐시에 반영)
         
     Returns:
-        Dict: 영양성분 정보 또는 None (오류/정보 없음)
+        Mapping: 영양성분 정보의 읽기 전용 스냅샷 또는 None (오류/정보 없음)
         
     Note:
-        - 오류 발생 시 None 반환 (오류 없이)
+        - 오류 발생 시 None 반환 (오류 없이), 오류 결과는 캐시하지 않음
         - 영양성분 DB가 없어도 기존 기능은 정상 동작
     """
+    if use_cache:
+        found, cached = _nutrition_cache.get(product_id)
+        if found:
+            return cached
+
+    nutrition_info = _fetch_nutrition_info(product_id)
+    if nutrition_info is not _FETCH_FAILED:
+        return _nutrition_cache.set(product_id, nutrition_info)
+    return None
+
+
+def _fetch_nutrition_info(product_id: int) -> Any:
+    """nutrition_info 테이블에서 제품 정보 조회 (실패 시 _FETCH_FAILED 반환)"""
     try:
         client = SupabaseClient()
         supabase = client.get_client()
@@ -39,6 +212,86 @@ def get_nutrition_info_safe(product_id: int) -> Optional[Dict[str, Any]]:
                 'product_id': product_id
             }
         return None  # 정보 없음 (오류 아님)
+    except Exception:
+        # 모든 예외를 무시하고 실패 표식 반환 (오류 없이)
+        return _FETCH_FAILED
+
+
+# in.(...) 조회 1회당 최대 제품 수 (PostgREST URL 길이 제한 대비)
+NUTRITION_PREFETCH_CHUNK_SIZE = 100
+
+
+def get_nutrition_info_many(
+    product_ids: Iterable[int],
+    use_cache: bool = True,
+    chunk_size: int = NUTRITION_PREFETCH_CHUNK_SIZE
+) -> Dict[Any, Optional[Mapping[str, Any]]]:
+    """
+    여러 제품의 영양성분 정보 일괄 조회 (in.(...) 쿼리, 공유 캐시 적재)
+
+    배치 분석 전에 한 번 호출하면 이후 get_nutrition_info_safe()가
+    모두 캐시에서 응답하므로 제품별 왕복 조회가 사라집니다.
+
+    Args:
+        product_ids: 제품 ID 목록 (중복/None은 무시)
+        use_cache: 캐시 사용 여부 (False면 캐시된 제품도 다시 조회)
+        chunk_size: 쿼리 1회당 최대 제품 수
+
+    Returns:
+        Dict: {제품 ID: 영양성분 정보 또는 None}
+            - get_nutrition_info_safe()와 같은 형식
+            - 조회 실패한 청크의 제품은 None (캐시하지 않음)
+    """
+    unique_ids = []
+    seen = set()
+    for product_id in product_ids:
+        if product_id is not None and product_id not in seen:
+            seen.add(product_id)
+            unique_ids.append(product_id)
+
+    result: Dict[Any, Optional[Mapping[str, Any]]] = {}
+    missing = []
+    for product_id in unique_ids:
+        if use_cache:
+            found, cached = _nutrition_cache.get(product_id)
+            if found:
+                result[product_id] = cached
+                continue
+        missing.append(product_id)
+
+    for start in range(0, len(missing), chunk_size):
+        chunk = missing[start:start + chunk_size]
+        rows_by_product = _fetch_nutrition_rows_many(chunk)
+
+        for product_id in chunk:
+            if rows_by_product is None:
+                result[product_id] = None  # 조회 실패 (캐시하지 않음)
+                continue
+            rows = rows_by_product.get(str(product_id))
+            nutrition_info = {
+                'ingredients': rows,
+                'product_id': product_id
+            } if rows else None
+            result[product_id] = _nutrition_cache.set(product_id, nutrition_info)
+
+    return result
+
+
+def _fetch_nutrition_rows_many(product_ids: List[Any]) -> Optional[Dict[str, List[Dict]]]:
+    """nutrition_info 테이블에서 여러 제품을 한 번에 조회 (실패 시 None)"""
+    try:
+        client = SupabaseClient()
+        supabase = client.get_client()
+
+        response = supabase.table('nutrition_info')\
+            .select('*')\
+            .in_('product_id', list(product_ids))\
+            .execute()
+
+        rows_by_product: Dict[str, List[Dict]] = {}
+        for row in response.data or []:
+            rows_by_product.setdefault(str(row.get('product_id')), []).append(row)
+        return rows_by_product
     except Exception:
         # 모든 예외를 무시하고 None 반환 (오류 없이)
         return None
@@ -48,91 +301,47 @@ def extract_ingredients(text: str) -> List[str]:
     """
     리뷰 텍스트에서 성분명 추출
     
+    성분 사전(기본 성분 목록 + nutrition_info 성분명/동의어)을 컴파일한
+    트라이 정규식으로 텍스트를 한 번만 스캔합니다.
+    
     Args:
         text: 리뷰 텍스트
         
     Returns:
-        List[str]: 추출된 성분명 리스트
+        List[str]: 추출된 성분명 리스트 (원문 표기, 등장 순서)
     """
     if not text:
         return []
     
-    # 주요 건강기능식품 성분 패턴
-    ingredient_patterns = [
-        # 비타민류
-        r'비타민\s*[A-Z]?\d*',
-        r'비타민\s*[A-Z]',
-        r'Vitamin\s*[A-Z]?\d*',
-        r'Vitamin\s*[A-Z]',
-        
-        # 카로티노이드
-        r'루테인',
-        r'제아잔틴',
-        r'제아잔틴',
-        r'리코펜',
-        r'베타카로틴',
-        r'Lutein',
-        r'Zeaxanthin',
-        r'Lycopene',
-        r'Beta[-\s]?carotene',
-        
-        # 오메가
-        r'오메가\s*3',
-        r'오메가\s*6',
-        r'오메가\s*9',
-        r'Omega\s*3',
-        r'Omega\s*6',
-        r'Omega\s*9',
-        r'DHA',
-        r'EPA',
-        
-        # 프로바이오틱스
-        r'프로바이오틱스',
-        r'Probiotic',
-        r'락토바실러스',
-        r'비피도박테리움',
-        r'Lactobacillus',
-        r'Bifidobacterium',
-        
-        # 미네랄
-        r'칼슘',
-        r'마그네슘',
-        r'아연',
-        r'셀레늄',
-        r'Calcium',
-        r'Magnesium',
-        r'Zinc',
-        r'Selenium',
-        
-        # 기타
-        r'코엔자임\s*Q10',
-        r'CoQ10',
-        r'글루코사민',
-        r'콘드로이틴',
-        r'Glucosamine',
-        r'Chondroitin',
-    ]
-    
-    extracted = []
-    text_lower = text.lower()
-    
-    for pattern in ingredient_patterns:
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        extracted.extend(matches)
-    
     # 중복 제거 및 정규화
     normalized = []
     seen = set()
     
-    for item in extracted:
-        normalized_item = item.strip().lower()
+    for _, surface in get_ingredient_lexicon().find(text):
+        normalized_item = surface.lower()
         if normalized_item and normalized_item not in seen:
             seen.add(normalized_item)
-            normalized.append(item.strip())
+            normalized.append(surface)
     
     return normalized
 
 
+def extract_ingredient_ids(text: str) -> List[str]:
+    """
+    리뷰 텍스트에서 정규(canonical) 성분 ID 추출
+    
+    Args:
+        text: 리뷰 텍스트
+        
+    Returns:
+        List[str]: 정규 성분 ID 리스트 (예: ["lutein", "vitamin_c"], 등장 순서)
+    """
+    if not text:
+        return []
+    
+    return get_ingredient_lexicon().extract_ids(text)
+
+
 def normalize_ingredient_name(name: str) -> str:
     """
     성분명 정규화 (비교를 위해)
@@ -158,6 +367,143 @@ def normalize_ingredient_name(name: str) -> str:
     return normalized
 
 
+class IngredientIndex:
+    """
+    제품별 성분 색인 (영양성분 정보에서 한 번만 생성)
+
+    is_valid_ingredient, get_official_efficacy, get_typical_effect_period가
+    성분을 언급할 때마다 전체 성분 행을 순회하며 정규화하지 않도록
+    정규화된 성분명/동의어, 효능, 효과 발현 기간을 미리 색인합니다.
+    매칭 기준은 기존 함수와 동일합니다.
+    - 유효 성분: 성분명/동의어와 양방향 포함 관계
+    - 효능/기간: 성분명 정확히 일치 (첫 번째 일치 항목)
+    """
+
+    def __init__(self, ingredients: Iterable[Dict[str, Any]]):
+        """
+        색인 생성
+
+        Args:
+            ingredients: 영양성분 정보의 성분 행 목록
+        """
+        self._names = set()           # 정규화된 성분명 + 동의어
+        self._name_lengths = set()    # 성분명 길이 (부분 문자열 검사용)
+        self._substrings = set()      # 성분명 + 동의어의 모든 부분 문자열
+        self._entries: Dict[str, Dict[str, Any]] = {}  # 효능/기간 조회용
+
+        for ingredient in ingredients or []:
+            # 실제 스키마에 맞게 조정 필요 (is_valid_ingredient와 같은 우선순위)
+            ingredient_name = ingredient.get('food_name', '') or \
+                             ingredient.get('representative_food_name', '') or \
+                             ingredient.get('ingredient_name', '')
+
+            if ingredient_name:
+                self._add_name(normalize_ingredient_name(ingredient_name))
+
+                aliases = ingredient.get('ingredient_aliases', [])
+                if isinstance(aliases, (list, tuple)):
+                    for alias in aliases:
+                        self._add_name(normalize_ingredient_name(str(alias)))
+
+            # 효능/기간은 ingredient_name 우선, 첫 번째 일치 항목 사용
+            ingredient_name_db = ingredient.get('ingredient_name', '') or \
+                                ingredient.get('food_name', '')
+            self._entries.setdefault(normalize_ingredient_name(ingredient_name_db), ingredient)
+
+    def _add_name(self, normalized: str) -> None:
+        """정규화된 성분명과 그 부분 문자열 등록"""
+        if normalized in self._names:
+            return
+        self._names.add(normalized)
+        self._name_lengths.add(len(normalized))
+        self._substrings.add("")
+        for start in range(len(normalized)):
+            for end in range(start + 1, len(normalized) + 1):
+                self._substrings.add(normalized[start:end])
+
+    def contains(self, mentioned_name: str) -> bool:
+        """언급된 성분이 성분명/동의어와 포함 관계인지 확인"""
+        mentioned = normalize_ingredient_name(mentioned_name)
+
+        # 언급된 성분명이 공식 성분명에 포함
+        if mentioned in self._substrings:
+            return True
+
+        # 공식 성분명이 언급된 성분명에 포함
+        for length in self._name_lengths:
+            for start in range(len(mentioned) - length + 1):
+                if mentioned[start:start + length] in self._names:
+                    return True
+
+        return False
+
+    def official_efficacy(self, ingredient_name: str) -> List[str]:
+        """성분의 공식 효능 목록 (중복 제거)"""
+        ingredient = self._entries.get(normalize_ingredient_name(ingredient_name))
+        if ingredient is None:
+            return []
+        official_efficacy = ingredient.get('official_efficacy', [])
+        if not isinstance(official_efficacy, (list, tuple)):
+            return []
+        return list(set(official_efficacy))
+
+    def typical_effect_period(self, ingredient_name: str) -> Optional[int]:
+        """성분의 일반적 효과 발현 기간 (일)"""
+        ingredient = self._entries.get(normalize_ingredient_name(ingredient_name))
+        if ingredient is None:
+            return None
+        period = ingredient.get('typical_effect_period_days')
+        return int(period) if period else None
+
+
+# 캐시 밖의 영양성분 정보용 성분 색인 ((제품 ID, 내용 버전) -> 색인)
+INGREDIENT_INDEX_CACHE_SIZE = 512
+_index_cache: "OrderedDict[Tuple[Any, str], IngredientIndex]" = OrderedDict()
+_index_lock = threading.Lock()
+
+
+def get_ingredient_index(nutrition_info: Mapping[str, Any]) -> IngredientIndex:
+    """
+    영양성분 정보의 성분 색인 반환 (없으면 생성)
+
+    - 영양성분 정보 캐시의 스냅샷이면 캐시 항목에 색인을 보관하므로
+      같은 제품은 스냅샷이 만료/교체될 때까지 한 번만 색인합니다.
+    - 그 밖의 딕셔너리는 (제품 ID, 내용 버전)으로 색인을 재사용하므로
+      내용이 바뀌면 다시 색인합니다.
+
+    Args:
+        nutrition_info: 영양성분 정보 (get_nutrition_info_safe() 결과 등)
+
+    Returns:
+        IngredientIndex: 성분 색인
+    """
+    product_id = nutrition_info.get('product_id')
+    is_snapshot, index = _nutrition_cache.get_index(product_id, nutrition_info)
+    if index is not None:
+        return index
+    if is_snapshot:
+        index = IngredientIndex(nutrition_info.get('ingredients', []))
+        _nutrition_cache.set_index(product_id, nutrition_info, index)
+        return index
+
+    key = (product_id, nutrition_info_version(nutrition_info))
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            return index
+
+    index = IngredientIndex(nutrition_info.get('ingredients', []))
+
+    with _index_lock:
+        _index_cache[key] = index
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > INGREDIENT_INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+
+    return index
+
+
 def is_valid_ingredient(
     mentioned_name: str,
     nutrition_info: Dict[str, Any]
@@ -175,39 +521,10 @@ def is_valid_ingredient(
     if not mentioned_name or not nutrition_info:
         return False
     
-    mentioned_normalized = normalize_ingredient_name(mentioned_name)
-    ingredients = nutrition_info.get('ingredients', [])
-    
-    if not ingredients:
+    if not nutrition_info.get('ingredients', []):
         return False
     
-    for ingredient in ingredients:
-        # 실제 스키마에 맞게 조정 필요
-        # 현재는 food_name, representative_food_name 등을 확인
-        ingredient_name = ingredient.get('food_name', '') or \
-                         ingredient.get('representative_food_name', '') or \
-                         ingredient.get('ingredient_name', '')
-        
-        if not ingredient_name:
-            continue
-        
-        official_normalized = normalize_ingredient_name(ingredient_name)
-        
-        # 정확히 일치하거나 포함 관계 확인
-        if mentioned_normalized in official_normalized or \
-           official_normalized in mentioned_normalized:
-            return True
-        
-        # 동의어 확인 (ingredient_aliases가 있는 경우)
-        aliases = ingredient.get('ingredient_aliases', [])
-        if isinstance(aliases, list):
-            for alias in aliases:
-                alias_normalized = normalize_ingredient_name(str(alias))
-                if mentioned_normalized in alias_normalized or \
-                   alias_normalized in mentioned_normalized:
-                    return True
-    
-    return False
+    return get_ingredient_index(nutrition_info).contains(mentioned_name)
 
 
 def get_official_efficacy(
@@ -227,21 +544,7 @@ def get_official_efficacy(
     if not ingredient_name or not nutrition_info:
         return []
     
-    ingredients = nutrition_info.get('ingredients', [])
-    efficacy_list = []
-    
-    for ingredient in ingredients:
-        ingredient_name_db = ingredient.get('ingredient_name', '') or \
-                            ingredient.get('food_name', '')
-        
-        if normalize_ingredient_name(ingredient_name) == \
-           normalize_ingredient_name(ingredient_name_db):
-            official_efficacy = ingredient.get('official_efficacy', [])
-            if isinstance(official_efficacy, list):
-                efficacy_list.extend(official_efficacy)
-            break
-    
-    return list(set(efficacy_list))  # 중복 제거
+    return get_ingredient_index(nutrition_info).official_efficacy(ingredient_name)
 
 
 def get_typical_effect_period(
@@ -261,17 +564,4 @@ def get_typical_effect_period(
     if not ingredient_name or not nutrition_info:
         return None
     
-    ingredients = nutrition_info.get('ingredients', [])
-    
-    for ingredient in ingredients:
-        ingredient_name_db = ingredient.get('ingredient_name', '') or \
-                            ingredient.get('food_name', '')
-        
-        if normalize_ingredient_name(ingredient_name) == \
-           normalize_ingredient_name(ingredient_name_db):
-            period = ingredient.get('typical_effect_period_days')
-            if period:
-                return int(period)
-            break
-    
-    return None
+    return get_ingredient_index(nutrition_info).typical_effect_period(ingredient_name)
@@ -0,0 +1,317 @@
+"""
+다중 리뷰 묶음(pack) 분석 모듈
+같은 제품의 리뷰 여러 개를 한 번의 LLM 호출로 분석합니다.
+
+동작 방식:
+- SYSTEM_PROMPT + 묶음 응답 규칙 + 제품 영양성분 정보를 시스템 프롬프트 앞부분에 한 번만
+  배치하고 캐시 지점(cache_control)을 지정 → 같은 제품의 다음 묶음은 프롬프트 캐시 적중
+- 사용자 메시지에는 번호가 붙은 리뷰 N개만 포함
+- 응답은 리뷰별 결과의 JSON 배열로 파싱 (각 항목은 analyze와 같은 형식)
+- 배열 파싱/검증에 실패하면 묶음을 반으로 나누어 재요청, 1건이 되면 기존 analyze_safe로 분석
+- 처리량(리뷰/초)과 리뷰당 토큰 수를 집계하여 묶음 크기 조정에 활용
+- 결과 캐시는 단건 분석과 다른 프롬프트 버전(PROMPT_VERSION)으로 저장 (묶음 응답은 단건과 다를 수 있음)
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .analysis_cache import AnalysisResultCache
+from .analyzer import PharmacistAnalyzer, _review_item
+from .nutrition_utils import get_nutrition_info_many, get_nutrition_info_safe
+
+
+# 기본 묶음 크기 (한 요청에 담을 리뷰 수)
+DEFAULT_PACK_SIZE = 10
+
+# 리뷰 1건당 출력 토큰 한도 (analyze의 max_tokens와 동일), 요청당 최대 한도
+MAX_TOKENS_PER_REVIEW = 1000
+MAX_TOKENS_PER_REQUEST = 16000
+
+
+class PackedPharmacistAnalyzer(PharmacistAnalyzer):
+    """같은 제품 리뷰를 묶어서 분석하는 약사 분석기"""
+
+    # 결과 캐시 키의 프롬프트 버전 (단건 분석 결과와 섞이지 않도록 묶음 모드 구분)
+    PROMPT_VERSION = f"{PharmacistAnalyzer.PROMPT_VERSION}:packed-1"
+
+    PACKED_INSTRUCTIONS = """
+**여러 리뷰 묶음 분석 규칙:**
+- 사용자 메시지에 [리뷰 1], [리뷰 2] ... 형식으로 리뷰 여러 개가 주어집니다
+- 각 리뷰는 서로 독립적으로 분석하세요 (다른 리뷰의 내용을 섞지 마세요)
+- 위 JSON 형식의 객체에 "review_index"(리뷰 번호, 1부터 시작) 필드를 추가하세요
+- 반드시 리뷰 순서대로 모든 리뷰의 객체를 담은 JSON 배열 하나로만 응답하세요
+"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        result_cache: Optional[AnalysisResultCache] = None
+    ):
+        """
+        묶음 분석기 초기화
+
+        Args:
+            api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+            result_cache: 분석 결과 캐시 (None이면 ANALYSIS_CACHE_PATH 설정 시 공유 캐시)
+        """
+        super().__init__(api_key, result_cache)
+        self._stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def analyze_packed(
+        self,
+        review_texts: Iterable[str],
+        product_id: Optional[int] = None,
+        pack_size: int = DEFAULT_PACK_SIZE,
+        model: str = "claude-sonnet-4-5-20250929"
+    ) -> List[Dict]:
+        """
+        같은 제품의 리뷰를 pack_size개씩 묶어 분석
+
+        Args:
+            review_texts: 리뷰 텍스트 목록 (모두 같은 제품)
+            product_id: 제품 ID (제공 시 영양성분 정보를 공통 프롬프트에 포함)
+            pack_size: 요청 1회에 담을 리뷰 수
+            model: 사용할 Claude 모델
+
+        Returns:
+            List[Dict]: 입력 순서대로 정렬된 리뷰별 분석 결과 (analyze_safe와 같은 형식)
+        """
+        started = time.perf_counter()
+        review_texts = list(review_texts)
+        results: List[Optional[Dict]] = [None] * len(review_texts)
+
+        nutrition_info = None
+        if product_id:
+            try:
+                nutrition_info = get_nutrition_info_safe(product_id)
+            except Exception:
+                nutrition_info = None
+
+        # 입력 오류와 캐시 적중은 묶음에서 제외
+        pending = []
+        for index, review_text in enumerate(review_texts):
+            if not review_text or len(review_text.strip()) < 10:
+                results[index] = self._error_result(
+                    ValueError("리뷰 텍스트가 너무 짧습니다 (최소 10자 이상)")
+                )
+                continue
+            cache_key = self._cache_key(review_text, product_id, nutrition_info, model)
+            cached = self.result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                results[index] = cached
+                continue
+            pending.append((index, review_text, cache_key))
+
+        pack_size = max(1, pack_size)
+        for start in range(0, len(pending), pack_size):
+            pack = pending[start:start + pack_size]
+            pack_results = self._analyze_pack(
+                [text for _, text, _ in pack], product_id, nutrition_info, model
+            )
+            for (index, _, cache_key), result in zip(pack, pack_results):
+                if cache_key and "error" not in result:
+                    self.result_cache.set(cache_key, result)
+                results[index] = result
+
+        with self._stats_lock:
+            self._stats["reviews"] += len(review_texts)
+            self._stats["elapsed"] += time.perf_counter() - started
+        return results
+
+    def analyze_many_packed(
+        self,
+        reviews: Iterable[Union[str, Dict[str, Any]]],
+        pack_size: int = DEFAULT_PACK_SIZE,
+        model: str = "claude-sonnet-4-5-20250929"
+    ) -> List[Dict]:
+        """
+        여러 제품의 리뷰를 제품별로 묶어 분석 (입력 순서대로 결과 반환)
+
+        Args:
+            reviews: 리뷰 텍스트 또는 리뷰 딕셔너리 목록
+                - 딕셔너리 키: review_text(또는 text/body), product_id(선택적)
+            pack_size: 요청 1회에 담을 리뷰 수
+            model: 사용할 Claude 모델
+
+        Returns:
+            List[Dict]: 리뷰별 분석 결과
+        """
+        items = [_review_item(review) for review in reviews]
+
+        product_ids = [product_id for _, product_id in items if product_id]
+        if product_ids:
+            get_nutrition_info_many(product_ids)
+
+        groups: Dict[Any, List[int]] = {}
+        for index, (_, product_id) in enumerate(items):
+            groups.setdefault(product_id, []).append(index)
+
+        results: List[Optional[Dict]] = [None] * len(items)
+        for product_id, indices in groups.items():
+            texts = [items[index][0] for index in indices]
+            for index, result in zip(indices, self.analyze_packed(texts, product_id, pack_size, model)):
+                results[index] = result
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        묶음 분석 통계 (묶음 크기 조정용)
+
+        Returns:
+            Dict: {
+                "reviews": 처리한 리뷰 수,
+                "packed_reviews": 묶음 응답으로 분석된 리뷰 수,
+                "requests": 묶음 요청 수,
+                "splits": 파싱 실패로 묶음을 나눈 횟수,
+                "fallbacks": 1건 단위 analyze_safe로 분석한 리뷰 수,
+                "input_tokens" / "output_tokens": 묶음 요청 토큰 합계,
+                "cache_read_input_tokens" / "cache_creation_input_tokens": 프롬프트 캐시 토큰,
+                "reviews_per_sec": 초당 처리 리뷰 수,
+                "tokens_per_review": 묶음 분석 리뷰당 토큰 수 (입력 + 캐시 + 출력,
+                    파싱 실패한 요청의 토큰 포함)
+            }
+        """
+        with self._stats_lock:
+            stats = dict(self._stats)
+        packed_reviews = stats["packed_reviews"]
+        total_tokens = (
+            stats["input_tokens"] + stats["output_tokens"] +
+            stats["cache_read_input_tokens"] + stats["cache_creation_input_tokens"]
+        )
+        stats["reviews_per_sec"] = (
+            round(stats["reviews"] / stats["elapsed"], 2) if stats["elapsed"] else 0.0
+        )
+        stats["tokens_per_review"] = (
+            round(total_tokens / packed_reviews, 1) if packed_reviews else 0.0
+        )
+        return stats
+
+    def reset_stats(self) -> None:
+        """통계 초기화"""
+        with self._stats_lock:
+            self._stats = {
+                "reviews": 0,
+                "packed_reviews": 0,
+                "requests": 0,
+                "splits": 0,
+                "fallbacks": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cache_read_input_tokens": 0,
+                "cache_creation_input_tokens": 0,
+                "elapsed": 0.0
+            }
+
+    def _analyze_pack(
+        self,
+        review_texts: List[str],
+        product_id: Optional[int],
+        nutrition_info: Optional[Dict],
+        model: str
+    ) -> List[Dict]:
+        """리뷰 묶음 1회 요청 (파싱 실패 시 반으로 나누어 재요청)"""
+        if len(review_texts) == 1:
+            with self._stats_lock:
+                self._stats["fallbacks"] += 1
+            return [self.analyze_safe(review_texts[0], product_id, model)]
+
+        try:
+            response = self.client.messages.create(
+                **self._packed_params(review_texts, nutrition_info, model)
+            )
+        except Exception as e:
+            error = Exception(f"AI 분석 중 오류 발생: {e}")
+            return [self._error_result(error) for _ in review_texts]
+
+        self._record_usage(response)
+        try:
+            results = self._parse_packed_response(response, review_texts, nutrition_info)
+        except (ValueError, TypeError, KeyError, IndexError, AttributeError):
+            # json.JSONDecodeError 포함: 묶음을 반으로 나누어 재요청
+            with self._stats_lock:
+                self._stats["splits"] += 1
+            middle = len(review_texts) // 2
+            return (
+                self._analyze_pack(review_texts[:middle], product_id, nutrition_info, model) +
+                self._analyze_pack(review_texts[middle:], product_id, nutrition_info, model)
+            )
+
+        with self._stats_lock:
+            self._stats["packed_reviews"] += len(review_texts)
+        return results
+
+    def _packed_params(
+        self,
+        review_texts: List[str],
+        nutrition_info: Optional[Dict],
+        model: str
+    ) -> Dict:
+        """묶음 요청 파라미터 (공통 접두부는 캐시 지점 지정)"""
+        prefix = self.SYSTEM_PROMPT + self.PACKED_INSTRUCTIONS
+        if nutrition_info:
+            prefix += self._nutrition_section(nutrition_info)
+
+        params = self._message_params(self._build_packed_prompt(review_texts), model)
+        params["system"] = [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}
+        ]
+        params["max_tokens"] = min(
+            MAX_TOKENS_PER_REVIEW * len(review_texts), MAX_TOKENS_PER_REQUEST
+        )
+        return params
+
+    def _build_packed_prompt(self, review_texts: List[str]) -> str:
+        """번호가 붙은 리뷰 목록 프롬프트"""
+        sections = [
+            f"[리뷰 {number}]\n---\n{review_text}\n---"
+            for number, review_text in enumerate(review_texts, start=1)
+        ]
+        return (
+            f"다음 건강기능식품 리뷰 {len(review_texts)}개를 각각 분석해주세요:\n\n"
+            + "\n\n".join(sections)
+            + f"\n\n위 리뷰 {len(review_texts)}개를 15년 경력 임상 약사 관점에서 각각 분석하고, "
+            "리뷰 순서대로 JSON 배열로 출력해주세요.\n"
+            "\n본 분석은 의학적 진단이 아닌 실사용자 체감 정보를 기반으로 합니다.\n"
+        )
+
+    def _parse_packed_response(
+        self,
+        response,
+        review_texts: List[str],
+        nutrition_info: Optional[Dict]
+    ) -> List[Dict]:
+        """
+        JSON 배열 응답을 리뷰별 결과로 변환
+
+        Raises:
+            ValueError: 배열이 아니거나 항목 수/번호/필수 필드가 맞지 않는 경우
+        """
+        items = json.loads(response.content[0].text)
+        if not isinstance(items, list) or len(items) != len(review_texts):
+            raise ValueError("묶음 응답 항목 수 불일치")
+
+        # review_index가 있으면 번호 기준으로 정렬
+        if all(isinstance(item, dict) and "review_index" in item for item in items):
+            items = sorted(items, key=lambda item: int(item["review_index"]))
+            if [int(item["review_index"]) for item in items] != list(range(1, len(items) + 1)):
+                raise ValueError("묶음 응답 리뷰 번호 불일치")
+
+        results = []
+        for item, review_text in zip(items, review_texts):
+            if not isinstance(item, dict):
+                raise ValueError("묶음 응답 항목 형식 오류")
+            item.pop("review_index", None)
+            results.append(self._finalize_result(item, review_text, nutrition_info))
+        return results
+
+    def _record_usage(self, response) -> None:
+        """묶음 요청 토큰 사용량 집계 (파싱 실패한 요청 포함)"""
+        usage = getattr(response, "usage", None)
+        with self._stats_lock:
+            self._stats["requests"] += 1
+            for field in ("input_tokens", "output_tokens",
+                          "cache_read_input_tokens", "cache_creation_input_tokens"):
+                self._stats[field] += getattr(usage, field, None) or 0
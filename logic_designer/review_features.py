@@ -0,0 +1,144 @@
+"""
+리뷰 특징(feature) 사전 계산 모듈
+리뷰 1건에서 여러 검증 단계가 공통으로 쓰는 값을 한 번만 계산하여 공유합니다.
+
+공유하는 값:
+- 정규화된 텍스트, 길이
+- 토큰 목록과 토큰별 등장 횟수 (키워드 반복 검사)
+- 규칙 엔진 그룹별 첫 일치 위치 (체크리스트 13개 항목, 개인 경험/부정 표현)
+- 추출된 성분명 (허위 성분 주장, 효과 시점, 영양성분 일치도, 약사 분석 성분 검증)
+
+사용 방식:
+- get_review_features(review_text)는 같은 텍스트에 같은 객체를 반환 (최근 사용 순 캐시)
+  → 체크리스트, TrustScoreCalculator, PharmacistAnalyzer가 인자를 바꾸지 않고도 공유
+- 각 값은 처음 사용할 때 계산 (성분 추출은 product_id가 있을 때만 필요)
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from . import ingredient_lexicon
+from .nutrition_utils import extract_ingredients
+from .rule_engine import CompiledRuleEngine
+
+
+# 토큰 분리 패턴 (키워드 반복 검사와 동일)
+_TOKEN_PATTERN = re.compile(r'\b\w+\b')
+
+
+class ReviewFeatures:
+    """리뷰 1건의 공통 특징 (처음 사용할 때 계산 후 재사용)"""
+
+    def __init__(self, text: str):
+        """
+        리뷰 특징 초기화
+
+        Args:
+            text: 리뷰 텍스트
+        """
+        self.text = text or ""
+        self.normalized_text = " ".join(self.text.split())
+        self.length = len(self.text.strip())
+
+        self._tokens: Optional[List[str]] = None
+        self._token_counts: Optional[Dict[str, int]] = None
+        self._rule_spans: Dict[int, Tuple[CompiledRuleEngine, Dict]] = {}
+        self._ingredients: Optional[Tuple[object, List[str]]] = None
+
+    @property
+    def tokens(self) -> List[str]:
+        """단어 토큰 목록 (등장 순서)"""
+        if self._tokens is None:
+            self._tokens = _TOKEN_PATTERN.findall(self.text)
+        return self._tokens
+
+    @property
+    def token_counts(self) -> Dict[str, int]:
+        """2글자 이상 토큰별 등장 횟수"""
+        if self._token_counts is None:
+            counts: Dict[str, int] = {}
+            for token in self.tokens:
+                if len(token) >= 2:
+                    counts[token] = counts.get(token, 0) + 1
+            self._token_counts = counts
+        return self._token_counts
+
+    @property
+    def max_token_count(self) -> int:
+        """가장 많이 반복된 토큰의 등장 횟수 (없으면 0)"""
+        counts = self.token_counts
+        return max(counts.values()) if counts else 0
+
+    def rule_spans(
+        self,
+        engine: CompiledRuleEngine,
+        deadline: Optional[float] = None
+    ) -> Dict[Hashable, Tuple[int, int]]:
+        """
+        규칙 엔진 그룹별 첫 일치 위치 (엔진별로 한 번만 스캔)
+
+        Args:
+            engine: 규칙 엔진 (예: AdChecklist.get_rule_engine())
+            deadline: 평가 마감 시각 (초과 시 RuleTimeoutError, 결과는 캐시하지 않음)
+
+        Returns:
+            Dict: {감지된 그룹키: (시작, 끝)}
+        """
+        entry = self._rule_spans.get(id(engine))
+        if entry is None or entry[0] is not engine:
+            entry = (engine, engine.spans(self.text, deadline=deadline))
+            self._rule_spans[id(engine)] = entry
+        return entry[1]
+
+    def matched_rules(self, engine: CompiledRuleEngine) -> Set[Hashable]:
+        """규칙 엔진에서 감지된 그룹키 집합 (engine.scan()과 동일)"""
+        return set(self.rule_spans(engine))
+
+    @property
+    def ingredients(self) -> List[str]:
+        """
+        언급된 성분명 (extract_ingredients와 동일)
+
+        성분 사전이 다시 만들어지면(rebuild_ingredient_lexicon) 다시 추출합니다.
+        """
+        lexicon = ingredient_lexicon.get_ingredient_lexicon()
+        if self._ingredients is None or self._ingredients[0] is not lexicon:
+            self._ingredients = (lexicon, extract_ingredients(self.text))
+        return self._ingredients[1]
+
+
+# 텍스트별 리뷰 특징 캐시 (같은 리뷰를 여러 단계에서 사용)
+REVIEW_FEATURES_CACHE_SIZE = 256
+_features_cache: "OrderedDict[str, ReviewFeatures]" = OrderedDict()
+_features_lock = threading.Lock()
+
+
+def get_review_features(review_text: str) -> ReviewFeatures:
+    """
+    리뷰 특징 반환 (같은 텍스트면 같은 객체, 없으면 생성)
+
+    Args:
+        review_text: 리뷰 텍스트
+
+    Returns:
+        ReviewFeatures: 리뷰 특징
+    """
+    review_text = review_text or ""
+
+    with _features_lock:
+        features = _features_cache.get(review_text)
+        if features is not None:
+            _features_cache.move_to_end(review_text)
+            return features
+
+    features = ReviewFeatures(review_text)
+
+    with _features_lock:
+        features = _features_cache.setdefault(review_text, features)
+        _features_cache.move_to_end(review_text)
+        while len(_features_cache) > REVIEW_FEATURES_CACHE_SIZE:
+            _features_cache.popitem(last=False)
+
+    return features
@@ -0,0 +1,140 @@
+"""
+컴파일된 규칙 엔진 모듈
+체크리스트의 모든 정규표현식 패턴을 한 번만 컴파일하여 리뷰 한 건을
+규칙 그룹당 한 번의 검색으로 평가합니다.
+
+동작 방식:
+- 규칙 그룹(체크리스트 항목)별 패턴을 하나의 교대(alternation) 정규식으로 묶어 컴파일
+- 그룹별 플래그는 인라인 범위 플래그((?im:...))로 고정하여 그룹 간 혼용 가능
+- 리뷰 평가 시 패턴마다 re.search를 반복하지 않고 그룹당 1회만 검색
+
+참고:
+- 모든 그룹을 하나의 마스터 정규식으로 합치면 CPython re 엔진의 리터럴 접두사
+  최적화가 사라져 오히려 느려짐 (측정 결과 약 2배) → 그룹 단위 교대를 사용
+- 교대 정규식의 search는 패턴 중 하나라도 일치하면 일치하므로
+  기존 방식(패턴마다 re.search 반복)과 결과가 완전히 동일합니다.
+
+안전 모드 (window 지정):
+- "무상.*제공"처럼 제한 없는 .*/.+ 는 일치하지 않는 긴 줄에서 시작 위치마다
+  줄 끝까지 다시 훑으므로 O(n²) (예: "100%" 2만 번 반복 → 수 초)
+- 안전 모드는 .*/.+ 를 .{0,W}/.{1,W} 로 바꿔 검색 비용을 O(n·W)로 제한
+  (두 표현 사이 거리가 W자 이하인 경우 결과 동일, 줄이 W자 이하면 항상 동일)
+- deadline을 주면 그룹 검색 사이마다 시간을 확인하여 초과 시 RuleTimeoutError
+  (진행 중인 검색 하나는 중단할 수 없으므로 deadline은 안전 모드 엔진과 함께 사용해야
+   검색 하나의 비용까지 제한됨, AdChecklist는 시간 예산 지정 시 안전 모드를 강제)
+- bound_pattern, RuleTimeoutError, DEFAULT_SAFE_WINDOW는 common.regex_safety에 정의
+"""
+
+import re
+import time
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+# 안전 모드 패턴 변환/시간 초과 예외는 core 검증기와 공유 (외부 의존성 없는 공통 모듈)
+from common.regex_safety import DEFAULT_SAFE_WINDOW, RuleTimeoutError, bound_pattern
+
+
+# 그룹 단위로 지정 가능한 플래그와 인라인 플래그 문자 매핑
+_INLINE_FLAGS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+)
+
+
+def _scoped(pattern: str, flags: int) -> str:
+    """패턴을 그룹 전용 인라인 플래그 범위로 감싸기 (예: (?im:...), (?-ims:...))"""
+    on = "".join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+    off = "".join(letter for flag, letter in _INLINE_FLAGS if not flags & flag)
+    return f"(?{on}-{off}:{pattern})" if off else f"(?{on}:{pattern})"
+
+
+class CompiledRuleEngine:
+    """여러 규칙 그룹을 미리 컴파일해 두고 한 번에 평가하는 엔진"""
+
+    def __init__(
+        self,
+        rule_groups: Dict[Hashable, Tuple[List[str], int]],
+        window: Optional[int] = None
+    ):
+        """
+        규칙 엔진 초기화 (패턴 컴파일은 여기서 한 번만 수행)
+
+        Args:
+            rule_groups: {그룹키: (패턴 리스트, re 플래그)}
+                - 그룹 내 패턴 중 하나라도 일치하면 해당 그룹이 감지됨
+                - 패턴이 없는 그룹은 무시
+            window: 안전 모드 반복 제한 길이 (None이면 패턴 그대로 사용)
+        """
+        self.window = window
+        self._compiled: Dict[Hashable, "re.Pattern"] = {}
+
+        for key, (patterns, flags) in rule_groups.items():
+            if not patterns:
+                continue
+            if window is not None:
+                patterns = [bound_pattern(p, window) for p in patterns]
+            alternation = "|".join(f"(?:{p})" for p in patterns)
+            self._compiled[key] = re.compile(_scoped(alternation, flags))
+
+    @property
+    def keys(self) -> Tuple[Hashable, ...]:
+        """엔진에 등록된 그룹키 목록 (등록 순서)"""
+        return tuple(self._compiled)
+
+    def scan(self, text: str, keys: Optional[Iterable[Hashable]] = None) -> Set[Hashable]:
+        """
+        텍스트에서 일치하는 규칙 그룹 검사
+
+        Args:
+            text: 검사할 텍스트
+            keys: 검사할 그룹키 (None이면 전체)
+
+        Returns:
+            Set: 감지된 그룹키 집합
+        """
+        if keys is None:
+            items = self._compiled.items()
+        else:
+            items = [(key, self._compiled[key]) for key in keys if key in self._compiled]
+
+        return {key for key, compiled in items if compiled.search(text)}
+
+    def spans(
+        self,
+        text: str,
+        keys: Optional[Iterable[Hashable]] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[Hashable, Tuple[int, int]]:
+        """
+        텍스트에서 일치하는 규칙 그룹과 첫 일치 위치 검사
+
+        Args:
+            text: 검사할 텍스트
+            keys: 검사할 그룹키 (None이면 전체)
+            deadline: 평가 마감 시각 (time.perf_counter() 기준, None이면 제한 없음,
+                그룹 검색 사이에만 확인하며 진행 중인 검색은 중단하지 않음)
+
+        Returns:
+            Dict: {감지된 그룹키: (시작, 끝)} (scan() 결과와 같은 키)
+
+        Raises:
+            RuleTimeoutError: 그룹 검색 전 마감 시각이 지난 경우
+        """
+        if keys is None:
+            items = self._compiled.items()
+        else:
+            items = [(key, self._compiled[key]) for key in keys if key in self._compiled]
+
+        found = {}
+        for key, compiled in items:
+            if deadline is not None and time.perf_counter() > deadline:
+                raise RuleTimeoutError(f"규칙 평가 시간 초과 (그룹 {key!r} 이전)", found)
+            match = compiled.search(text)
+            if match is not None:
+                found[key] = match.span()
+        return found
+
+    def matches(self, key: Hashable, text: str) -> bool:
+        """단일 그룹 일치 여부 검사"""
+        compiled = self._compiled.get(key)
+        return compiled is not None and compiled.search(text) is not None
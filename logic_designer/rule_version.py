@@ -0,0 +1,119 @@
+"""
+규칙 세트 버전(fingerprint) 모듈
+저장된 채점 결과가 어떤 규칙으로 계산되었는지 기록하여, 규칙이 바뀐 행만 다시 계산할 수 있게 합니다.
+
+- rule_set_fingerprint(): 체크리스트 패턴(AD_PATTERNS, 개인 경험/부정 표현, 의학적 주장/효과 시점),
+  키워드 반복 임계값, 신뢰도 가중치/감점/광고 판별 기준, 안전 모드/시간 예산,
+  영양성분 검증 시 성분 사전 버전(nutrition_info 데이터 포함)의 해시
+  → AD_PATTERNS나 가중치, nutrition_info 데이터를 수정하면 값이 바뀜
+- review_input_hash(): 리뷰 텍스트와 점수 입력(product_id, L/R/M/P/C 점수)의 해시
+  → 리뷰 내용이 바뀐 행만 구분
+
+두 값이 모두 같으면 저장된 결과를 그대로 재사용해도 됩니다.
+"""
+
+import hashlib
+import json
+from typing import Any, Mapping, Optional
+
+from .checklist import AdChecklist
+from .ingredient_lexicon import get_ingredient_lexicon
+from .product_criteria import ProductCheckCriteria
+from .trust_score import TrustScoreCalculator
+
+
+# 점수 입력 필드 (analyze()의 점수 인자와 동일)
+SCORE_INPUT_FIELDS = (
+    "length_score",
+    "repurchase_score",
+    "monthly_use_score",
+    "photo_score",
+    "consistency_score"
+)
+
+
+def _digest(payload: Any) -> str:
+    """JSON 직렬화 결과의 SHA-256 앞 16자리"""
+    data = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def rule_set_fingerprint(
+    criteria: Optional[ProductCheckCriteria] = None,
+    use_nutrition_validation: bool = False,
+    safe_regex: bool = False,
+    time_budget: Optional[float] = None
+) -> str:
+    """
+    현재 규칙 세트의 fingerprint
+
+    Args:
+        criteria: 제품별 체크 기준 (None이면 기본 기준)
+        use_nutrition_validation: 영양성분 검증 사용 여부 (점수 공식이 달라짐)
+        safe_regex: 체크리스트 안전 모드 여부 (반복 제한 길이가 결과에 영향)
+        time_budget: 리뷰 1건 체크리스트 시간 예산(초, 초과한 행은 RULE_TIMEOUT으로 기록되므로 결과에 영향)
+
+    Returns:
+        str: 16자리 16진수 해시 (규칙/가중치가 같으면 항상 같은 값)
+    """
+    checklist = AdChecklist
+    calculator = TrustScoreCalculator
+
+    rules = {
+        "ad_patterns": {str(num): item for num, item in checklist.AD_PATTERNS.items()},
+        "personal_patterns": checklist.PERSONAL_PATTERNS,
+        "negative_patterns": checklist.NEGATIVE_PATTERNS,
+        "medical_claim_patterns": checklist.MEDICAL_CLAIM_PATTERNS,
+        "unrealistic_timeline_patterns": checklist.UNREALISTIC_TIMELINE_PATTERNS,
+        "short_period_pattern": checklist.SHORT_PERIOD_PATTERN,
+        "keyword_repetition_threshold": checklist.KEYWORD_REPETITION_THRESHOLD,
+        "criteria": criteria.to_dict() if criteria else None,
+        "base_weights": calculator.BASE_WEIGHTS,
+        "nutrition_weights": calculator.NUTRITION_WEIGHTS,
+        "penalty_per_item": calculator.PENALTY_PER_ITEM,
+        "ad_score_threshold": calculator.AD_SCORE_THRESHOLD,
+        "ad_detected_limit": calculator.AD_DETECTED_LIMIT,
+        "use_nutrition_validation": use_nutrition_validation
+    }
+    if safe_regex:
+        # 기존 결과의 fingerprint가 바뀌지 않도록 안전 모드일 때만 추가
+        rules["safe_regex_window"] = checklist.SAFE_REGEX_WINDOW
+    if time_budget is not None:
+        rules["time_budget"] = float(time_budget)
+    if use_nutrition_validation:
+        # 성분 사전은 영양성분 검증에서만 사용 (nutrition_info 행의 해시 포함)
+        rules["ingredient_lexicon"] = get_ingredient_lexicon().version
+    if criteria:
+        # 생성 시각/설명은 채점 결과에 영향 없음
+        rules["criteria"].pop("created_at", None)
+        rules["criteria"].pop("description", None)
+
+    return _digest(rules)
+
+
+def review_input_hash(review_text: Optional[str], row: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    리뷰 입력 해시 (리뷰 텍스트 + product_id + 점수 입력)
+
+    Args:
+        review_text: 리뷰 텍스트
+        row: 리뷰 행 (product_id와 점수 필드가 있으면 함께 해시, 빈 값은 제외)
+
+    Returns:
+        str: 16자리 16진수 해시
+    """
+    row = row or {}
+    product_id = row.get("product_id")
+    inputs = {
+        "text": review_text or "",
+        # CSV(문자열)와 JSON(숫자) 입력이 같은 해시가 되도록 문자열로 통일
+        "product_id": None if product_id in (None, "") else str(product_id)
+    }
+    for field in SCORE_INPUT_FIELDS:
+        value = row.get(field)
+        if value not in (None, ""):
+            try:
+                inputs[field] = float(value)
+            except (TypeError, ValueError):
+                inputs[field] = str(value)
+    return _digest(inputs)
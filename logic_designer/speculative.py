@@ -0,0 +1,204 @@
+"""
+추측(speculative) 약사 분석 모듈
+analyze(speculative=True)에서 광고 판별이 끝나기 전에 AI 분석을 미리 시작합니다.
+
+동작 방식:
+- 백그라운드 이벤트 루프 스레드 하나에서 AsyncPharmacistAnalyzer로 분석 실행
+  (영양성분 조회 → Claude 호출), 그동안 호출한 쪽은 체크리스트/신뢰도 점수 계산
+- 광고로 판별되면 진행 중인 분석 태스크를 취소 → 진행 중인 HTTP 요청도 중단
+- 광고가 아니면 이미 진행 중인(또는 끝난) 분석 결과를 그대로 사용
+
+통계 (get_speculation_stats):
+- used / wasted: 결과를 사용한 호출 수 / 버린 호출 수
+- cancelled_in_flight: 응답 도착 전에 취소한 호출 수 (나머지는 응답까지 받은 뒤 버림)
+- latency_saved: 검증과 AI 분석을 겹쳐서 줄인 시간 합계 (초)
+- wasted_seconds: 버린 호출이 진행된 시간 합계 (초)
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Optional
+
+from .async_analyzer import AsyncPharmacistAnalyzer
+
+
+class _SpeculationLoop:
+    """추측 분석용 백그라운드 이벤트 루프 (데몬 스레드, 처음 사용할 때 시작)"""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def submit(self, coro) -> Future:
+        """코루틴을 백그라운드 루프에서 실행 (취소 가능한 Future 반환)"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="speculative-analysis", daemon=True
+                ).start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+
+_speculation_loop = _SpeculationLoop()
+
+_stats_lock = threading.Lock()
+_stats: Dict[str, Any] = {}
+
+
+def reset_speculation_stats() -> None:
+    """추측 분석 통계 초기화"""
+    with _stats_lock:
+        _stats.clear()
+        _stats.update({
+            "started": 0,
+            "used": 0,
+            "wasted": 0,
+            "cancelled_in_flight": 0,
+            "latency_saved": 0.0,
+            "wasted_seconds": 0.0
+        })
+
+
+reset_speculation_stats()
+
+
+def get_speculation_stats() -> Dict[str, Any]:
+    """
+    추측 분석 통계 반환
+
+    Returns:
+        Dict: started, used, wasted, cancelled_in_flight, latency_saved, wasted_seconds,
+            waste_rate(버린 비율), avg_latency_saved(사용한 호출당 절약 시간)
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    decided = stats["used"] + stats["wasted"]
+    stats["waste_rate"] = round(stats["wasted"] / decided, 4) if decided else 0.0
+    stats["avg_latency_saved"] = (
+        round(stats["latency_saved"] / stats["used"], 4) if stats["used"] else 0.0
+    )
+    return stats
+
+
+def _record(**increments) -> None:
+    """통계 누적"""
+    with _stats_lock:
+        for key, value in increments.items():
+            _stats[key] += value
+
+
+class SpeculativeCall:
+    """진행 중인 추측 분석 1건 (PharmacistAnalyzer.analyze_safe와 같은 결과 형식)"""
+
+    def __init__(self, started_at: float):
+        self._future: Optional[Future] = None
+        self._started_at = started_at
+        self._finished_at: Optional[float] = None
+        self._decided = False
+
+    def _finish(self) -> None:
+        """분석 완료 시각 기록 (백그라운드 루프에서 호출)"""
+        self._finished_at = time.perf_counter()
+
+    def _overlap(self, decided_at: float) -> float:
+        """판별 시점까지 AI 분석이 진행된 시간"""
+        finished_at = self._finished_at
+        end = decided_at if finished_at is None else min(decided_at, finished_at)
+        return max(0.0, end - self._started_at)
+
+    def analyze_safe(self, review_text: str = None, product_id: Optional[int] = None,
+                     model: Optional[str] = None) -> Dict:
+        """
+        분석 결과 반환 (완료될 때까지 대기)
+
+        시작할 때 지정한 리뷰/제품/모델의 결과를 반환합니다 (인자는 호환용).
+
+        Raises:
+            Exception: 분석기 생성 실패 (API 키 없음 등)
+        """
+        decided_at = time.perf_counter()
+        if not self._decided:
+            self._decided = True
+            _record(used=1, latency_saved=self._overlap(decided_at))
+        return self._future.result()
+
+    def cancel(self) -> None:
+        """분석 결과를 버림 (응답 도착 전이면 요청 취소)"""
+        if self._decided:
+            return
+        self._decided = True
+        decided_at = time.perf_counter()
+        cancelled = self._future.cancel()
+        _record(
+            wasted=1,
+            cancelled_in_flight=1 if cancelled else 0,
+            wasted_seconds=self._overlap(decided_at)
+        )
+
+
+class SpeculativeAnalyzer:
+    """광고 판별과 동시에 AI 분석을 시작하는 분석기"""
+
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+        """
+        추측 분석기 초기화 (AsyncPharmacistAnalyzer는 첫 분석 시 백그라운드 루프에서 생성)
+
+        Args:
+            api_key: Anthropic API 키 (None인 경우 환경변수에서 로드)
+            base_url: API 주소 (None이면 기본값)
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self._analyzer: Optional[AsyncPharmacistAnalyzer] = None
+
+    def start(
+        self,
+        review_text: str,
+        product_id: Optional[int] = None,
+        model: str = "claude-sonnet-4-5-20250929"
+    ) -> SpeculativeCall:
+        """
+        AI 분석 시작 (영양성분 조회 포함, 바로 반환)
+
+        Args:
+            review_text: 분석할 리뷰 텍스트
+            product_id: 제품 ID (선택적)
+            model: 사용할 Claude 모델
+
+        Returns:
+            SpeculativeCall: 결과 대기(analyze_safe) 또는 취소(cancel)용 핸들
+        """
+        _record(started=1)
+        call = SpeculativeCall(time.perf_counter())
+
+        async def run() -> Dict:
+            try:
+                # 영양성분 조회와 캐시 조회는 analyze()에서 스레드로 실행 (백그라운드 루프 차단 방지)
+                if self._analyzer is None:
+                    self._analyzer = self._create_analyzer()
+                return await self._analyzer.analyze_safe(review_text, product_id, model)
+            finally:
+                call._finish()
+
+        call._future = _speculation_loop.submit(run())
+        return call
+
+    def _create_analyzer(self) -> AsyncPharmacistAnalyzer:
+        """비동기 약사 분석기 생성 (백그라운드 루프에서 호출)"""
+        return AsyncPharmacistAnalyzer(api_key=self.api_key, base_url=self.base_url)
+
+
+# API 키별 공유 추측 분석기 (클라이언트 연결 재사용)
+_speculative_analyzers: Dict[Optional[str], SpeculativeAnalyzer] = {}
+_speculative_analyzers_lock = threading.Lock()
+
+
+def get_speculative_analyzer(api_key: Optional[str] = None) -> SpeculativeAnalyzer:
+    """API 키별 공유 추측 분석기 반환"""
+    with _speculative_analyzers_lock:
+        if api_key not in _speculative_analyzers:
+            _speculative_analyzers[api_key] = SpeculativeAnalyzer(api_key=api_key)
+        return _speculative_analyzers[api_key]
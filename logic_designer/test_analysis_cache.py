@@ -0,0 +1,160 @@
+"""
+analysis_cache.py 테스트 스크립트
+캐시 키 구성, 크기 제한, 캐시 우회, 디스크 영속성, 약사 분석기 연동 검증
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import analysis_cache
+from logic_designer.analysis_cache import AnalysisResultCache, get_analysis_cache
+from logic_designer.analyzer import PharmacistAnalyzer
+
+
+REVIEW = "루테인 한 달 먹었는데 눈이 덜 피곤해요. 재구매 예정입니다."
+
+
+class FakeMessages:
+    """messages.create 호출 횟수를 세는 가짜 API"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **params):
+        self.calls += 1
+        text = json.dumps({
+            "summary": f"요약 {self.calls}", "efficacy": "정보 없음",
+            "side_effects": "정보 없음", "tip": "정보 없음"
+        }, ensure_ascii=False)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def _analyzer(cache):
+    analyzer = PharmacistAnalyzer(api_key="test-key", result_cache=cache)
+    analyzer.client = SimpleNamespace(messages=FakeMessages())
+    return analyzer
+
+
+def test_key_covers_all_parts():
+    """리뷰 공백 차이는 같은 키, 제품/영양성분/모델/프롬프트 버전이 다르면 다른 키"""
+    base = AnalysisResultCache.make_key(REVIEW, 1, {"ingredients": []}, "m", "1")
+
+    assert AnalysisResultCache.make_key(f"  {REVIEW}\n", 1, {"ingredients": []}, "m", "1") == base
+    assert AnalysisResultCache.make_key(REVIEW, 2, {"ingredients": []}, "m", "1") != base
+    assert AnalysisResultCache.make_key(
+        REVIEW, 1, {"ingredients": [{"ingredient_name": "루테인"}]}, "m", "1"
+    ) != base
+    assert AnalysisResultCache.make_key(REVIEW, 1, {"ingredients": []}, "m2", "1") != base
+    assert AnalysisResultCache.make_key(REVIEW, 1, {"ingredients": []}, "m", "2") != base
+
+
+def test_size_eviction_keeps_recently_used(monkeypatch):
+    """최대 항목 수를 여유분(slack)보다 넘으면 가장 오래 사용되지 않은 항목부터 한 번에 제거"""
+    now = [1000.0]
+    monkeypatch.setattr(analysis_cache.time, "time", lambda: now[0])
+    cache = AnalysisResultCache(max_entries=2)  # 여유분 1개 → 4번째 저장에서 정리
+
+    for key in ["a", "b", "c"]:
+        now[0] += 1
+        cache.set(key, {"key": key})
+    assert cache.stats()["size"] == 3
+    now[0] += 1
+    assert cache.get("a") == {"key": "a"}  # a 사용 → b, c가 가장 오래됨
+    now[0] += 1
+    cache.set("a", {"key": "a2"})  # 기존 항목 갱신은 항목 수를 늘리지 않음
+    now[0] += 1
+    cache.set("d", {"key": "d"})
+
+    assert cache.get("b") is None
+    assert cache.get("c") is None
+    assert cache.get("a") == {"key": "a2"}
+    assert cache.get("d") == {"key": "d"}
+    assert cache.stats()["size"] == 2
+
+
+def test_store_does_not_count_rows(monkeypatch):
+    """저장할 때마다 COUNT(*)를 실행하지 않고, 정리할 때만 실제 항목 수로 보정"""
+    cache = AnalysisResultCache(max_entries=100)
+    statements = []
+    cache._conn.set_trace_callback(statements.append)
+
+    for i in range(100):
+        cache.set(f"k{i}", {"i": i})
+    assert not any("COUNT(*)" in sql for sql in statements)
+
+    for i in range(100, 111):
+        cache.set(f"k{i}", {"i": i})
+    assert sum("COUNT(*)" in sql for sql in statements) == 1
+    assert cache.stats()["size"] == 100
+
+
+def test_max_bytes_evicts_by_page_usage():
+    """max_bytes를 넘으면 주기적으로 오래된 항목을 제거하여 사용 크기를 제한"""
+    cache = AnalysisResultCache(max_entries=100000, max_bytes=200_000)
+    payload = {"summary": "x" * 2000}
+
+    for i in range(1000):
+        cache.set(f"k{i}", payload)
+
+    stats = cache.stats()
+    assert stats["bytes"] <= 200_000 * 1.5
+    assert 0 < stats["size"] < 1000
+    assert cache.get("k999") == payload
+    assert cache.get("k0") is None
+
+
+def test_analyzer_uses_cache_and_bypass():
+    """같은 리뷰는 API 재호출 없이 캐시 결과, use_cache=False면 새로 분석 후 갱신"""
+    analyzer = _analyzer(AnalysisResultCache())
+
+    first = analyzer.analyze(REVIEW)
+    second = analyzer.analyze(f" {REVIEW} ")
+    assert analyzer.client.messages.calls == 1
+    assert second == first
+    assert second is not first
+
+    refreshed = analyzer.analyze_safe(REVIEW, use_cache=False)
+    assert analyzer.client.messages.calls == 2
+    assert refreshed["summary"] == "요약 2"
+    assert analyzer.analyze(REVIEW)["summary"] == "요약 2"
+
+    analyzer.analyze(REVIEW, model="other-model")
+    assert analyzer.client.messages.calls == 3
+
+
+def test_cache_persists_on_disk(tmp_path, monkeypatch):
+    """SQLite 파일 캐시는 프로세스(인스턴스)가 바뀌어도 유지, 환경변수로 공유 캐시 활성화"""
+    path = str(tmp_path / "cache" / "analysis.sqlite3")
+    first = _analyzer(AnalysisResultCache(path))
+    result = first.analyze(REVIEW)
+    first.result_cache.close()
+
+    monkeypatch.setenv("ANALYSIS_CACHE_PATH", path)
+    monkeypatch.setattr(analysis_cache, "_analysis_cache", None)
+    second = _analyzer(None)
+
+    assert second.result_cache is get_analysis_cache()
+    assert second.analyze(REVIEW) == result
+    assert second.client.messages.calls == 0
+    second.result_cache.close()
+
+
+def test_no_cache_without_configuration(monkeypatch):
+    """ANALYSIS_CACHE_PATH가 없으면 캐시 없이 매번 분석"""
+    monkeypatch.delenv("ANALYSIS_CACHE_PATH", raising=False)
+    analyzer = _analyzer(None)
+
+    assert analyzer.result_cache is None
+    analyzer.analyze(REVIEW)
+    analyzer.analyze(REVIEW)
+    assert analyzer.client.messages.calls == 2
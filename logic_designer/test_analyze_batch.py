@@ -0,0 +1,67 @@
+"""
+analyze_batch() 테스트 스크립트
+일괄 분석 결과가 analyze() 개별 호출과 동일하고, 엔진 객체를 재사용하는지 검증
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logic_designer
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+
+
+def test_batch_matches_single_analyze(monkeypatch):
+    """일괄 분석 결과가 입력 순서대로 analyze()와 동일"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    texts = [t["body"] for t in NORMAL_REVIEW_TEMPLATES + AD_REVIEW_TEMPLATES]
+    reviews = [{"review_text": text, "photo_score": 20} for text in texts]
+
+    batch = logic_designer.analyze_batch(iter(reviews), use_nutrition_validation=False)
+    single = [
+        logic_designer.analyze(text, photo_score=20, use_nutrition_validation=False)
+        for text in texts
+    ]
+
+    assert batch == single
+
+
+def test_batch_reuses_analyzer_and_reports_item_errors(monkeypatch):
+    """약사 분석기는 한 번만 생성되고, 개별 오류는 해당 항목에만 기록"""
+    created = []
+
+    class FakeAnalyzer:
+        def __init__(self, api_key=None):
+            created.append(api_key)
+
+        def analyze_safe(self, review_text, product_id=None, model=None):
+            return {"summary": review_text[:5]}
+
+    monkeypatch.setattr(logic_designer, "PharmacistAnalyzer", FakeAnalyzer)
+
+    normal = NORMAL_REVIEW_TEMPLATES[0]["body"]
+    results = logic_designer.analyze_batch(
+        [
+            {"text": normal, "length_score": 90, "monthly_use_score": 90},
+            {"product_id": 1},
+            {"body": "짧음"},
+            {"review_text": normal, "length_score": 90, "monthly_use_score": 90},
+        ],
+        api_key="test-key",
+        use_nutrition_validation=False
+    )
+
+    assert len(results) == 4
+    assert results[0]["analysis"] == {"summary": normal[:5]}
+    assert results[1]["error"] == "ITEM_ERROR"
+    assert results[2]["error"] == "REVIEW_TOO_SHORT"
+    assert results[3] == results[0]
+    assert created == ["test-key"]
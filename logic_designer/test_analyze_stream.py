@@ -0,0 +1,64 @@
+"""
+analyze_stream() 테스트 스크립트
+검증 결과가 AI 분석 호출 전에 먼저 나오고, 최종 결과가 analyze()와 동일한지 검증
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logic_designer
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+
+
+def test_validation_before_analysis(monkeypatch):
+    """검증 이벤트는 약사 분석기 생성 전에 나오고, 분석 이벤트가 뒤따름"""
+    calls = []
+
+    class FakeAnalyzer:
+        def __init__(self, api_key=None):
+            calls.append("created")
+
+        def analyze_safe(self, review_text, product_id=None, model=None):
+            return {"summary": review_text[:5]}
+
+    monkeypatch.setattr(logic_designer, "PharmacistAnalyzer", FakeAnalyzer)
+
+    normal = NORMAL_REVIEW_TEMPLATES[0]["body"]
+    stream = logic_designer.analyze_stream(
+        normal, length_score=90, monthly_use_score=90, use_nutrition_validation=False
+    )
+
+    first = next(stream)
+    assert first["event"] == "validation"
+    assert first["data"]["is_ad"] is False
+    assert calls == []
+
+    second = next(stream)
+    assert second == {"event": "analysis", "data": {"summary": normal[:5]}}
+    assert calls == ["created"]
+    assert list(stream) == []
+
+
+def test_stream_matches_analyze(monkeypatch):
+    """스트림 이벤트를 합치면 analyze() 결과와 동일, 짧은 리뷰는 error 이벤트만"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+
+    for text in [t["body"] for t in NORMAL_REVIEW_TEMPLATES[:2] + AD_REVIEW_TEMPLATES[:2]]:
+        events = {
+            event["event"]: event["data"]
+            for event in logic_designer.analyze_stream(text, use_nutrition_validation=False)
+        }
+        assert events == logic_designer.analyze(text, use_nutrition_validation=False)
+
+    assert list(logic_designer.analyze_stream("짧음")) == [{
+        "event": "error",
+        "data": {"error": "REVIEW_TOO_SHORT", "message": "리뷰가 너무 짧습니다 (최소 10자 이상)"}
+    }]
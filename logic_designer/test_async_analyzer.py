@@ -0,0 +1,216 @@
+"""
+AsyncPharmacistAnalyzer 테스트 스크립트
+로컬 스텁 서버(Messages API 흉내)로 동시 요청 수 제한, retry-after 재시도,
+입력 순서 유지를 검증
+"""
+
+import asyncio
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer.async_analyzer import AsyncPharmacistAnalyzer
+
+
+class StubMessagesServer(ThreadingHTTPServer):
+    """POST /v1/messages 스텁 (리뷰 번호를 summary로 돌려줌)"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubMessagesHandler)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.requests = []
+        self.temperatures = set()
+        self.rate_limited = set()  # 첫 요청에 429를 돌려줄 리뷰 번호
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubMessagesHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+        review_no = prompt.split("리뷰번호:")[1].split()[0]
+        server = self.server
+
+        with server.lock:
+            server.requests.append(review_no)
+            server.temperatures.add(body.get("temperature"))
+            first_rate_limit = review_no in server.rate_limited
+            server.rate_limited.discard(review_no)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+
+        try:
+            time.sleep(random.uniform(0.01, 0.05))
+            if first_rate_limit:
+                self._send(429, {
+                    "type": "error",
+                    "error": {"type": "rate_limit_error", "message": "rate limited"}
+                }, {"retry-after": "0.05"})
+                return
+
+            if review_no == "broken":
+                text = "JSON 아님"
+            else:
+                text = json.dumps({
+                    "summary": review_no, "efficacy": "정보 없음",
+                    "side_effects": "정보 없음", "tip": "정보 없음"
+                }, ensure_ascii=False)
+            self._send(200, {
+                "id": f"msg_{review_no}", "type": "message", "role": "assistant",
+                "model": body["model"], "stop_reason": "end_turn", "stop_sequence": None,
+                "content": [{"type": "text", "text": text}],
+                "usage": {"input_tokens": 10, "output_tokens": 10}
+            })
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status, payload, headers=None):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def stub_server():
+    server = StubMessagesServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_analyze_many_bounded_and_ordered(stub_server):
+    """동시 요청 수는 max_concurrency 이하, 결과는 입력 순서, 429는 재시도"""
+    stub_server.rate_limited = {"3", "7"}
+    analyzer = AsyncPharmacistAnalyzer(api_key="test-key", base_url=stub_server.base_url)
+
+    reviews = [f"리뷰번호: {i} 루테인 먹고 눈이 편해졌어요" for i in range(20)]
+    reviews[5] = {"review_text": "리뷰번호: broken 파싱 실패 응답 테스트"}
+    reviews[9] = "짧음"
+
+    results = asyncio.run(analyzer.analyze_many(reviews, max_concurrency=4))
+
+    assert len(results) == 20
+    for i, result in enumerate(results):
+        if i == 5:
+            assert result["error"] == "분석 실패"
+            assert "파싱 실패" in result["message"]
+        elif i == 9:
+            assert result["error"] == "입력 오류"
+        else:
+            assert result["summary"] == str(i)
+            assert "disclaimer" in result
+
+    assert 1 < stub_server.max_in_flight <= 4
+    assert stub_server.temperatures == {0.3}
+    assert stub_server.requests.count("3") == 2
+    assert stub_server.requests.count("7") == 2
+
+
+def test_retry_gives_up_after_max_retries(stub_server):
+    """재시도 횟수를 넘기면 분석 실패 결과"""
+    analyzer = AsyncPharmacistAnalyzer(
+        api_key="test-key", base_url=stub_server.base_url, max_retries=0
+    )
+    stub_server.rate_limited = {"1"}
+
+    result = asyncio.run(analyzer.analyze_safe("리뷰번호: 1 비타민C 먹고 피로가 줄었어요"))
+
+    assert result["error"] == "분석 실패"
+    assert stub_server.requests == ["1"]
+
+
+def test_blocking_io_runs_off_event_loop(stub_server, monkeypatch):
+    """영양성분 조회와 결과 캐시 조회/저장은 스레드에서 실행되어 이벤트 루프를 막지 않음"""
+    from logic_designer import analyzer as analyzer_module
+
+    loop_threads = []
+
+    def slow_nutrition(product_id):
+        time.sleep(0.3)
+        loop_threads.append(("nutrition", threading.current_thread()))
+        return None
+
+    class SlowCache:
+        def make_key(self, *parts):
+            return repr(parts)
+
+        def get(self, key):
+            time.sleep(0.3)
+            loop_threads.append(("get", threading.current_thread()))
+            return None
+
+        def set(self, key, value):
+            loop_threads.append(("set", threading.current_thread()))
+
+    monkeypatch.setattr(analyzer_module, "get_nutrition_info_safe", slow_nutrition)
+    analyzer = AsyncPharmacistAnalyzer(
+        api_key="test-key", base_url=stub_server.base_url, result_cache=SlowCache()
+    )
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await analyzer.analyze("리뷰번호: 1 루테인 먹고 눈이 편해졌어요", product_id=1)
+        task.cancel()
+        return result, ticks, threading.current_thread()
+
+    result, ticks, loop_thread = asyncio.run(main())
+
+    assert result["summary"] == "1"
+    assert ticks >= 20  # 0.6초 동안 루프가 계속 동작
+    assert [name for name, _ in loop_threads] == ["nutrition", "get", "set"]
+    assert all(thread is not loop_thread for _, thread in loop_threads)
+
+
+def test_retry_delay_prefers_headers():
+    """retry-after-ms, retry-after(초), 지수 백오프 순으로 대기 시간 결정"""
+    analyzer = AsyncPharmacistAnalyzer(api_key="test-key", max_retry_wait=5)
+
+    class FakeError:
+        def __init__(self, headers):
+            self.response = type("Response", (), {"headers": headers})()
+
+    assert analyzer._retry_delay(FakeError({"retry-after-ms": "250"}), 0) == 0.25
+    assert analyzer._retry_delay(FakeError({"retry-after": "2"}), 0) == 2.0
+    assert analyzer._retry_delay(FakeError({"retry-after": "120"}), 0) == 5
+    assert analyzer._retry_delay(FakeError({}), 2) == 2.0
@@ -0,0 +1,191 @@
+"""
+BatchPharmacistAnalyzer 테스트 스크립트
+로컬 가짜 Message Batches 서버로 배치 제출, 상태 확인, 결과 변환,
+체크포인트 재개를 검증
+"""
+
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer.batch_analyzer import BatchPharmacistAnalyzer
+
+
+class FakeBatchServer(ThreadingHTTPServer):
+    """Message Batches API 흉내 (제출 → 상태 확인 2회 후 완료 → JSONL 결과)"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeBatchHandler)
+        self.lock = threading.Lock()
+        self.batches = {}      # batch_id → 요청 목록
+        self.polls = {}        # batch_id → 상태 확인 횟수
+        self.created = []      # 제출된 배치의 custom_id 목록
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def batch_object(self, batch_id):
+        ended = self.polls[batch_id] >= 2
+        return {
+            "id": batch_id, "type": "message_batch",
+            "processing_status": "ended" if ended else "in_progress",
+            "request_counts": {"processing": 0, "succeeded": 0, "errored": 0,
+                               "canceled": 0, "expired": 0},
+            "created_at": "2026-01-01T00:00:00Z", "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T01:00:00Z" if ended else None,
+            "archived_at": None, "cancel_initiated_at": None,
+            "results_url": f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+        }
+
+
+class FakeBatchHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            batch_id = f"msgbatch_{len(server.batches) + 1}"
+            server.batches[batch_id] = body["requests"]
+            server.polls[batch_id] = 0
+            server.created.append([request["custom_id"] for request in body["requests"]])
+            payload = server.batch_object(batch_id)
+        self._send(payload)
+
+    def do_GET(self):
+        parts = self.path.strip("/").split("/")
+        server = self.server
+        batch_id = parts[3]
+
+        if parts[-1] == "results":
+            lines = [json.dumps(_batch_result(request), ensure_ascii=False)
+                     for request in reversed(server.batches[batch_id])]
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/binary")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+            return
+
+        with server.lock:
+            server.polls[batch_id] += 1
+            payload = server.batch_object(batch_id)
+        self._send(payload)
+
+    def _send(self, payload):
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def _batch_result(request):
+    """요청 프롬프트의 리뷰 번호로 결과 생성 (errored/파싱 실패 포함)"""
+    assert request["params"]["temperature"] == 0.3
+    prompt = request["params"]["messages"][0]["content"]
+    review_no = prompt.split("리뷰번호:")[1].split()[0]
+
+    if review_no == "errored":
+        return {"custom_id": request["custom_id"], "result": {
+            "type": "errored",
+            "error": {"type": "error", "error": {"type": "api_error", "message": "boom"}}
+        }}
+
+    text = "JSON 아님" if review_no == "broken" else json.dumps({
+        "summary": review_no, "efficacy": "정보 없음",
+        "side_effects": "정보 없음", "tip": "정보 없음"
+    }, ensure_ascii=False)
+    return {"custom_id": request["custom_id"], "result": {"type": "succeeded", "message": {
+        "id": f"msg_{review_no}", "type": "message", "role": "assistant",
+        "model": request["params"]["model"], "stop_reason": "end_turn", "stop_sequence": None,
+        "content": [{"type": "text", "text": text}],
+        "usage": {"input_tokens": 10, "output_tokens": 10}
+    }}}
+
+
+@pytest.fixture
+def batch_server():
+    server = FakeBatchServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _analyzer(server, **kwargs):
+    return BatchPharmacistAnalyzer(
+        api_key="test-key", base_url=server.base_url, poll_interval=0, **kwargs
+    )
+
+
+REVIEWS = [f"리뷰번호: {i} 루테인 먹고 눈이 편해졌어요" for i in range(7)] + [
+    "짧음",
+    {"review_text": "리뷰번호: broken 파싱 실패 응답"},
+    {"text": "리뷰번호: errored 배치 오류 응답"},
+]
+
+
+def test_bulk_results_in_analyze_safe_shape(batch_server):
+    """배치 분할 제출, 결과는 입력 순서, 실패는 analyze_safe 형식"""
+    results = _analyzer(batch_server, max_batch_requests=4).analyze_bulk(REVIEWS)
+
+    assert [len(ids) for ids in batch_server.created] == [4, 4, 1]
+    assert all(polls >= 2 for polls in batch_server.polls.values())
+    for i in range(7):
+        assert results[i]["summary"] == str(i)
+        assert "disclaimer" in results[i]
+    assert results[7]["error"] == "입력 오류"
+    assert results[8]["error"] == "분석 실패"
+    assert "파싱 실패" in results[8]["message"]
+    assert results[9]["error"] == "분석 실패"
+    assert "errored" in results[9]["message"]
+
+
+def test_checkpoint_resume_after_crash(batch_server, tmp_path):
+    """중단 후 재실행 시 배치를 다시 제출하지 않고 남은 결과만 이어서 수신"""
+    checkpoint = str(tmp_path / "bulk.jsonl")
+
+    stream = _analyzer(batch_server).iter_results(REVIEWS, checkpoint_path=checkpoint)
+    first = [next(stream) for _ in range(3)]
+    stream.close()  # 작업 중단 흉내
+    assert len(batch_server.created) == 1
+
+    resumed = list(_analyzer(batch_server).iter_results(REVIEWS, checkpoint_path=checkpoint))
+    assert len(batch_server.created) == 1
+    assert resumed[:3] == first
+    assert sorted(index for index, _ in resumed) == list(range(len(REVIEWS)))
+
+    # 완료된 체크포인트로 다시 실행하면 API 호출 없이 결과 반환
+    again = _analyzer(batch_server).analyze_bulk(REVIEWS, checkpoint_path=checkpoint)
+    assert again == [result for _, result in sorted(resumed, key=lambda item: item[0])]
+    assert len(batch_server.created) == 1
+
+
+def test_checkpoint_rejects_other_input(batch_server, tmp_path):
+    """다른 입력으로 만든 체크포인트는 사용하지 않음"""
+    checkpoint = str(tmp_path / "bulk.jsonl")
+    _analyzer(batch_server).analyze_bulk(REVIEWS[:2], checkpoint_path=checkpoint)
+
+    with pytest.raises(ValueError):
+        _analyzer(batch_server).analyze_bulk(REVIEWS[:3], checkpoint_path=checkpoint)
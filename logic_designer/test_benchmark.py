@@ -0,0 +1,105 @@
+"""
+benchmark.py 테스트 스크립트
+합성 코퍼스가 결정적이고, 외부 서비스 없이 단계별 처리량/지연 시간을 측정하며,
+기준값 대비 성능 저하를 찾아내는지 검증
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logic_designer
+from logic_designer import benchmark
+
+
+def test_corpus_is_deterministic_and_mixed():
+    """같은 seed는 같은 코퍼스, 텍스트는 모두 다르고 한국어/영어와 정상/광고가 섞임"""
+    corpus = list(benchmark.generate_corpus(500, seed=7))
+
+    assert corpus == list(benchmark.generate_corpus(500, seed=7))
+    assert corpus != list(benchmark.generate_corpus(500, seed=8))
+    assert len({review["review_text"] for review in corpus}) == 500
+    assert {review["language"] for review in corpus} == {"ko", "en"}
+    assert {review["is_ad_template"] for review in corpus} == {True, False}
+    assert benchmark.corpus_size("100k") == 100_000
+    assert benchmark.corpus_size("1M") == 1_000_000
+
+
+def test_stubs_replace_supabase_and_anthropic(monkeypatch):
+    """대체 컨텍스트 안에서는 Supabase/Anthropic 호출 없이 analyze()가 끝까지 동작"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    review = next(r for r in benchmark.generate_corpus(50) if not r["is_ad_template"])
+
+    with benchmark.stub_external_services() as calls:
+        result = logic_designer.analyze(
+            review["review_text"], product_id=review["product_id"],
+            length_score=100, repurchase_score=100, monthly_use_score=100, consistency_score=100
+        )
+
+    assert result["analysis"]["summary"] == benchmark.STUB_ANALYSIS["summary"]
+    assert calls.messages.calls == 1
+    assert calls.nutrition_fetches == 1
+    assert calls.lexicon_loads == 0  # 성분 사전은 미리 생성되어 DB 조회 없음
+
+
+def test_run_benchmark_reports_every_stage():
+    """단계별 처리량과 p50 ≤ p99 지연 시간"""
+    results = benchmark.run_benchmark(size=200)
+
+    assert results["size"] == 200
+    assert list(results["stages"]) == list(benchmark.STAGES)
+    for stats in results["stages"].values():
+        assert stats["reviews"] == 200
+        assert stats["reviews_per_sec"] > 0
+        assert 0 <= stats["p50_ms"] <= stats["p99_ms"]
+
+
+def test_baseline_comparison(tmp_path, capsys):
+    """기준값 저장 후 비교: 처리량이 허용 범위 이상 떨어진 단계만 성능 저하"""
+    path = tmp_path / "baseline.json"
+    assert benchmark.main(["--size", "100", "--stages", "checklist,rating",
+                           "--save-baseline", str(path)]) == 0
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    assert set(baseline["stages"]) == {"checklist", "rating"}
+
+    current = {"stages": {
+        "checklist": dict(baseline["stages"]["checklist"],
+                          reviews_per_sec=baseline["stages"]["checklist"]["reviews_per_sec"] * 0.5),
+        "rating": dict(baseline["stages"]["rating"],
+                       reviews_per_sec=baseline["stages"]["rating"]["reviews_per_sec"] * 0.9)
+    }}
+    regressions = benchmark.compare_with_baseline(current, baseline, tolerance=0.2)
+
+    assert [item["stage"] for item in regressions] == ["checklist"]
+    assert regressions[0]["change"] == -0.5
+
+    # 기준값 처리량보다 크게 느리면 CLI는 1 반환
+    baseline["stages"]["rating"]["reviews_per_sec"] *= 1000
+    path.write_text(json.dumps(baseline), encoding="utf-8")
+    assert benchmark.main(["--size", "100", "--stages", "rating", "--baseline", str(path)]) == 1
+    assert "성능 저하: rating" in capsys.readouterr().out
+
+
+def test_pathological_corpus_with_safe_regex():
+    """긴 리뷰/반복 스팸 코퍼스: 결정적이고, 안전 모드 체크리스트 측정과 시간 초과 집계"""
+    corpus = list(benchmark.generate_pathological_corpus(6, seed=3, length=4000))
+
+    assert corpus == list(benchmark.generate_pathological_corpus(6, seed=3, length=4000))
+    assert all(1000 <= len(review["review_text"]) <= 4010 for review in corpus)
+    assert all("\n" not in review["review_text"] for review in corpus)
+
+    results = benchmark.run_benchmark(size=6, corpus="pathological", safe_regex=True)
+    assert list(results["stages"]) == list(benchmark.PATHOLOGICAL_STAGES)
+    assert results["stages"]["checklist"]["timeouts"] == 0
+
+    results = benchmark.run_benchmark(size=6, stages=["checklist"], corpus="pathological",
+                                      safe_regex=True, time_budget=1e-9)
+    assert results["stages"]["checklist"]["timeouts"] == 6
@@ -0,0 +1,247 @@
+"""
+bulk.py 테스트 스크립트
+CSV/JSONL 입력을 청크 단위로 채점한 결과가 analyze()의 검증 결과와 같고,
+워커 수와 관계없이 입력 순서대로 기록되는지 검증
+"""
+
+import csv
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logic_designer
+from logic_designer import bulk
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+
+
+def _rows():
+    """정상/광고 리뷰 + 짧은 리뷰 + 텍스트 없는 행"""
+    bodies = [t["body"] for t in NORMAL_REVIEW_TEMPLATES + AD_REVIEW_TEMPLATES]
+    rows = [
+        {"id": str(i), "product_id": f"P-{i % 3}", "body": body, "length_score": str(40 + i)}
+        for i, body in enumerate(bodies)
+    ]
+    rows.append({"id": "short", "product_id": "P-0", "body": "짧음", "length_score": ""})
+    rows.append({"id": "empty", "product_id": "P-0", "body": "", "length_score": ""})
+    return rows
+
+
+def _write_csv(path, rows):
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _read_jsonl(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_match_analyze_validation(tmp_path, monkeypatch):
+    """채점 결과가 analyze()의 validation 블록과 동일"""
+    # 약사 분석은 API 키 없음 오류로 바로 끝나도록 (검증 블록만 비교)
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    rows = _rows()
+    _write_csv(tmp_path / "reviews.csv", rows)
+
+    stats = bulk.score_file(
+        str(tmp_path / "reviews.csv"), str(tmp_path / "out.jsonl"),
+        workers=1, chunk_size=4, progress=False
+    )
+    records = _read_jsonl(tmp_path / "out.jsonl")
+
+    assert stats["reviews"] == len(rows)
+    assert stats["errors"] == 2
+    assert [r["row"] for r in records] == list(range(len(rows)))
+    assert set(records[0]) == set(bulk.OUTPUT_FIELDS)
+
+    for row, record in zip(rows[:-2], records):
+        validation = logic_designer.analyze(
+            row["body"], length_score=float(row["length_score"]), use_nutrition_validation=False
+        )["validation"]
+        assert logic_designer.validate_review(
+            row["body"], length_score=float(row["length_score"]), use_nutrition_validation=False
+        ) == validation
+        assert record["review_id"] == row["id"]
+        assert record["trust_score"] == validation["trust_score"]
+        assert record["is_ad"] == validation["is_ad"]
+        assert record["reasons"] == validation["reasons"]
+        assert record["checklist_items"] == [int(r.split(".")[0]) for r in validation["reasons"]]
+        assert record["error"] is None
+
+    assert records[-2]["error"] == "REVIEW_TOO_SHORT"
+    assert records[-1]["trust_score"] is None and records[-1]["error"]
+    assert stats["ads"] == sum(1 for r in records if r["is_ad"])
+
+
+def test_process_pool_keeps_input_order(tmp_path):
+    """프로세스 풀 결과는 단일 프로세스 결과와 같고 입력 순서 유지 (JSONL 입력)"""
+    rows = _rows() * 5
+    with open(tmp_path / "reviews.jsonl", "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    bulk.score_file(str(tmp_path / "reviews.jsonl"), str(tmp_path / "single.jsonl"),
+                    workers=1, chunk_size=3, progress=False)
+    stats = bulk.score_file(str(tmp_path / "reviews.jsonl"), str(tmp_path / "pool.jsonl"),
+                            workers=2, chunk_size=3, progress=False)
+
+    assert stats["workers"] == 2
+    assert _read_jsonl(tmp_path / "pool.jsonl") == _read_jsonl(tmp_path / "single.jsonl")
+
+
+def test_cli_reports_progress(tmp_path, capsys):
+    """CLI는 진행 상황과 처리량을 stderr에 출력하고 0을 반환"""
+    _write_csv(tmp_path / "reviews.csv", _rows())
+
+    exit_code = bulk.main([str(tmp_path / "reviews.csv"), "-o", str(tmp_path / "out.jsonl"),
+                           "--workers", "1", "--chunk-size", "5"])
+    err = capsys.readouterr().err
+
+    assert exit_code == 0
+    assert "reviews/s" in err
+    assert "완료" in err
+    assert bulk.main([str(tmp_path / "missing.csv"), "-o", str(tmp_path / "x.jsonl")]) == 1
+
+
+def test_parquet_output(tmp_path):
+    """Parquet 출력 (pyarrow 설치 시)"""
+    pq = pytest.importorskip("pyarrow.parquet")
+    _write_csv(tmp_path / "reviews.csv", _rows())
+
+    bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "out.parquet"),
+                    workers=1, progress=False)
+    bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "out.jsonl"),
+                    workers=1, progress=False)
+
+    assert pq.read_table(tmp_path / "out.parquet").to_pylist() == _read_jsonl(tmp_path / "out.jsonl")
+
+
+def test_previous_results_skip_unchanged_rows(tmp_path, monkeypatch):
+    """이전 결과가 있으면 규칙과 리뷰가 바뀐 행만 다시 계산"""
+    rows = _rows()
+    _write_csv(tmp_path / "reviews.csv", rows)
+    first = bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "v1.jsonl"),
+                            workers=1, chunk_size=4, progress=False)
+    assert first["skipped"] == 0 and first["recomputed"] == len(rows)
+
+    # 리뷰 2건 수정 → 수정된 행만 재계산, 결과는 전체 재계산과 동일
+    rows[0]["body"] += " 재구매 의사 있어요."
+    rows[3]["length_score"] = "90"
+    _write_csv(tmp_path / "reviews.csv", rows)
+    stats = bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "v2.jsonl"),
+                            workers=2, chunk_size=4, progress=False,
+                            previous_path=str(tmp_path / "v1.jsonl"))
+    bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "full.jsonl"),
+                    workers=1, progress=False)
+
+    # 텍스트가 없는 행은 해시할 입력이 없으므로 항상 다시 계산
+    assert stats["skipped"] == len(rows) - 3
+    assert stats["recomputed"] == 3
+    assert _read_jsonl(tmp_path / "v2.jsonl") == _read_jsonl(tmp_path / "full.jsonl")
+
+    # 가중치가 바뀌면 전체 재계산 (이전 결과 파일에 덮어쓰기)
+    monkeypatch.setattr(bulk.TrustScoreCalculator, "AD_SCORE_THRESHOLD", 45)
+    stats = bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "v2.jsonl"),
+                            workers=1, progress=False, previous_path=str(tmp_path / "v2.jsonl"))
+
+    assert stats["skipped"] == 0 and stats["recomputed"] == len(rows)
+    assert stats["rule_set_version"] != first["rule_set_version"]
+    assert {r["rule_set_version"] for r in _read_jsonl(tmp_path / "v2.jsonl")} == {stats["rule_set_version"]}
+
+
+def test_time_budget_records_timeouts(tmp_path):
+    """시간 예산을 넘긴 리뷰는 RULE_TIMEOUT으로 기록되고 나머지 행은 계속 처리"""
+    rows = _rows()
+    for i, row in enumerate(rows):
+        row["body"] += f" [{i} 예산]"
+    _write_csv(tmp_path / "reviews.csv", rows)
+
+    stats = bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "out.jsonl"),
+                            workers=1, progress=False, safe_regex=True, time_budget=1e-9)
+    records = _read_jsonl(tmp_path / "out.jsonl")
+
+    assert stats["reviews"] == len(rows)
+    assert stats["timeouts"] == len(rows) - 1  # 마지막 행은 너무 짧아 검사 전에 오류
+    assert [r["error"] for r in records[:-1]] == ["RULE_TIMEOUT"] * (len(rows) - 1)
+    assert all(r["trust_score"] is None for r in records)
+
+    # 안전 모드는 규칙 세트 버전에 반영
+    normal = bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "normal.jsonl"),
+                             workers=1, progress=False)
+    assert normal["rule_set_version"] != stats["rule_set_version"]
+    assert normal["timeouts"] == 0
+
+    # 시간 예산 초과 행은 같은 설정으로 다시 실행해도 재사용하지 않음
+    rerun = bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "rerun.jsonl"),
+                            workers=1, progress=False, time_budget=1e-9,
+                            previous_path=str(tmp_path / "out.jsonl"))
+    assert rerun["rule_set_version"] == stats["rule_set_version"]
+    assert rerun["skipped"] == 1  # 검사 전 오류(짧은 리뷰) 행만 재사용
+    assert rerun["timeouts"] == len(rows) - 1
+
+    # 시간 예산이 다르면 규칙 세트 버전도 다름
+    relaxed = bulk.score_file(str(tmp_path / "reviews.csv"), str(tmp_path / "relaxed.jsonl"),
+                              workers=1, progress=False, time_budget=60)
+    assert relaxed["rule_set_version"] not in (stats["rule_set_version"], normal["rule_set_version"])
+
+
+def test_score_review_default_version_matches_score_file(tmp_path):
+    """score_review의 기본 규칙 세트 버전은 워커 설정(안전 모드/시간 예산)을 반영"""
+    row = _rows()[0]
+    bulk._init_worker(safe_regex=True, time_budget=60)
+    try:
+        record = bulk.score_review(row)
+    finally:
+        bulk._init_worker()
+
+    assert record["rule_set_version"] == bulk.rule_set_fingerprint(safe_regex=True, time_budget=60)
+    assert record["rule_set_version"] != bulk.score_review(row)["rule_set_version"]
+
+
+def test_nutrition_prefetched_once_per_chunk(tmp_path, monkeypatch):
+    """--nutrition 채점은 리뷰마다가 아니라 청크마다 영양성분 정보를 일괄 조회"""
+    from logic_designer import ingredient_lexicon, nutrition_utils
+
+    single_fetches = []
+    batch_fetches = []
+
+    def fetch_one(product_id):
+        single_fetches.append(product_id)
+        return None
+
+    def fetch_many(product_ids):
+        batch_fetches.append(sorted(product_ids))
+        return {str(product_id): [{"ingredient_name": "루테인"}] for product_id in product_ids}
+
+    monkeypatch.setattr(nutrition_utils, "_fetch_nutrition_info", fetch_one)
+    monkeypatch.setattr(nutrition_utils, "_fetch_nutrition_rows_many", fetch_many)
+    monkeypatch.setattr(nutrition_utils, "_nutrition_cache", nutrition_utils.NutritionInfoCache())
+    monkeypatch.setattr(ingredient_lexicon, "_load_nutrition_rows", lambda *args, **kwargs: [])
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon", ingredient_lexicon.IngredientLexicon.from_nutrition_rows([]))
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon_retry_at", None)
+
+    rows = [
+        {"id": str(i), "product_id": f"P-{i}", "body": "루테인 먹고 눈이 편해졌어요. 재구매 의사 있습니다."}
+        for i in range(6)
+    ]
+    _write_csv(tmp_path / "reviews.csv", rows)
+    stats = bulk.score_file(
+        str(tmp_path / "reviews.csv"), str(tmp_path / "out.jsonl"),
+        workers=1, chunk_size=4, progress=False, use_nutrition_validation=True
+    )
+
+    assert stats["errors"] == 0
+    assert single_fetches == []
+    assert batch_fetches == [["P-0", "P-1", "P-2", "P-3"], ["P-4", "P-5"]]
@@ -0,0 +1,169 @@
+"""
+IngredientIndex 테스트 스크립트
+제품별 성분 색인이 기존 행 순회 방식과 동일한 결과를 내는지 검증
+"""
+
+import random
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import nutrition_utils
+from logic_designer.nutrition_utils import (
+    normalize_ingredient_name,
+    is_valid_ingredient,
+    get_official_efficacy,
+    get_typical_effect_period
+)
+
+
+def legacy_is_valid_ingredient(mentioned_name, nutrition_info):
+    """기존 구현 (성분 행 전체 순회) - 비교 기준"""
+    if not mentioned_name or not nutrition_info:
+        return False
+    mentioned_normalized = normalize_ingredient_name(mentioned_name)
+    ingredients = nutrition_info.get('ingredients', [])
+    if not ingredients:
+        return False
+    for ingredient in ingredients:
+        ingredient_name = ingredient.get('food_name', '') or \
+                         ingredient.get('representative_food_name', '') or \
+                         ingredient.get('ingredient_name', '')
+        if not ingredient_name:
+            continue
+        official_normalized = normalize_ingredient_name(ingredient_name)
+        if mentioned_normalized in official_normalized or \
+           official_normalized in mentioned_normalized:
+            return True
+        aliases = ingredient.get('ingredient_aliases', [])
+        if isinstance(aliases, list):
+            for alias in aliases:
+                alias_normalized = normalize_ingredient_name(str(alias))
+                if mentioned_normalized in alias_normalized or \
+                   alias_normalized in mentioned_normalized:
+                    return True
+    return False
+
+
+def legacy_lookup(ingredient_name, nutrition_info):
+    """기존 구현 (효능, 효과 발현 기간) - 비교 기준"""
+    if not ingredient_name or not nutrition_info:
+        return [], None
+    for ingredient in nutrition_info.get('ingredients', []):
+        ingredient_name_db = ingredient.get('ingredient_name', '') or \
+                            ingredient.get('food_name', '')
+        if normalize_ingredient_name(ingredient_name) == \
+           normalize_ingredient_name(ingredient_name_db):
+            official_efficacy = ingredient.get('official_efficacy', [])
+            efficacy = official_efficacy if isinstance(official_efficacy, list) else []
+            period = ingredient.get('typical_effect_period_days')
+            return sorted(set(efficacy)), (int(period) if period else None)
+    return [], None
+
+
+NAMES = ["루테인", "비타민 C", "비타민-D3", "오메가3", "Zinc", "아연", "밀크 씨슬", "  ", "", "C"]
+
+
+def build_products(seed: int = 3):
+    """결정적 무작위 제품 영양성분 정보"""
+    rng = random.Random(seed)
+    products = []
+    for _ in range(60):
+        ingredients = []
+        for _ in range(rng.randint(0, 5)):
+            ingredient = {
+                rng.choice(["food_name", "ingredient_name", "representative_food_name"]):
+                    rng.choice(NAMES),
+                "ingredient_aliases": rng.sample(NAMES, rng.randint(0, 2)),
+                "official_efficacy": rng.sample(["눈 건강", "항산화", "면역"], rng.randint(0, 3)),
+                "typical_effect_period_days": rng.choice([None, 0, 14, "30"]),
+            }
+            if rng.random() < 0.3:
+                ingredient["ingredient_name"] = rng.choice(NAMES)
+            ingredients.append(ingredient)
+        products.append({"ingredients": ingredients, "product_id": len(products)})
+    return products
+
+
+MENTIONS = NAMES + ["루테인 20mg", "비타민C", "비타민", "vitamin c", "밀크씨슬추출물", "d3", "칼슘"]
+
+
+def test_index_matches_legacy():
+    """색인 결과가 기존 구현과 완전히 동일"""
+    for nutrition_info in build_products():
+        for mentioned in MENTIONS:
+            assert is_valid_ingredient(mentioned, nutrition_info) == \
+                legacy_is_valid_ingredient(mentioned, nutrition_info), (mentioned, nutrition_info)
+
+            efficacy, period = legacy_lookup(mentioned, nutrition_info)
+            assert sorted(get_official_efficacy(mentioned, nutrition_info)) == efficacy
+            assert get_typical_effect_period(mentioned, nutrition_info) == period
+
+
+def test_index_built_once_per_product(monkeypatch):
+    """같은 영양성분 정보 객체는 한 번만 색인"""
+    built = []
+    original = nutrition_utils.IngredientIndex
+
+    class CountingIndex(original):
+        def __init__(self, ingredients):
+            built.append(ingredients)
+            super().__init__(ingredients)
+
+    monkeypatch.setattr(nutrition_utils, "IngredientIndex", CountingIndex)
+    monkeypatch.setattr(nutrition_utils, "_index_cache", nutrition_utils.OrderedDict())
+
+    nutrition_info = {"ingredients": [{"ingredient_name": "루테인", "typical_effect_period_days": 30}]}
+    for _ in range(3):
+        assert is_valid_ingredient("루테인", nutrition_info)
+        assert get_typical_effect_period("루테인", nutrition_info) == 30
+    assert len(built) == 1
+
+    # 성분 목록이 교체되면 다시 색인
+    nutrition_info["ingredients"] = [{"ingredient_name": "아연"}]
+    assert not is_valid_ingredient("루테인", nutrition_info)
+    assert len(built) == 2
+
+
+def test_index_built_once_across_cached_lookups(monkeypatch):
+    """get_nutrition_info_safe()를 반복 호출해도 제품 색인은 한 번만 생성"""
+    built = []
+    original = nutrition_utils.IngredientIndex
+
+    class CountingIndex(original):
+        def __init__(self, ingredients):
+            built.append(ingredients)
+            super().__init__(ingredients)
+
+    fetched = []
+
+    def fake_fetch(product_id):
+        fetched.append(product_id)
+        return {"ingredients": [{"ingredient_name": "루테인"}], "product_id": product_id}
+
+    monkeypatch.setattr(nutrition_utils, "IngredientIndex", CountingIndex)
+    monkeypatch.setattr(nutrition_utils, "_index_cache", nutrition_utils.OrderedDict())
+    monkeypatch.setattr(nutrition_utils, "_fetch_nutrition_info", fake_fetch)
+    monkeypatch.setattr(nutrition_utils, "_nutrition_cache", nutrition_utils.NutritionInfoCache())
+
+    for _ in range(5):
+        nutrition_info = nutrition_utils.get_nutrition_info_safe(7)
+        assert is_valid_ingredient("루테인", nutrition_info)
+        assert not is_valid_ingredient("아연", nutrition_info)
+
+    assert fetched == [7]
+    assert len(built) == 1
+    # 색인은 영양성분 캐시 항목에 보관 (보조 색인 캐시는 사용하지 않음)
+    assert len(nutrition_utils._index_cache) == 0
+
+    # 캐시가 새로 조회되면 스냅샷과 함께 색인도 교체
+    nutrition_utils.get_nutrition_info_safe(7, use_cache=False)
+    assert is_valid_ingredient("루테인", nutrition_utils.get_nutrition_info_safe(7))
+    assert len(built) == 2
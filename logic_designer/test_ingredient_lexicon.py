@@ -0,0 +1,136 @@
+"""
+ingredient_lexicon.py 테스트 스크립트
+성분 사전 추출 결과(정규 ID, 원문 표기)와 nutrition_info 기반 재생성 검증
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import ingredient_lexicon
+from logic_designer.ingredient_lexicon import IngredientLexicon, rebuild_ingredient_lexicon
+from logic_designer.nutrition_utils import extract_ingredients, extract_ingredient_ids
+
+
+def test_builtin_canonical_ids():
+    """기본 성분: 표기 변형이 같은 정규 ID로 매핑"""
+    lexicon = IngredientLexicon.builtin()
+    text = "비타민 D3랑 비타민C, 루테인 그리고 Beta carotene, 오메가 3와 omega3, CoQ10, 코엔자임 Q10"
+
+    assert lexicon.extract_ids(text) == [
+        "vitamin_d3", "vitamin_c", "lutein", "beta_carotene", "omega_3", "coenzyme_q10"
+    ]
+    assert lexicon.find("Vitamin b12 좋아요") == [("vitamin_b12", "Vitamin b12")]
+    assert lexicon.find("비타민 먹어요") == [("vitamin", "비타민")]
+    assert lexicon.find("") == []
+
+
+def test_extract_ingredients_keeps_surfaces(monkeypatch):
+    """extract_ingredients()는 원문 표기를 중복 없이 등장 순서대로 반환"""
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon", IngredientLexicon.builtin())
+
+    text = "루테인 20mg에 LUTEIN 추가, 아연과 zinc, 비타민 C 그리고 비타민 c"
+    assert extract_ingredients(text) == ["루테인", "LUTEIN", "아연", "zinc", "비타민 C"]
+    assert extract_ingredient_ids(text) == ["lutein", "zinc", "vitamin_c"]
+    assert extract_ingredients("") == []
+
+
+def test_rebuild_from_nutrition_rows(monkeypatch):
+    """nutrition_info 성분명/동의어로 사전 재생성 (기본 성분명은 기본 ID 재사용)"""
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon", None)
+    rows = [
+        {"ingredient_name": "루테인", "ingredient_aliases": ["마리골드꽃추출물"]},
+        {"ingredient_name": "밀크씨슬", "ingredient_aliases": ["실리마린", "Milk thistle"]},
+        {"food_name": "비타민 C"},
+        {"ingredient_name": ""},
+    ]
+
+    lexicon = rebuild_ingredient_lexicon(rows)
+    assert ingredient_lexicon.get_ingredient_lexicon() is lexicon
+
+    text = "마리골드꽃추출물이랑 milk-thistle, 실리마린 함량이 높고 비타민C도 있어요"
+    assert extract_ingredient_ids(text) == ["lutein", "밀크씨슬", "vitamin_c"]
+    assert "마리골드꽃추출물" in lexicon.surfaces("lutein")
+
+
+class _FakeQuery:
+    """supabase-py 쿼리 빌더 흉내 (select/order/range/execute, 서버 max-rows 적용)"""
+
+    def __init__(self, table):
+        self.table = table
+        self.start, self.end = 0, None
+
+    def select(self, columns):
+        return self
+
+    def order(self, column):
+        return self
+
+    def range(self, start, end):
+        self.start, self.end = start, end
+        return self
+
+    def execute(self):
+        self.table.requests.append((self.start, self.end))
+        if self.table.fail:
+            raise ConnectionError("Supabase 연결 실패")
+        end = min(self.end + 1, self.start + self.table.max_rows)
+        return type("Response", (), {"data": self.table.rows[self.start:end]})()
+
+
+class _FakeSupabase:
+    def __init__(self, rows, max_rows=1000, fail=False):
+        self.rows, self.max_rows, self.fail = rows, max_rows, fail
+        self.requests = []
+
+    def __call__(self):
+        return self
+
+    def get_client(self):
+        return self
+
+    def table(self, name):
+        assert name == "nutrition_info"
+        return _FakeQuery(self)
+
+
+def test_load_pages_past_server_max_rows(monkeypatch):
+    """서버 max-rows가 페이지 크기보다 작아도 전체 행을 빈 페이지까지 읽음"""
+    rows = [{"id": i, "ingredient_name": f"성분{i}"} for i in range(25)]
+    fake = _FakeSupabase(rows, max_rows=7)
+    monkeypatch.setattr(ingredient_lexicon, "SupabaseClient", fake)
+
+    assert ingredient_lexicon._load_nutrition_rows(page_size=10) == rows
+    assert [start for start, _ in fake.requests] == [0, 7, 14, 21, 25]
+
+
+def test_failed_load_falls_back_and_retries(monkeypatch, caplog):
+    """조회 실패 시 기본 사전을 쓰고 경고를 남기며, 재시도 시각이 지나면 다시 조회"""
+    fake = _FakeSupabase([{"id": 1, "ingredient_name": "밀크씨슬"}], fail=True)
+    monkeypatch.setattr(ingredient_lexicon, "SupabaseClient", fake)
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon", None)
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon_retry_at", None)
+
+    with caplog.at_level("WARNING", logger=ingredient_lexicon.__name__):
+        fallback = ingredient_lexicon.get_ingredient_lexicon()
+    assert fallback.version == IngredientLexicon.builtin().version
+    assert "nutrition_info 조회 실패" in caplog.text
+
+    # 재시도 시각 전에는 다시 조회하지 않음
+    fake.fail = False
+    assert ingredient_lexicon.get_ingredient_lexicon() is fallback
+    assert len(fake.requests) == 1
+
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon_retry_at", 0.0)
+    loaded = ingredient_lexicon.get_ingredient_lexicon()
+    assert loaded is not fallback
+    assert loaded.canonical_id("밀크씨슬") == "밀크씨슬"
+    assert ingredient_lexicon._lexicon_retry_at is None
+    assert ingredient_lexicon.get_ingredient_lexicon() is loaded
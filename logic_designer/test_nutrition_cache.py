@@ -0,0 +1,192 @@
+"""
+영양성분 정보 캐시 테스트 스크립트
+LRU 크기 제한, TTL 만료, 무효화, analyze() 1회 조회 여부 검증
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import pytest
+
+import logic_designer
+from logic_designer import analysis_cache, nutrition_utils
+from logic_designer.nutrition_utils import NutritionInfoCache
+
+
+SAMPLE_INFO = {
+    "ingredients": [{"ingredient_name": "루테인", "typical_effect_period_days": 30}],
+    "product_id": 1
+}
+
+
+def _patch_fetch(monkeypatch, result=SAMPLE_INFO):
+    """DB 조회를 가짜 함수로 교체하고 호출 기록 반환"""
+    calls = []
+
+    def fake_fetch(product_id):
+        calls.append(product_id)
+        return result
+
+    monkeypatch.setattr(nutrition_utils, "_fetch_nutrition_info", fake_fetch)
+    monkeypatch.setattr(nutrition_utils, "_nutrition_cache", NutritionInfoCache())
+    return calls
+
+
+def test_lru_and_ttl(monkeypatch):
+    """크기 초과 시 LRU 제거, TTL 경과 시 만료"""
+    now = [1000.0]
+    monkeypatch.setattr(nutrition_utils.time, "monotonic", lambda: now[0])
+
+    cache = NutritionInfoCache(maxsize=2, ttl=10)
+    cache.set(1, {"a": 1})
+    cache.set(2, None)
+    assert cache.get(1) == (True, {"a": 1})
+    cache.set(3, {"c": 3})  # 2번이 가장 오래 사용되지 않음
+    assert cache.get(2) == (False, None)
+    assert cache.get(3) == (True, {"c": 3})
+
+    now[0] += 11
+    assert cache.get(1) == (False, None)
+    assert cache.stats()["size"] == 1
+
+    cache.invalidate()
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_cached_value_is_read_only_snapshot(monkeypatch):
+    """캐시는 읽기 전용 스냅샷을 한 번만 만들고 같은 객체를 그대로 반환"""
+    source = {"ingredients": [{"ingredient_name": "루테인", "ingredient_aliases": ["lutein"]}]}
+    calls = _patch_fetch(monkeypatch, result=source)
+
+    first = nutrition_utils.get_nutrition_info_safe(1)
+    second = nutrition_utils.get_nutrition_info_safe(1)
+    assert first is second
+    assert calls == [1]
+
+    with pytest.raises(TypeError):
+        first["ingredients"] = []
+    with pytest.raises(AttributeError):
+        first["ingredients"].append({"ingredient_name": "오염"})
+    with pytest.raises(TypeError):
+        first["ingredients"][0]["ingredient_name"] = "변경"
+
+    # 원본을 수정해도 스냅샷은 그대로
+    source["ingredients"][0]["ingredient_name"] = "변경"
+    assert first["ingredients"][0]["ingredient_name"] == "루테인"
+    assert nutrition_utils.is_valid_ingredient("lutein", first)
+    assert analysis_cache.nutrition_info_version(first) == analysis_cache.nutrition_info_version(
+        {"ingredients": [{"ingredient_name": "루테인", "ingredient_aliases": ["lutein"]}]}
+    )
+
+
+def test_analyze_fetches_product_once(monkeypatch):
+    """analyze() 한 번에 제품 영양성분 정보는 한 번만 조회"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    calls = _patch_fetch(monkeypatch)
+
+    review = "루테인 먹고 하루만에 효과 봤어요. 눈이 편해졌습니다"
+    logic_designer.analyze(review, product_id=1)
+    logic_designer.analyze(review, product_id=1)
+
+    stats = logic_designer.get_nutrition_cache_stats()
+    assert calls == [1]
+    assert stats["misses"] == 1
+    assert stats["hits"] >= 3
+
+    logic_designer.invalidate_nutrition_cache(1)
+    logic_designer.analyze(review, product_id=1)
+    assert calls == [1, 1]
+
+
+def test_failed_fetch_not_cached(monkeypatch):
+    """조회 실패는 캐시하지 않고, 정보 없음(None)은 캐시"""
+    calls = _patch_fetch(monkeypatch, result=nutrition_utils._FETCH_FAILED)
+    assert nutrition_utils.get_nutrition_info_safe(7) is None
+    assert nutrition_utils.get_nutrition_info_safe(7) is None
+    assert calls == [7, 7]
+
+    calls = _patch_fetch(monkeypatch, result=None)
+    assert nutrition_utils.get_nutrition_info_safe(8) is None
+    assert nutrition_utils.get_nutrition_info_safe(8) is None
+    assert calls == [8]
+
+
+def test_prefetch_many_chunks_and_warms_cache(monkeypatch):
+    """여러 제품 일괄 조회: 청크 단위 in.(...) 조회 후 캐시 적재"""
+    single_calls = _patch_fetch(monkeypatch)
+    chunks = []
+
+    def fake_fetch_many(product_ids):
+        chunks.append(list(product_ids))
+        return {str(pid): [{"product_id": pid, "ingredient_name": "루테인"}]
+                for pid in product_ids if pid % 2 == 0}
+
+    monkeypatch.setattr(nutrition_utils, "_fetch_nutrition_rows_many", fake_fetch_many)
+
+    result = nutrition_utils.get_nutrition_info_many([1, 2, 3, 2, None, 4, 5], chunk_size=2)
+    assert chunks == [[1, 2], [3, 4], [5]]
+    assert result[1] is None
+    assert result[2]["ingredients"][0]["ingredient_name"] == "루테인"
+    assert set(result) == {1, 2, 3, 4, 5}
+
+    assert nutrition_utils.get_nutrition_info_safe(4) == result[4]
+    assert nutrition_utils.get_nutrition_info_safe(5) is None
+    assert single_calls == []
+
+
+def test_analyze_batch_prefetches_once(monkeypatch):
+    """analyze_batch()는 리뷰 평가 전에 제품 정보를 한 번에 조회"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    single_calls = _patch_fetch(monkeypatch)
+    chunks = []
+
+    def fake_fetch_many(product_ids):
+        chunks.append(list(product_ids))
+        return {}
+
+    monkeypatch.setattr(nutrition_utils, "_fetch_nutrition_rows_many", fake_fetch_many)
+
+    review = "루테인 먹고 눈이 편해졌습니다. 재구매 예정이에요"
+    logic_designer.analyze_batch(
+        {"review_text": review, "product_id": pid} for pid in [1, 2, 1, 3]
+    )
+    assert chunks == [[1, 2, 3]]
+    assert single_calls == []
+
+
+def test_iter_analyze_batch_reads_input_in_chunks(monkeypatch):
+    """iter_analyze_batch()는 입력을 chunk_size건씩만 읽고 청크마다 한 번 일괄 조회"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    single_calls = _patch_fetch(monkeypatch)
+    chunks = []
+    consumed = []
+
+    def fake_fetch_many(product_ids):
+        chunks.append(list(product_ids))
+        return {}
+
+    monkeypatch.setattr(nutrition_utils, "_fetch_nutrition_rows_many", fake_fetch_many)
+
+    def reviews():
+        for pid in [1, 2, 1, 3, 4]:
+            consumed.append(pid)
+            yield {"review_text": "루테인 먹고 눈이 편해졌습니다. 재구매 예정이에요", "product_id": pid}
+
+    results = logic_designer.iter_analyze_batch(reviews(), chunk_size=2)
+    next(results)
+    assert consumed == [1, 2]
+    assert chunks == [[1, 2]]
+
+    assert len(list(results)) == 4
+    assert chunks == [[1, 2], [3], [4]]
+    assert single_calls == []
@@ -0,0 +1,158 @@
+"""
+PackedPharmacistAnalyzer 테스트 스크립트
+묶음 요청 구성(캐시 지점), 배열 응답 분리, 파싱 실패 시 묶음 분할, 통계 검증
+"""
+
+import json
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import analyzer as analyzer_module, packed_analyzer
+from logic_designer.analyzer import PharmacistAnalyzer
+from logic_designer.analysis_cache import AnalysisResultCache
+from logic_designer.packed_analyzer import PackedPharmacistAnalyzer
+
+
+NUTRITION_INFO = {
+    "product_id": 1,
+    "ingredients": [{"ingredient_name": "루테인", "official_efficacy": "눈 건강"}]
+}
+
+
+class FakeMessages:
+    """리뷰 번호별 결과 배열을 돌려주는 가짜 API (broken_over 이상 크기 묶음은 깨진 응답)"""
+
+    def __init__(self, broken_over=None):
+        self.calls = []
+        self.broken_over = broken_over
+
+    def create(self, **params):
+        self.calls.append(params)
+        prompt = params["messages"][0]["content"]
+        review_nos = [part.split()[0] for part in prompt.split("리뷰번호:")[1:]]
+
+        if self.broken_over and len(review_nos) >= self.broken_over:
+            text = "[{\"summary\": \"잘린 응답"
+        elif len(review_nos) == 1 and "[리뷰 1]" not in prompt:
+            text = json.dumps(_item(review_nos[0]), ensure_ascii=False)
+        else:
+            items = [dict(_item(no), review_index=i) for i, no in enumerate(review_nos, start=1)]
+            text = json.dumps(list(reversed(items)), ensure_ascii=False)
+
+        usage = SimpleNamespace(
+            input_tokens=100, output_tokens=50 * len(review_nos),
+            cache_read_input_tokens=0, cache_creation_input_tokens=0
+        )
+        return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+
+def _item(review_no):
+    return {"summary": review_no, "efficacy": "정보 없음",
+            "side_effects": "정보 없음", "tip": "정보 없음"}
+
+
+def _analyzer(monkeypatch, messages, cache=None):
+    monkeypatch.setattr(packed_analyzer, "get_nutrition_info_safe", lambda product_id: NUTRITION_INFO)
+    analyzer = PackedPharmacistAnalyzer(api_key="test-key", result_cache=cache)
+    analyzer.client = SimpleNamespace(messages=messages)
+    return analyzer
+
+
+REVIEWS = [f"리뷰번호: {i} 루테인 먹고 눈이 편해졌어요" for i in range(5)]
+
+
+def test_pack_shares_cached_prefix(monkeypatch):
+    """영양성분 정보는 캐시 지점이 있는 시스템 프롬프트에 한 번만, 결과는 입력 순서"""
+    messages = FakeMessages()
+    analyzer = _analyzer(monkeypatch, messages)
+
+    results = analyzer.analyze_packed(REVIEWS + ["짧음"], product_id=1, pack_size=3)
+
+    assert len(messages.calls) == 2
+    system = messages.calls[0]["system"]
+    assert system[0]["cache_control"] == {"type": "ephemeral"}
+    assert "**제품 영양성분 정보:**" in system[0]["text"]
+    assert "영양성분" not in messages.calls[0]["messages"][0]["content"]
+    assert system == messages.calls[1]["system"]
+    assert messages.calls[0]["max_tokens"] == 3000
+
+    assert [result["summary"] for result in results[:5]] == [str(i) for i in range(5)]
+    assert all("disclaimer" in result and "review_index" not in result for result in results[:5])
+    assert results[0]["ingredient_validation"]["mentioned_ingredients"] == ["루테인"]
+    assert results[5]["error"] == "입력 오류"
+
+
+def test_broken_array_splits_pack(monkeypatch):
+    """배열 파싱 실패 시 반으로 나누어 재요청, 1건이 되면 단건 분석"""
+    messages = FakeMessages(broken_over=3)
+    analyzer = _analyzer(monkeypatch, messages)
+
+    results = analyzer.analyze_packed(REVIEWS, product_id=1, pack_size=5)
+
+    # 5건(실패) → 2건 + 3건(실패) → 1건 + 2건
+    assert [result["summary"] for result in results] == [str(i) for i in range(5)]
+    stats = analyzer.stats()
+    assert stats["splits"] == 2
+    assert stats["fallbacks"] == 1
+    assert stats["requests"] == 4
+    assert stats["packed_reviews"] == 4
+
+
+def test_stats_and_result_cache(monkeypatch):
+    """리뷰당 토큰 수/처리량 집계, 캐시 적중 리뷰는 묶음에서 제외"""
+    messages = FakeMessages()
+    analyzer = _analyzer(monkeypatch, messages, cache=AnalysisResultCache())
+
+    analyzer.analyze_packed(REVIEWS[:4], product_id=1, pack_size=4)
+    stats = analyzer.stats()
+    assert stats["reviews"] == 4
+    assert stats["tokens_per_review"] == (100 + 200) / 4
+    assert stats["reviews_per_sec"] > 0
+
+    results = analyzer.analyze_packed(REVIEWS, product_id=1, pack_size=4)
+    assert len(messages.calls) == 2
+    assert "[리뷰 1]" not in messages.calls[1]["messages"][0]["content"]
+    assert [result["summary"] for result in results] == [str(i) for i in range(5)]
+
+
+def test_packed_cache_separate_from_single(monkeypatch):
+    """묶음 분석 결과와 단건 분석 결과는 같은 캐시를 써도 서로 다른 키로 저장"""
+    cache = AnalysisResultCache()
+    messages = FakeMessages()
+    analyzer = _analyzer(monkeypatch, messages, cache=cache)
+    single = PharmacistAnalyzer(api_key="test-key", result_cache=cache)
+    single.client = SimpleNamespace(messages=messages)
+    monkeypatch.setattr(analyzer_module, "get_nutrition_info_safe", lambda product_id: NUTRITION_INFO)
+
+    single.analyze(REVIEWS[0], product_id=1)
+    analyzer.analyze_packed(REVIEWS[:2], product_id=1, pack_size=2)
+    assert len(messages.calls) == 2  # 단건 캐시를 묶음 분석에서 재사용하지 않음
+
+    single.analyze(REVIEWS[1], product_id=1)
+    assert len(messages.calls) == 3  # 묶음 캐시를 단건 분석에서 재사용하지 않음
+
+    analyzer.analyze_packed(REVIEWS[:2], product_id=1, pack_size=2)
+    assert len(messages.calls) == 3
+    assert analyzer.PROMPT_VERSION != single.PROMPT_VERSION
+
+
+def test_many_packed_groups_by_product(monkeypatch):
+    """analyze_many_packed는 제품별로 묶고 입력 순서대로 반환"""
+    monkeypatch.setattr(packed_analyzer, "get_nutrition_info_many", lambda product_ids: {})
+    messages = FakeMessages()
+    analyzer = _analyzer(monkeypatch, messages)
+    reviews = [{"review_text": text, "product_id": 1 + i % 2} for i, text in enumerate(REVIEWS)]
+
+    results = analyzer.analyze_many_packed(reviews, pack_size=10)
+
+    assert len(messages.calls) == 2
+    assert [result["summary"] for result in results] == [str(i) for i in range(5)]
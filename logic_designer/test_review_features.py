@@ -0,0 +1,98 @@
+"""
+review_features.py 테스트 스크립트
+리뷰 특징을 한 번만 계산하여 체크리스트/신뢰도 점수/약사 분석 성분 검증이
+공유하는지, 기존 계산과 결과가 같은지 검증
+"""
+
+import re
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import analyzer, checklist, ingredient_lexicon, review_features, trust_score
+from logic_designer.analyzer import PharmacistAnalyzer
+from logic_designer.checklist import AdChecklist
+from logic_designer.ingredient_lexicon import IngredientLexicon
+from logic_designer.review_features import ReviewFeatures, get_review_features
+from logic_designer.trust_score import TrustScoreCalculator
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+
+
+NUTRITION_INFO = {
+    "product_id": 1,
+    "ingredients": [{"ingredient_name": "루테인", "official_efficacy": "눈 건강"}]
+}
+
+REVIEW = "제가 루테인이랑 아연 한 달 먹어봤는데 눈이 덜 피곤해요. 다만 알약이 커요."
+
+
+def _legacy_max_repetition(text):
+    """기존 키워드 반복 계산 (re.findall + 2글자 이상 빈도)"""
+    word_freq = {}
+    for word in re.findall(r'\b\w+\b', text):
+        if len(word) >= 2:
+            word_freq[word] = word_freq.get(word, 0) + 1
+    return max(word_freq.values()) if word_freq else 0
+
+
+def test_features_match_legacy_scans():
+    """토큰/반복 횟수/규칙 스캔 결과가 기존 계산과 동일"""
+    engine = AdChecklist.get_rule_engine()
+    texts = [t["body"] for t in NORMAL_REVIEW_TEMPLATES + AD_REVIEW_TEMPLATES] + ["", "a b"]
+
+    for text in texts:
+        features = ReviewFeatures(text)
+        assert features.tokens == re.findall(r'\b\w+\b', text)
+        assert features.max_token_count == _legacy_max_repetition(text)
+        assert features.matched_rules(engine) == engine.scan(text)
+        for start, end in features.rule_spans(engine).values():
+            assert 0 <= start <= end <= len(text)
+
+
+def test_cache_returns_same_object():
+    """같은 텍스트는 같은 특징 객체"""
+    assert get_review_features(REVIEW) is get_review_features(REVIEW)
+    assert get_review_features(REVIEW) is not get_review_features(REVIEW + " ")
+
+
+def test_ingredients_extracted_once_per_review(monkeypatch):
+    """체크리스트, 신뢰도 점수, 약사 분석 성분 검증이 성분 추출 결과를 공유"""
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon", IngredientLexicon.builtin())
+    for module in (checklist, trust_score, analyzer):
+        monkeypatch.setattr(module, "get_nutrition_info_safe", lambda product_id: NUTRITION_INFO)
+
+    calls = []
+    original = review_features.extract_ingredients
+
+    def counting_extract(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(review_features, "extract_ingredients", counting_extract)
+    features = ReviewFeatures(REVIEW)
+
+    detected = AdChecklist().check_ad_patterns(REVIEW, product_id=1, features=features)
+    score = TrustScoreCalculator().calculate_final_score(
+        review_text=REVIEW, product_id=1, features=features
+    )
+    monkeypatch.setattr(review_features, "_features_cache", OrderedDict({REVIEW: features}))
+    validation = PharmacistAnalyzer(api_key="test-key")._validate_ingredients(REVIEW, NUTRITION_INFO)
+
+    assert calls == [REVIEW]
+    assert "허위 성분 주장" in detected[5]
+    assert score["nutrition_score"] == 30.0
+    assert validation["mentioned_ingredients"] == ["루테인", "아연"]
+    assert validation["invalid_ingredients"] == ["아연"]
+
+    # 성분 사전이 바뀌면 다시 추출
+    monkeypatch.setattr(ingredient_lexicon, "_lexicon", IngredientLexicon.builtin())
+    assert features.ingredients == ["루테인", "아연"]
+    assert len(calls) == 2
@@ -0,0 +1,235 @@
+"""
+rule_engine.py 테스트 스크립트
+컴파일된 규칙 엔진이 기존 패턴별 re.search 방식과 동일한 결과를 내는지,
+안전 모드(반복 길이 제한)와 시간 예산이 긴/비정상 입력에서 동작하는지 검증
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+from logic_designer.checklist import AdChecklist
+from logic_designer.product_criteria import DefaultProductCriteria
+from logic_designer import checklist as checklist_module
+from logic_designer.benchmark import PATHOLOGICAL_FRAGMENTS, STUB_NUTRITION_INGREDIENTS
+from logic_designer.rule_engine import CompiledRuleEngine, RuleTimeoutError, bound_pattern
+
+
+def legacy_check_ad_patterns(checklist: AdChecklist, review_text: str) -> dict:
+    """기존 구현 (패턴마다 re.search 반복) - 비교 기준"""
+    if not review_text or len(review_text.strip()) < 3:
+        return {}
+
+    def has_personal_experience(text):
+        for pattern in AdChecklist.PERSONAL_PATTERNS:
+            if re.search(pattern, text):
+                return True
+        return False
+
+    def has_negative_opinion(text):
+        if checklist.criteria and checklist.criteria.negative_expressions:
+            for expr in checklist.criteria.negative_expressions:
+                if expr in text:
+                    return True
+        for pattern in AdChecklist.NEGATIVE_PATTERNS:
+            if re.search(pattern, text):
+                return True
+        return False
+
+    detected_issues = {}
+    for item_num, item_data in AdChecklist.AD_PATTERNS.items():
+        name = item_data["name"]
+        if item_num == 4:
+            if not has_personal_experience(review_text):
+                detected_issues[item_num] = name
+            continue
+        if item_num == 6:
+            threshold = checklist.criteria.keyword_repetition_threshold if checklist.criteria else 7
+            if checklist._has_keyword_repetition(review_text, threshold=threshold):
+                detected_issues[item_num] = name
+            continue
+        if item_num == 7:
+            if not has_negative_opinion(review_text):
+                if 8 in detected_issues or 2 in detected_issues:
+                    detected_issues[item_num] = name
+            continue
+        if checklist.criteria and checklist.criteria.ad_suspicious_expressions:
+            for suspicious_expr in checklist.criteria.ad_suspicious_expressions:
+                if suspicious_expr in review_text:
+                    detected_issues[item_num] = f"{name} (제품별 기준: {suspicious_expr})"
+                    break
+        for pattern in item_data["patterns"]:
+            if re.search(pattern, review_text, re.IGNORECASE | re.MULTILINE):
+                detected_issues[item_num] = name
+                break
+    return detected_issues
+
+
+# 패턴을 자극하는 조각들 (무작위 조합 코퍼스 생성용)
+FRAGMENTS = [
+    "무상으로 제공", "무료 제공 받았어요", "협찬", "선물 받", "!!!", "~~~", "♡♡♡",
+    "진짜 정말", "완전 너무", "1. 성분", "\n2. 원료", "- 장점", "• 포인트", "✓ 체크리스트 항목입니다",
+    "루테인 함유 성분 추출물", "20mg 10mg", "500 IU", "최고 강추", "대박 만족",
+    "항산화 효과와 면역력 개선", "임상 결과 흡수율", "100% 효과", "하루 만에 변화",
+    "기적 같은 효과", "다른 제품에 비해 좋", "VS ", "제품 비교", "~했답니다", "~하세요",
+    "후기 남겨요", "😀😁😂🤣😃", "😍😘🥰😗😙", "저는", "직접", "먹", "샀", "단점", "아쉬",
+    "안 좋", "그런데", "Mg", "iu", "vs ", "눈이", "편해요", " ", "\n", "ABC", "좋아요",
+]
+
+
+def build_corpus(size: int = 400, seed: int = 42) -> list:
+    """결정적 무작위 코퍼스 + 목업 템플릿 + 경계 사례"""
+    rng = random.Random(seed)
+    corpus = []
+    for template in NORMAL_REVIEW_TEMPLATES + AD_REVIEW_TEMPLATES:
+        corpus.append(template["body"])
+        corpus.append(f"{template['title']}\n{template['body']}")
+    corpus.extend([
+        "", "  ", "ab", "좋아요",
+        "1. 첫째\n2. 둘째\n- 셋째",
+        "그냥 그래요\n\n•\t항목",
+        "효과 효과 효과 효과 효과 효과 효과 효과 효과 효과 좋아요",
+    ])
+    for _ in range(size):
+        pieces = rng.choices(FRAGMENTS, k=rng.randint(1, 12))
+        corpus.append("".join(pieces))
+    return corpus
+
+
+def test_engine_matches_legacy_default():
+    """기본 기준: 규칙 엔진 결과가 기존 구현과 완전히 동일"""
+    checklist = AdChecklist()
+    for text in build_corpus():
+        expected = legacy_check_ad_patterns(checklist, text)
+        actual = checklist.check_ad_patterns(text)
+        assert actual == expected, f"불일치: {text!r}\n{actual} != {expected}"
+        assert list(actual) == list(expected), f"항목 순서 불일치: {text!r}"
+
+
+def test_engine_matches_legacy_with_criteria():
+    """제품별 기준 사용 시에도 동일"""
+    criteria = DefaultProductCriteria.create_vitamin_c_criteria()
+    criteria.add_ad_suspicious_expression("협찬")
+    criteria.add_negative_expression("눈이")
+    checklist = AdChecklist(criteria=criteria)
+    for text in build_corpus(seed=7):
+        expected = legacy_check_ad_patterns(checklist, text)
+        actual = checklist.check_ad_patterns(text)
+        assert actual == expected, f"불일치: {text!r}\n{actual} != {expected}"
+        assert list(actual) == list(expected), f"항목 순서 불일치: {text!r}"
+
+
+def test_engine_group_flags():
+    """그룹별 플래그가 서로 섞이지 않고 적용됨"""
+    engine = CompiledRuleEngine({
+        "a": ([r"ab.*", r"zz"], 0),
+        "b": ([r"b"], 0),
+        "c": ([r"^x"], re.MULTILINE),
+        "d": ([r"ABC"], re.IGNORECASE),
+        "e": ([r"^x"], 0),
+        "empty": ([], 0),
+    })
+    assert engine.keys == ("a", "b", "c", "d", "e")
+    assert engine.scan("zabc\nx") == {"a", "b", "c", "d"}
+    assert engine.scan("ZABC") == {"d"}
+    assert engine.scan("zabc", keys=["b", "empty"]) == {"b"}
+    assert engine.scan("") == set()
+    assert not engine.matches("empty", "anything")
+
+
+def test_bound_pattern_rewrites_only_unbounded_dots():
+    """이스케이프/문자 클래스는 그대로, .*/.+/.{n,}만 제한"""
+    assert bound_pattern(r"무상.*제공", 50) == r"무상.{0,50}제공"
+    assert bound_pattern(r"a.+?b", 50) == r"a.{1,50}?b"
+    assert bound_pattern(r"a.{3,}b", 50) == r"a.{3,50}b"
+    assert bound_pattern(r"a.{3,9}b\.*[.*]+", 50) == r"a.{3,9}b\.*[.*]+"
+    assert bound_pattern(r"[]a.*]\.+.*", 50) == r"[]a.*]\.+.{0,50}"
+
+
+def test_safe_engine_matches_on_short_lines():
+    """퍼즈: 줄이 제한 길이 이하이면 안전 모드 결과가 기본 모드와 동일"""
+    rng = random.Random(3)
+    fragments = FRAGMENTS + list(PATHOLOGICAL_FRAGMENTS)
+    corpus = build_corpus(seed=11) + [
+        "".join(rng.choices(fragments, k=rng.randint(1, 40))) for _ in range(400)
+    ]
+    window = AdChecklist.SAFE_REGEX_WINDOW
+    safe = AdChecklist(safe_mode=True)
+
+    compared = 0
+    for text in corpus:
+        if any(len(line) > window for line in text.split("\n")):
+            continue
+        compared += 1
+        assert safe.check_ad_patterns(text) == AdChecklist().check_ad_patterns(text), repr(text)
+        assert safe._search(r"(하루|일주일).*(만에|만)", text) == \
+            AdChecklist()._search(r"(하루|일주일).*(만에|만)", text)
+    assert compared > 300
+
+
+def test_safe_mode_bounds_pathological_inputs(monkeypatch):
+    """반복 조각 스팸(줄바꿈 없음)도 안전 모드는 길이에 비례한 시간 안에 끝남"""
+    monkeypatch.setattr(
+        checklist_module, "get_nutrition_info_safe",
+        lambda product_id: {"ingredients": STUB_NUTRITION_INGREDIENTS, "product_id": product_id}
+    )
+    safe = AdChecklist(safe_mode=True)
+
+    for fragment in ("100%", "무상", "하루", "완전"):
+        text = "루테인 " + fragment * 20000
+        started = time.perf_counter()
+        safe.check_ad_patterns(text, product_id=1)
+        assert time.perf_counter() - started < 3.0, fragment
+
+
+def test_time_budget_raises_timeout():
+    """시간 예산을 넘기면 일부 결과 대신 RuleTimeoutError"""
+    engine = AdChecklist.get_rule_engine()
+    text = AD_REVIEW_TEMPLATES[0]["body"]
+
+    with pytest.raises(RuleTimeoutError) as excinfo:
+        engine.spans(text, deadline=time.perf_counter() - 1)
+    assert excinfo.value.partial == {}
+
+    with pytest.raises(RuleTimeoutError):
+        AdChecklist(time_budget=1e-9).check_ad_patterns(text + " [budget]")
+
+    assert AdChecklist(time_budget=5).check_ad_patterns(text) == AdChecklist().check_ad_patterns(text)
+
+
+def test_time_budget_forces_safe_mode(monkeypatch):
+    """시간 예산만 지정해도 안전 모드로 검색하여 검색 하나가 예산을 무한히 넘지 않음"""
+    monkeypatch.setattr(
+        checklist_module, "get_nutrition_info_safe",
+        lambda product_id: {"ingredients": STUB_NUTRITION_INGREDIENTS, "product_id": product_id}
+    )
+    budgeted = AdChecklist(time_budget=60)
+    assert budgeted.safe_mode and not AdChecklist().safe_mode
+
+    text = "루테인 " + "100%" * 20000
+    started = time.perf_counter()
+    budgeted.check_ad_patterns(text, product_id=1)
+    assert time.perf_counter() - started < 3.0
+
+
+if __name__ == "__main__":
+    test_engine_matches_legacy_default()
+    test_engine_matches_legacy_with_criteria()
+    test_engine_group_flags()
+    test_bound_pattern_rewrites_only_unbounded_dots()
+    test_safe_engine_matches_on_short_lines()
+    test_time_budget_raises_timeout()
+    print("✅ 모든 테스트 통과!")
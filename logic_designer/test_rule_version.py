@@ -0,0 +1,105 @@
+"""
+rule_version.py 테스트 스크립트
+규칙 세트 fingerprint가 패턴/임계값/가중치 변경에만 반응하고,
+리뷰 입력 해시가 CSV/JSON 입력에서 같은 값이 되는지 검증
+"""
+
+import sys
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import ingredient_lexicon
+from logic_designer.checklist import AdChecklist
+from logic_designer.product_criteria import ProductCheckCriteria
+from logic_designer.rule_version import review_input_hash, rule_set_fingerprint
+from logic_designer.trust_score import TrustScoreCalculator
+
+
+def test_fingerprint_changes_with_rules_and_weights(monkeypatch):
+    """AD_PATTERNS, 키워드 반복 임계값, 가중치가 바뀌면 fingerprint도 바뀜"""
+    base = rule_set_fingerprint()
+    assert base == rule_set_fingerprint()
+    assert base != rule_set_fingerprint(use_nutrition_validation=True)
+
+    patterns = dict(AdChecklist.AD_PATTERNS)
+    patterns[1] = {"name": "대가성 문구 존재", "patterns": patterns[1]["patterns"] + [r"체험단"]}
+    monkeypatch.setattr(AdChecklist, "AD_PATTERNS", patterns)
+    changed_patterns = rule_set_fingerprint()
+    monkeypatch.undo()
+
+    monkeypatch.setattr(AdChecklist, "KEYWORD_REPETITION_THRESHOLD", 5)
+    changed_threshold = rule_set_fingerprint()
+    monkeypatch.undo()
+
+    monkeypatch.setattr(TrustScoreCalculator, "BASE_WEIGHTS",
+                        {"L": 0.25, "R": 0.15, "M": 0.3, "P": 0.1, "C": 0.2})
+    changed_weights = rule_set_fingerprint()
+    monkeypatch.undo()
+
+    assert len({base, changed_patterns, changed_threshold, changed_weights}) == 4
+    assert rule_set_fingerprint() == base
+
+
+def test_fingerprint_covers_nutrition_rules_and_settings(monkeypatch):
+    """의학적 주장/효과 시점 패턴, 시간 예산, 성분 사전(nutrition_info) 버전이 바뀌면 fingerprint도 바뀜"""
+    base = rule_set_fingerprint(use_nutrition_validation=True)
+
+    monkeypatch.setattr(AdChecklist, "MEDICAL_CLAIM_PATTERNS",
+                        AdChecklist.MEDICAL_CLAIM_PATTERNS + [r"특효"])
+    changed_claims = rule_set_fingerprint(use_nutrition_validation=True)
+    monkeypatch.undo()
+
+    monkeypatch.setattr(AdChecklist, "UNREALISTIC_TIMELINE_PATTERNS",
+                        AdChecklist.UNREALISTIC_TIMELINE_PATTERNS[:1])
+    changed_timeline = rule_set_fingerprint(use_nutrition_validation=True)
+    monkeypatch.undo()
+
+    assert len({base, changed_claims, changed_timeline}) == 3
+
+    assert rule_set_fingerprint(time_budget=1.0) != rule_set_fingerprint(time_budget=2.0)
+    assert rule_set_fingerprint(time_budget=1.0) != rule_set_fingerprint()
+
+    # nutrition_info 데이터가 바뀌면 성분 사전 버전과 fingerprint가 바뀜
+    rows = [{"ingredient_name": "아스타잔틴", "ingredient_aliases": ["헤마토코쿠스"]}]
+    try:
+        ingredient_lexicon.rebuild_ingredient_lexicon(rows=[])
+        empty = rule_set_fingerprint(use_nutrition_validation=True)
+        ingredient_lexicon.rebuild_ingredient_lexicon(rows=rows)
+        loaded = rule_set_fingerprint(use_nutrition_validation=True)
+        assert empty != loaded
+        assert rule_set_fingerprint() == rule_set_fingerprint(use_nutrition_validation=False)
+    finally:
+        ingredient_lexicon.rebuild_ingredient_lexicon(rows=[])
+
+
+def test_fingerprint_ignores_criteria_metadata():
+    """제품별 기준의 설명/생성 시각은 fingerprint에 영향 없음"""
+    criteria = ProductCheckCriteria(product_name="루테인", nutrition_category="비타민")
+    dated = ProductCheckCriteria(product_name="루테인", nutrition_category="비타민",
+                                 description="설명", created_at="2026-01-07")
+    stricter = ProductCheckCriteria(product_name="루테인", nutrition_category="비타민",
+                                    keyword_repetition_threshold=3)
+
+    assert rule_set_fingerprint(criteria) == rule_set_fingerprint(dated)
+    assert rule_set_fingerprint(criteria) != rule_set_fingerprint(stricter)
+    assert rule_set_fingerprint(criteria) != rule_set_fingerprint()
+
+
+def test_input_hash_normalizes_row_values():
+    """CSV 문자열과 JSON 숫자 입력은 같은 해시, 텍스트/점수가 바뀌면 다른 해시"""
+    text = "제가 한 달 먹어봤는데 눈이 덜 피곤해요."
+
+    csv_row = {"product_id": "1", "length_score": "70", "photo_score": ""}
+    json_row = {"product_id": 1, "length_score": 70.0}
+
+    assert review_input_hash(text, csv_row) == review_input_hash(text, json_row)
+    assert review_input_hash(text, csv_row) != review_input_hash(text + " ", csv_row)
+    assert review_input_hash(text, csv_row) != review_input_hash(text, {"product_id": "1", "length_score": "80"})
+    assert review_input_hash(text) == review_input_hash(text, {})
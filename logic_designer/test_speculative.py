@@ -0,0 +1,102 @@
+"""
+speculative.py 테스트 스크립트
+analyze(speculative=True)의 결과가 기본 모드와 같고, 광고 판별 시 진행 중인 분석이
+취소되며, 사용/낭비 통계가 집계되는지 검증
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import logic_designer
+from logic_designer import speculative
+from database.mock_data import NORMAL_REVIEW_TEMPLATES, AD_REVIEW_TEMPLATES
+
+
+class FakeAsyncAnalyzer:
+    """delay초 뒤에 결과를 주는 가짜 비동기 분석기 (취소 여부 기록)"""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.started = threading.Event()
+        self.cancelled = threading.Event()
+
+    async def analyze_safe(self, review_text, product_id=None, model=None):
+        self.started.set()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return {"summary": review_text[:5], "model": model}
+
+
+def _use_fake(monkeypatch, delay):
+    fake = FakeAsyncAnalyzer(delay)
+    monkeypatch.setattr(speculative, "_speculative_analyzers", {})
+    monkeypatch.setattr(speculative.SpeculativeAnalyzer, "_create_analyzer", lambda self: fake)
+    speculative.reset_speculation_stats()
+    return fake
+
+
+def test_ad_review_cancels_in_flight_call(monkeypatch):
+    """광고로 판별되면 진행 중인 AI 분석을 취소하고 낭비 통계에 기록"""
+    fake = _use_fake(monkeypatch, delay=30)
+    ad = AD_REVIEW_TEMPLATES[0]["body"]
+
+    result = logic_designer.analyze(ad, use_nutrition_validation=False, speculative=True)
+
+    assert result == logic_designer.analyze(ad, use_nutrition_validation=False)
+    assert result["analysis"]["error"] == "AD_REVIEW"
+    assert fake.started.wait(5)
+    assert fake.cancelled.wait(5)
+
+    stats = logic_designer.get_speculation_stats()
+    assert stats["started"] == 1
+    assert stats["wasted"] == 1
+    assert stats["cancelled_in_flight"] == 1
+    assert stats["used"] == 0
+    assert stats["waste_rate"] == 1.0
+
+
+def test_normal_review_uses_overlapped_result(monkeypatch):
+    """광고가 아니면 미리 시작한 분석 결과를 사용하고 절약 시간을 기록"""
+    fake = _use_fake(monkeypatch, delay=0.2)
+    normal = NORMAL_REVIEW_TEMPLATES[0]["body"]
+
+    started = time.perf_counter()
+    result = logic_designer.analyze(
+        normal, length_score=90, monthly_use_score=90,
+        use_nutrition_validation=False, speculative=True, model="m"
+    )
+    elapsed = time.perf_counter() - started
+
+    assert result["validation"]["is_ad"] is False
+    assert result["analysis"] == {"summary": normal[:5], "model": "m"}
+    assert not fake.cancelled.is_set()
+    assert elapsed < 5
+
+    stats = logic_designer.get_speculation_stats()
+    assert stats["used"] == 1
+    assert stats["wasted"] == 0
+    assert stats["latency_saved"] > 0
+
+
+def test_speculative_without_api_key_matches_default(monkeypatch):
+    """분석기 생성 실패(API 키 없음)도 기본 모드와 같은 오류 결과"""
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    monkeypatch.setattr(speculative, "_speculative_analyzers", {})
+
+    for text in [NORMAL_REVIEW_TEMPLATES[1]["body"], "짧음"]:
+        assert logic_designer.analyze(text, use_nutrition_validation=False, speculative=True) == \
+            logic_designer.analyze(text, use_nutrition_validation=False)
@@ -0,0 +1,93 @@
+"""
+TrustScoreCalculator.calculate_final_scores() 테스트 스크립트
+열 단위 일괄 계산 결과가 리뷰별(스칼라) 계산과 완전히 동일한지 검증
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from logic_designer import trust_score
+from logic_designer.trust_score import TrustScoreCalculator
+
+
+def build_columns(size: int = 3000, seed: int = 11) -> dict:
+    """결정적 무작위 열 입력 (정수, .xx5 경계값, 영양성분 점수 누락 포함)"""
+    rng = random.Random(seed)
+
+    def score():
+        kind = rng.random()
+        if kind < 0.3:
+            return rng.randint(0, 100)
+        if kind < 0.5:
+            return rng.randint(0, 10000) / 1000 + 0.005
+        return rng.uniform(0, 100)
+
+    columns = {key: [score() for _ in range(size)] for key in "LRMPC"}
+    columns["N"] = [None if rng.random() < 0.4 else score() for _ in range(size)]
+    columns["penalty_count"] = [rng.randint(0, 6) for _ in range(size)]
+    return columns
+
+
+def scalar_results(calculator: TrustScoreCalculator, columns: dict) -> dict:
+    """리뷰별 스칼라 계산 결과 (비교 기준)"""
+    expected = {"base_score": [], "penalty": [], "final_score": [], "is_ad": []}
+    for i in range(len(columns["L"])):
+        base_score = calculator.calculate_base_score(
+            columns["L"][i], columns["R"][i], columns["M"][i],
+            columns["P"][i], columns["C"][i], columns["N"][i]
+        )
+        final_score = calculator.apply_penalty(base_score, columns["penalty_count"][i])
+        expected["base_score"].append(base_score)
+        expected["penalty"].append(columns["penalty_count"][i] * 10)
+        expected["final_score"].append(final_score)
+        expected["is_ad"].append(calculator.is_ad(final_score, columns["penalty_count"][i]))
+    return expected
+
+
+def test_batch_matches_scalar_pure_python(monkeypatch):
+    """NumPy 없이도 스칼라 계산과 동일"""
+    monkeypatch.setattr(trust_score, "NUMPY_AVAILABLE", False)
+    calculator = TrustScoreCalculator()
+    columns = build_columns()
+
+    assert calculator.calculate_final_scores(columns) == scalar_results(calculator, columns)
+
+
+def test_batch_matches_scalar_numpy():
+    """NumPy 배열 연산 결과가 스칼라 계산과 비트 단위로 동일"""
+    np = pytest.importorskip("numpy")
+    calculator = TrustScoreCalculator()
+    columns = build_columns()
+    expected = scalar_results(calculator, columns)
+
+    arrays = {key: np.asarray(values, dtype=float) for key, values in columns.items() if key != "N"}
+    arrays["N"] = np.array([np.nan if v is None else v for v in columns["N"]])
+    arrays["penalty_count"] = np.asarray(columns["penalty_count"])
+    result = calculator.calculate_final_scores(arrays)
+
+    for key in expected:
+        assert result[key].tolist() == expected[key], key
+
+
+def test_batch_defaults_and_length_check():
+    """누락된 열은 calculate_final_score 기본값 사용, 길이가 다르면 오류"""
+    calculator = TrustScoreCalculator()
+    result = calculator.calculate_final_scores({"penalty_count": [0, 3]})
+    single = calculator.calculate_final_score()
+
+    assert list(result["base_score"]) == [single["base_score"]] * 2
+    assert list(result["is_ad"]) == [False, True]
+
+    with pytest.raises(ValueError):
+        calculator.calculate_final_scores({"L": [1, 2], "R": [1]})
@@ -3,17 +3,57 @@
 리뷰의 신뢰도를 수치화하여 평가합니다.
 """
 
-from typing import Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Sequence
 from .nutrition_utils import (
     get_nutrition_info_safe,
-    extract_ingredients,
     is_valid_ingredient
 )
+from .review_features import ReviewFeatures, get_review_features
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+# 열(column) 입력의 기본값 (calculate_final_score 기본값과 동일)
+COLUMN_DEFAULTS = {"L": 50, "R": 50, "M": 50, "P": 0, "C": 50}
+
+# 이 값 이상이면 배열 반올림 대신 round()로 계산 (x * 100 오차가 커지는 범위)
+_ROUND_EXACT_LIMIT = 1e9
+
+
+def _round2_array(values: "np.ndarray") -> "np.ndarray":
+    """
+    소수 둘째 자리 반올림 (배열, 내장 round(x, 2)와 동일한 결과)
+
+    np.round는 x * 100을 거치므로 .5 경계 부근에서 round()와 다를 수 있습니다.
+    경계에 가까운 값만 골라 round()로 다시 계산합니다.
+    """
+    scaled = values * 100
+    rounded = np.rint(scaled) / 100
+    fraction = scaled - np.floor(scaled)
+    ambiguous = (np.abs(fraction - 0.5) < 1e-6) | ~(np.abs(values) < _ROUND_EXACT_LIMIT)
+    for i in np.flatnonzero(ambiguous):
+        rounded[i] = round(float(values[i]), 2)
+    return rounded
 
 
 class TrustScoreCalculator:
     """신뢰도 점수 계산 클래스"""
 
+    # 기본 점수 가중치 (영양성분 점수 없을 때)
+    BASE_WEIGHTS = {"L": 0.2, "R": 0.2, "M": 0.3, "P": 0.1, "C": 0.2}
+    # 기본 점수 가중치 (영양성분 점수 있을 때)
+    NUTRITION_WEIGHTS = {"L": 0.15, "R": 0.15, "M": 0.25, "P": 0.1, "C": 0.15, "N": 0.2}
+
+    # 항목당 감점 점수, 광고 판별 기준 (40점 미만 또는 감점 항목 3개 이상)
+    PENALTY_PER_ITEM = 10
+    AD_SCORE_THRESHOLD = 40
+    AD_DETECTED_LIMIT = 3
+
     def __init__(self):
         """신뢰도 점수 계산기 초기화"""
         pass
@@ -49,26 +89,28 @@ class TrustScoreCalculator:
         """
         if nutrition_score is not None:
             # 영양성분 점수 포함 공식
+            w = self.NUTRITION_WEIGHTS
             score = (
-                length_score * 0.15 +
-                repurchase_score * 0.15 +
-                monthly_use_score * 0.25 +
-                photo_score * 0.1 +
-                consistency_score * 0.15 +
-                nutrition_score * 0.2
+                length_score * w["L"] +
+                repurchase_score * w["R"] +
+                monthly_use_score * w["M"] +
+                photo_score * w["P"] +
+                consistency_score * w["C"] +
+                nutrition_score * w["N"]
             )
         else:
             # 기존 공식 (하위 호환성)
+            w = self.BASE_WEIGHTS
             score = (
-                length_score * 0.2 +
-                repurchase_score * 0.2 +
-                monthly_use_score * 0.3 +
-                photo_score * 0.1 +
-                consistency_score * 0.2
+                length_score * w["L"] +
+                repurchase_score * w["R"] +
+                monthly_use_score * w["M"] +
+                photo_score * w["P"] +
+                consistency_score * w["C"]
             )
         return round(score, 2)
 
-    def apply_penalty(self, base_score: float, penalty_count: int, penalty_per_item: int = 10) -> float:
+    def apply_penalty(self, base_score: float, penalty_count: int, penalty_per_item: int = PENALTY_PER_ITEM) -> float:
         """
         감점 적용
 
@@ -87,7 +129,8 @@ class TrustScoreCalculator:
     def calculate_nutrition_consistency_score(
         self,
         review_text: str,
-        product_id: Optional[int] = None
+        product_id: Optional[int] = None,
+        features: Optional[ReviewFeatures] = None
     ) -> float:
         """
         영양성분 일치도 점수 계산 (안전한 방식)
@@ -98,6 +141,7 @@ class TrustScoreCalculator:
         Args:
             review_text: 리뷰 텍스트
             product_id: 제품 ID (None이면 기본값 반환)
+            features: 리뷰 특징 (추출된 성분명 재사용, None이면 get_review_features로 조회)
             
         Returns:
             float: 영양성분 일치도 점수 (0-100), 오류 시 50.0 반환
@@ -115,8 +159,10 @@ class TrustScoreCalculator:
             if not nutrition_info:
                 return 50.0  # 정보 없으면 중간값 (오류 아님)
             
-            # 2. 리뷰에서 성분명 추출
-            mentioned_ingredients = extract_ingredients(review_text)
+            # 2. 리뷰에서 성분명 추출 (리뷰 특징에서 재사용)
+            if features is None:
+                features = get_review_features(review_text)
+            mentioned_ingredients = features.ingredients
             
             # 3. 성분 언급이 없으면 중간값 반환
             if len(mentioned_ingredients) == 0:
@@ -151,10 +197,11 @@ class TrustScoreCalculator:
         photo_score: float = 0,
         consistency_score: float = 50,
         penalty_count: int = 0,
-        penalty_per_item: int = 10,
+        penalty_per_item: int = PENALTY_PER_ITEM,
         review_text: Optional[str] = None,
         product_id: Optional[int] = None,
-        use_nutrition_score: bool = True
+        use_nutrition_score: bool = True,
+        features: Optional[ReviewFeatures] = None
     ) -> Dict:
         """
         최종 신뢰도 점수 계산 (기본 점수 + 감점, 영양성분 일치도 포함)
@@ -170,6 +217,7 @@ class TrustScoreCalculator:
             review_text: 리뷰 텍스트 (영양성분 점수 계산용, 선택적)
             product_id: 제품 ID (영양성분 정보 조회용, 선택적)
             use_nutrition_score: 영양성분 점수 사용 여부 (기본값: True)
+            features: 리뷰 특징 (체크리스트와 공유, 선택적)
 
         Returns:
             Dict: {
@@ -186,7 +234,8 @@ class TrustScoreCalculator:
             try:
                 nutrition_score = self.calculate_nutrition_consistency_score(
                     review_text,
-                    product_id
+                    product_id,
+                    features
                 )
             except Exception:
                 # 계산 실패 시 기본값 사용 (오류 없이)
@@ -231,7 +280,7 @@ class TrustScoreCalculator:
             }
         }
 
-    def is_ad(self, final_score: float, penalty_count: int, threshold: float = 40) -> bool:
+    def is_ad(self, final_score: float, penalty_count: int, threshold: float = AD_SCORE_THRESHOLD) -> bool:
         """
         광고 여부 판별
 
@@ -244,7 +293,110 @@ class TrustScoreCalculator:
             bool: 광고 여부 (True: 광고, False: 일반 리뷰)
         """
         # 40점 미만 또는 감점 항목 3개 이상이면 광고로 판별
-        return final_score < threshold or penalty_count >= 3
+        return final_score < threshold or penalty_count >= self.AD_DETECTED_LIMIT
+
+    def calculate_final_scores(
+        self,
+        array_inputs: Mapping[str, Sequence[Any]],
+        penalty_per_item: int = PENALTY_PER_ITEM,
+        threshold: float = AD_SCORE_THRESHOLD
+    ) -> Dict[str, Any]:
+        """
+        여러 리뷰의 최종 신뢰도 점수 일괄 계산 (열 단위 입력)
+
+        가중치 변경 후 저장된 리뷰 전체를 재계산할 때처럼 리뷰 수가 많은 경우
+        리뷰마다 calculate_base_score/apply_penalty/is_ad를 호출하지 않고
+        열 단위로 한 번에 계산합니다. 결과는 리뷰별 계산과 완전히 동일합니다.
+        NumPy가 설치되어 있으면 배열 연산을 사용합니다.
+
+        Args:
+            array_inputs: 열 단위 입력 (NumPy 배열 또는 리스트)
+                - "L", "R", "M", "P", "C": 원시 점수 (없으면 기본값 50/50/50/0/50)
+                - "N": 영양성분 일치도 점수 (선택적, None/NaN인 리뷰는 기존 공식)
+                - "penalty_count": 감점 항목 개수 (없으면 0)
+            penalty_per_item: 항목당 감점 점수 (기본값: 10)
+            threshold: 광고 판별 임계값 (기본값: 40)
+
+        Returns:
+            Dict: {
+                "base_score": 기본 점수 열,
+                "penalty": 감점 점수 열,
+                "final_score": 최종 점수 열,
+                "is_ad": 광고 여부 열
+            }
+            NumPy 사용 시 각 열은 np.ndarray, 아니면 list
+        """
+        lengths = {len(column) for column in array_inputs.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"열 길이가 서로 다릅니다: {sorted(lengths)}")
+        size = lengths.pop() if lengths else 0
+
+        if NUMPY_AVAILABLE:
+            return self._calculate_final_scores_numpy(
+                array_inputs, size, penalty_per_item, threshold
+            )
+
+        columns = {
+            key: array_inputs.get(key, [default] * size)
+            for key, default in COLUMN_DEFAULTS.items()
+        }
+        nutrition = array_inputs.get("N", [None] * size)
+        penalty_counts = array_inputs.get("penalty_count", [0] * size)
+
+        result = {"base_score": [], "penalty": [], "final_score": [], "is_ad": []}
+        for i in range(size):
+            nutrition_score = nutrition[i]
+            if nutrition_score != nutrition_score:  # NaN
+                nutrition_score = None
+            base_score = self.calculate_base_score(
+                columns["L"][i],
+                columns["R"][i],
+                columns["M"][i],
+                columns["P"][i],
+                columns["C"][i],
+                nutrition_score
+            )
+            final_score = self.apply_penalty(base_score, penalty_counts[i], penalty_per_item)
+            result["base_score"].append(base_score)
+            result["penalty"].append(penalty_counts[i] * penalty_per_item)
+            result["final_score"].append(final_score)
+            result["is_ad"].append(self.is_ad(final_score, penalty_counts[i], threshold))
+        return result
+
+    def _calculate_final_scores_numpy(
+        self,
+        array_inputs: Mapping[str, Sequence[Any]],
+        size: int,
+        penalty_per_item: int,
+        threshold: float
+    ) -> Dict[str, Any]:
+        """calculate_final_scores의 NumPy 배열 연산 구현"""
+        def column(key, default):
+            if key not in array_inputs:
+                return np.full(size, default, dtype=float)
+            return np.asarray(array_inputs[key], dtype=float)
+
+        L, R, M, P, C = (column(key, default) for key, default in COLUMN_DEFAULTS.items())
+        N = column("N", np.nan)
+        penalty_counts = np.asarray(array_inputs.get("penalty_count", np.zeros(size, dtype=int)))
+
+        # calculate_base_score와 같은 연산 순서 (부동소수점 결과 동일)
+        wn, wb = self.NUTRITION_WEIGHTS, self.BASE_WEIGHTS
+        with_nutrition = (
+            L * wn["L"] + R * wn["R"] + M * wn["M"] + P * wn["P"] + C * wn["C"] + N * wn["N"]
+        )
+        without_nutrition = L * wb["L"] + R * wb["R"] + M * wb["M"] + P * wb["P"] + C * wb["C"]
+        base_score = _round2_array(np.where(np.isnan(N), without_nutrition, with_nutrition))
+
+        penalty = penalty_counts * penalty_per_item
+        final_score = _round2_array(np.maximum(0, base_score - penalty))
+
+        return {
+            "base_score": base_score,
+            "penalty": penalty,
+            "final_score": final_score,
+            "is_ad": (final_score < threshold) | (penalty_counts >= self.AD_DETECTED_LIMIT)
+        }
 
 
 # 편의 함수
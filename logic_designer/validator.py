@@ -7,10 +7,10 @@ import re
 from typing import Dict, List, Tuple, Optional
 from .nutrition_utils import (
     get_nutrition_info_safe,
-    extract_ingredients,
     is_valid_ingredient,
     get_official_efficacy
 )
+from .review_features import get_review_features
 
 
 class ReviewValidator:
@@ -217,19 +217,13 @@ class ReviewValidator:
         return False
 
     def _has_keyword_repetition(self, text: str, threshold: int = 5) -> bool:
-        """특정 키워드 과도한 반복 검사"""
-        words = re.findall(r'\b\w+\b', text)
-        if len(words) < 10:
+        """특정 키워드 과도한 반복 검사 (리뷰 특징의 토큰 등장 횟수 재사용)"""
+        features = get_review_features(text)
+        if len(features.tokens) < 10:
             return False
 
-        word_freq = {}
-        for word in words:
-            if len(word) >= 2:  # 2글자 이상 단어만
-                word_freq[word] = word_freq.get(word, 0) + 1
-
-        # 가장 많이 반복된 단어가 threshold 이상이면 True
-        max_freq = max(word_freq.values()) if word_freq else 0
-        return max_freq >= threshold
+        # 가장 많이 반복된 단어(2글자 이상)가 threshold 이상이면 True
+        return features.max_token_count >= threshold
 
     def _has_negative_opinion(self, text: str) -> bool:
         """부정적 의견 또는 단점 언급 여부 검사"""
@@ -265,7 +259,7 @@ class ReviewValidator:
             if not nutrition_info:
                 return False
             
-            mentioned_ingredients = extract_ingredients(review_text)
+            mentioned_ingredients = get_review_features(review_text).ingredients
             if not mentioned_ingredients:
                 return False
             
@@ -319,7 +313,7 @@ class ReviewValidator:
                 return False
             
             # 성분의 공식 효능 확인
-            mentioned_ingredients = extract_ingredients(review_text)
+            mentioned_ingredients = get_review_features(review_text).ingredients
             for ingredient in mentioned_ingredients:
                 official_efficacy = get_official_efficacy(ingredient, nutrition_info)
                 # 공식 효능 정보가 없으면 검증 불가 (의심하지 않음)
@@ -381,8 +375,8 @@ class ReviewValidator:
                     "message": "영양성분 정보 없음"
                 }
             
-            # 2. 리뷰에서 성분명 추출
-            mentioned_ingredients = extract_ingredients(review_text)
+            # 2. 리뷰에서 성분명 추출 (리뷰 특징에서 재사용)
+            mentioned_ingredients = list(get_review_features(review_text).ingredients)
             
             # 3. 성분 검증
             valid_ingredients = []
@@ -4,7 +4,6 @@ Supabase products 데이터를 GitHub에 업데이트하는 스크립트
 import os
 import sys
 import json
-import requests
 from datetime import datetime
 
 # UTF-8 인코딩 설정
@@ -17,6 +16,8 @@ if sys.platform == 'win32':
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from ui_integration.http_client import http_get
+
 # Supabase 설정 (secrets.toml에서 읽기)
 SUPABASE_URL = "https://bvowxbpqtfpkkxkzsumf.supabase.co"
 SUPABASE_KEY = "sb_publishable_afWmzo_2ypv3liBdpCkJjg_KjS7nqE2"
@@ -37,7 +38,7 @@ def fetch_products():
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = http_get(url, headers=headers, params=params)
         if response.status_code == 200:
             data = response.json()
             print(f"✓ {len(data)}개 제품 데이터 조회 성공")
@@ -6,7 +6,6 @@ import os
 import sys
 import json
 import csv
-import requests
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -14,6 +13,8 @@ from dotenv import load_dotenv
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from ui_integration.http_client import http_get
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -39,7 +40,7 @@ def fetch_table(table_name):
         "select": "*"
     }
 
-    response = requests.get(url, headers=headers, params=params)
+    response = http_get(url, headers=headers, params=params)
 
     if response.status_code == 200:
         return response.json()
@@ -6,7 +6,6 @@ Products 테이블의 rating_avg와 rating_count를 실제 리뷰 데이터로 
 import sys
 import io
 import os
-import requests
 from datetime import datetime
 
 # UTF-8 인코딩 설정
@@ -18,6 +17,8 @@ if sys.platform == 'win32':
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from ui_integration.http_client import http_get, get_http_client
+
 # Supabase 설정 (SERVICE_ROLE_KEY 사용 - 관리자 권한)
 SUPABASE_URL = "https://bvowxbpqtfpkkxkzsumf.supabase.co"
 SUPABASE_KEY = "sb_secret_7colYDry0-0E76v-yrpzFA_ab48cpbo"  # SERVICE_ROLE_KEY
@@ -32,7 +33,7 @@ def fetch_all_products():
     }
     params = {"select": "id,brand,title"}
     
-    response = requests.get(url, headers=headers, params=params)
+    response = http_get(url, headers=headers, params=params)
     if response.status_code == 200:
         return response.json()
     else:
@@ -52,7 +53,7 @@ def fetch_reviews_for_product(product_id):
         "product_id": f"eq.{product_id}"
     }
     
-    response = requests.get(url, headers=headers, params=params)
+    response = http_get(url, headers=headers, params=params)
     if response.status_code == 200:
         return response.json()
     else:
@@ -74,7 +75,7 @@ def update_product_ratings(product_id, rating_avg, rating_count):
         "rating_count": rating_count
     }
     
-    response = requests.patch(url, headers=headers, params=params, json=data)
+    response = get_http_client().patch(url, headers=headers, params=params, json=data)
     return response.status_code == 200
 
 def main():
@@ -4,7 +4,9 @@ logic_designer의 검증 로직을 REST API로 제공
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from typing import Optional, List
+import json
 import sys
 import os
 
@@ -21,11 +23,11 @@ from api.schemas import ReviewAnalysisRequest, ReviewAnalysisResponse
 router = APIRouter()
 
 try:
-    from logic_designer import analyze as analyze_review
+    from logic_designer import analyze as analyze_review, analyze_batch, analyze_stream
 except ImportError:
     # 로컬 개발 환경에서 경로가 다를 수 있음
     sys.path.insert(0, os.path.join(project_root, 'dev2-2Hour', 'dev2-main'))
-    from logic_designer import analyze as analyze_review
+    from logic_designer import analyze as analyze_review, analyze_batch, analyze_stream
 
 @router.post("/analyze", response_model=ReviewAnalysisResponse)
 async def analyze_review_endpoint(request: ReviewAnalysisRequest):
@@ -50,6 +52,40 @@ async def analyze_review_endpoint(request: ReviewAnalysisRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"분석 중 오류 발생: {str(e)}")
 
+@router.post("/analyze/stream")
+async def analyze_review_stream_endpoint(request: ReviewAnalysisRequest):
+    """
+    리뷰 분석 스트리밍 엔드포인트 (Server-Sent Events)
+    
+    검증 결과(validation 이벤트)를 즉시 보내고, 약사 AI 분석 결과(analysis 이벤트)는
+    Claude 응답이 도착하면 이어서 보냅니다. 리뷰가 너무 짧으면 error 이벤트만 보냅니다.
+    """
+    def event_stream():
+        try:
+            for event in analyze_stream(
+                review_text=request.review_text,
+                product_id=request.product_id,
+                length_score=request.length_score,
+                repurchase_score=request.repurchase_score,
+                monthly_use_score=request.monthly_use_score,
+                photo_score=request.photo_score,
+                consistency_score=request.consistency_score,
+                use_nutrition_validation=request.use_nutrition_validation
+            ):
+                yield _sse_message(event["event"], event["data"])
+        except Exception as e:
+            yield _sse_message("error", {"error": "STREAM_ERROR", "message": f"분석 중 오류 발생: {str(e)}"})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _sse_message(event: str, data: dict) -> str:
+    """SSE 메시지 형식으로 변환"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
 @router.get("/batch-analyze")
 async def batch_analyze_reviews(
     product_id: int,
@@ -64,26 +100,31 @@ async def batch_analyze_reviews(
     """
     try:
         # Supabase에서 리뷰 가져오기
-        sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(current_dir))))
-        from supabase_data import get_reviews_by_product_id
+        sys.path.insert(0, os.path.dirname(os.path.dirname(current_dir)))
+        from supabase_data import get_reviews_by_product
+        
+        reviews = get_reviews_by_product(str(product_id))[:limit]
         
-        reviews = get_reviews_by_product_id(product_id)[:limit]
+        # 엔진 객체(체크리스트, 점수 계산기, AI 클라이언트)를 재사용하여 일괄 분석
+        batch_results = analyze_batch(
+            {
+                "review_text": review.get("body", review.get("text", "")),
+                "product_id": product_id
+            }
+            for review in reviews
+        )
         
         results = []
-        for review in reviews:
-            try:
-                result = analyze_review(
-                    review_text=review.get("body", review.get("text", "")),
-                    product_id=product_id
-                )
+        for review, result in zip(reviews, batch_results):
+            if result.get("error") == "ITEM_ERROR":
                 results.append({
                     "review_id": review.get("id"),
-                    "analysis": result
+                    "error": result["message"]
                 })
-            except Exception as e:
+            else:
                 results.append({
                     "review_id": review.get("id"),
-                    "error": str(e)
+                    "analysis": result
                 })
         
         return {"results": results, "total": len(results)}
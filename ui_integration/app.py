@@ -6,6 +6,7 @@
 import streamlit as st
 import pandas as pd
 import os
+import threading
 from typing import Dict, List, Optional
 from datetime import datetime
 
@@ -28,35 +29,68 @@ from supabase_data import (
     get_reviews_by_date_range,
     get_reviews_by_language,
     get_all_categories,
-    get_statistics_summary
+    get_statistics_summary,
+    get_reviews_for_products,
+    fetch_many
 )
 from utils import safe_get_product_label, safe_find_item, safe_parse_value
 USE_SUPABASE = True
 
 # ========== 성능 최적화: 데이터 캐싱 ==========
-@st.cache_data(ttl=300)  # 5분 캐시
+@st.cache_data(ttl=300, show_spinner=False)  # 5분 캐시
 def get_cached_products():
     """제품 목록 캐싱"""
     return get_all_products()
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_cached_categories():
     """카테고리 목록 캐싱"""
     return get_all_categories()
 
 @st.cache_data(ttl=60, show_spinner=False)
-def get_cached_statistics(_cache_version="v2_fixed_price"):
-    """통계 데이터 캐싱 (평균가격 수정 버전 v2)
-    
-    _cache_version 파라미터로 캐시 키를 변경하여 기존 캐시 무효화
-    """
+def get_cached_statistics():
+    """통계 데이터 캐싱 (1분)"""
     return get_statistics_summary()
 
-@st.cache_data(ttl=300)
+@st.cache_data(ttl=300, show_spinner=False)
 def get_cached_analysis_results():
     """분석 결과 캐싱"""
     return get_all_analysis_results()
 
+def warm_dashboard_cache():
+    """첫 로딩 시 데이터별 캐시를 fetch_many로 동시에 채움 (세션당 한 번)
+
+    첫 로딩 시간이 네 조회의 합이 아니라 가장 느린 조회 하나와 비슷해집니다.
+    이후에는 각 get_cached_* 함수가 자기 TTL로 캐시를 사용합니다.
+    """
+    if st.session_state.get('dashboard_cache_warmed'):
+        return
+    st.session_state['dashboard_cache_warmed'] = True
+
+    try:
+        from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except ImportError:
+        add_script_run_ctx, ctx = None, None
+
+    def in_script_context(func):
+        # 작업 스레드에서도 현재 세션의 캐시/컨텍스트를 사용
+        def run():
+            if ctx is not None:
+                add_script_run_ctx(threading.current_thread(), ctx)
+            return func()
+        return run
+
+    try:
+        fetch_many([
+            in_script_context(func)
+            for func in (get_cached_analysis_results, get_cached_products,
+                         get_cached_categories, get_cached_statistics)
+        ])
+    except Exception:
+        # 실패한 조회는 아래에서 개별 호출 시 다시 시도하고 오류를 표시
+        pass
+
 # ========== 필터 검증 함수 ==========
 def validate_filters(filters: Dict) -> List[str]:
     """필터 값 검증 및 에러 메시지 반환"""
@@ -773,7 +807,8 @@ def main():
     """메인 앱 함수"""
     st.markdown('<div class="main-title">🔍 건기식 리뷰 팩트체크 시스템</div>', unsafe_allow_html=True)
     
-    # 데이터 로드 - 캐싱된 데이터 사용 (성능 최적화)
+    # 데이터 로드 - 캐싱된 데이터 사용 (성능 최적화, 첫 로딩은 동시 조회)
+    warm_dashboard_cache()
     try:
         all_data = get_cached_analysis_results()
         if not all_data:
@@ -875,13 +910,12 @@ def main():
                         all_products_for_chat = get_cached_products() or []
                         all_reviews_for_chat = []
 
-                        # 모든 제품의 리뷰 수집
-                        for p in all_products_for_chat:
-                            product_id = p.get('id')
-                            if product_id:
-                                from supabase_data import get_reviews_by_product
-                                reviews = get_reviews_by_product(product_id)
-                                all_reviews_for_chat.extend(reviews)
+                        # 모든 제품의 리뷰 수집 (제품별 요청 대신 일괄 조회)
+                        reviews_by_product = get_reviews_for_products(
+                            p.get('id') for p in all_products_for_chat
+                        )
+                        for reviews in reviews_by_product.values():
+                            all_reviews_for_chat.extend(reviews)
 
                         # 챗봇 검색 실행
                         result = chatbot_service.search(
@@ -1149,7 +1183,7 @@ def main():
                 st.rerun()
 
             try:
-                stats = get_cached_statistics(_cache_version="v2_fixed_price")
+                stats = get_cached_statistics()
 
                 # 전체 통계 (컴팩트)
                 col_s1, col_s2 = st.columns(2)
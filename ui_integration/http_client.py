@@ -0,0 +1,200 @@
+"""
+공유 HTTP 클라이언트 모듈
+Supabase REST API 호출이 같은 연결 풀(keep-alive)을 재사용하도록 requests.Session을 공유합니다.
+
+- 연결 풀 크기 제한 (pool_maxsize, 초과 요청은 빈 연결을 기다림)
+- 기본 타임아웃 (연결, 읽기)
+- gzip 응답 압축
+- 429 / 5xx 응답은 지터가 적용된 지수 백오프로 재시도 (Retry-After 헤더 우선)
+
+같은 디렉토리의 supabase_data.py와 scripts/의 Supabase 스크립트가 함께 사용합니다.
+"""
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+Timeout = Union[float, Tuple[float, float]]
+
+
+class PooledHTTPClient:
+    """연결 풀을 공유하는 HTTP 클라이언트 (재시도 + 백오프)"""
+
+    # 재시도할 응답 코드 (요청 제한 + 일시적 서버 오류)
+    RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+    # 5xx/연결 오류 시 재시도해도 안전한 메서드 (429는 처리되지 않은 요청이므로 항상 재시도)
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        timeout: Timeout = (3.05, 15.0),
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0
+    ):
+        """
+        클라이언트 초기화
+
+        Args:
+            pool_connections: 호스트별 연결 풀 수
+            pool_maxsize: 풀당 최대 연결 수 (동시 요청 상한)
+            timeout: 기본 타임아웃 (초 또는 (연결, 읽기) 튜플, 요청별 timeout 인자가 우선)
+            max_retries: 최대 재시도 횟수 (0이면 재시도 안 함)
+            backoff_base: 첫 재시도 대기 상한 (초, 재시도마다 2배)
+            backoff_max: 재시도 대기 최대값 (초)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retries = 0  # 누적 재시도 횟수 (여러 스레드가 공유하므로 _lock으로 갱신)
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """공유 세션 (첫 사용 시 생성)"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        """연결 풀 크기가 제한된 세션 생성"""
+        session = requests.Session()
+        # 재시도는 request()에서 직접 처리 (어댑터 재시도 비활성화)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+            pool_block=True
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive"
+        })
+        return session
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        재시도 대기 시간 (full jitter: 0 ~ min(backoff_max, backoff_base * 2^attempt))
+
+        Args:
+            attempt: 재시도 순번 (0부터)
+            retry_after: 서버가 알려준 대기 시간 (초, 있으면 우선)
+
+        Returns:
+            float: 대기 시간 (초)
+        """
+        if retry_after is not None:
+            return min(max(retry_after, 0.0), self.backoff_max)
+        cap = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더 파싱 (초 또는 HTTP 날짜, 없거나 잘못된 값이면 None)"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return None
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        HTTP 요청 (429/5xx 응답과 연결 오류는 백오프 후 재시도)
+
+        Args:
+            method: HTTP 메서드
+            url: 요청 URL
+            **kwargs: requests.Session.request 인자 (timeout 생략 시 기본 타임아웃)
+
+        Returns:
+            requests.Response: 마지막 응답 (재시도를 모두 소진하면 마지막 오류 응답 그대로)
+
+        Raises:
+            requests.RequestException: 재시도를 모두 소진한 연결 오류/타임아웃
+        """
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        idempotent = method in self.IDEMPOTENT_METHODS
+
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                delay = self.backoff_delay(attempt)
+            else:
+                retryable = response.status_code in self.RETRY_STATUS and (
+                    idempotent or response.status_code == 429
+                )
+                if not retryable or attempt >= self.max_retries:
+                    return response
+                delay = self.backoff_delay(attempt, self._retry_after(response))
+                response.close()
+
+            with self._lock:
+                self.retries += 1
+            attempt += 1
+            time.sleep(delay)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET 요청"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """POST 요청"""
+        return self.request("POST", url, **kwargs)
+
+    def patch(self, url: str, **kwargs: Any) -> requests.Response:
+        """PATCH 요청"""
+        return self.request("PATCH", url, **kwargs)
+
+    def close(self) -> None:
+        """세션과 풀의 연결 종료 (다음 요청 시 새 세션 생성)"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+# Supabase 호출 전체가 공유하는 클라이언트
+_http_client = PooledHTTPClient()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """공유 HTTP 클라이언트 반환"""
+    return _http_client
+
+
+def http_get(url: str, **kwargs: Any) -> requests.Response:
+    """공유 클라이언트로 GET 요청 (재시도 + 기본 타임아웃)"""
+    return _http_client.get(url, **kwargs)
+
+
+def http_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """공유 클라이언트로 HTTP 요청 (재시도 + 기본 타임아웃)"""
+    return _http_client.request(method, url, **kwargs)
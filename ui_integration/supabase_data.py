@@ -5,12 +5,39 @@ Streamlit Cloud와 로컬 환경 모두 지원합니다.
 """
 
 import os
-import requests
-from typing import Dict, List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+try:
+    from http_client import http_get  # ui_integration에서 실행 (Streamlit, API 서버)
+except ImportError:
+    from ui_integration.http_client import http_get  # 프로젝트 루트에서 실행
 
 # 디버그 모드 (사용자 UI에서 숨김)
 DEBUG = False
 
+# 페이지당 행 수 (서버 max-rows가 더 작으면 서버 상한만큼씩 읽음)
+DEFAULT_PAGE_SIZE = 1000
+
+# 통계 요약에 사용할 상위 제품 수 (rating_count 기준)
+STATISTICS_TOP_PRODUCTS = 30
+
+# 리뷰 일괄 조회 시 요청당 제품 ID 수 (product_id=in.(...) URL 길이 제한)
+REVIEW_BATCH_SIZE = 100
+
+# fetch_many 최대 동시 요청 수 (공유 HTTP 클라이언트 연결 풀 크기 이하)
+MAX_CONCURRENT_FETCHES = 4
+
+# 분석 결과를 만드는 상위 제품 수 (rating_count 기준)
+ANALYSIS_TOP_PRODUCTS = 5
+
+# 404 응답 후 RPC를 다시 시도하기까지의 시간 (초, 그동안은 클라이언트 집계로 대체)
+RPC_RETRY_INTERVAL = 600.0
+
+# 배포되지 않은 RPC 함수 {함수명: 다시 시도할 시각 (time.monotonic 기준)}
+_unavailable_rpcs: Dict[str, float] = {}
+
 def _get_config():
     """Streamlit secrets 또는 환경 변수에서 Supabase 설정 가져오기"""
     supabase_url = None
@@ -68,8 +95,8 @@ def _get_headers():
     }
 
 
-def _fetch_from_supabase(table: str, params: str = '') -> List[Dict]:
-    """Supabase REST API에서 데이터 가져오기"""
+def _get_rest_base() -> Optional[str]:
+    """REST API 기본 URL 반환 (설정이 없으면 경고 후 None)"""
     supabase_url = _get_supabase_url()
     supabase_key = _get_supabase_key()
 
@@ -82,10 +109,19 @@ def _fetch_from_supabase(table: str, params: str = '') -> List[Dict]:
             st.info("Settings > Secrets에서 SUPABASE_URL과 SUPABASE_ANON_KEY를 설정하세요.")
         except:
             pass
+        return None
+
+    return f'{supabase_url}/rest/v1'
+
+
+def _fetch_from_supabase(table: str, params: str = '') -> List[Dict]:
+    """Supabase REST API에서 데이터 가져오기"""
+    rest_base = _get_rest_base()
+    if not rest_base:
         return []
 
-    url = f'{supabase_url}/rest/v1/{table}?{params}'
-    response = requests.get(url, headers=_get_headers())
+    url = f'{rest_base}/{table}?{params}'
+    response = http_get(url, headers=_get_headers())
     if response.status_code == 200:
         return response.json()
     else:
@@ -93,6 +129,277 @@ def _fetch_from_supabase(table: str, params: str = '') -> List[Dict]:
         return []
 
 
+Fetch = Union[Tuple[str, str], Callable[[], Any]]
+
+
+def _run_fetch(fetch: Fetch) -> Any:
+    """fetch_many 항목 하나 실행"""
+    if callable(fetch):
+        return fetch()
+    table, params = fetch
+    return _fetch_from_supabase(table, params)
+
+
+def fetch_many(
+    fetches: Union[Iterable[Fetch], Mapping[str, Fetch]],
+    max_workers: int = MAX_CONCURRENT_FETCHES
+) -> Union[List[Any], Dict[str, Any]]:
+    """
+    서로 독립적인 조회를 스레드 풀에서 동시에 실행
+
+    전체 소요 시간이 가장 느린 조회 하나와 비슷해지도록, 순서대로 기다리던
+    PostgREST 요청을 max_workers개까지 동시에 보냅니다.
+
+    Args:
+        fetches: 조회 목록 - (테이블, 쿼리 파라미터) 튜플(_fetch_from_supabase로 조회)
+            또는 인자 없는 함수(예: get_all_categories), dict면 같은 키로 결과 반환
+        max_workers: 최대 동시 실행 수
+
+    Returns:
+        입력 순서대로의 결과 리스트 (dict 입력이면 {키: 결과})
+
+    Raises:
+        Exception: 조회 함수에서 발생한 예외 (모든 조회가 끝난 뒤 입력 순서상 첫 번째 예외)
+    """
+    if isinstance(fetches, Mapping):
+        keys = list(fetches)
+        return dict(zip(keys, fetch_many([fetches[k] for k in keys], max_workers)))
+
+    fetches = list(fetches)
+    if len(fetches) <= 1 or max_workers <= 1:
+        return [_run_fetch(fetch) for fetch in fetches]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(fetches))) as executor:
+        futures = [executor.submit(_run_fetch, fetch) for fetch in fetches]
+    return [future.result() for future in futures]
+
+
+def _call_supabase_rpc(function: str, params: str = ''):
+    """
+    PostgREST RPC 함수 호출 (database/statistics_rpc.sql의 STABLE 함수, GET 요청)
+
+    Args:
+        function: 함수명
+        params: 함수 인자 쿼리 파라미터 (예: 'p_top_products=30')
+
+    Returns:
+        함수 반환값 (JSON), 함수가 없거나 호출 실패 시 None
+        (404 응답 후 RPC_RETRY_INTERVAL 동안은 요청하지 않고 None, 이후 함수 배포 여부를 다시 확인)
+    """
+    retry_at = _unavailable_rpcs.get(function)
+    if retry_at is not None:
+        if time.monotonic() < retry_at:
+            return None
+        _unavailable_rpcs.pop(function, None)
+    rest_base = _get_rest_base()
+    if not rest_base:
+        return None
+
+    url = f'{rest_base}/rpc/{function}'
+    if params:
+        url = f'{url}?{params}'
+    try:
+        response = http_get(url, headers=_get_headers())
+    except Exception as e:
+        print(f"Error calling rpc/{function}: {e}")
+        return None
+    if response.status_code == 200:
+        return response.json()
+    if response.status_code == 404:
+        # 함수 미배포: 한동안 호출은 바로 클라이언트 집계로 대체
+        _unavailable_rpcs[function] = time.monotonic() + RPC_RETRY_INTERVAL
+    if DEBUG:
+        print(f"rpc/{function} 사용 불가: {response.status_code} - {response.text}")
+    return None
+
+
+class SupabaseFetchError(Exception):
+    """페이지 조회 실패 (네트워크 오류 또는 오류 응답, 그때까지의 행은 이미 반환됨)"""
+
+
+def _parse_content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Content-Range 헤더(예: '0-999/12345', '*/0')에서 전체 행 수 추출 (없으면 None)"""
+    if not content_range or '/' not in content_range:
+        return None
+    total = content_range.rsplit('/', 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+class SupabasePager:
+    """
+    PostgREST 테이블을 페이지 단위로 읽는 스트리밍 이터레이터
+
+    한 번에 한 페이지(page_size 행)만 메모리에 두므로 수백만 건의 리뷰도
+    일정한 메모리로 집계할 수 있습니다. PostgREST의 응답 행 수 제한(max-rows)에
+    걸려 결과가 잘리는 문제도 피합니다.
+
+    - offset 방식 (기본): limit + offset, 정렬이 없으면 id 오름차순 추가
+    - keyset 방식 (keyset='id'): '{keyset}=gt.{마지막 값}' 조건으로 다음 페이지 조회
+      (깊은 페이지에서도 일정한 속도, select에 keyset 컬럼이 포함되어야 함)
+    - 끝 판별: count 지정 시 Content-Range 전체 행 수, 아니면 빈 페이지
+      (서버 max-rows가 page_size보다 작으면 짧은 페이지가 끝이 아닐 수 있음)
+    - 조회 실패 시 SupabaseFetchError (잘린 결과를 전체 결과로 오인하지 않도록)
+    """
+
+    def __init__(
+        self,
+        table: str,
+        params: str = '',
+        page_size: int = DEFAULT_PAGE_SIZE,
+        keyset: Optional[str] = None,
+        count: Optional[str] = None
+    ):
+        """
+        페이지 이터레이터 초기화
+
+        Args:
+            table: 테이블명
+            params: 쿼리 파라미터 (select, 필터, order 등, limit/offset 제외)
+            page_size: 페이지당 행 수
+            keyset: keyset 페이지네이션 컬럼 (None이면 offset 방식)
+            count: 전체 행 수 계산 방식 ('exact', 'planned', 'estimated', None이면 계산 안 함)
+
+        Raises:
+            ValueError: page_size가 1 미만이거나, keyset 방식에 order/limit/offset이 지정된 경우
+        """
+        if page_size < 1:
+            raise ValueError("page_size는 1 이상이어야 합니다.")
+        param_names = {part.split('=', 1)[0] for part in params.split('&') if part}
+        if param_names & {'limit', 'offset'}:
+            raise ValueError("limit/offset은 SupabasePager가 지정합니다.")
+        if keyset and 'order' in param_names:
+            raise ValueError("keyset 방식은 keyset 컬럼 오름차순으로만 정렬됩니다.")
+
+        self.table = table
+        self.params = params
+        self.page_size = page_size
+        self.keyset = keyset
+        self.count = count
+        self.total: Optional[int] = None  # count 지정 시 첫 페이지 조회 후 설정
+        self.pages = 0
+        self.rows = 0
+        self.error: Optional[str] = None  # 조회 실패 시 오류 메시지 (SupabaseFetchError와 같은 내용)
+
+    def _page_params(self, offset: int, last_key) -> str:
+        """페이지 요청 쿼리 파라미터"""
+        parts = [self.params] if self.params else []
+        if self.keyset:
+            if last_key is not None:
+                parts.append(f'{self.keyset}=gt.{last_key}')
+            parts.append(f'order={self.keyset}.asc')
+        else:
+            if 'order=' not in self.params:
+                parts.append('order=id.asc')  # offset 방식은 정렬이 고정되어야 페이지가 겹치지 않음
+            parts.append(f'offset={offset}')
+        parts.append(f'limit={self.page_size}')
+        return '&'.join(parts)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        행을 하나씩 반환 (Supabase 설정이 없으면 행 없이 종료)
+
+        Raises:
+            SupabaseFetchError: 페이지 조회 실패 (네트워크 오류 또는 200/206 이외의 응답)
+            ValueError: keyset 컬럼이 select에 없는 경우
+        """
+        rest_base = _get_rest_base()
+        if not rest_base:
+            self.error = "Supabase 설정 없음"
+            return
+
+        offset = 0
+        last_key = None
+        while True:
+            headers = _get_headers()
+            if self.count and self.pages == 0:
+                headers['Prefer'] = f'count={self.count}'
+
+            url = f'{rest_base}/{self.table}?{self._page_params(offset, last_key)}'
+            try:
+                response = http_get(url, headers=headers)
+            except Exception as e:
+                self.error = str(e)
+                raise SupabaseFetchError(f"{self.table} (page {self.pages + 1}): {e}") from e
+            # 206 Partial Content: 전체 행 수를 계산한 페이지 응답
+            if response.status_code not in (200, 206):
+                self.error = f"{response.status_code} - {response.text}"
+                raise SupabaseFetchError(f"{self.table} (page {self.pages + 1}): {self.error}")
+
+            if self.count and self.pages == 0:
+                self.total = _parse_content_range_total(response.headers.get('Content-Range'))
+
+            page = response.json()
+            self.pages += 1
+            if not page:
+                return
+
+            if self.keyset:
+                last_key = page[-1].get(self.keyset)
+                if last_key is None:
+                    raise ValueError(f"keyset 컬럼 '{self.keyset}'이 select에 포함되어야 합니다.")
+            offset += len(page)
+            self.rows += len(page)
+
+            yield from page
+
+            # 전체 행 수를 알면 추가 요청 없이 종료 (모르면 빈 페이지가 올 때까지 조회)
+            if self.total is not None and self.rows >= self.total:
+                return
+
+
+def iter_supabase_rows(
+    table: str,
+    params: str = '',
+    page_size: int = DEFAULT_PAGE_SIZE,
+    keyset: Optional[str] = None,
+    count: Optional[str] = None
+) -> SupabasePager:
+    """
+    테이블 행을 페이지 단위로 스트리밍 (SupabasePager 생성)
+
+    Args:
+        table: 테이블명
+        params: 쿼리 파라미터 (limit/offset 제외)
+        page_size: 페이지당 행 수
+        keyset: keyset 페이지네이션 컬럼 (예: 'id')
+        count: 전체 행 수 계산 방식 ('exact' 등, 결과는 pager.total)
+
+    Returns:
+        SupabasePager: 행(Dict)을 하나씩 내보내는 이터레이터
+    """
+    return SupabasePager(table, params, page_size=page_size, keyset=keyset, count=count)
+
+
+def count_supabase_rows(table: str, params: str = '', count: str = 'exact') -> Optional[int]:
+    """
+    조건에 맞는 전체 행 수 (행 데이터는 가져오지 않음)
+
+    Args:
+        table: 테이블명
+        params: 필터 파라미터
+        count: 계산 방식 ('exact', 'planned', 'estimated')
+
+    Returns:
+        Optional[int]: 행 수 (조회 실패 시 None)
+    """
+    rest_base = _get_rest_base()
+    if not rest_base:
+        return None
+
+    headers = _get_headers()
+    headers['Prefer'] = f'count={count}'
+    query = f'{params}&limit=1' if params else 'limit=1'
+    try:
+        response = http_get(f'{rest_base}/{table}?{query}', headers=headers)
+    except Exception as e:
+        print(f"Error counting {table}: {e}")
+        return None
+    if response.status_code not in (200, 206):
+        print(f"Error counting {table}: {response.status_code} - {response.text}")
+        return None
+    return _parse_content_range_total(response.headers.get('Content-Range'))
+
+
 def get_products_by_category(category: str) -> List[Dict]:
     """카테고리별 제품 조회"""
     if not category:
@@ -196,27 +503,81 @@ def get_reviews_by_language(language: str) -> List[Dict]:
 
 
 def get_all_categories() -> List[str]:
-    """모든 카테고리 목록 반환"""
-    products = _fetch_from_supabase('products', 'select=category')
-    categories = sorted(list(set(p.get('category') for p in products if p.get('category'))))
-    return categories
+    """모든 카테고리 목록 반환 (RPC 집계, 함수가 없으면 카테고리 컬럼만 스트리밍하여 계산, 실패 시 빈 리스트)"""
+    categories = _call_supabase_rpc('get_all_categories')
+    if isinstance(categories, list):
+        return categories
+
+    try:
+        rows = iter_supabase_rows('products', 'select=id,category', keyset='id')
+        return sorted(set(p.get('category') for p in rows if p.get('category')))
+    except SupabaseFetchError as e:
+        print(f"Error fetching categories: {e}")
+        return []
 
 
 def get_statistics_summary() -> Dict:
-    """전체 통계 요약 반환 (최근 30개 제품 기준)"""
-    products = _fetch_from_supabase('products', 'select=*&order=rating_count.desc')
-    reviews = _fetch_from_supabase('reviews', 'select=*')
-    
-    # 최근 30개 제품만 사용 (rating_count 기준 상위 30개)
-    products = products[:30]
-    
+    """
+    전체 통계 요약 반환 (최근 30개 제품 기준)
+
+    DB의 get_statistics_summary RPC가 집계 결과만 반환하고,
+    함수가 배포되지 않은 경우 클라이언트에서 같은 규칙으로 집계합니다.
+    """
+    summary = _call_supabase_rpc('get_statistics_summary', f'p_top_products={STATISTICS_TOP_PRODUCTS}')
+    if isinstance(summary, dict):
+        return _normalize_statistics_summary(summary)
+    try:
+        return _compute_statistics_summary()
+    except SupabaseFetchError as e:
+        # 일부 리뷰만 집계한 값을 전체 통계로 보여주지 않음
+        print(f"Error computing statistics: {e}")
+        return _normalize_statistics_summary({})
+
+
+def _normalize_statistics_summary(summary: Dict) -> Dict:
+    """RPC 결과를 클라이언트 집계와 같은 형식으로 변환 (JSON 문자열 키 → 평점 정수 키)"""
+    distribution = summary.get('rating_distribution') or {}
+    return {
+        'total_products': summary.get('total_products', 0),
+        'total_reviews': summary.get('total_reviews', 0),
+        'brands': summary.get('brands') or {},
+        'categories': summary.get('categories') or {},
+        'rating_distribution': {k: distribution.get(str(k), 0) for k in range(1, 6)},
+        'avg_price': float(summary.get('avg_price') or 0)
+    }
+
+
+def _aggregate_review_ratings() -> Tuple[int, Dict[int, int]]:
+    """
+    리뷰 수와 평점 분포 (평점만 페이지 단위로 스트리밍하여 집계, 전체 리뷰를 메모리에 올리지 않음)
+
+    Raises:
+        SupabaseFetchError: 페이지 조회 실패 (일부만 집계한 결과를 반환하지 않음)
+    """
+    rating_distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+    total_reviews = 0
+    for r in iter_supabase_rows('reviews', 'select=id,rating', keyset='id'):
+        total_reviews += 1
+        rating = r.get('rating')
+        if rating and rating in rating_distribution:
+            rating_distribution[rating] += 1
+    return total_reviews, rating_distribution
+
+
+def _compute_statistics_summary() -> Dict:
+    """통계 요약 클라이언트 집계 (get_statistics_summary RPC가 없을 때)"""
+    # 최근 30개 제품만 사용 (rating_count 기준 상위 30개), 리뷰 집계와 동시에 조회
+    products, (total_reviews, rating_distribution) = fetch_many([
+        ('products', f'select=*&order=rating_count.desc&limit={STATISTICS_TOP_PRODUCTS}'),
+        _aggregate_review_ratings
+    ])
+
     total_products = len(products)
-    total_reviews = len(reviews)
     
     # 브랜드별 통계
     brands = {}
     for p in products:
-        brand = p.get('brand', 'Unknown')
+        brand = p.get('brand') or 'Unknown'
         if brand not in brands:
             brands[brand] = {'count': 0, 'total_rating': 0, 'total_reviews': 0}
         brands[brand]['count'] += 1
@@ -228,18 +589,11 @@ def get_statistics_summary() -> Dict:
     # 카테고리별 통계
     categories = {}
     for p in products:
-        category = p.get('category', 'Unknown')
+        category = p.get('category') or 'Unknown'
         if category not in categories:
             categories[category] = {'count': 0}
         categories[category]['count'] += 1
     
-    # 평점 분포
-    rating_distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for r in reviews:
-        rating = r.get('rating')
-        if rating and rating in rating_distribution:
-            rating_distribution[rating] += 1
-    
     # 평균 가격 (가격 변환 및 검증 추가)
     valid_prices = []
     for p in products:
@@ -273,76 +627,102 @@ def get_statistics_summary() -> Dict:
     }
 
 
+def _format_product(p: Dict) -> Dict:
+    """Supabase products 행을 mock_data 제품 형식으로 변환"""
+    price = p.get('price') or 0
+    return {
+        "id": str(p['id']),
+        "name": p.get('title', ''),
+        "brand": p.get('brand', ''),
+        "price": price / 100 if price > 1000 else price,  # KRW to USD 근사치
+        "serving_size": "1 Softgel",
+        "servings_per_container": 60,
+        "ingredients": {
+            "lutein": "20mg",
+            "zeaxanthin": "4mg"
+        },
+        "product_url": p.get('url', ''),
+        "rating_avg": p.get('rating_avg') or 0,
+        "rating_count": p.get('rating_count') or 0,
+        "category": p.get('category', '')
+    }
+
+
+def _format_review(r: Dict) -> Dict:
+    """Supabase reviews 행을 mock_data 리뷰 형식으로 변환"""
+    return {
+        "product_id": str(r.get('product_id', '')),
+        "text": r.get('body', ''),
+        "rating": r.get('rating', 5),
+        "date": r.get('review_date', ''),
+        "reorder": False,  # Supabase에 해당 필드가 없으면 기본값
+        "one_month_use": len(r.get('body', '')) > 100,  # 리뷰 길이로 추정
+        "reviewer": r.get('author', 'Anonymous'),
+        "verified": True,  # 기본값
+        "helpful_count": r.get('helpful_count', 0),  # Supabase helpful_count 필드
+        "language": r.get('language', 'ko'),  # Supabase language 필드
+        "title": r.get('title', '')  # Supabase title 필드
+    }
+
+
 def get_all_products() -> List[Dict]:
     """모든 제품 정보 반환"""
     products = _fetch_from_supabase('products', 'select=*&order=rating_count.desc')
     # mock_data 형식에 맞게 변환
-    formatted = []
-    for p in products:
-        price = p.get('price') or 0
-        formatted.append({
-            "id": str(p['id']),
-            "name": p.get('title', ''),
-            "brand": p.get('brand', ''),
-            "price": price / 100 if price > 1000 else price,  # KRW to USD 근사치
-            "serving_size": "1 Softgel",
-            "servings_per_container": 60,
-            "ingredients": {
-                "lutein": "20mg",
-                "zeaxanthin": "4mg"
-            },
-            "product_url": p.get('url', ''),
-            "rating_avg": p.get('rating_avg') or 0,
-            "rating_count": p.get('rating_count') or 0,
-            "category": p.get('category', '')
-        })
-    return formatted
+    return [_format_product(p) for p in products]
 
 
 def get_product_by_id(product_id: str) -> Optional[Dict]:
     """특정 제품 정보 반환"""
     products = _fetch_from_supabase('products', f'select=*&id=eq.{product_id}')
     if products:
-        p = products[0]
-        price = p.get('price') or 0
-        return {
-            "id": str(p['id']),
-            "name": p.get('title', ''),
-            "brand": p.get('brand', ''),
-            "price": price / 100 if price > 1000 else price,
-            "serving_size": "1 Softgel",
-            "servings_per_container": 60,
-            "ingredients": {
-                "lutein": "20mg",
-                "zeaxanthin": "4mg"
-            },
-            "product_url": p.get('url', ''),
-            "rating_avg": p.get('rating_avg') or 0,
-            "rating_count": p.get('rating_count') or 0,
-            "category": p.get('category', '')
-        }
+        return _format_product(products[0])
     return None
 
 
 def get_reviews_by_product(product_id: str) -> List[Dict]:
     """특정 제품의 리뷰 반환"""
     reviews = _fetch_from_supabase('reviews', f'select=*&product_id=eq.{product_id}&order=review_date.desc')
-    formatted = []
-    for r in reviews:
-        formatted.append({
-            "product_id": str(r.get('product_id', '')),
-            "text": r.get('body', ''),
-            "rating": r.get('rating', 5),
-            "date": r.get('review_date', ''),
-            "reorder": False,  # Supabase에 해당 필드가 없으면 기본값
-            "one_month_use": len(r.get('body', '')) > 100,  # 리뷰 길이로 추정
-            "reviewer": r.get('author', 'Anonymous'),
-            "verified": True,  # 기본값
-            "helpful_count": r.get('helpful_count', 0),  # Supabase helpful_count 필드
-            "language": r.get('language', 'ko'),  # Supabase language 필드
-            "title": r.get('title', '')  # Supabase title 필드
-        })
-    return formatted
+    return [_format_review(r) for r in reviews]
+
+
+def get_reviews_for_products(product_ids: Iterable) -> Dict[str, List[Dict]]:
+    """
+    여러 제품의 리뷰를 한 번에 조회 (제품마다 get_reviews_by_product를 호출하는 N+1 조회 대체)
+
+    product_id=in.(...) 조건으로 REVIEW_BATCH_SIZE개 제품씩 묶어 조회하고
+    한 번의 순회로 제품별로 나눕니다.
+
+    Args:
+        product_ids: 제품 ID 목록 (중복/빈 값은 무시)
+
+    Returns:
+        Dict[str, List[Dict]]: {제품 ID(str): 리뷰 리스트 (최신순)}, 리뷰가 없거나
+            조회에 실패한 배치의 제품은 빈 리스트 (일부만 조회된 리뷰 목록은 반환하지 않음)
+    """
+    grouped: Dict[str, List[Dict]] = {}
+    for product_id in product_ids:
+        if product_id not in (None, ''):
+            grouped.setdefault(str(product_id), [])
+
+    ids = list(grouped)
+    for start in range(0, len(ids), REVIEW_BATCH_SIZE):
+        batch = ','.join(ids[start:start + REVIEW_BATCH_SIZE])
+        # id를 보조 정렬 키로 두어 같은 날짜의 리뷰가 페이지 사이에서 겹치지 않게 함
+        params = f'select=*&product_id=in.({batch})&order=review_date.desc,id.desc'
+        batch_reviews: Dict[str, List[Dict]] = {}
+        try:
+            # count로 전체 행 수를 받아 마지막 페이지 뒤의 빈 페이지 요청 생략
+            for r in iter_supabase_rows('reviews', params, count='exact'):
+                review = _format_review(r)
+                batch_reviews.setdefault(review["product_id"], []).append(review)
+        except SupabaseFetchError as e:
+            print(f"Error fetching reviews: {e}")
+            continue
+        for product_id, reviews in batch_reviews.items():
+            grouped.setdefault(product_id, []).extend(reviews)
+
+    return grouped
 
 
 def generate_checklist_results(reviews: List[Dict]) -> Dict:
@@ -507,7 +887,7 @@ def get_analysis_result(product_id: str) -> Optional[Dict]:
     if not product:
         return None
 
-    reviews = get_reviews_by_product(product_id)
+    reviews = get_reviews_for_products([product["id"]])[product["id"]]
     checklist = generate_checklist_results(reviews)
     ai_analysis = generate_ai_analysis(product, checklist)
 
@@ -521,12 +901,17 @@ def get_analysis_result(product_id: str) -> Optional[Dict]:
 
 def get_all_analysis_results() -> Dict[str, Dict]:
     """모든 제품의 분석 결과 반환"""
-    products = get_all_products()
+    # 상위 5개 제품만 조회
+    products = [
+        _format_product(p)
+        for p in _fetch_from_supabase('products', f'select=*&order=rating_count.desc&limit={ANALYSIS_TOP_PRODUCTS}')
+    ]
+    reviews_by_product = get_reviews_for_products(p["id"] for p in products)
     results = {}
 
-    for product in products[:5]:  # 상위 5개 제품만
+    for product in products:
         product_id = product["id"]
-        reviews = get_reviews_by_product(product_id)
+        reviews = reviews_by_product[product_id]
         checklist = generate_checklist_results(reviews)
         ai_analysis = generate_ai_analysis(product, checklist)
 
@@ -0,0 +1,177 @@
+"""
+http_client.py 테스트 스크립트
+로컬 HTTP 서버로 연결 재사용(keep-alive), gzip 응답, 429/5xx 재시도와 백오프 대기 시간을 검증
+"""
+
+import gzip
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ui_integration import http_client
+from ui_integration.http_client import PooledHTTPClient
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """경로별로 미리 정한 상태 코드를 순서대로 응답하는 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._respond()
+
+    def do_PATCH(self):
+        self._respond()
+
+    def _respond(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        server.requests.append((self.command, self.path, self.client_address[1], self.headers.get("Accept-Encoding")))
+        script = server.scripts.get(self.path, [])
+        status, headers = script.pop(0) if script else (200, {})
+
+        body = json.dumps([{"id": 1, "path": self.path}]).encode("utf-8")
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body)
+            headers = {**headers, "Content-Encoding": "gzip"}
+
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.requests = []
+    httpd.scripts = {}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """백오프 대기 시간 기록 (실제로 기다리지 않음)"""
+    recorded = []
+    monkeypatch.setattr(http_client.time, "sleep", recorded.append)
+    return recorded
+
+
+def _url(server, path):
+    return f"http://127.0.0.1:{server.server_address[1]}{path}"
+
+
+def test_keep_alive_and_gzip(server):
+    """여러 요청이 한 연결을 재사용하고 gzip 응답을 풀어서 반환"""
+    client = PooledHTTPClient()
+    responses = [client.get(_url(server, f"/rest/v1/products?id=eq.{i}")) for i in range(5)]
+
+    assert [r.json()[0]["path"] for r in responses] == [f"/rest/v1/products?id=eq.{i}" for i in range(5)]
+    assert len({port for _, _, port, _ in server.requests}) == 1
+    assert all("gzip" in encoding for _, _, _, encoding in server.requests)
+    client.close()
+
+
+def test_retries_429_and_5xx_with_backoff(server, sleeps):
+    """429/503은 재시도하고 Retry-After가 있으면 그 시간만큼 대기"""
+    server.scripts["/flaky"] = [(503, {}), (429, {"Retry-After": "2"}), (502, {})]
+    client = PooledHTTPClient(max_retries=3, backoff_base=0.5, backoff_max=8.0)
+
+    response = client.get(_url(server, "/flaky"))
+
+    assert response.status_code == 200
+    assert len(server.requests) == 4
+    assert client.retries == 3
+    assert 0 <= sleeps[0] <= 0.5
+    assert sleeps[1] == 2.0
+    assert 0 <= sleeps[2] <= 2.0
+
+
+def test_retry_count_is_thread_safe(server, sleeps):
+    """여러 스레드가 동시에 재시도해도 재시도 횟수가 누락되지 않음"""
+    paths = [f"/busy-{i}" for i in range(40)]
+    for path in paths:
+        server.scripts[path] = [(503, {}), (503, {})]
+    client = PooledHTTPClient(max_retries=3)
+
+    threads = [threading.Thread(target=client.get, args=(_url(server, path),)) for path in paths]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert client.retries == 2 * len(paths)
+    assert len(server.requests) == 3 * len(paths)
+
+
+def test_gives_up_after_max_retries(server, sleeps):
+    """재시도를 모두 소진하면 마지막 오류 응답을 그대로 반환"""
+    server.scripts["/down"] = [(500, {})] * 5
+    client = PooledHTTPClient(max_retries=2)
+
+    assert client.get(_url(server, "/down")).status_code == 500
+    assert len(server.requests) == 3
+    assert len(sleeps) == 2
+
+
+def test_non_idempotent_only_retries_429(server, sleeps):
+    """PATCH는 5xx를 재시도하지 않고 429만 재시도"""
+    server.scripts["/patch-5xx"] = [(500, {})]
+    server.scripts["/patch-429"] = [(429, {"Retry-After": "100"})]
+    client = PooledHTTPClient(backoff_max=8.0)
+
+    assert client.patch(_url(server, "/patch-5xx"), json={}).status_code == 500
+    assert client.patch(_url(server, "/patch-429"), json={}).status_code == 200
+    assert [path for _, path, _, _ in server.requests] == ["/patch-5xx", "/patch-429", "/patch-429"]
+    assert sleeps == [8.0]  # Retry-After는 backoff_max로 제한
+
+
+def test_connection_error_retried_then_raised(sleeps):
+    """연결 오류는 재시도 후 예외를 그대로 전달하고, 기본 타임아웃이 적용됨"""
+    client = PooledHTTPClient(max_retries=2, timeout=(0.5, 1.0))
+    with pytest.raises(requests.ConnectionError):
+        client.get("http://127.0.0.1:1/unreachable")
+    assert len(sleeps) == 2
+
+
+def test_backoff_jitter_bounds():
+    """지터 대기 시간은 0 ~ min(backoff_max, base * 2^attempt) 범위"""
+    client = PooledHTTPClient(backoff_base=0.5, backoff_max=4.0)
+    for attempt in range(6):
+        cap = min(4.0, 0.5 * 2 ** attempt)
+        delays = [client.backoff_delay(attempt) for _ in range(50)]
+        assert all(0 <= d <= cap for d in delays)
+    assert client.backoff_delay(0, retry_after=-3) == 0.0
+
+
+def test_shared_client_session_reused():
+    """모듈 함수는 같은 클라이언트와 세션을 공유하고 풀 크기가 제한됨"""
+    client = http_client.get_http_client()
+    assert client is http_client.get_http_client()
+    assert client.session is client.session
+    adapter = client.session.get_adapter("https://example.supabase.co")
+    assert adapter._pool_maxsize == client.pool_maxsize
+    assert adapter._pool_block is True
@@ -0,0 +1,354 @@
+"""
+supabase_data.py 테스트 스크립트
+메모리 기반 가짜 PostgREST로 페이지 단위 스트리밍(offset/keyset), count=exact,
+통계 집계가 PostgREST 응답 행 수 제한(max-rows)에 잘리지 않는지 검증
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+
+# Windows 콘솔 인코딩 설정
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ui_integration import supabase_data
+
+
+class _Response:
+    def __init__(self, status_code, rows, headers=None):
+        self.status_code = status_code
+        self._rows = rows
+        self.headers = headers or {}
+        self.text = str(rows)
+
+    def json(self):
+        return self._rows
+
+
+def _match(value, op, arg):
+    if op == 'eq':
+        return str(value) == arg
+    if op == 'in':
+        return str(value) in arg.strip('()').split(',')
+    number = float(arg)
+    return {'gt': value > number, 'gte': value >= number, 'lt': value < number, 'lte': value <= number}[op]
+
+
+class FakePostgREST:
+    """테이블 행을 메모리에 두고 select/필터/order/limit/offset/count를 흉내내는 http_get 대체"""
+
+    def __init__(self, tables, max_rows=1000, rpcs=None):
+        self.tables = tables
+        self.max_rows = max_rows
+        self.rpcs = rpcs or {}
+        self.calls = []
+
+    def __call__(self, url, headers=None, **kwargs):
+        parts = urlsplit(url)
+        table = parts.path.rsplit('/', 1)[1]
+        query = parse_qsl(parts.query)
+        self.calls.append((table, query, dict(headers or {})))
+
+        if '/rpc/' in parts.path:
+            if table not in self.rpcs:
+                return _Response(404, {'code': 'PGRST202'})
+            return _Response(200, self.rpcs[table](**dict(query)))
+
+        rows = list(self.tables[table])
+        select, order, limit, offset = '*', None, None, 0
+        for key, value in query:
+            if key == 'select':
+                select = value
+            elif key == 'order':
+                order = value
+            elif key == 'limit':
+                limit = int(value)
+            elif key == 'offset':
+                offset = int(value)
+            else:
+                op, arg = value.split('.', 1)
+                rows = [r for r in rows if r.get(key) is not None and _match(r[key], op, arg)]
+
+        if order:
+            for term in reversed(order.split(',')):
+                column, _, direction = term.partition('.')
+                rows.sort(key=lambda r: r.get(column) or 0, reverse=direction.startswith('desc'))
+
+        total = len(rows)
+        limit = min(limit or self.max_rows, self.max_rows)
+        page = rows[offset:offset + limit]
+        if select != '*':
+            columns = select.split(',')
+            page = [{c: r.get(c) for c in columns} for r in page]
+
+        if 'count=' in ((headers or {}).get('Prefer') or ''):
+            end = f'{offset}-{offset + len(page) - 1}' if page else '*'
+            status = 206 if len(page) < total else 200
+            return _Response(status, page, {'Content-Range': f'{end}/{total}'})
+        return _Response(200, page)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    """설정과 http_get을 가짜 PostgREST로 대체"""
+    products = [
+        {'id': i, 'title': f'제품 {i}', 'brand': f'브랜드{i % 3}', 'category': ['눈', '뼈', '장'][i % 3],
+         'price': 1500 + i * 100 if i % 2 else 25 + i, 'rating_avg': 4.0, 'rating_count': 100 - i}
+        for i in range(1, 41)
+    ]
+    reviews = [
+        {'id': i, 'product_id': (i % 40) + 1, 'rating': (i % 5) + 1, 'body': f'리뷰 {i}'}
+        for i in range(1, 2501)
+    ]
+    server = FakePostgREST({'products': products, 'reviews': reviews})
+    monkeypatch.setattr(supabase_data, '_config_cache', ('https://example.supabase.co', 'anon-key'))
+    monkeypatch.setattr(supabase_data, 'http_get', server)
+    monkeypatch.setattr(supabase_data, '_unavailable_rpcs', {})
+    return server
+
+
+def test_offset_pages_cover_all_rows(fake):
+    """offset 방식은 id 정렬을 추가하고 max-rows를 넘는 테이블도 모두 읽음"""
+    pager = supabase_data.iter_supabase_rows('reviews', 'select=id,rating', page_size=1000)
+    ids = [r['id'] for r in pager]
+
+    assert ids == list(range(1, 2501))
+    assert pager.pages == 4  # 마지막 빈 페이지로 끝 판별
+    assert all(('order', 'id.asc') in query for _, query, _ in fake.calls)
+    # 한 번의 요청은 max-rows에서 잘림
+    assert len(supabase_data._fetch_from_supabase('reviews', 'select=id')) == 1000
+
+
+def test_keyset_pages_and_exact_count(fake):
+    """keyset 방식은 마지막 id 이후를 조회하고 count=exact는 첫 페이지에서만 요청"""
+    pager = supabase_data.iter_supabase_rows(
+        'reviews', 'select=id,rating&rating=gte.4', page_size=300, keyset='id', count='exact'
+    )
+    rows = list(pager)
+
+    assert [r['id'] for r in rows] == [i for i in range(1, 2501) if (i % 5) + 1 >= 4]
+    assert pager.total == len(rows) == pager.rows
+    assert ('id', 'gt.' + str(rows[299]['id'])) in fake.calls[1][1]
+    assert 'Prefer' in fake.calls[0][2] and 'Prefer' not in fake.calls[1][2]
+    assert all(key != 'offset' for _, query, _ in fake.calls for key, _ in query)
+
+
+def test_pager_is_lazy(fake):
+    """필요한 만큼만 페이지를 요청"""
+    pager = iter(supabase_data.iter_supabase_rows('reviews', 'select=id', page_size=100, keyset='id'))
+    first = [next(pager) for _ in range(150)]
+
+    assert first[-1]['id'] == 150
+    assert len(fake.calls) == 2
+
+
+def test_pager_rejects_conflicting_params(fake):
+    """limit/offset 직접 지정, keyset + order 조합, select에 keyset 컬럼 누락은 오류"""
+    with pytest.raises(ValueError):
+        supabase_data.SupabasePager('reviews', 'select=*&limit=10')
+    with pytest.raises(ValueError):
+        supabase_data.SupabasePager('reviews', 'order=rating.desc', keyset='id')
+    with pytest.raises(ValueError):
+        list(supabase_data.SupabasePager('reviews', 'select=rating', keyset='id'))
+
+
+def test_pager_raises_on_error(fake, monkeypatch):
+    """조회 실패 시 그때까지의 행을 반환한 뒤 SupabaseFetchError (오류 내용은 pager.error)"""
+    responses = iter([_Response(200, [{'id': 1}, {'id': 2}]), _Response(500, [])])
+    monkeypatch.setattr(supabase_data, 'http_get', lambda url, headers=None: next(responses))
+    pager = supabase_data.iter_supabase_rows('reviews', 'select=id', page_size=2, keyset='id')
+
+    seen = []
+    with pytest.raises(supabase_data.SupabaseFetchError):
+        for r in pager:
+            seen.append(r['id'])
+    assert seen == [1, 2]
+    assert pager.error.startswith('500')
+
+
+def test_pager_reads_past_low_server_max_rows(fake):
+    """서버 max-rows가 page_size보다 작아도 짧은 페이지에서 멈추지 않고 끝까지 읽음"""
+    fake.max_rows = 300
+    offset_ids = [r['id'] for r in supabase_data.iter_supabase_rows('reviews', 'select=id')]
+    keyset_ids = [r['id'] for r in supabase_data.iter_supabase_rows('reviews', 'select=id', keyset='id')]
+
+    assert offset_ids == keyset_ids == list(range(1, 2501))
+
+    # count를 지정하면 전체 행 수에 도달한 뒤 빈 페이지를 요청하지 않음
+    fake.calls.clear()
+    pager = supabase_data.iter_supabase_rows('reviews', 'select=id', keyset='id', count='exact')
+    assert len(list(pager)) == pager.total == 2500
+    assert len(fake.calls) == 9
+
+
+def test_callers_handle_fetch_errors(fake, monkeypatch):
+    """스트리밍 중 실패하면 잘린 결과 대신 빈 결과를 반환"""
+    def failing_after_first_page(url, headers=None):
+        # keyset 다음 페이지(id=gt.)와 offset 다음 페이지는 실패
+        if 'id=gt.' in url or 'offset=100' in url:
+            return _Response(503, [])
+        return fake(url, headers)
+
+    monkeypatch.setattr(supabase_data, 'http_get', failing_after_first_page)
+    fake.max_rows = 100
+
+    summary = supabase_data.get_statistics_summary()
+    assert summary['total_reviews'] == 0
+    assert summary['rating_distribution'] == {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
+    assert supabase_data.get_all_categories() == []
+    assert supabase_data.get_reviews_for_products(['1', '2']) == {'1': [], '2': []}
+
+
+def test_count_rows(fake):
+    """행 데이터 없이 전체 행 수만 조회"""
+    assert supabase_data.count_supabase_rows('reviews') == 2500
+    assert supabase_data.count_supabase_rows('reviews', 'product_id=eq.1') == 62
+
+
+def test_statistics_summary_counts_every_review(fake):
+    """통계 요약은 max-rows와 관계없이 모든 리뷰의 평점 분포를 집계"""
+    summary = supabase_data.get_statistics_summary()
+
+    assert summary['total_reviews'] == 2500
+    assert summary['rating_distribution'] == {k: 500 for k in range(1, 6)}
+    assert summary['total_products'] == 30
+    reviews_calls = [query for table, query, _ in fake.calls if table == 'reviews']
+    assert all(('select', 'id,rating') in query for query in reviews_calls)
+
+
+def test_statistics_summary_uses_rpc(fake):
+    """RPC가 있으면 집계 결과만 한 번 조회 (JSON 문자열 키는 평점 정수 키로 변환)"""
+    fake.rpcs['get_statistics_summary'] = lambda p_top_products: {
+        'total_products': int(p_top_products), 'total_reviews': 2500,
+        'brands': {'브랜드1': {'count': 10, 'total_rating': 40.0, 'total_reviews': 700}},
+        'categories': {'눈': {'count': 10}},
+        'rating_distribution': {'1': 500, '2': 500, '3': 500, '4': 500, '5': 500},
+        'avg_price': '27.5'
+    }
+    summary = supabase_data.get_statistics_summary()
+
+    assert [table for table, _, _ in fake.calls] == ['get_statistics_summary']
+    assert summary['total_products'] == 30
+    assert summary['rating_distribution'] == {k: 500 for k in range(1, 6)}
+    assert summary['avg_price'] == 27.5
+
+
+def test_statistics_summary_falls_back_when_rpc_missing(fake):
+    """RPC가 배포되지 않았으면 클라이언트에서 같은 규칙으로 집계하고 RPC를 다시 요청하지 않음"""
+    first = supabase_data.get_statistics_summary()
+    second = supabase_data.get_statistics_summary()
+
+    assert first == second
+    assert [table for table, _, _ in fake.calls].count('get_statistics_summary') == 1
+    top = sorted(fake.tables['products'], key=lambda p: -p['rating_count'])[:30]
+    prices = [p['price'] / 100 if p['price'] > 1000 else p['price'] for p in top]
+    assert first['avg_price'] == pytest.approx(sum(prices) / len(prices))
+    assert sum(c['count'] for c in first['categories'].values()) == 30
+
+
+def test_all_categories_rpc_and_fallback(fake):
+    """카테고리 목록은 RPC 결과를 그대로 사용하고, 없으면 카테고리 컬럼만 조회"""
+    assert supabase_data.get_all_categories() == ['눈', '뼈', '장']
+    assert ('select', 'id,category') in fake.calls[-1][1]
+
+    # 함수를 배포해도 재시도 시각 전에는 클라이언트 집계, 이후에는 RPC 사용
+    fake.rpcs['get_all_categories'] = lambda: ['눈', '뼈']
+    assert supabase_data.get_all_categories() == ['눈', '뼈', '장']
+    supabase_data._unavailable_rpcs['get_all_categories'] = 0.0
+    assert supabase_data.get_all_categories() == ['눈', '뼈']
+    assert 'get_all_categories' not in supabase_data._unavailable_rpcs
+
+
+def test_reviews_for_products_matches_per_product_fetch(fake, monkeypatch):
+    """일괄 조회 결과는 제품별 조회와 같고, 요청 수는 제품 수가 아닌 배치 수에 비례"""
+    monkeypatch.setattr(supabase_data, 'REVIEW_BATCH_SIZE', 16)
+    ids = [str(i) for i in range(1, 41)] + ['1', None, '']
+
+    grouped = supabase_data.get_reviews_for_products(ids)
+    review_calls = [query for table, query, _ in fake.calls if table == 'reviews']
+
+    assert list(grouped) == [str(i) for i in range(1, 41)]
+    assert len(review_calls) == 4  # 3개 배치 (첫 배치만 max-rows를 넘어 2페이지)
+    assert all(dict(query)['product_id'].startswith('in.(') for query in review_calls)
+    for product_id in ('1', '17', '40'):
+        expected = supabase_data.get_reviews_by_product(product_id)
+        assert sorted(r['text'] for r in grouped[product_id]) == sorted(r['text'] for r in expected)
+    assert supabase_data.get_reviews_for_products([]) == {}
+
+
+def test_analysis_results_use_constant_round_trips(fake):
+    """분석 결과는 제품 수와 관계없이 제품 1회 + 리뷰 1회 조회"""
+    results = supabase_data.get_all_analysis_results()
+    tables = [table for table, _, _ in fake.calls]
+
+    assert len(results) == 5
+    assert tables == ['products', 'reviews']
+    for product_id, result in results.items():
+        assert len(result['reviews']) == sum(1 for r in fake.tables['reviews'] if str(r['product_id']) == product_id)
+
+    fake.calls.clear()
+    single = supabase_data.get_analysis_result('3')
+    assert [table for table, _, _ in fake.calls] == ['products', 'reviews']
+    assert single['product']['id'] == '3' and len(single['reviews']) == 63
+
+
+def test_fetch_many_runs_concurrently_with_cap():
+    """조회는 최대 동시 실행 수까지 병렬로 실행되고 결과는 입력 순서대로 반환"""
+    lock = threading.Lock()
+    state = {'running': 0, 'peak': 0}
+
+    def slow(value):
+        def fetch():
+            with lock:
+                state['running'] += 1
+                state['peak'] = max(state['peak'], state['running'])
+            time.sleep(0.05)
+            with lock:
+                state['running'] -= 1
+            return value
+        return fetch
+
+    started = time.perf_counter()
+    results = supabase_data.fetch_many([slow(i) for i in range(6)], max_workers=3)
+    elapsed = time.perf_counter() - started
+
+    assert results == list(range(6))
+    assert state['peak'] == 3
+    assert elapsed < 0.05 * 6
+
+
+def test_fetch_many_tables_and_mapping(fake):
+    """(테이블, 파라미터) 튜플과 함수를 섞어 쓰고, dict 입력은 같은 키로 반환"""
+    results = supabase_data.fetch_many({
+        'products': ('products', 'select=id&limit=3'),
+        'categories': supabase_data.get_all_categories,
+        'count': lambda: supabase_data.count_supabase_rows('reviews')
+    })
+
+    assert results == {'products': [{'id': 1}, {'id': 2}, {'id': 3}], 'categories': ['눈', '뼈', '장'], 'count': 2500}
+
+
+def test_fetch_many_raises_after_all_finish():
+    """조회 중 예외는 다른 조회가 모두 끝난 뒤 전달"""
+    finished = []
+
+    def fail():
+        raise RuntimeError('조회 실패')
+
+    def slow():
+        time.sleep(0.05)
+        finished.append(True)
+        return 1
+
+    with pytest.raises(RuntimeError):
+        supabase_data.fetch_many([fail, slow])
+    assert finished == [True]